@@ -9,15 +9,18 @@ Command for managing Blender extensions.
 
 
 import argparse
+import concurrent.futures
 import contextlib
 import hashlib  # for SHA1 check-summing files.
 import io
 import json
 import os
+import queue
 import re
 import shutil
 import signal  # Override `Ctrl-C`.
 import sys
+import threading
 import tomllib
 import urllib.error  # For `URLError`.
 import urllib.parse  # For `urljoin`.
@@ -63,6 +66,11 @@ PKG_EXT = ".zip"
 
 PKG_REPO_LIST_FILENAME = "index.json"
 
+# Cache the listing of archives between runs of `server-generate`
+# (a "." prefix is used so this isn't confused with archives or the listing).
+PKG_REPO_LIST_CACHE_FILENAME = ".index_cache.json"
+PKG_REPO_LIST_CACHE_VERSION = 1
+
 # Only for building.
 PKG_MANIFEST_FILENAME_TOML = "blender_manifest.toml"
 
@@ -116,6 +124,9 @@ RE_PYTHON_WHEEL_VERSION_TAG = re.compile("([a-zA-Z]+)([0-9]+)")
 # 16kb to be responsive even on slow connections.
 CHUNK_SIZE_DEFAULT = 1 << 14
 
+# The number of packages downloaded at once when installing.
+DOWNLOAD_JOBS_MAX = 4
+
 # Short descriptions for the UI:
 # Used for project tag-line & permissions values.
 TERSE_DESCRIPTION_MAX_LENGTH = 64
@@ -432,6 +443,17 @@ class PkgServerRepoConfig(NamedTuple):
     blocklist: list[dict[str, Any]]
 
 
+class PkgServerGenerateEntry(NamedTuple):
+    """The listing of an archive (for generating repositories)."""
+    # None when the archive failed validation.
+    manifest: PkgManifest | None
+    # The data included in the repository listing, None when the archive can't be included.
+    manifest_dict: dict[str, Any] | None
+    python_versions: list[tuple[int] | tuple[int, int]]
+    # Messages to report as `(type, message)` pairs (see `MESSAGE_TYPES`).
+    messages: list[tuple[str, str]]
+
+
 # -----------------------------------------------------------------------------
 # Generic Functions
 
@@ -954,6 +976,139 @@ def pkg_manifest_from_archive_and_validate(
         return pkg_manifest_from_zipfile_and_validate(zip_fh, archive_subdir, strict=strict)
 
 
+def pkg_server_generate_entry_from_archive(
+        repo_dir: str,
+        filename: str,
+) -> PkgServerGenerateEntry:
+    """
+    Validate the archive and calculate its listing in the repository.
+
+    NOTE: this runs in a sub-process when generating a repository in parallel,
+    so messages are returned instead of being logged.
+    """
+    filepath = os.path.join(repo_dir, filename)
+    messages: list[tuple[str, str]] = []
+    python_versions_final: list[tuple[int] | tuple[int, int]] = []
+
+    manifest = pkg_manifest_from_archive_and_validate(filepath, strict=False)
+    if isinstance(manifest, str):
+        messages.append(("ERROR", "archive validation failed {!r}, error: {:s}".format(filepath, manifest)))
+        return PkgServerGenerateEntry(None, None, python_versions_final, messages)
+    manifest_dict = manifest._asdict()
+
+    # Call all optional keys so the JSON never contains `null` items.
+    for key, value in list(manifest_dict.items()):
+        if value is None:
+            del manifest_dict[key]
+
+    # Don't include these in the server listing.
+    wheels: list[str] = manifest_dict.pop("wheels", [])
+
+    # Extract the `python_versions` from wheels.
+    if wheels:
+        if isinstance(python_versions := python_versions_from_wheels(wheels), str):
+            messages.append(("WARN", "unable to parse Python version from \"wheels\" ({:s}): {:s}".format(
+                python_versions,
+                filepath,
+            )))
+        else:
+            python_versions_final[:] = sorted(python_versions)
+
+            manifest_dict["python_versions"] = [
+                ".".join(str(v) for v in version)
+                for version in python_versions_final
+            ]
+
+    # These are added, ensure they don't exist.
+    has_key_error = False
+    for key in ("archive_url", "archive_size", "archive_hash"):
+        if key not in manifest_dict:
+            continue
+        messages.append(("ERROR", "malformed meta-data from {!r}, contains key it shouldn't: {:s}".format(
+            filepath,
+            key,
+        )))
+        has_key_error = True
+    if has_key_error:
+        return PkgServerGenerateEntry(manifest, None, python_versions_final, messages)
+
+    # A relative URL.
+    manifest_dict["archive_url"] = "./" + urllib.request.pathname2url(filename)
+
+    # Add archive variables, see: `PkgManifest_Archive`.
+    if isinstance((result := sha256_from_file_or_error(filepath, hash_prefix=True)), str):
+        messages.append(("ERROR", "unable to calculate hash ({:s}): {:s}".format(result, filepath)))
+        return PkgServerGenerateEntry(manifest, None, python_versions_final, messages)
+    manifest_dict["archive_size"], manifest_dict["archive_hash"] = result
+    del result
+
+    return PkgServerGenerateEntry(manifest, manifest_dict, python_versions_final, messages)
+
+
+def pkg_server_generate_entry_from_cache(
+        cache_item: dict[str, Any],
+        manifest_dict_prev: dict[str, Any],
+) -> PkgServerGenerateEntry | None:
+    """
+    Return the entry for an unchanged archive from its listing in the previously generated repository,
+    or None when the listing doesn't match the cache (the archive must be read again).
+    """
+    if not (
+            manifest_dict_prev.get("archive_hash") == cache_item["archive_hash"] and
+            manifest_dict_prev.get("archive_size") == cache_item["size"]
+    ):
+        return None
+
+    manifest_dict = dict(manifest_dict_prev)
+    try:
+        manifest = PkgManifest(**{key: manifest_dict[key] for key in PkgManifest._fields if key in manifest_dict})
+        python_versions_final: list[tuple[int] | tuple[int, int]] = [
+            tuple(int(v) for v in version.split("."))  # type: ignore
+            for version in manifest_dict.get("python_versions", ())
+        ]
+    except (TypeError, ValueError, AttributeError):
+        return None
+
+    messages = [(message_type, message) for message_type, message in cache_item["messages"]]
+    return PkgServerGenerateEntry(manifest, manifest_dict, python_versions_final, messages)
+
+
+def pkg_server_generate_cache_read(filepath: str) -> dict[str, Any]:
+    """
+    Return the cache from generating a repository or an empty cache when it doesn't exist or can't be used.
+    """
+    cache_empty: dict[str, Any] = {"version": PKG_REPO_LIST_CACHE_VERSION, "time_ns": 0, "archives": {}}
+    try:
+        with open(filepath, "r", encoding="utf-8") as fh:
+            cache = json.load(fh)
+    except Exception:
+        return cache_empty
+    if not (
+            isinstance(cache, dict) and
+            cache.get("version") == PKG_REPO_LIST_CACHE_VERSION and
+            isinstance(cache.get("time_ns"), int) and
+            isinstance(cache.get("archives"), dict)
+    ):
+        return cache_empty
+    return cache
+
+
+def pkg_server_generate_cache_write(filepath: str, cache: dict[str, Any]) -> str | None:
+    """
+    Write the cache, returning an error on failure.
+    """
+    filepath_temp = filepath + ".{:d}.tmp".format(os.getpid())
+    try:
+        with open(filepath_temp, "w", encoding="utf-8") as fh:
+            json.dump(cache, fh)
+        os.replace(filepath_temp, filepath)
+    except Exception as ex:
+        if os.path.exists(filepath_temp):
+            os.unlink(filepath_temp)
+        return str(ex)
+    return None
+
+
 def pkg_server_repo_config_from_toml_and_validate(
         filepath: str,
 ) -> PkgServerRepoConfig | str:
@@ -3273,6 +3428,36 @@ def generic_arg_server_generate_html_template(subparse: argparse.ArgumentParser)
 # Generate Repository
 
 
+def generic_arg_server_generate_jobs(subparse: argparse.ArgumentParser) -> None:
+    subparse.add_argument(
+        "--jobs",
+        dest="jobs",
+        type=int,
+        default=1,
+        metavar="JOBS",
+        help=(
+            "The number of processes used to validate & hash archives (default=1).\n"
+            "Zero uses the number of CPU cores."
+        ),
+    )
+
+
+def generic_arg_server_generate_cache(subparse: argparse.ArgumentParser) -> None:
+    subparse.add_argument(
+        "--cache",
+        dest="cache",
+        type=arg_handle_int_as_bool,
+        help=(
+            "Reuse the listing of archives which are unchanged since the repository was last generated,\n"
+            "detected by their size & modification time (default=0).\n"
+            "The cache is stored in ``{:s}`` in the repository directory,\n"
+            "it is not part of the repository and doesn't need to be published.".format(PKG_REPO_LIST_CACHE_FILENAME)
+        ),
+        default=False,
+        required=False,
+    )
+
+
 def generic_arg_package_list_positional(subparse: argparse.ArgumentParser) -> None:
     subparse.add_argument(
         dest="packages",
@@ -3741,7 +3926,11 @@ class subcmd_server:
             repo_config_filepath: str,
             html: bool,
             html_template: str,
+            jobs: int,
+            use_cache: bool,
     ) -> bool:
+        import time
+
         if url_has_known_prefix(repo_dir):
             msglog.fatal_error("Directory: {!r} must be a local path, not a URL!".format(repo_dir))
             return False
@@ -3788,6 +3977,35 @@ class subcmd_server:
 
         del repo_config
 
+        filepath_repo_json = os.path.join(repo_dir, PKG_REPO_LIST_FILENAME)
+        filepath_repo_cache = os.path.join(repo_dir, PKG_REPO_LIST_CACHE_FILENAME)
+
+        # Listings from the previous run, keyed by file-name, used for archives which are unchanged since then.
+        cache_archives_prev: dict[str, Any] = {}
+        repo_data_prev: dict[str, dict[str, Any]] = {}
+        cache_time_prev = 0
+        if use_cache:
+            cache = pkg_server_generate_cache_read(filepath_repo_cache)
+            cache_archives_prev = cache["archives"]
+            cache_time_prev = cache["time_ns"]
+            del cache
+            if cache_archives_prev:
+                try:
+                    with open(filepath_repo_json, "r", encoding="utf-8") as fh:
+                        repo_data_prev = {
+                            manifest_dict["archive_url"]: manifest_dict
+                            for manifest_dict in json.load(fh)["data"]
+                        }
+                except Exception:
+                    cache_archives_prev.clear()
+        # Archives modified after the previous run started may have been modified again
+        # without their size or time changing (depending on the file-system time resolution), never use their cache.
+        cache_time = time.time_ns()
+
+        filenames: list[str] = []
+        entries: dict[str, PkgServerGenerateEntry] = {}
+        cache_archives: dict[str, Any] = {}
+
         for entry in os.scandir(repo_dir):
             if not entry.name.endswith(PKG_EXT):
                 continue
@@ -3801,65 +4019,76 @@ class subcmd_server:
                 continue
 
             filename = entry.name
-            filepath = os.path.join(repo_dir, filename)
-            manifest = pkg_manifest_from_archive_and_validate(filepath, strict=False)
-            if isinstance(manifest, str):
-                msglog.error("archive validation failed {!r}, error: {:s}".format(filepath, manifest))
+            filenames.append(filename)
+            if not use_cache:
                 continue
-            manifest_dict = manifest._asdict()
-
-            pkg_idname = manifest_dict["id"]
 
-            # Call all optional keys so the JSON never contains `null` items.
-            for key, value in list(manifest_dict.items()):
-                if value is None:
-                    del manifest_dict[key]
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            cache_archives[filename] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+            if (
+                    (cache_item := cache_archives_prev.get(filename)) is None or
+                    (cache_item["size"], cache_item["mtime_ns"]) != (stat.st_size, stat.st_mtime_ns) or
+                    stat.st_mtime_ns >= cache_time_prev
+            ):
+                continue
+            if (manifest_dict_prev := repo_data_prev.get("./" + urllib.request.pathname2url(filename))) is None:
+                continue
+            if (pkg_entry := pkg_server_generate_entry_from_cache(cache_item, manifest_dict_prev)) is not None:
+                entries[filename] = pkg_entry
+
+        del cache_archives_prev, repo_data_prev
+
+        # Validate & hash the remaining archives, in parallel when there are enough of them.
+        filenames_uncached = [filename for filename in filenames if filename not in entries]
+        if jobs <= 0:
+            jobs = os.cpu_count() or 1
+        jobs = min(jobs, len(filenames_uncached))
+        if jobs > 1:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as executor:
+                entries.update(zip(
+                    filenames_uncached,
+                    executor.map(
+                        pkg_server_generate_entry_from_archive,
+                        [repo_dir] * len(filenames_uncached),
+                        filenames_uncached,
+                        chunksize=max(1, len(filenames_uncached) // (jobs * 4)),
+                    ),
+                ))
+        else:
+            for filename in filenames_uncached:
+                entries[filename] = pkg_server_generate_entry_from_archive(repo_dir, filename)
+        del filenames_uncached
 
-            # Don't include these in the server listing.
-            wheels: list[str] = manifest_dict.pop("wheels", [])
+        for filename in filenames:
+            pkg_entry = entries[filename]
 
-            # Extract the `python_versions` from wheels.
-            python_versions_final: list[tuple[int] | tuple[int, int]] = []
-            if wheels:
-                if isinstance(python_versions := python_versions_from_wheels(wheels), str):
-                    msglog.warn("unable to parse Python version from \"wheels\" ({:s}): {:s}".format(
-                        python_versions,
-                        filepath,
-                    ))
+            for message_type, message in pkg_entry.messages:
+                if message_type == "WARN":
+                    msglog.warn(message)
                 else:
-                    python_versions_final[:] = sorted(python_versions)
-
-                    manifest_dict["python_versions"] = [
-                        ".".join(str(v) for v in version)
-                        for version in python_versions_final
-                    ]
+                    msglog.error(message)
 
-            if (pkg_items := repo_data_idname_map.get(pkg_idname)) is None:
-                pkg_items = repo_data_idname_map[pkg_idname] = []
-            pkg_items.append((manifest, filename, python_versions_final))
-
-            # These are added, ensure they don't exist.
-            has_key_error = False
-            for key in ("archive_url", "archive_size", "archive_hash"):
-                if key not in manifest_dict:
-                    continue
-                msglog.error("malformed meta-data from {!r}, contains key it shouldn't: {:s}".format(filepath, key))
-                has_key_error = True
-            if has_key_error:
+            if (manifest := pkg_entry.manifest) is None:
                 continue
 
-            # A relative URL.
-            manifest_dict["archive_url"] = "./" + urllib.request.pathname2url(filename)
+            if (pkg_items := repo_data_idname_map.get(manifest.id)) is None:
+                pkg_items = repo_data_idname_map[manifest.id] = []
+            pkg_items.append((manifest, filename, pkg_entry.python_versions))
 
-            # Add archive variables, see: `PkgManifest_Archive`.
-            if isinstance((result := sha256_from_file_or_error(filepath, hash_prefix=True)), str):
-                msglog.error("unable to calculate hash ({:s}): {:s}".format(result, filepath))
+            if (manifest_dict := pkg_entry.manifest_dict) is None:
                 continue
-            manifest_dict["archive_size"], manifest_dict["archive_hash"] = result
-            del result
 
             repo_data.append(manifest_dict)
 
+            if (cache_item := cache_archives.get(filename)) is not None:
+                cache_item["archive_hash"] = manifest_dict["archive_hash"]
+                cache_item["messages"] = pkg_entry.messages
+
+        del entries
+
         # Detect duplicates:
         # repo_data_idname_map
         for pkg_idname, pkg_items in repo_data_idname_map.items():
@@ -3881,8 +4110,6 @@ class subcmd_server:
 
         del repo_data_idname_map
 
-        filepath_repo_json = os.path.join(repo_dir, PKG_REPO_LIST_FILENAME)
-
         try:
             with open(filepath_repo_json, "w", encoding="utf-8") as fh:
                 json.dump(repo_gen_dict, fh, indent=2)
@@ -3890,6 +4117,19 @@ class subcmd_server:
             msglog.fatal_error("failed to write repository: {:s}".format(str(ex)))
             return False
 
+        if use_cache:
+            # Only archives included in the listing can be reused.
+            cache_archives = {
+                filename: cache_item
+                for filename, cache_item in cache_archives.items()
+                if "archive_hash" in cache_item
+            }
+            if (error := pkg_server_generate_cache_write(
+                    filepath_repo_cache,
+                    {"version": PKG_REPO_LIST_CACHE_VERSION, "time_ns": cache_time, "archives": cache_archives},
+            )) is not None:
+                msglog.warn("failed to write repository cache: {:s}".format(error))
+
         msglog.status("found {:d} packages.".format(len(repo_data)))
 
         return True
@@ -4018,130 +4258,186 @@ class subcmd_client:
         # Remove `filepath_local_pkg_temp` if this block exits.
         directories_to_clean: list[str] = []
         with CleanupPathsContext(files=(), directories=directories_to_clean):
-            try:
-                # pylint: disable-next=consider-using-with
-                zip_fh_context = zipfile.ZipFile(filepath_archive, mode="r")
-            except Exception as ex:
-                msglog.error("Error extracting archive: {:s}".format(str(ex)))
+            if (result := subcmd_client._install_package_from_file_extract(
+                    msglog,
+                    local_dir=local_dir,
+                    filepath_archive=filepath_archive,
+                    blender_version_tuple=blender_version_tuple,
+                    python_version_tuple=python_version_tuple,
+                    manifest_compare=manifest_compare,
+                    directories_to_clean=directories_to_clean,
+            )) is None:
                 return False
+            manifest, filepath_local_pkg_temp = result
+            del result
 
-            with contextlib.closing(zip_fh_context) as zip_fh:
-                archive_subdir = pkg_zipfile_detect_subdir_or_none(zip_fh)
-                if archive_subdir is None:
-                    msglog.error("Missing manifest from: {:s}".format(filepath_archive))
-                    return False
+            return subcmd_client._install_package_from_file_finalize(
+                msglog,
+                local_dir=local_dir,
+                manifest=manifest,
+                filepath_local_pkg_temp=filepath_local_pkg_temp,
+                temp_prefix_and_suffix=temp_prefix_and_suffix,
+                directories_to_clean=directories_to_clean,
+            )
 
-                manifest = pkg_manifest_from_zipfile_and_validate(zip_fh, archive_subdir, strict=False)
-                if isinstance(manifest, str):
-                    msglog.error("Failed to load manifest from: {:s}".format(manifest))
-                    return False
+    @staticmethod
+    def _install_package_from_file_extract(
+            msglog: MessageLogger,
+            *,
+            local_dir: str,
+            filepath_archive: str,
+            blender_version_tuple: tuple[int, int, int],
+            python_version_tuple: tuple[int, int, int],
+            manifest_compare: PkgManifest | None,
+            directories_to_clean: list[str],
+    ) -> tuple[PkgManifest, str] | None:
+        """
+        Validate the archive and extract it into a temporary directory (added to ``directories_to_clean``),
+        return the manifest and the temporary directory or None on failure.
+
+        The package is installed by moving the temporary directory, see: ``_install_package_from_file_finalize``.
+        """
+        try:
+            # pylint: disable-next=consider-using-with
+            zip_fh_context = zipfile.ZipFile(filepath_archive, mode="r")
+        except Exception as ex:
+            msglog.error("Error extracting archive: {:s}".format(str(ex)))
+            return None
 
-                if manifest_compare is not None:
-                    # The archive ID name must match the server name,
-                    # otherwise the package will install but not be able to collate
-                    # the installed package with the remote ID.
-                    if manifest_compare.id != manifest.id:
-                        msglog.error(
-                            "Package ID mismatch (remote: \"{:s}\", archive: \"{:s}\")".format(
-                                manifest_compare.id,
-                                manifest.id,
-                            )
+        with contextlib.closing(zip_fh_context) as zip_fh:
+            archive_subdir = pkg_zipfile_detect_subdir_or_none(zip_fh)
+            if archive_subdir is None:
+                msglog.error("Missing manifest from: {:s}".format(filepath_archive))
+                return None
+
+            manifest = pkg_manifest_from_zipfile_and_validate(zip_fh, archive_subdir, strict=False)
+            if isinstance(manifest, str):
+                msglog.error("Failed to load manifest from: {:s}".format(manifest))
+                return None
+
+            if manifest_compare is not None:
+                # The archive ID name must match the server name,
+                # otherwise the package will install but not be able to collate
+                # the installed package with the remote ID.
+                if manifest_compare.id != manifest.id:
+                    msglog.error(
+                        "Package ID mismatch (remote: \"{:s}\", archive: \"{:s}\")".format(
+                            manifest_compare.id,
+                            manifest.id,
                         )
-                        return False
-                    if manifest_compare.version != manifest.version:
-                        msglog.error(
-                            "Package version mismatch (remote: \"{:s}\", archive: \"{:s}\")".format(
-                                manifest_compare.version,
-                                manifest.version,
-                            )
+                    )
+                    return None
+                if manifest_compare.version != manifest.version:
+                    msglog.error(
+                        "Package version mismatch (remote: \"{:s}\", archive: \"{:s}\")".format(
+                            manifest_compare.version,
+                            manifest.version,
                         )
-                        return False
-
-                if repository_filter_skip(
-                    # Converting back to a dict is awkward but harmless,
-                    # done since some callers only have a dictionary.
-                    manifest._asdict(),
-                    filter_blender_version=blender_version_tuple,
-                    filter_platform=platform_from_this_system(),
-                    filter_python_version=python_version_tuple,
-                    skip_message_fn=lambda message: any_as_none(
-                        msglog.error("{:s}: {:s}".format(manifest.id, message))
-                    ),
-                    error_fn=lambda ex: any_as_none(
-                        msglog.error("{:s}: {:s}".format(manifest.id, str(ex)))
-                    ),
-                ):
-                    return False
+                    )
+                    return None
+
+            if repository_filter_skip(
+                # Converting back to a dict is awkward but harmless,
+                # done since some callers only have a dictionary.
+                manifest._asdict(),
+                filter_blender_version=blender_version_tuple,
+                filter_platform=platform_from_this_system(),
+                filter_python_version=python_version_tuple,
+                skip_message_fn=lambda message: any_as_none(
+                    msglog.error("{:s}: {:s}".format(manifest.id, message))
+                ),
+                error_fn=lambda ex: any_as_none(
+                    msglog.error("{:s}: {:s}".format(manifest.id, str(ex)))
+                ),
+            ):
+                return None
 
-                # We have the cache, extract it to a directory.
-                # This will be a directory.
-                filepath_local_pkg = os.path.join(local_dir, manifest.id)
+            # We have the cache, extract it to a directory.
+            # This will be a directory.
+            filepath_local_pkg = os.path.join(local_dir, manifest.id)
 
-                # First extract into a temporary directory, validate the package is not corrupt,
-                # then move the package to it's expected location.
-                filepath_local_pkg_temp = filepath_local_pkg + "@"
+            # First extract into a temporary directory, validate the package is not corrupt,
+            # then move the package to it's expected location.
+            filepath_local_pkg_temp = filepath_local_pkg + "@"
 
-                # It's unlikely this exist, nevertheless if it does - it must be removed.
-                if os.path.lexists(filepath_local_pkg_temp):
-                    if (error := rmtree_with_fallback_or_error(filepath_local_pkg_temp)) is not None:
-                        msglog.error(
-                            "Failed to remove temporary directory for \"{:s}\": {:s}".format(manifest.id, error),
-                        )
-                        return False
+            # It's unlikely this exist, nevertheless if it does - it must be removed.
+            if os.path.lexists(filepath_local_pkg_temp):
+                if (error := rmtree_with_fallback_or_error(filepath_local_pkg_temp)) is not None:
+                    msglog.error(
+                        "Failed to remove temporary directory for \"{:s}\": {:s}".format(manifest.id, error),
+                    )
+                    return None
 
-                directories_to_clean.append(filepath_local_pkg_temp)
+            directories_to_clean.append(filepath_local_pkg_temp)
 
-                if archive_subdir:
-                    zipfile_make_root_directory(zip_fh, archive_subdir)
-                del archive_subdir
+            if archive_subdir:
+                zipfile_make_root_directory(zip_fh, archive_subdir)
+            del archive_subdir
 
-                try:
-                    for member in zip_fh.infolist():
-                        zip_fh.extract(member, filepath_local_pkg_temp)
-                except Exception as ex:
-                    msglog.error("Failed to extract files for \"{:s}\": {:s}".format(manifest.id, str(ex)))
-                    return False
+            try:
+                for member in zip_fh.infolist():
+                    zip_fh.extract(member, filepath_local_pkg_temp)
+            except Exception as ex:
+                msglog.error("Failed to extract files for \"{:s}\": {:s}".format(manifest.id, str(ex)))
+                return None
 
-            is_reinstall = False
-            # Even though this is expected to be a directory,
-            # check for any file since the existence of a file should not break installation.
-            # Besides users manually creating files, this could occur from broken symbolic-links
-            # or an incorrectly repaired corrupt file-system.
-            if os.path.lexists(filepath_local_pkg):
-                if (error := rmtree_with_fallback_or_error_pseudo_atomic(
-                        filepath_local_pkg,
-                        temp_prefix_and_suffix=temp_prefix_and_suffix,
-                )) is not None:
-                    if os.path.lexists(filepath_local_pkg):
-                        msglog.error("Failed to remove or relocate existing directory for \"{:s}\": {:s}".format(
-                            manifest.id,
-                            error,
-                        ))
-                        return False
+        return manifest, filepath_local_pkg_temp
 
-                    msglog.status("Relocated directory that could not be removed \"{:s}\": {:s}".format(
+    @staticmethod
+    def _install_package_from_file_finalize(
+            msglog: MessageLogger,
+            *,
+            local_dir: str,
+            manifest: PkgManifest,
+            filepath_local_pkg_temp: str,
+            temp_prefix_and_suffix: tuple[str, str],
+            directories_to_clean: list[str],
+    ) -> bool:
+        """
+        Install the package extracted by ``_install_package_from_file_extract``, replacing any existing package.
+        """
+        filepath_local_pkg = os.path.join(local_dir, manifest.id)
+
+        is_reinstall = False
+        # Even though this is expected to be a directory,
+        # check for any file since the existence of a file should not break installation.
+        # Besides users manually creating files, this could occur from broken symbolic-links
+        # or an incorrectly repaired corrupt file-system.
+        if os.path.lexists(filepath_local_pkg):
+            if (error := rmtree_with_fallback_or_error_pseudo_atomic(
+                    filepath_local_pkg,
+                    temp_prefix_and_suffix=temp_prefix_and_suffix,
+            )) is not None:
+                if os.path.lexists(filepath_local_pkg):
+                    msglog.error("Failed to remove or relocate existing directory for \"{:s}\": {:s}".format(
                         manifest.id,
                         error,
                     ))
+                    return False
 
-                is_reinstall = True
-
-            # While renaming should never fail, it's always possible file-system operations fail.
-            # Unlike other actions, failure here causes the extension to be uninstalled.
-            #
-            # There is little that can be done about this, being able to create a temporary
-            # directory and move it into the destination is required for installation.
-            # When that fails - the best that can be done is to communicate the failure, see: #130211.
-            try:
-                os.rename(filepath_local_pkg_temp, filepath_local_pkg)
-            except Exception as ex:
-                msglog.error("Failed to rename directory, causing unexpected removal \"{:s}\": {:s}".format(
+                msglog.status("Relocated directory that could not be removed \"{:s}\": {:s}".format(
                     manifest.id,
-                    str(ex),
+                    error,
                 ))
-                return False
 
-            directories_to_clean.remove(filepath_local_pkg_temp)
+            is_reinstall = True
+
+        # While renaming should never fail, it's always possible file-system operations fail.
+        # Unlike other actions, failure here causes the extension to be uninstalled.
+        #
+        # There is little that can be done about this, being able to create a temporary
+        # directory and move it into the destination is required for installation.
+        # When that fails - the best that can be done is to communicate the failure, see: #130211.
+        try:
+            os.rename(filepath_local_pkg_temp, filepath_local_pkg)
+        except Exception as ex:
+            msglog.error("Failed to rename directory, causing unexpected removal \"{:s}\": {:s}".format(
+                manifest.id,
+                str(ex),
+            ))
+            return False
+
+        directories_to_clean.remove(filepath_local_pkg_temp)
 
         if is_reinstall:
             msglog.status("Reinstalled \"{:s}\"".format(manifest.id))
@@ -4193,6 +4489,86 @@ class subcmd_client:
 
         return True
 
+    @staticmethod
+    def _install_package_download(
+            *,
+            filepath_remote_archive: str,
+            filepath_local_cache_archive: str,
+            archive_size_expected: int,
+            archive_hash_expected: str,
+            local_cache: bool,
+            headers: dict[str, str],
+            timeout_in_seconds: float,
+            remote_url: str,
+            pkg_idname: str,
+            progress_fn: Callable[[int], bool],
+            warn_fn: Callable[[str], None],
+    ) -> str | None:
+        """
+        Download the archive into the cache (unless the cache already contains it) and verify it,
+        return an error or None on success.
+
+        NOTE: this runs in a thread, ``progress_fn`` is called with the number of bytes downloaded
+        and returns true when the download should be canceled (in this case the returned error should be ignored).
+        """
+        # Check if the cache should be used.
+        if os.path.exists(filepath_local_cache_archive):
+            found = False
+            if local_cache:
+                if isinstance((result := sha256_from_file_or_error(
+                        filepath_local_cache_archive,
+                        hash_prefix=True,
+                )), str):
+                    # Only a warning because it's not a problem to re-download the file.
+                    warn_fn("unable to calculate hash for cache: {:s}".format(result))
+                elif result == (archive_size_expected, archive_hash_expected):
+                    found = True
+            if found:
+                progress_fn(archive_size_expected)
+                return None
+            os.unlink(filepath_local_cache_archive)
+
+        # Create `filepath_local_cache_archive`.
+        filename_archive_size_test = 0
+        sha256 = hashlib.new('sha256')
+
+        try:
+            with open(filepath_local_cache_archive, "wb") as fh_cache:
+                for block in url_retrieve_to_data_iter_or_filesystem(
+                        filepath_remote_archive,
+                        headers=headers,
+                        chunk_size=CHUNK_SIZE_DEFAULT,
+                        timeout_in_seconds=timeout_in_seconds,
+                        retrieve_info=DataRetrieveInfo(),  # Unused.
+                ):
+                    if progress_fn(len(block)):
+                        return "canceled"
+                    fh_cache.write(block)
+                    sha256.update(block)
+                    filename_archive_size_test += len(block)
+
+        except (Exception, KeyboardInterrupt) as ex:
+            # NOTE: don't support `demote_connection_errors_to_status` here because a connection
+            # failure on installing *is* an error by definition.
+            # Unlike querying information which might reasonably be skipped.
+            return url_retrieve_exception_as_message(ex, prefix="install", url=remote_url)
+
+        # Validate:
+        if filename_archive_size_test != archive_size_expected:
+            return "Archive size mismatch \"{:s}\", expected {:d}, was {:d}".format(
+                pkg_idname,
+                archive_size_expected,
+                filename_archive_size_test,
+            )
+        filename_archive_hash_test = "sha256:" + sha256.hexdigest()
+        if filename_archive_hash_test != archive_hash_expected:
+            return "Archive checksum mismatch \"{:s}\", expected {:s}, was {:s}".format(
+                pkg_idname,
+                archive_hash_expected,
+                filename_archive_hash_test,
+            )
+        return None
+
     @staticmethod
     def install_packages(
             msglog: MessageLogger,
@@ -4325,13 +4701,30 @@ class subcmd_client:
         request_exit = False
 
         # Ensure all cache is cleared (when `local_cache` is disabled) no matter the cause of exiting.
+        # Packages are extracted into temporary directories as they are downloaded, these are removed on failure.
         files_to_clean: list[str] = []
-        with CleanupPathsContext(files=files_to_clean, directories=()):
-            for manifest_archive in packages_info:
+        directories_to_clean: list[str] = []
+        with CleanupPathsContext(files=files_to_clean, directories=directories_to_clean):
+            # Download packages in threads, events are handled (progress reported & downloads extracted)
+            # from this thread as they arrive as `(package_index, message_type, value)`.
+            events: queue.SimpleQueue[tuple[int, str, Any]] = queue.SimpleQueue()
+            download_cancel = threading.Event()
+
+            def download_progress_fn(pkg_index: int, size: int) -> bool:
+                events.put((pkg_index, "PROGRESS", size))
+                return download_cancel.is_set()
+
+            headers = url_request_headers_create(
+                accept_json=False,
+                user_agent=online_user_agent,
+                access_token=access_token,
+            )
+
+            download_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=max(1, min(len(packages_info), DOWNLOAD_JOBS_MAX)),
+            )
+            for pkg_index, manifest_archive in enumerate(packages_info):
                 pkg_idname = manifest_archive.manifest.id
-                # Archive name.
-                archive_size_expected = manifest_archive.archive_size
-                archive_hash_expected = manifest_archive.archive_hash
                 pkg_archive_url = manifest_archive.archive_url
 
                 # Local path.
@@ -4349,98 +4742,97 @@ class subcmd_client:
                 else:
                     filepath_remote_archive = pkg_archive_url
 
-                # Check if the cache should be used.
-                found = False
-                if os.path.exists(filepath_local_cache_archive):
-                    if local_cache:
-                        if isinstance((result := sha256_from_file_or_error(
-                                filepath_local_cache_archive,
-                                hash_prefix=True,
-                        )), str):
-                            # Only a warning because it's not a problem to re-download the file.
-                            msglog.warn("unable to calculate hash for cache: {:s}".format(result))
-                        elif result == (archive_size_expected, archive_hash_expected):
-                            found = True
-                    if not found:
-                        os.unlink(filepath_local_cache_archive)
-
-                if not found:
-                    # Create `filepath_local_cache_archive`.
-                    filename_archive_size_test = 0
-                    sha256 = hashlib.new('sha256')
-
-                    # NOTE(@ideasman42): There is more logic in the try/except block than I'd like.
-                    # Refactoring could be done to avoid that but it ends up making logic difficult to follow.
-                    try:
-                        with open(filepath_local_cache_archive, "wb") as fh_cache:
-                            for block in url_retrieve_to_data_iter_or_filesystem(
-                                    filepath_remote_archive,
-                                    headers=url_request_headers_create(
-                                        accept_json=False,
-                                        user_agent=online_user_agent,
-                                        access_token=access_token,
-                                    ),
-                                    chunk_size=CHUNK_SIZE_DEFAULT,
-                                    timeout_in_seconds=timeout_in_seconds,
-                                    retrieve_info=DataRetrieveInfo(),  # Unused.
-                            ):
-                                request_exit |= msglog.progress(
-                                    "Downloading \"{:s}\"".format(pkg_idname),
-                                    filename_archive_size_test,
-                                    archive_size_expected,
-                                    'BYTE',
-                                )
-                                if request_exit:
-                                    break
-                                fh_cache.write(block)
-                                sha256.update(block)
-                                filename_archive_size_test += len(block)
-
-                    except (Exception, KeyboardInterrupt) as ex:
-                        # NOTE: don't support `demote_connection_errors_to_status` here because a connection
-                        # failure on installing *is* an error by definition.
-                        # Unlike querying information which might reasonably be skipped.
-                        msglog.fatal_error(
-                            url_retrieve_exception_as_message(
-                                ex, prefix="install", url=remote_url))
-                        return False
+                download_executor.submit(
+                    subcmd_client._install_package_download,
+                    filepath_remote_archive=filepath_remote_archive,
+                    filepath_local_cache_archive=filepath_local_cache_archive,
+                    archive_size_expected=manifest_archive.archive_size,
+                    archive_hash_expected=manifest_archive.archive_hash,
+                    local_cache=local_cache,
+                    headers=headers,
+                    timeout_in_seconds=timeout_in_seconds,
+                    remote_url=remote_url,
+                    pkg_idname=pkg_idname,
+                    progress_fn=lambda size, pkg_index=pkg_index: download_progress_fn(pkg_index, size),
+                    warn_fn=lambda message, pkg_index=pkg_index: events.put((pkg_index, "WARN", message)),
+                ).add_done_callback(
+                    lambda future, pkg_index=pkg_index: events.put((
+                        pkg_index,
+                        "DONE",
+                        future.result() if future.exception() is None else str(future.exception()),
+                    )),
+                )
 
-                    if request_exit:
-                        return False
+            if len(packages_info) == 1:
+                progress_message = "Downloading \"{:s}\"".format(packages_info[0].manifest.id)
+            else:
+                progress_message = "Downloading {:d} packages".format(len(packages_info))
+            progress_size = 0
+            progress_range = sum(manifest_archive.archive_size for manifest_archive in packages_info)
 
-                    # Validate:
-                    if filename_archive_size_test != archive_size_expected:
-                        msglog.fatal_error("Archive size mismatch \"{:s}\", expected {:d}, was {:d}".format(
-                            pkg_idname,
-                            archive_size_expected,
-                            filename_archive_size_test,
-                        ))
-                        return False
-                    filename_archive_hash_test = "sha256:" + sha256.hexdigest()
-                    if filename_archive_hash_test != archive_hash_expected:
-                        msglog.fatal_error("Archive checksum mismatch \"{:s}\", expected {:s}, was {:s}".format(
-                            pkg_idname,
-                            archive_hash_expected,
-                            filename_archive_hash_test,
-                        ))
-                        return False
-                    del filename_archive_size_test
-                    del filename_archive_hash_test
-                del found
-                del filepath_local_cache_archive
+            # Packages extracted to a temporary directory: `(manifest, filepath_local_pkg_temp)`.
+            packages_extracted: list[tuple[PkgManifest, str] | None] = [None] * len(packages_info)
 
-            # All packages have been downloaded, install them.
-            for manifest_archive in packages_info:
-                filepath_local_cache_archive = os.path.join(local_cache_dir, manifest_archive.manifest.id + PKG_EXT)
+            error = None
+            downloads_pending = len(packages_info)
+            try:
+                while downloads_pending:
+                    pkg_index, message_type, value = events.get()
+                    if message_type == "PROGRESS":
+                        progress_size += value
+                        if not request_exit:
+                            request_exit |= msglog.progress(progress_message, progress_size, progress_range, 'BYTE')
+                            if request_exit:
+                                download_cancel.set()
+                    elif message_type == "WARN":
+                        msglog.warn(value)
+                    else:
+                        assert message_type == "DONE"
+                        downloads_pending -= 1
+                        if request_exit or (error is not None):
+                            continue
+                        if value is not None:
+                            # Report the first error, all other downloads are canceled.
+                            error = value
+                            download_cancel.set()
+                            continue
+
+                        # Extract while other packages download, installation is only finalized
+                        # once all packages have been downloaded (so a failed download doesn't install any).
+                        manifest_archive = packages_info[pkg_index]
+                        packages_extracted[pkg_index] = subcmd_client._install_package_from_file_extract(
+                            msglog,
+                            local_dir=local_dir,
+                            filepath_archive=os.path.join(local_cache_dir, manifest_archive.manifest.id + PKG_EXT),
+                            blender_version_tuple=blender_version_tuple,
+                            python_version_tuple=python_version_tuple,
+                            manifest_compare=manifest_archive.manifest,
+                            directories_to_clean=directories_to_clean,
+                        )
+            finally:
+                download_cancel.set()
+                download_executor.shutdown(wait=True)
 
-                if not subcmd_client._install_package_from_file_impl(
+            if request_exit:
+                return False
+
+            if error is not None:
+                msglog.fatal_error(error)
+                return False
+
+            # All packages have been downloaded, install them.
+            for result in packages_extracted:
+                if result is None:
+                    # The package failed to install.
+                    continue
+                manifest, filepath_local_pkg_temp = result
+                if not subcmd_client._install_package_from_file_finalize(
                         msglog,
                         local_dir=local_dir,
-                        filepath_archive=filepath_local_cache_archive,
-                        blender_version_tuple=blender_version_tuple,
-                        python_version_tuple=python_version_tuple,
-                        manifest_compare=manifest_archive.manifest,
+                        manifest=manifest,
+                        filepath_local_pkg_temp=filepath_local_pkg_temp,
                         temp_prefix_and_suffix=temp_prefix_and_suffix,
+                        directories_to_clean=directories_to_clean,
                 ):
                     # The package failed to install.
                     continue
@@ -5117,6 +5509,8 @@ def unregister():
             repo_config_filepath="",
             html=True,
             html_template="",
+            jobs=1,
+            use_cache=False,
         ):
             # Error running command.
             return False
@@ -5178,6 +5572,8 @@ def argparse_create_server_generate(
     generic_arg_server_generate_repo_config(subparse)
     generic_arg_server_generate_html(subparse)
     generic_arg_server_generate_html_template(subparse)
+    generic_arg_server_generate_jobs(subparse)
+    generic_arg_server_generate_cache(subparse)
     if args_internal:
         generic_arg_output_type(subparse)
 
@@ -5188,6 +5584,8 @@ def argparse_create_server_generate(
             repo_config_filepath=args.repo_config,
             html=args.html,
             html_template=args.html_template,
+            jobs=args.jobs,
+            use_cache=args.cache,
         ),
     )
 
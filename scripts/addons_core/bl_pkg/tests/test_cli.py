@@ -659,6 +659,29 @@ class TestCLI_WithRepo(unittest.TestCase):
         output = command_output(["server-generate", "--repo-dir", self.dirpath])
         self.assertEqual(output, "found 3 packages.\n")
 
+    def test_server_generate_cache_and_jobs(self) -> None:
+        filepath_repo_json = os.path.join(self.dirpath, "index.json")
+
+        def repo_json_data() -> Any:
+            with open(filepath_repo_json, "r", encoding="utf-8") as fh:
+                return json.load(fh)
+
+        filepath_repo_cache = os.path.join(self.dirpath, ".index_cache.json")
+        if os.path.exists(filepath_repo_cache):
+            os.remove(filepath_repo_cache)
+
+        # Serial & without a cache by default.
+        output = command_output(["server-generate", "--repo-dir", self.dirpath])
+        self.assertEqual(output, "found 3 packages.\n")
+        self.assertFalse(os.path.exists(filepath_repo_cache))
+        data_expected = repo_json_data()
+
+        # The first run creates the cache, the second reuses it, both must match generating without a cache.
+        for args in (["--cache=1", "--jobs=2"], ["--cache=1", "--jobs=2"], ["--cache=1"]):
+            output = command_output(["server-generate", "--repo-dir", self.dirpath, *args])
+            self.assertEqual(output, "found 3 packages.\n")
+            self.assertEqual(repo_json_data(), data_expected)
+
     def test_client_list(self) -> None:
         # TODO: only run once.
         self.test_server_generate()
@@ -764,6 +787,84 @@ class TestCLI_WithRepo(unittest.TestCase):
             self.assertFalse(os.path.isdir(os.path.join(temp_dir_local, "another_package")))
 
 
+class TestCLI_InstallMultipleHTTP(unittest.TestCase):
+    """
+    Install multiple packages at once from a local HTTP server (packages are downloaded concurrently).
+    """
+    # Use a different port to the server used for all tests when `USE_HTTP` is enabled.
+    http_port = HTTP_PORT + 1
+    dirpath = ""
+
+    pkg_idnames = tuple("package_{:02d}".format(i) for i in range(8))
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.dirpath = tempfile.mkdtemp(prefix="bl_ext_http_")
+        my_generate_repo(
+            cls.dirpath,
+            templates=tuple(
+                PkgTemplate(idname=pkg_idname, name=pkg_idname.replace("_", " ").title(), version="1.0.0")
+                for pkg_idname in cls.pkg_idnames
+            ),
+        )
+        output = command_output(["server-generate", "--repo-dir", cls.dirpath])
+        assert output == "found {:d} packages.\n".format(len(cls.pkg_idnames))
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        shutil.rmtree(cls.dirpath)
+
+    def _sync_and_install(self, temp_dir_local: str, pkg_idnames: Sequence[str]) -> Sequence[JSON_OutputElem]:
+        remote_url = "http://localhost:{:d}/index.json".format(self.http_port)
+        command_output_from_json_0([
+            "sync",
+            "--remote-url", remote_url,
+            "--local-dir", temp_dir_local,
+        ], exclude_types={"PROGRESS"})
+
+        return command_output_from_json_0(
+            [
+                "install", ",".join(pkg_idnames),
+                "--remote-url", remote_url,
+                "--local-dir", temp_dir_local,
+                "--local-cache", "0",
+            ],
+            exclude_types={"PROGRESS"},
+            expected_returncode=0 if all(
+                os.path.exists(os.path.join(self.dirpath, pkg_idname + PKG_EXT)) for pkg_idname in pkg_idnames
+            ) else 1,
+        )
+
+    def test_install_multiple(self) -> None:
+        with HTTPServerContext(directory=self.dirpath, port=self.http_port):
+            with tempfile.TemporaryDirectory(dir=TEMP_DIR_LOCAL) as temp_dir_local:
+                output_json = self._sync_and_install(temp_dir_local, self.pkg_idnames)
+                self.assertEqual(
+                    output_json,
+                    [("STATUS", "Installed \"{:s}\"".format(pkg_idname)) for pkg_idname in self.pkg_idnames],
+                )
+                for pkg_idname in self.pkg_idnames:
+                    self.assertTrue(os.path.isfile(os.path.join(temp_dir_local, pkg_idname, "__init__.py")))
+
+    def test_install_multiple_with_missing_archive(self) -> None:
+        # When any download fails, none of the packages are installed.
+        filepath_archive = os.path.join(self.dirpath, self.pkg_idnames[-1] + PKG_EXT)
+        filepath_archive_moved = filepath_archive + ".moved"
+        os.rename(filepath_archive, filepath_archive_moved)
+        try:
+            with HTTPServerContext(directory=self.dirpath, port=self.http_port):
+                with tempfile.TemporaryDirectory(dir=TEMP_DIR_LOCAL) as temp_dir_local:
+                    output_json = self._sync_and_install(temp_dir_local, self.pkg_idnames)
+                    self.assertEqual(len(output_json), 1)
+                    self.assertEqual(output_json[0][0], "FATAL_ERROR")
+                    self.assertEqual(
+                        sorted(os.listdir(temp_dir_local)),
+                        [".blender_ext"],
+                    )
+        finally:
+            os.rename(filepath_archive_moved, filepath_archive)
+
+
 if __name__ == "__main__":
     if USE_HTTP:
         # This doesn't take advantage of a HTTP client/server.
@@ -4,6 +4,9 @@
 
 import bpy
 
+# Number of channel values formatted at once.
+EXPORT_CHUNK_SIZE = 65536
+
 
 def write_armature(
         context,
@@ -230,6 +233,12 @@ def write_armature(
     file.write("Frames: %d\n" % (frame_end - frame_start + 1))
     file.write("Frame Time: %.6f\n" % (1.0 / (scene.render.fps / scene.render.fps_base)))
 
+    # Frames are formatted in bulk, a chunk of frames at a time.
+    num_channels = sum(3 if dbone.skip_position else 6 for dbone in bones_decorated)
+    frame_format = "%.6f " * num_channels + "\n"
+    frame_values = []
+    num_frames_pending = 0
+
     for frame in range(frame_start, frame_end + 1):
         scene.frame_set(frame)
 
@@ -253,19 +262,24 @@ def write_armature(
             rot = mat_final.to_euler(dbone.rot_order_str_reverse, dbone.prev_euler)
 
             if not dbone.skip_position:
-                file.write("%.6f %.6f %.6f " % (loc * global_scale)[:])
+                frame_values.extend((loc * global_scale)[:])
 
-            file.write(
-                "%.6f %.6f %.6f " % (
-                    degrees(rot[dbone.rot_order[0]]),
-                    degrees(rot[dbone.rot_order[1]]),
-                    degrees(rot[dbone.rot_order[2]]),
-                )
-            )
+            frame_values.extend((
+                degrees(rot[dbone.rot_order[0]]),
+                degrees(rot[dbone.rot_order[1]]),
+                degrees(rot[dbone.rot_order[2]]),
+            ))
 
             dbone.prev_euler = rot
 
-        file.write("\n")
+        num_frames_pending += 1
+        if len(frame_values) >= EXPORT_CHUNK_SIZE:
+            file.write((frame_format * num_frames_pending) % tuple(frame_values))
+            frame_values.clear()
+            num_frames_pending = 0
+
+    if num_frames_pending:
+        file.write((frame_format * num_frames_pending) % tuple(frame_values))
 
     file.close()
 
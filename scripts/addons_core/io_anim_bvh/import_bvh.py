@@ -2,9 +2,10 @@
 #
 # SPDX-License-Identifier: GPL-2.0-or-later
 
-from math import radians, ceil
+from math import ceil
 
 import bpy
+import numpy as np
 from bpy.app.translations import pgettext_tip as tip_
 from mathutils import Vector, Euler, Matrix
 
@@ -34,7 +35,7 @@ class BVH_Node:
         'rot_order',
         # Same as above but a string 'XYZ' format..
         'rot_order_str',
-        # A list one tuple's one for each frame: (locx, locy, locz, rotx, roty, rotz),
+        # An array with a row for each frame: (locx, locy, locz, rotx, roty, rotz),
         # euler rotation ALWAYS stored xyz order, even when native used.
         'anim_data',
         # Convenience function, bool, same as: (channels[0] != -1 or channels[1] != -1 or channels[2] != -1).
@@ -75,9 +76,9 @@ class BVH_Node:
 
         self.children = []
 
-        # List of 6 length tuples: (lx, ly, lz, rx, ry, rz)
+        # Array of 6 length rows: (lx, ly, lz, rx, ry, rz), starting with the rest pose,
         # even if the channels aren't used they will just be zero.
-        self.anim_data = [(0, 0, 0, 0, 0, 0)]
+        self.anim_data = np.zeros((1, 6))
 
     def __repr__(self):
         return (
@@ -89,25 +90,148 @@ class BVH_Node:
         )
 
 
+def euler_to_matrices(eulers, order):
+    """
+    Rotation matrices of an ``(n, 3)`` array of euler angles (x, y, z) in radians,
+    with the order of a Blender euler rotation mode, the first axis is applied first.
+    """
+    cos = np.cos(eulers)
+    sin = np.sin(eulers)
+    matrices = np.broadcast_to(np.identity(3), (len(eulers), 3, 3))
+    for axis in order:
+        i = 'XYZ'.index(axis)
+        j = (i + 1) % 3
+        k = (i + 2) % 3
+        axis_matrices = np.zeros((len(eulers), 3, 3))
+        axis_matrices[:, i, i] = 1.0
+        axis_matrices[:, j, j] = cos[:, i]
+        axis_matrices[:, k, k] = cos[:, i]
+        axis_matrices[:, j, k] = -sin[:, i]
+        axis_matrices[:, k, j] = sin[:, i]
+        matrices = axis_matrices @ matrices
+    return matrices
+
+
+def matrices_to_quaternions(matrices):
+    """
+    Quaternions (w, x, y, z) of an ``(n, 3, 3)`` array of rotation matrices,
+    using the same method as ``Matrix.to_quaternion``, with a non-negative w.
+    """
+    m = matrices
+    quaternions = np.empty((len(m), 4))
+
+    # Compute from the largest of the 4 components, to avoid dividing by small values.
+    m00, m11, m22 = m[:, 0, 0], m[:, 1, 1], m[:, 2, 2]
+    cases = (
+        # Largest component, trace, sign of the largest component, other components (sums and differences).
+        (1, 1.0 + m00 - m11 - m22, m[:, 2, 1] - m[:, 1, 2],
+         ((0, m[:, 2, 1] - m[:, 1, 2]), (2, m[:, 1, 0] + m[:, 0, 1]), (3, m[:, 0, 2] + m[:, 2, 0]))),
+        (2, 1.0 - m00 + m11 - m22, m[:, 0, 2] - m[:, 2, 0],
+         ((0, m[:, 0, 2] - m[:, 2, 0]), (1, m[:, 1, 0] + m[:, 0, 1]), (3, m[:, 2, 1] + m[:, 1, 2]))),
+        (3, 1.0 - m00 - m11 + m22, m[:, 1, 0] - m[:, 0, 1],
+         ((0, m[:, 1, 0] - m[:, 0, 1]), (1, m[:, 0, 2] + m[:, 2, 0]), (2, m[:, 2, 1] + m[:, 1, 2]))),
+        (0, 1.0 + m00 + m11 + m22, None,
+         ((1, m[:, 2, 1] - m[:, 1, 2]), (2, m[:, 0, 2] - m[:, 2, 0]), (3, m[:, 1, 0] - m[:, 0, 1]))),
+    )
+    masks = (
+        (m22 < 0.0) & (m00 > m11),
+        (m22 < 0.0) & ~(m00 > m11),
+        ~(m22 < 0.0) & (m00 < -m11),
+        ~(m22 < 0.0) & ~(m00 < -m11),
+    )
+    for mask, (largest, trace, sign, others) in zip(masks, cases):
+        if not mask.any():
+            continue
+        s = 2.0 * np.sqrt(np.maximum(trace[mask], 0.0))
+        if sign is not None:
+            # Ensure w is non-negative for a canonical result.
+            s = np.where(sign[mask] < 0.0, -s, s)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            inv_s = 1.0 / s
+        quaternions[mask, largest] = 0.25 * s
+        for component, value in others:
+            quaternions[mask, component] = value[mask] * inv_s
+
+    quaternions /= np.linalg.norm(quaternions, axis=1)[:, np.newaxis]
+    return quaternions
+
+
 def sorted_nodes(bvh_nodes):
     bvh_nodes_list = list(bvh_nodes.values())
     bvh_nodes_list.sort(key=lambda bvh_node: bvh_node.index)
     return bvh_nodes_list
 
 
+# Size in bytes of the chunks of lines of motion data parsed at once.
+MOTION_CHUNK_SIZE = 16 * 1024 * 1024
+
+
+def read_bvh_hierarchy_lines(file):
+    """
+    Read the lines of the file up to the start of the motion data (after the frame count and time),
+    as a list of lists, each line a list of words. Empty lines are skipped.
+    """
+    file_lines = []
+    motion_header_lines = None
+    for line in file:
+        # Split by whitespace.
+        words = line.split()
+        if not words:
+            continue
+        file_lines.append(words)
+
+        if motion_header_lines is not None:
+            motion_header_lines -= 1
+            if motion_header_lines == 0:
+                break
+        elif len(words) == 1 and words[0].lower() == 'motion':
+            # Followed by the frame count and frame time lines.
+            motion_header_lines = 2
+
+    return file_lines
+
+
+def read_bvh_motion(file, num_channels):
+    """
+    Read the motion data at the current position of the file,
+    as a ``(frames, num_channels + 1)`` array. Lines are parsed in bulk, one chunk at a time.
+
+    The extra last column holds the last value of each line,
+    which is what missing rotation channels of a node with other rotation channels read.
+    """
+    chunks = []
+    while lines := file.readlines(MOTION_CHUNK_SIZE):
+        try:
+            chunk = np.loadtxt(lines, dtype=np.float64, comments=None, ndmin=2)
+        except ValueError:
+            chunk = None
+
+        if chunk is None or (len(chunk) and chunk.shape[1] < num_channels):
+            # Lines with a varying number of values, values beyond the channels are ignored.
+            chunk = []
+            for line in lines:
+                words = line.split()
+                if not words:
+                    continue
+                if len(words) < num_channels:
+                    raise Exception("Expected %d values per frame, found %d" % (num_channels, len(words)))
+                chunk.append([float(word) for word in (*words[:num_channels], words[-1])])
+            chunks.append(np.array(chunk, dtype=np.float64).reshape(-1, num_channels + 1))
+        else:
+            chunks.append(np.concatenate((chunk[:, :num_channels], chunk[:, -1:]), axis=1))
+
+    if not chunks:
+        return np.zeros((0, num_channels + 1))
+    return np.concatenate(chunks)
+
+
 def read_bvh(context, file_path, rotate_mode='XYZ', global_scale=1.0):
     # File loading stuff
     # Open the file for importing
     file = open(file_path, 'r')
 
     # Separate into a list of lists, each line a list of words.
-    file_lines = file.readlines()
-    # Non standard carriage returns?
-    if len(file_lines) == 1:
-        file_lines = file_lines[0].split('\r')
-
-    # Split by whitespace.
-    file_lines = [ll for ll in [l.split() for l in file_lines] if ll]
+    file_lines = read_bvh_hierarchy_lines(file)
 
     # Create hierarchy as empties
     if file_lines[0][0].lower() == 'hierarchy':
@@ -266,31 +390,26 @@ def read_bvh(context, file_path, rotate_mode='XYZ', global_scale=1.0):
     # second life expects it, which isn't to spec.
     bvh_nodes_list = sorted_nodes(bvh_nodes)
 
-    while lineIdx < len(file_lines):
-        line = file_lines[lineIdx]
-        for bvh_node in bvh_nodes_list:
-            # for bvh_node in bvh_nodes_serial:
-            lx = ly = lz = rx = ry = rz = 0.0
-            channels = bvh_node.channels
-            anim_data = bvh_node.anim_data
-            if channels[0] != -1:
-                lx = global_scale * float(line[channels[0]])
-
-            if channels[1] != -1:
-                ly = global_scale * float(line[channels[1]])
+    # All channels of a frame, in the order of the file.
+    motion = read_bvh_motion(file, channelIndex + 1)
+    file.close()
 
-            if channels[2] != -1:
-                lz = global_scale * float(line[channels[2]])
+    for bvh_node in bvh_nodes_list:
+        channels = bvh_node.channels
+        anim_data = np.zeros((len(motion) + 1, 6))
+        for axis_i in range(3):
+            if channels[axis_i] != -1:
+                anim_data[1:, axis_i] = global_scale * motion[:, channels[axis_i]]
 
-            if channels[3] != -1 or channels[4] != -1 or channels[5] != -1:
+        if bvh_node.has_rot:
+            for axis_i in range(3, 6):
+                channel = channels[axis_i]
+                if channel == -1:
+                    # The last value of the line, as it has always been read.
+                    channel = motion.shape[1] - 1
+                anim_data[1:, axis_i] = np.radians(motion[:, channel])
 
-                rx = radians(float(line[channels[3]]))
-                ry = radians(float(line[channels[4]]))
-                rz = radians(float(line[channels[5]]))
-
-            # Done importing motion data #
-            anim_data.append((lx, ly, lz, rx, ry, rz))
-        lineIdx += 1
+        bvh_node.anim_data = anim_data
 
     # Assign children
     for bvh_node in bvh_nodes_list:
@@ -550,97 +669,77 @@ def bvh_node_dict2armature(
         num_frame = num_frame - skip_frame
 
     # Create a shared time axis for all animation curves.
-    time = [float(frame_start)] * num_frame
     if use_fps_scale:
         dt = scene.render.fps * bvh_frame_time
-        for frame_i in range(1, num_frame):
-            time[frame_i] += float(frame_i) * dt
+        time = float(frame_start) + np.arange(num_frame, dtype=np.float64) * dt
     else:
-        for frame_i in range(1, num_frame):
-            time[frame_i] += float(frame_i)
+        time = float(frame_start) + np.arange(num_frame, dtype=np.float64)
 
     # print("bvh_frame_time = %f, dt = %f, num_frame = %d"
     #      % (bvh_frame_time, dt, num_frame]))
 
+    linear_value = bpy.types.Keyframe.bl_rna.properties['interpolation'].enum_items['LINEAR'].value
+
+    def add_fcurves(data_path, values, action_group):
+        # One curve for each column of values, all keyframes of a curve are set at once.
+        num_keys = len(values)
+        keyframe_co = np.empty((num_keys, 2), dtype=np.float32)
+        keyframe_co[:, 0] = time[:num_keys]
+        interpolation = np.full(num_keys, linear_value, dtype=np.ubyte)
+
+        for axis_i in range(values.shape[1]):
+            keyframe_co[:, 1] = values[:, axis_i]
+
+            curve = action.fcurves.new(data_path=data_path, index=axis_i, action_group=action_group)
+            keyframe_points = curve.keyframe_points
+            keyframe_points.add(num_keys)
+            keyframe_points.foreach_set('co', keyframe_co.ravel())
+            keyframe_points.foreach_set('interpolation', interpolation)
+            curve.update()
+
     for i, bvh_node in enumerate(bvh_nodes_list):
         pose_bone, bone, bone_rest_matrix, bone_rest_matrix_inv = bvh_node.temp
+        anim_data = bvh_node.anim_data[skip_frame:skip_frame + num_frame]
 
         if bvh_node.has_loc:
             # Not sure if there is a way to query this or access it in the
             # PoseBone structure.
             data_path = 'pose.bones["%s"].location' % escape_identifier(pose_bone.name)
 
-            location = [(0.0, 0.0, 0.0)] * num_frame
-            for frame_i in range(num_frame):
-                bvh_loc = bvh_node.anim_data[frame_i + skip_frame][:3]
-
-                bone_translate_matrix = Matrix.Translation(
-                    Vector(bvh_loc) - bvh_node.rest_head_local)
-                location[frame_i] = (bone_rest_matrix_inv @
-                                     bone_translate_matrix).to_translation()
+            # Translations relative to the rest location, in the space of the rest rotation.
+            location = (anim_data[:, :3] - np.array(bvh_node.rest_head_local)) @ \
+                np.array(bone_rest_matrix_inv.to_3x3()).T
 
             # For each location x, y, z.
-            for axis_i in range(3):
-                curve = action.fcurves.new(data_path=data_path, index=axis_i, action_group=bvh_node.name)
-                keyframe_points = curve.keyframe_points
-                keyframe_points.add(num_frame)
-
-                for frame_i in range(num_frame):
-                    keyframe_points[frame_i].co = (
-                        time[frame_i],
-                        location[frame_i][axis_i],
-                    )
+            add_fcurves(data_path, location, bvh_node.name)
 
         if bvh_node.has_rot:
-            data_path = None
-            rotate = None
+            # apply rotation order and convert to XYZ
+            # note that the rot_order_str is reversed.
+            bone_rotation_matrices = euler_to_matrices(anim_data[:, 3:], bvh_node.rot_order_str[::-1])
+            bone_rotation_matrices = (
+                np.array(bone_rest_matrix_inv.to_3x3()) @
+                bone_rotation_matrices @
+                np.array(bone_rest_matrix.to_3x3())
+            )
 
             if 'QUATERNION' == rotate_mode:
-                rotate = [(1.0, 0.0, 0.0, 0.0)] * num_frame
+                rotate = matrices_to_quaternions(bone_rotation_matrices)
                 data_path = ('pose.bones["%s"].rotation_quaternion' % escape_identifier(pose_bone.name))
             else:
-                rotate = [(0.0, 0.0, 0.0)] * num_frame
+                # Keep eulers compatible with the previous frame, which depends on the previous result.
+                rotate = np.empty((len(anim_data), 3))
+                prev_euler = Euler((0.0, 0.0, 0.0))
+                for frame_i, bone_rotation_matrix in enumerate(bone_rotation_matrices):
+                    prev_euler = Matrix(bone_rotation_matrix).to_euler(pose_bone.rotation_mode, prev_euler)
+                    rotate[frame_i] = prev_euler
                 data_path = ('pose.bones["%s"].rotation_euler' % escape_identifier(pose_bone.name))
 
-            prev_euler = Euler((0.0, 0.0, 0.0))
-            for frame_i in range(num_frame):
-                bvh_rot = bvh_node.anim_data[frame_i + skip_frame][3:]
-
-                # apply rotation order and convert to XYZ
-                # note that the rot_order_str is reversed.
-                euler = Euler(bvh_rot, bvh_node.rot_order_str[::-1])
-                bone_rotation_matrix = euler.to_matrix().to_4x4()
-                bone_rotation_matrix = (
-                    bone_rest_matrix_inv @
-                    bone_rotation_matrix @
-                    bone_rest_matrix
-                )
-
-                if len(rotate[frame_i]) == 4:
-                    rotate[frame_i] = bone_rotation_matrix.to_quaternion()
-                else:
-                    rotate[frame_i] = bone_rotation_matrix.to_euler(
-                        pose_bone.rotation_mode, prev_euler)
-                    prev_euler = rotate[frame_i]
-
             # For each euler angle x, y, z (or quaternion w, x, y, z).
-            for axis_i in range(len(rotate[0])):
-                curve = action.fcurves.new(data_path=data_path, index=axis_i, action_group=bvh_node.name)
-                keyframe_points = curve.keyframe_points
-                keyframe_points.add(num_frame)
-
-                for frame_i in range(num_frame):
-                    keyframe_points[frame_i].co = (
-                        time[frame_i],
-                        rotate[frame_i][axis_i],
-                    )
-
-    for cu in action.fcurves:
-        if IMPORT_LOOP:
-            pass  # 2.5 doenst have cyclic now?
-
-        for bez in cu.keyframe_points:
-            bez.interpolation = 'LINEAR'
+            add_fcurves(data_path, rotate, bvh_node.name)
+
+    if IMPORT_LOOP:
+        pass  # 2.5 doenst have cyclic now?
 
     # finally apply matrix
     arm_ob.matrix_world = global_matrix
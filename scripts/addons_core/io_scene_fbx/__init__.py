@@ -5,7 +5,7 @@
 bl_info = {
     "name": "FBX format",
     "author": "Campbell Barton, Bastien Montagne, Jens Restemeier, @Mysteryem",
-    "version": (5, 12, 7),
+    "version": (5, 13, 0),
     "blender": (4, 2, 0),
     "location": "File > Import-Export",
     "description": "FBX IO meshes, UVs, vertex colors, materials, textures, cameras, lamps and actions",
@@ -193,6 +193,13 @@ class ImportFBX(bpy.types.Operator, ImportHelper):
         default=True,
     )
 
+    use_mmap: BoolProperty(
+        name="Lazy Parsing",
+        description="Memory-map the file and only decode the data actually imported, "
+        "reducing peak memory usage for large files",
+        default=False,
+    )
+
     def draw(self, context):
         layout = self.layout
         layout.use_property_split = True
@@ -236,6 +243,7 @@ def import_panel_include(layout, operator):
         sub.prop(operator, "use_custom_props_enum_as_string")
         body.prop(operator, "use_image_search")
         body.prop(operator, "colors_type")
+        body.prop(operator, "use_mmap")
 
 
 def import_panel_transform(layout, operator):
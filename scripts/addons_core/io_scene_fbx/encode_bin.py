@@ -4,15 +4,17 @@
 
 try:
     from . import data_types
-    from .fbx_utils_threading import MultiThreadedTaskConsumer
+    from .fbx_utils_threading import MultiThreadedTaskConsumer, ProcessTask, TaskBatchPolicy, BACKEND_THREAD
 except:
     import data_types
-    from fbx_utils_threading import MultiThreadedTaskConsumer
+    from fbx_utils_threading import MultiThreadedTaskConsumer, ProcessTask, TaskBatchPolicy, BACKEND_THREAD
 
 from struct import pack
 from contextlib import contextmanager
+from collections import deque
 import array
 import numpy as np
+import os
 import zlib
 
 _BLOCK_SENTINEL_LENGTH = ...
@@ -34,6 +36,34 @@ _FOOT_ID = b'\xfa\xbc\xab\x09\xd0\xc8\xd4\x66\xb1\x76\xfb\x83\x1c\xf7\x26\x7e'
 _ELEMS_ID_ALWAYS_BLOCK_SENTINEL = {b"AnimationStack", b"AnimationLayer"}
 
 
+def _compress_array_task_size(_props, _insert_at, data, _length):
+    """The size of a compression task, used to group small arrays into batches."""
+    return len(data)
+
+
+# Compression of arrays for the process backend, where compression is done in a separate process and the compressed
+# data is inserted on the main thread.
+def _compress_array_split(props, insert_at, data, length):
+    # Worst case size of the compressed data, matching zlib's compressBound() plus the zlib header and trailer.
+    data_len = len(data)
+    compress_bound = data_len + (data_len >> 12) + (data_len >> 14) + (data_len >> 25) + 13 + 6
+    return data, compress_bound, (props, insert_at, length)
+
+
+def _compress_array_process(data, output_view):
+    data = zlib.compress(data, 1)
+    output_view[:len(data)] = data
+    return len(data)
+
+
+def _compress_array_finish(data, props, insert_at, length):
+    encoding = 1
+    props[insert_at] = pack('<3I', length, encoding, len(data)) + data
+
+
+_COMPRESS_ARRAY_PROCESS_TASK = ProcessTask(_compress_array_split, _compress_array_process, _compress_array_finish)
+
+
 class FBXElem:
     __slots__ = (
         "id",
@@ -56,18 +86,24 @@ class FBXElem:
 
     @classmethod
     @contextmanager
-    def enable_multithreading_cm(cls):
+    def enable_multithreading_cm(cls, backend=BACKEND_THREAD):
         """Temporarily enable multithreaded array compression.
 
         The context manager handles starting up and shutting down the threads.
 
+        `backend` is the `fbx_utils_threading` backend used to compress arrays. Exports with many small arrays, such as
+        animation curves, are dominated by per-array Python overhead which does not benefit from threads, so may be
+        faster with BACKEND_PROCESS or BACKEND_AUTO.
+
         Only exits once all the threads are done (either all tasks were completed or an error occurred and the threads
         were stopped prematurely).
 
-        Writing to a file is temporarily disabled as a safeguard."""
+        Writing elements whose arrays are still being compressed is temporarily disabled as a safeguard, use
+        `_wait_for_pending_arrays` first."""
         # __enter__()
         orig_func = cls._add_compressed_array_helper
         orig_write = cls._write
+        orig_wait = cls._wait_for_pending_arrays
 
         def insert_compressed_array(props, insert_at, data, length):
             # zlib.compress releases the GIL, so can be multithreaded.
@@ -78,7 +114,15 @@ class FBXElem:
             data = pack('<3I', length, encoding, comp_len) + data
             props[insert_at] = data
 
-        with MultiThreadedTaskConsumer.new_cpu_bound_cm(insert_compressed_array) as wrapped_func:
+        compress_array_cm = MultiThreadedTaskConsumer.new_cpu_bound_cm(
+            insert_compressed_array,
+            backend=backend,
+            process_task=_COMPRESS_ARRAY_PROCESS_TASK,
+            # Threads consume tasks one by one, as they always have.
+            batch_policy=None if backend == BACKEND_THREAD else TaskBatchPolicy(_compress_array_task_size),
+            with_wait_function=True,
+        )
+        with compress_array_cm as (wrapped_func, wait_func):
             try:
                 def _add_compressed_array_helper_multi(self, data, length):
                     # Append a dummy value that will be replaced with the compressed array data later.
@@ -89,12 +133,21 @@ class FBXElem:
                     # `insert_at`.
                     wrapped_func(self.props, insert_at, data, length)
 
-                # As an extra safeguard, temporarily replace the `_write` function to raise an error if called.
-                def temp_write(*_args, **_kwargs):
-                    raise RuntimeError("Writing is not allowed until multithreaded array compression has been disabled")
+                # As an extra safeguard, temporarily replace the `_write` function to raise an error if called on an
+                # element with arrays that are still being compressed. FBXStreamWriter only writes elements once all
+                # their arrays have been compressed.
+                def temp_write(self, *args, **kwargs):
+                    if self._has_pending_arrays():
+                        raise RuntimeError("Writing is not allowed until multithreaded array compression has been "
+                                           "disabled or has completed for the element")
+                    return orig_write(self, *args, **kwargs)
+
+                def _wait_for_pending_arrays_multi(self):
+                    wait_func(lambda: not self._has_pending_arrays())
 
                 cls._add_compressed_array_helper = _add_compressed_array_helper_multi
                 cls._write = temp_write
+                cls._wait_for_pending_arrays = _wait_for_pending_arrays_multi
 
                 # Return control back to the caller of __enter__().
                 yield
@@ -103,6 +156,7 @@ class FBXElem:
                 # Restore the original functions.
                 cls._add_compressed_array_helper = orig_func
                 cls._write = orig_write
+                cls._wait_for_pending_arrays = orig_wait
             # Exiting the MultiThreadedTaskConsumer context manager will wait for all scheduled tasks to complete.
 
     def add_bool(self, data):
@@ -281,6 +335,18 @@ class FBXElem:
     # -------------------------
     # internal helper functions
 
+    def _has_pending_arrays(self):
+        """Whether any array of this element or its children is still waiting to be compressed by another thread."""
+        # `...` is the placeholder used by `enable_multithreading_cm` until the compressed array is inserted.
+        return any(data is ... for data in self.props) or any(elem._has_pending_arrays() for elem in self.elems)
+
+    def _wait_for_pending_arrays(self):
+        """Wait until all the arrays of this element and its children have been compressed.
+
+        Note: This function may be swapped out by enable_multithreading_cm, without it, arrays are compressed
+        immediately."""
+        pass
+
     def _calc_offsets(self, offset, is_last):
         """
         Call before writing, calculates fixed offsets.
@@ -344,6 +410,27 @@ class FBXElem:
             write(_BLOCK_SENTINEL_DATA)
 
 
+def _write_timedate_hack_elem(elem):
+    """Return True if `elem` is the FileID or CreationTime element and has been changed."""
+    if elem.id == b'FileId':
+        assert(elem.props_type[0] == b'R'[0])
+        assert(len(elem.props_type) == 1)
+        elem.props.clear()
+        elem.props_type.clear()
+
+        elem.add_bytes(_FILE_ID)
+        return True
+    elif elem.id == b'CreationTime':
+        assert(elem.props_type[0] == b'S'[0])
+        assert(len(elem.props_type) == 1)
+        elem.props.clear()
+        elem.props_type.clear()
+
+        elem.add_string(_TIME_ID)
+        return True
+    return False
+
+
 def _write_timedate_hack(elem_root):
     # perform 2 changes
     # - set the FileID
@@ -351,21 +438,7 @@ def _write_timedate_hack(elem_root):
 
     ok = 0
     for elem in elem_root.elems:
-        if elem.id == b'FileId':
-            assert(elem.props_type[0] == b'R'[0])
-            assert(len(elem.props_type) == 1)
-            elem.props.clear()
-            elem.props_type.clear()
-
-            elem.add_bytes(_FILE_ID)
-            ok += 1
-        elif elem.id == b'CreationTime':
-            assert(elem.props_type[0] == b'S'[0])
-            assert(len(elem.props_type) == 1)
-            elem.props.clear()
-            elem.props_type.clear()
-
-            elem.add_string(_TIME_ID)
+        if _write_timedate_hack_elem(elem):
             ok += 1
 
         if ok == 2:
@@ -415,20 +488,216 @@ def write(fn, elem_root, version):
         elem_root._calc_offsets_children(tell(), False)
         elem_root._write_children(write, tell, False)
 
-        write(_FOOT_ID)
-        write(b'\x00' * 4)
+        _write_footer(write, tell, version)
 
-        # padding for alignment (values between 1 & 16 observed)
-        # if already aligned to 16, add a full 16 bytes padding.
-        ofs = tell()
-        pad = ((ofs + 15) & ~15) - ofs
-        if pad == 0:
-            pad = 16
 
-        write(b'\0' * pad)
+def _write_footer(write, tell, version):
+    write(_FOOT_ID)
+    write(b'\x00' * 4)
 
-        write(pack('<I', version))
+    # padding for alignment (values between 1 & 16 observed)
+    # if already aligned to 16, add a full 16 bytes padding.
+    ofs = tell()
+    pad = ((ofs + 15) & ~15) - ofs
+    if pad == 0:
+        pad = 16
+
+    write(b'\0' * pad)
+
+    write(pack('<I', version))
+
+    # unknown magic (always the same)
+    write(b'\0' * 120)
+    write(b'\xf8\x5a\x8c\x6a\xde\xf5\xd9\x7e\xec\xe9\x0c\xe3\x75\x8f\x29\x0b')
+
+
+class FBXStreamWriter:
+    """Write an FBX file progressively, instead of building the whole element tree in memory first like `write` does.
+
+    Complete root-level elements are given to `write_elem` (or `write_children`). Elements with many children, such as
+    "Objects", are started with `begin_elem`, have their complete children given to `write_elem` as they are created,
+    and are then ended with `end_elem`, at which point their end offset is back-patched into the already written
+    header. The properties and children of each element are released as soon as it has been written, so peak memory is
+    proportional to the few elements queued at once rather than to the whole file.
+
+    Elements with arrays still being compressed by `FBXElem.enable_multithreading_cm` are kept queued until their
+    compression completes, so writing can be interleaved with creating elements with multithreading enabled. Queued
+    elements are written as soon as their arrays have been compressed. When more than `max_pending_ops` elements are
+    queued, the writer waits for the compression of the oldest ones, so at most `max_pending_ops` elements are held in
+    memory at once.
+
+    Must be used as a context manager. The file is written to a temporary file next to `fn`, which only replaces `fn`
+    once the context manager exits without an exception. The output is identical to that of `write`."""
+    __slots__ = ("_fn", "_tmp_fn", "_file", "_version", "_ops", "_max_pending_ops", "_open_elems", "_timedate_ok")
+
+    # Queued operations.
+    _OP_ELEM = 0
+    _OP_BEGIN = 1
+    _OP_END = 2
+
+    def __init__(self, fn, version, max_pending_ops=16):
+        assert(max_pending_ops >= 1)
+        self._fn = fn
+        self._tmp_fn = None
+        self._file = None
+        self._version = version
+        # Queued (op, elem) operations, in file order.
+        self._ops = deque()
+        self._max_pending_ops = max_pending_ops
+        # Stack of [elem, header_offset, props_length, has_children] of the elements started with `begin_elem` that
+        # have been written, starting with the root element, which is not saved per se.
+        self._open_elems = [[None, -1, -1, False]]
+        # Number of elements changed by `_write_timedate_hack_elem`.
+        self._timedate_ok = 0
+
+    def __enter__(self):
+        # Not using `tempfile`, so that the file is created with the same permissions as when written directly.
+        self._tmp_fn = "%s.%d.tmp" % (self._fn, os.getpid())
+        self._file = open(self._tmp_fn, 'wb')
+
+        init_version(self._version)
+
+        write = self._file.write
+        write(_HEAD_MAGIC)
+        write(pack('<I', self._version))
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        finished = False
+        try:
+            if exc_type is None:
+                self._finish()
+                finished = True
+        finally:
+            self._file.close()
+            if finished:
+                os.replace(self._tmp_fn, self._fn)
+            else:
+                os.remove(self._tmp_fn)
+
+    def write_elem(self, elem):
+        """Queue a complete element, with all its children, to be written."""
+        assert(elem.id != b'')
+        self._ops.append((self._OP_ELEM, elem))
+        self._process_ops()
+
+    def write_children(self, elem):
+        """Queue all the current children of `elem` to be written and remove them from `elem`."""
+        for sub_elem in elem.elems:
+            self.write_elem(sub_elem)
+        elem.elems.clear()
+
+    def begin_elem(self, elem):
+        """Queue an element whose children will be written by following calls, until the matching `end_elem` call.
+
+        The element's own properties must be complete and it must not have any children yet."""
+        assert(elem.id != b'')
+        assert(not elem.elems)
+        self._ops.append((self._OP_BEGIN, elem))
+        self._process_ops()
+
+    def end_elem(self):
+        """End the element started by the last unmatched `begin_elem` call."""
+        self._ops.append((self._OP_END, None))
+        self._process_ops()
+
+    def _process_ops(self, finishing=False):
+        ops = self._ops
+        while ops:
+            op, elem = ops[0]
+            if op != self._OP_END and elem._has_pending_arrays():
+                if len(ops) <= self._max_pending_ops and not finishing:
+                    # Elements must be written in order, so everything after this element must wait too.
+                    break
+                # Too many operations are queued, or the file is being finished, wait for the oldest element.
+                elem._wait_for_pending_arrays()
+
+            # Whether an element is the last child of its parent determines whether an element without children ends
+            # with a block sentinel, and is only known once the next operation has been queued.
+            if len(ops) > 1:
+                is_last = ops[1][0] == self._OP_END
+            elif finishing or op == self._OP_BEGIN:
+                is_last = True
+            else:
+                break
+
+            ops.popleft()
+            if op == self._OP_ELEM:
+                self._write_elem(elem, is_last)
+            elif op == self._OP_BEGIN:
+                self._write_elem_start(elem)
+            else:
+                self._write_elem_end(is_last)
+
+    def _write_elem(self, elem, is_last):
+        f = self._file
+        tell = f.tell
+
+        if len(self._open_elems) == 1:
+            # Root level element.
+            if _write_timedate_hack_elem(elem):
+                self._timedate_ok += 1
+
+        elem._calc_offsets(tell(), is_last)
+        elem._write(f.write, tell, is_last)
+        self._open_elems[-1][3] = True
+
+        # The element's data is no longer needed, release it.
+        elem.props.clear()
+        elem.elems.clear()
+
+    def _write_elem_start(self, elem):
+        assert(not elem._has_pending_arrays())
+        f = self._file
+        write = f.write
+        header_offset = f.tell()
+
+        props_length = 0
+        for data in elem.props:
+            # 1 byte for the prop type
+            props_length += 1 + len(data)
+
+        # The end offset is written once known, by `_write_elem_end`.
+        write(pack(_ELEM_META_FORMAT, 0, len(elem.props), props_length))
+
+        write(bytes((len(elem.id),)))
+        write(elem.id)
+
+        for i, data in enumerate(elem.props):
+            write(bytes((elem.props_type[i],)))
+            write(data)
+
+        self._open_elems.append([elem, header_offset, props_length, False])
+
+    def _write_elem_end(self, is_last):
+        if len(self._open_elems) == 1:
+            raise RuntimeError("end_elem() called without a matching begin_elem()")
+        elem, header_offset, props_length, has_children = self._open_elems.pop()
+        f = self._file
+
+        # Same as `FBXElem._write_children`.
+        if has_children:
+            f.write(_BLOCK_SENTINEL_DATA)
+        elif (not elem.props and not is_last) or elem.id in _ELEMS_ID_ALWAYS_BLOCK_SENTINEL:
+            f.write(_BLOCK_SENTINEL_DATA)
+
+        end_offset = f.tell()
+        f.seek(header_offset)
+        f.write(pack(_ELEM_META_FORMAT, end_offset, len(elem.props), props_length))
+        f.seek(end_offset)
+
+        self._open_elems[-1][3] = True
+        elem.props.clear()
+
+    def _finish(self):
+        self._process_ops(finishing=True)
+        if len(self._open_elems) != 1:
+            raise RuntimeError("begin_elem() called without a matching end_elem()")
+
+        if self._timedate_ok != 2:
+            print("Missing fields!")
 
-        # unknown magic (always the same)
-        write(b'\0' * 120)
-        write(b'\xf8\x5a\x8c\x6a\xde\xf5\xd9\x7e\xec\xe9\x0c\xe3\x75\x8f\x29\x0b')
+        f = self._file
+        # The root element always ends with a block sentinel, see `write`.
+        f.write(_BLOCK_SENTINEL_DATA)
+        _write_footer(f.write, f.tell, self._version)
@@ -3297,28 +3297,42 @@ def fbx_definitions_elements(root, scene_data):
     fbx_templates_generate(definitions, scene_data.templates)
 
 
-def fbx_objects_elements(root, scene_data):
+def fbx_objects_elements(root, scene_data, stream=None):
     """
     Data (objects, geometry, material, textures, armatures, etc.).
+
+    When `stream` is an `encode_bin.FBXStreamWriter`, sub-elements are written to it as soon as they are complete
+    instead of being added to `root`.
     """
     perfmon = PerfMon()
     perfmon.level_up()
-    objects = elem_empty(root, b"Objects")
+    if stream is None:
+        objects = elem_empty(root, b"Objects")
+    else:
+        objects = elem_empty(None, b"Objects")
+        stream.begin_elem(objects)
+
+    def stream_complete_elems():
+        if stream is not None:
+            stream.write_children(objects)
 
     perfmon.step("FBX export fetch empties (%d)..." % len(scene_data.data_empties))
 
     for empty in scene_data.data_empties:
         fbx_data_empty_elements(objects, empty, scene_data)
+        stream_complete_elems()
 
     perfmon.step("FBX export fetch lamps (%d)..." % len(scene_data.data_lights))
 
     for lamp in scene_data.data_lights:
         fbx_data_light_elements(objects, lamp, scene_data)
+        stream_complete_elems()
 
     perfmon.step("FBX export fetch cameras (%d)..." % len(scene_data.data_cameras))
 
     for cam in scene_data.data_cameras:
         fbx_data_camera_elements(objects, cam, scene_data)
+        stream_complete_elems()
 
     perfmon.step("FBX export fetch meshes (%d)..."
                  % len({me_key for me_key, _me, _free in scene_data.data_meshes.values()}))
@@ -3326,6 +3340,7 @@ def fbx_objects_elements(root, scene_data):
     done_meshes = set()
     for me_obj in scene_data.data_meshes:
         fbx_data_mesh_elements(objects, me_obj, scene_data, done_meshes)
+        stream_complete_elems()
     del done_meshes
 
     perfmon.step("FBX export fetch objects (%d)..." % len(scene_data.objects))
@@ -3338,6 +3353,7 @@ def fbx_objects_elements(root, scene_data):
             if dp_obj not in scene_data.objects:
                 continue
             fbx_data_object_elements(objects, dp_obj, scene_data)
+        stream_complete_elems()
 
     perfmon.step("FBX export fetch remaining...")
 
@@ -3345,24 +3361,32 @@ def fbx_objects_elements(root, scene_data):
         if not (ob_obj.is_object and ob_obj.type == 'ARMATURE'):
             continue
         fbx_data_armature_elements(objects, ob_obj, scene_data)
+        stream_complete_elems()
 
     if scene_data.data_leaf_bones:
         fbx_data_leaf_bone_elements(objects, scene_data)
 
     for ma in scene_data.data_materials:
         fbx_data_material_elements(objects, ma, scene_data)
+        stream_complete_elems()
 
     for blender_tex_key in scene_data.data_textures:
         fbx_data_texture_file_elements(objects, blender_tex_key, scene_data)
+        stream_complete_elems()
 
     for vid in scene_data.data_videos:
         fbx_data_video_elements(objects, vid, scene_data)
+        stream_complete_elems()
 
     perfmon.step("FBX export fetch animations...")
     start_time = time.process_time()
 
     fbx_data_animation_elements(objects, scene_data)
 
+    if stream is not None:
+        stream_complete_elems()
+        stream.end_elem()
+
     perfmon.level_down()
 
 
@@ -3514,36 +3538,40 @@ def save_single(operator, scene, depsgraph, filepath="",
     # Generate some data about exported scene...
     scene_data = fbx_data_from_scene(scene, depsgraph, settings)
 
-    # Enable multithreaded array compression in FBXElem and wait until all threads are done before exiting the context
-    # manager.
-    with encode_bin.FBXElem.enable_multithreading_cm():
-        # Writing elements into an FBX hierarchy can now begin.
-        root = elem_empty(None, b"")  # Root element has no id, as it is not saved per se!
+    # Elements are written to file as soon as they are complete, rather than building the whole FBX hierarchy in memory
+    # first. The file is only finalized once the context manager exits.
+    with encode_bin.FBXStreamWriter(filepath, FBX_VERSION) as stream:
+        # Enable multithreaded array compression in FBXElem and wait until all threads are done before exiting the
+        # context manager.
+        with encode_bin.FBXElem.enable_multithreading_cm():
+            # Writing elements into an FBX hierarchy can now begin.
+            root = elem_empty(None, b"")  # Root element has no id, as it is not saved per se!
 
-        # Mostly FBXHeaderExtension and GlobalSettings.
-        fbx_header_elements(root, scene_data)
+            # Mostly FBXHeaderExtension and GlobalSettings.
+            fbx_header_elements(root, scene_data)
 
-        # Documents and References are pretty much void currently.
-        fbx_documents_elements(root, scene_data)
-        fbx_references_elements(root, scene_data)
+            # Documents and References are pretty much void currently.
+            fbx_documents_elements(root, scene_data)
+            fbx_references_elements(root, scene_data)
 
-        # Templates definitions.
-        fbx_definitions_elements(root, scene_data)
+            # Templates definitions.
+            fbx_definitions_elements(root, scene_data)
+            stream.write_children(root)
 
-        # Actual data.
-        fbx_objects_elements(root, scene_data)
+            # Actual data, written to file progressively.
+            fbx_objects_elements(root, scene_data, stream)
 
-        # How data are inter-connected.
-        fbx_connections_elements(root, scene_data)
+            # How data are inter-connected.
+            fbx_connections_elements(root, scene_data)
 
-        # Animation.
-        fbx_takes_elements(root, scene_data)
+            # Animation.
+            fbx_takes_elements(root, scene_data)
+            stream.write_children(root)
 
-        # Cleanup!
-        fbx_scene_data_cleanup(scene_data)
+            # Cleanup!
+            fbx_scene_data_cleanup(scene_data)
 
-    # And we are done, all multithreaded tasks are complete, and we can write the whole thing to file!
-    encode_bin.write(filepath, root, FBX_VERSION)
+        # And we are done, all multithreaded tasks are complete, and the remaining elements can be written to file!
 
     # Clear cached ObjectWrappers!
     ObjectWrapper.cache_clear()
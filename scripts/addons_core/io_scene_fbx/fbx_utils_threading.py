@@ -2,9 +2,13 @@
 #
 # SPDX-License-Identifier: GPL-2.0-or-later
 
-from contextlib import contextmanager, nullcontext
+from collections import deque, namedtuple
+from contextlib import contextmanager, nullcontext, ExitStack
 import os
 from queue import SimpleQueue
+import sys
+from threading import Condition
+import types
 
 # Note: `bpy` cannot be imported here because this module is also used by the fbx2json.py and json2fbx.py scripts.
 
@@ -28,6 +32,41 @@ else:
         # Assume that multithreading is not supported and fall back to single-threaded execution.
         _MULTITHREADING_ENABLED = False
 
+# For debugging/profiling purposes, can be modified at runtime to prevent the use of the process backend.
+_MULTIPROCESSING_ENABLED = _MULTITHREADING_ENABLED
+# Worker processes are always spawned, never forked: forking a process that is running other threads, as Blender does,
+# can deadlock the child process and is not supported on macOS.
+_MULTIPROCESSING_CONTEXT = None
+if _MULTIPROCESSING_ENABLED:
+    try:
+        import multiprocessing
+        from multiprocessing.shared_memory import SharedMemory
+        from concurrent.futures import ProcessPoolExecutor
+        _MULTIPROCESSING_CONTEXT = multiprocessing.get_context("spawn")
+    except (ImportError, ValueError):
+        _MULTIPROCESSING_ENABLED = False
+
+# Backends that `MultiThreadedTaskConsumer.new_cpu_bound_cm` can run tasks with.
+# Run each task immediately on the calling thread.
+BACKEND_INLINE = 'INLINE'
+# Run tasks on separate threads, only useful when the task function releases the GIL. This is the default.
+BACKEND_THREAD = 'THREAD'
+# Run batches of tasks in separate processes, with input and output data passed through shared memory. Starting the
+# processes is expensive, so this backend is only used when requested explicitly (or through BACKEND_AUTO).
+BACKEND_PROCESS = 'PROCESS'
+# Pick one of the above backends from the sizes of the first tasks scheduled, see `TaskBatchPolicy.choose_backend`.
+BACKEND_AUTO = 'AUTO'
+
+# Describes how to run a task in a separate process. All functions must be defined at module level so that they can be
+# pickled.
+# - `split_function(*task_args)` is called on the calling thread and returns a tuple of
+#   `(input_data, output_size, finish_args)`, where `input_data` is a bytes-like object.
+# - `process_function(input_view, output_view)` is called in a worker process with memoryviews of the shared memory
+#   holding the input data and the output buffer of `output_size` bytes, it returns the number of output bytes written.
+# - `finish_function(output_view, *finish_args)` is called on the calling thread with the written part of the output
+#   buffer. `output_view` is only valid during the call, so it must be copied if it needs to be kept.
+ProcessTask = namedtuple("ProcessTask", ("split_function", "process_function", "finish_function"))
+
 
 def get_cpu_count():
     """Get the number of cpus assigned to the current process if that information is available on this system.
@@ -41,6 +80,125 @@ def get_cpu_count():
     return count if count is not None else 1
 
 
+def task_size_histogram(task_sizes):
+    """Return a list of the number of tasks in each power of two bucket of size, bucket `i` counting the tasks with sizes
+    in the range `[2**(i-1), 2**i)` (bucket 0 counting tasks of size zero)."""
+    histogram = []
+    for size in task_sizes:
+        bucket = size.bit_length()
+        if bucket >= len(histogram):
+            histogram.extend([0] * (bucket + 1 - len(histogram)))
+        histogram[bucket] += 1
+    return histogram
+
+
+class TaskBatchPolicy:
+    """Policy for grouping small tasks into batches, so that the per-task overhead of the backend is paid once per
+    batch, and for picking a backend automatically.
+
+    `size_function(*task_args)` must return an estimate of the amount of work of a task, typically its size in bytes.
+    Tasks smaller than `small_task_size` are grouped together until the batch reaches `max_batch_size`, larger tasks are
+    scheduled on their own."""
+    __slots__ = ("size_function", "small_task_size", "max_batch_size", "sample_count", "sample_size")
+
+    def __init__(self, size_function, small_task_size=16 * 1024, max_batch_size=256 * 1024, sample_count=256,
+                 sample_size=1024 * 1024):
+        self.size_function = size_function
+        self.small_task_size = small_task_size
+        self.max_batch_size = max_batch_size
+        # BACKEND_AUTO picks a backend once this many tasks have been sampled, or once the total size of the sampled
+        # tasks reaches `sample_size`, whichever comes first.
+        self.sample_count = sample_count
+        self.sample_size = sample_size
+
+    def choose_backend(self, task_sizes, can_use_processes):
+        """Pick a backend from the histogram of `task_sizes`, the sizes of the first tasks to be scheduled.
+
+        - When most tasks are small, Python overhead, which does not run in parallel on threads, dominates the time
+          spent in each task, so separate processes are used if possible.
+        - Otherwise, threads are used since the task functions are expected to release the GIL for larger tasks."""
+        histogram = task_size_histogram(task_sizes)
+        # All the tasks in buckets below this index are smaller than `small_task_size`.
+        small_bucket_end = self.small_task_size.bit_length()
+        num_small_tasks = sum(histogram[:small_bucket_end])
+
+        if can_use_processes and num_small_tasks * 4 >= len(task_sizes) * 3:
+            return BACKEND_PROCESS
+        return BACKEND_THREAD
+
+
+class _TaskBatcher:
+    """Groups small tasks into batches according to a TaskBatchPolicy before passing them to `schedule_batch_function`.
+    """
+    __slots__ = ("_schedule_batch_function", "_size_function", "_small_task_size", "_max_batch_size", "_batch",
+                 "_batch_size")
+
+    def __init__(self, schedule_batch_function, batch_policy):
+        self._schedule_batch_function = schedule_batch_function
+        self._size_function = batch_policy.size_function
+        self._small_task_size = batch_policy.small_task_size
+        self._max_batch_size = batch_policy.max_batch_size
+        self._batch = []
+        self._batch_size = 0
+
+    def schedule(self, *args):
+        size = self._size_function(*args)
+        if size >= self._small_task_size:
+            # Large tasks are scheduled on their own.
+            self._schedule_batch_function([args])
+            return
+        self._batch.append(args)
+        self._batch_size += size
+        if self._batch_size >= self._max_batch_size:
+            self.flush()
+
+    def flush(self):
+        if self._batch:
+            self._schedule_batch_function(self._batch)
+            self._batch = []
+            self._batch_size = 0
+
+
+@contextmanager
+def _batching_cm(schedule_batch_cm, batch_policy):
+    """Wrap a context manager that returns a function scheduling a list of task arguments and a wait function, such that
+    it instead returns a function scheduling a single task, grouping tasks into batches according to `batch_policy`."""
+    with schedule_batch_cm as (schedule_batch_function, wait_function):
+        batcher = _TaskBatcher(schedule_batch_function, batch_policy)
+
+        def wait_batched(predicate):
+            if not predicate():
+                # The tasks being waited for may be in the last, partially filled, batch.
+                batcher.flush()
+                wait_function(predicate)
+
+        yield batcher.schedule, wait_batched
+        # Only reached when no exception occurred, in which case the last, partially filled, batch must be scheduled
+        # before the wrapped context manager waits for all tasks to complete.
+        batcher.flush()
+
+
+@contextmanager
+def _without_wait_function_cm(schedule_cm):
+    """Wrap a context manager that returns a scheduling function and a wait function, to only return the former."""
+    with schedule_cm as (schedule_function, _wait_function):
+        yield schedule_function
+
+
+def _wait_inline(predicate):
+    """The wait function of tasks run immediately on the calling thread, which have always completed already."""
+    if not predicate():
+        raise RuntimeError("Waiting for tasks that were never scheduled")
+
+
+def _batch_consumer_function(consumer_function):
+    """Return a function that calls `consumer_function` for each task arguments in a batch."""
+    def consume_batch(batch):
+        for args in batch:
+            consumer_function(*args)
+    return consume_batch
+
+
 class MultiThreadedTaskConsumer:
     """Helper class that encapsulates everything needed to run a function on separate threads, with a single-threaded
     fallback if multithreading is not available.
@@ -55,7 +213,7 @@ class MultiThreadedTaskConsumer:
     _SHUT_DOWN_THREADS = object()
 
     __slots__ = ("_consumer_function", "_shared_task_queue", "_task_consumer_futures", "_executor",
-                 "_max_consumer_threads", "_shutting_down", "_max_queue_per_consumer")
+                 "_max_consumer_threads", "_shutting_down", "_max_queue_per_consumer", "_task_done_condition")
 
     def __init__(self, consumer_function, max_consumer_threads, max_queue_per_consumer=5):
         # It's recommended to use MultiThreadedTaskConsumer.new_cpu_bound_cm() instead of creating new instances
@@ -81,9 +239,12 @@ class MultiThreadedTaskConsumer:
         # When shutting down the threads, this is set to True as an extra safeguard to prevent new tasks being
         # scheduled.
         self._shutting_down = False
+        # Notified by the consumer threads whenever a task completes, for `_wait`.
+        self._task_done_condition = Condition()
 
     @classmethod
-    def new_cpu_bound_cm(cls, consumer_function, other_cpu_bound_threads_in_use=1, hard_max_threads=32):
+    def new_cpu_bound_cm(cls, consumer_function, other_cpu_bound_threads_in_use=1, hard_max_threads=32,
+                         backend=BACKEND_THREAD, process_task=None, batch_policy=None, with_wait_function=False):
         """Return a context manager that, when entered, returns a wrapper around `consumer_function` that schedules
         `consumer_function` to be run on a separate thread.
 
@@ -106,14 +267,59 @@ class MultiThreadedTaskConsumer:
         Most IO-bound tasks can probably use a ThreadPoolExecutor directly instead because there will typically be fewer
         tasks and, on average, each individual task will take longer.
         If needed, `cls.new_cpu_bound_cm(consumer_function, -4)` could be suitable for lots of small IO-bound tasks,
-        because it ensures a minimum of 5 threads, like the default ThreadPoolExecutor."""
-        if _MULTITHREADING_ENABLED:
+        because it ensures a minimum of 5 threads, like the default ThreadPoolExecutor.
+
+        `backend` selects how tasks are run, one of the BACKEND_* values:
+        - BACKEND_THREAD, the default, runs tasks on separate threads as described above.
+        - BACKEND_PROCESS runs tasks in spawned worker processes through `process_task`, a ProcessTask describing how to
+          split each task into work done in a worker process and work done on the calling thread. The maximum number of
+          processes is determined in the same way as the maximum number of threads. Falls back to BACKEND_THREAD when
+          `process_task` is None or processes are not available on the current system.
+        - BACKEND_INLINE runs tasks immediately on the calling thread.
+        - BACKEND_AUTO runs tasks immediately on the calling thread while sampling their sizes, until
+          `batch_policy.sample_count` tasks have been scheduled or their total size reaches `batch_policy.sample_size`.
+          The remaining tasks are run by the backend picked by `batch_policy.choose_backend`, which may be
+          BACKEND_PROCESS when `process_task` is given.
+
+        When `batch_policy` is a TaskBatchPolicy, small tasks are grouped into batches which are each run as a single
+        task by the thread and process backends. `batch_policy` is required by BACKEND_AUTO.
+
+        When `with_wait_function` is True, the context manager instead returns a tuple of the wrapper and a
+        `wait(predicate)` function, which blocks until `predicate()` returns True, checking it again as scheduled tasks
+        complete, and raises the exception of a failed task. `predicate` must become True once some of the tasks
+        scheduled so far have completed, such as when waiting for the results of specific tasks."""
+        schedule_cm = cls._new_cpu_bound_cm(consumer_function, other_cpu_bound_threads_in_use, hard_max_threads,
+                                            backend, process_task, batch_policy)
+        if with_wait_function:
+            return schedule_cm
+        return _without_wait_function_cm(schedule_cm)
+
+    @classmethod
+    def _new_cpu_bound_cm(cls, consumer_function, other_cpu_bound_threads_in_use, hard_max_threads, backend,
+                          process_task, batch_policy):
+        """Implementation of `new_cpu_bound_cm`, always returning a context manager that returns a tuple of the wrapper
+        and the wait function."""
+        if backend == BACKEND_AUTO:
+            assert(batch_policy is not None)
+            return _AutoBackendTaskScheduler(cls, consumer_function, other_cpu_bound_threads_in_use, hard_max_threads,
+                                             process_task, batch_policy)._wrap_cm()
+
+        if backend in {BACKEND_THREAD, BACKEND_PROCESS} and _MULTITHREADING_ENABLED:
             max_threads = get_cpu_count() - other_cpu_bound_threads_in_use
             max_threads = min(max_threads, hard_max_threads)
             if max_threads > 0:
-                return cls(consumer_function, max_threads)._wrap_executor_cm()
+                if backend == BACKEND_PROCESS and process_task is not None and _MULTIPROCESSING_ENABLED:
+                    # The process backend always consumes batches, even if they only contain a single task.
+                    batch_cm = MultiProcessTaskConsumer(process_task, max_threads)._wrap_executor_cm()
+                    if batch_policy is None:
+                        return _batching_cm(batch_cm, TaskBatchPolicy(lambda *_args: 0, small_task_size=0))
+                    return _batching_cm(batch_cm, batch_policy)
+                if batch_policy is None:
+                    return cls(consumer_function, max_threads)._wrap_executor_cm()
+                batch_cm = cls(_batch_consumer_function(consumer_function), max_threads)._wrap_executor_cm()
+                return _batching_cm(batch_cm, batch_policy)
         # Fall back to single-threaded.
-        return nullcontext(consumer_function)
+        return nullcontext((consumer_function, _wait_inline))
 
     def _task_consumer_callable(self):
         """Callable that is run by each task consumer thread.
@@ -129,11 +335,15 @@ class MultiThreadedTaskConsumer:
                 else:
                     # Call the task consumer function.
                     self._consumer_function(*task_args)
+                    with self._task_done_condition:
+                        self._task_done_condition.notify_all()
         finally:
             # Either the thread has been told to shut down because it received _SHUT_DOWN_THREADS or an exception has
             # occurred.
             # Add _SHUT_DOWN_THREADS to the queue so that the other consumer threads will also shut down.
             self._shared_task_queue.put(self._SHUT_DOWN_THREADS)
+            with self._task_done_condition:
+                self._task_done_condition.notify_all()
 
     def _schedule_task(self, *args):
         """Task consumer threads are only started as tasks are added.
@@ -165,16 +375,29 @@ class MultiThreadedTaskConsumer:
                 # Add a new consumer thread because the queue has grown too large.
                 self._task_consumer_futures.append(self._executor.submit(self._task_consumer_callable))
 
+    def _wait(self, predicate):
+        """Block until `predicate()` returns True, checking it again whenever a task completes.
+        Raises the exception of a task consumer thread that stopped because of an exception."""
+        task_done_condition = self._task_done_condition
+        with task_done_condition:
+            while not predicate():
+                for future in self._task_consumer_futures:
+                    if future.done() and future.exception() is not None:
+                        raise future.exception()
+                # A thread stopping with an exception notifies the condition before its future is done, so don't wait
+                # indefinitely.
+                task_done_condition.wait(0.1)
+
     @contextmanager
     def _wrap_executor_cm(self):
-        """Wrap the executor's context manager to instead return self._schedule_task and such that the threads
-        automatically start shutting down before the executor itself starts shutting down."""
+        """Wrap the executor's context manager to instead return self._schedule_task and self._wait, and such that the
+        threads automatically start shutting down before the executor itself starts shutting down."""
         # .__enter__()
         # Exiting the context manager of the executor will wait for all threads to finish and prevent new
         # threads from being created, as if its shutdown() method had been called.
         with self._executor:
             try:
-                yield self._schedule_task
+                yield self._schedule_task, self._wait
             finally:
                 # .__exit__()
                 self._shutting_down = True
@@ -192,3 +415,261 @@ class MultiThreadedTaskConsumer:
                         # If one of the threads raised an exception, propagate it to the main thread.
                         # Only the first exception will be propagated if there were multiple.
                         raise ex
+
+
+# Run by each worker process before any task, with the arguments from `_worker_process_initargs`.
+_WORKER_PROCESS_INIT_CODE = """
+import sys
+import types
+for i in range(1, len(package_names) + 1):
+    name = ".".join(package_names[:i])
+    if name not in sys.modules:
+        module = types.ModuleType(name)
+        # Parent packages, such as those of extensions, only need to exist.
+        module.__path__ = [package_dir] if i == len(package_names) else []
+        sys.modules[name] = module
+"""
+
+# Replaces the `__main__` module while worker processes may be started, see `_worker_process_main_module_cm`.
+_WORKER_PROCESS_MAIN_MODULE = types.ModuleType("__main__")
+
+
+def _worker_process_initargs():
+    """Return the `initializer` and `initargs` arguments of the ProcessPoolExecutor, preparing spawned worker processes
+    to import the modules of this package.
+
+    A spawned worker is a plain Python interpreter, which imports the modules of the functions it is given to run. The
+    `__init__.py` of the add-on imports `bpy`, which is not available there, so the package is instead registered in the
+    worker as an empty module that only knows where to find its submodules."""
+    if not __package__:
+        # Imported as a top-level module, such as by the fbx2json.py script, `sys.path` is enough to find the modules.
+        return None, ()
+    init_globals = {"package_names": __package__.split("."), "package_dir": os.path.dirname(os.path.abspath(__file__))}
+    return exec, (_WORKER_PROCESS_INIT_CODE, init_globals)
+
+
+@contextmanager
+def _worker_process_main_module_cm():
+    """Spawned worker processes import the `__main__` module of the current process when they start, which, for scripts
+    run by Blender, imports `bpy`. Hide it while worker processes may be started."""
+    main_module = sys.modules.get("__main__")
+    sys.modules["__main__"] = _WORKER_PROCESS_MAIN_MODULE
+    try:
+        yield
+    finally:
+        if main_module is None:
+            del sys.modules["__main__"]
+        else:
+            sys.modules["__main__"] = main_module
+
+
+def _process_shared_memory_batch(process_function, shared_memory_name, layout):
+    """Run `process_function` for each task in a batch. This is run in a worker process.
+
+    `layout` contains an `(input_offset, input_size, output_offset, output_size)` tuple for each task, locating its
+    input data and output buffer within the shared memory.
+
+    Returns the number of bytes written to the output buffer of each task."""
+    # Note: Spawned workers share the resource tracker of the process that created the shared memory, so attaching to
+    # the shared memory here only registers it again with the same tracker, and it is unregistered once it is unlinked.
+    shared_memory = SharedMemory(name=shared_memory_name)
+    try:
+        buf = shared_memory.buf
+        output_sizes = []
+        for input_offset, input_size, output_offset, output_size in layout:
+            # The views must be released before the shared memory can be closed.
+            with buf[input_offset:input_offset + input_size] as input_view:
+                with buf[output_offset:output_offset + output_size] as output_view:
+                    output_sizes.append(process_function(input_view, output_view))
+        del buf
+    finally:
+        shared_memory.close()
+    return output_sizes
+
+
+def _destroy_shared_memory(shared_memory):
+    shared_memory.close()
+    shared_memory.unlink()
+
+
+class MultiProcessTaskConsumer:
+    """Helper class that encapsulates everything needed to run batches of tasks in separate processes, see
+    `MultiThreadedTaskConsumer.new_cpu_bound_cm` with `backend=BACKEND_PROCESS`.
+
+    The input data of each batch is copied into a block of shared memory, along with space for the output of each task,
+    so only the layout of the block needs to be sent to the worker process and nothing but the size of each output needs
+    to be sent back. Blocks are reused by later batches once a batch has been finished.
+
+    Unlike threads, processes are not limited by Python's Global Interpreter Lock, so are useful for many small tasks
+    where the Python overhead of each task is significant compared to the time spent with the GIL released."""
+    __slots__ = ("_process_task", "_executor", "_pending_batches", "_max_pending_batches", "_free_shared_memory")
+
+    def __init__(self, process_task, max_consumer_processes):
+        # It's recommended to use MultiThreadedTaskConsumer.new_cpu_bound_cm() instead of creating new instances
+        # directly.
+        # __init__ should only be called after checking _MULTIPROCESSING_ENABLED.
+        assert(_MULTIPROCESSING_ENABLED)
+        self._process_task = process_task
+        initializer, initargs = _worker_process_initargs()
+        self._executor = ProcessPoolExecutor(max_workers=max_consumer_processes, mp_context=_MULTIPROCESSING_CONTEXT,
+                                             initializer=initializer, initargs=initargs)
+        # (future, shared_memory, layout, finish_args_list) of each batch that has not been finished yet, oldest first.
+        self._pending_batches = deque()
+        # Limits the amount of shared memory in use at once, by waiting for the oldest batch to complete.
+        self._max_pending_batches = max_consumer_processes * 2
+        # Blocks of shared memory of finished batches, smallest first.
+        self._free_shared_memory = []
+
+    def _acquire_shared_memory(self, size):
+        """Return a block of shared memory of at least `size` bytes, reusing a free block when possible."""
+        free_shared_memory = self._free_shared_memory
+        for i, shared_memory in enumerate(free_shared_memory):
+            if shared_memory.size >= size:
+                del free_shared_memory[i]
+                return shared_memory
+        if free_shared_memory:
+            # Replace the largest free block, which is too small, so that the number of blocks stays bounded.
+            _destroy_shared_memory(free_shared_memory.pop())
+        # Round up to a power of two, so that a block is likely to fit the following batches.
+        return SharedMemory(create=True, size=1 << max(size - 1, 0).bit_length())
+
+    def _release_shared_memory(self, shared_memory):
+        free_shared_memory = self._free_shared_memory
+        free_shared_memory.append(shared_memory)
+        free_shared_memory.sort(key=lambda shared_memory: shared_memory.size)
+
+    def _schedule_batch(self, batch):
+        split_function = self._process_task.split_function
+        layout = []
+        finish_args_list = []
+        input_data_list = []
+        total_size = 0
+        for args in batch:
+            input_data, output_size, finish_args = split_function(*args)
+            input_size = len(input_data)
+            layout.append((total_size, input_size, total_size + input_size, output_size))
+            input_data_list.append(input_data)
+            finish_args_list.append(finish_args)
+            total_size += input_size + output_size
+
+        shared_memory = self._acquire_shared_memory(total_size)
+        try:
+            buf = shared_memory.buf
+            for (input_offset, input_size, _output_offset, _output_size), input_data in zip(layout, input_data_list):
+                buf[input_offset:input_offset + input_size] = input_data
+            del buf
+            with _worker_process_main_module_cm():
+                future = self._executor.submit(_process_shared_memory_batch, self._process_task.process_function,
+                                               shared_memory.name, layout)
+        except BaseException:
+            _destroy_shared_memory(shared_memory)
+            raise
+        self._pending_batches.append((future, shared_memory, layout, finish_args_list))
+
+        # Finish batches that have already completed, and wait for the oldest batches to complete if too many are in
+        # progress.
+        pending_batches = self._pending_batches
+        while pending_batches and (len(pending_batches) > self._max_pending_batches or pending_batches[0][0].done()):
+            self._finish_batch(*pending_batches.popleft())
+
+    def _finish_batch(self, future, shared_memory, layout, finish_args_list):
+        try:
+            # Waits for the batch to complete and propagates any exception raised by the worker process.
+            output_sizes = future.result()
+            finish_function = self._process_task.finish_function
+            buf = shared_memory.buf
+            for (_input_offset, _input_size, output_offset, _output_size), output_size, finish_args in zip(
+                    layout, output_sizes, finish_args_list):
+                with buf[output_offset:output_offset + output_size] as output_view:
+                    finish_function(output_view, *finish_args)
+            del buf
+        except BaseException:
+            _destroy_shared_memory(shared_memory)
+            raise
+        self._release_shared_memory(shared_memory)
+
+    def _wait(self, predicate):
+        """Finish the oldest batches until `predicate()` returns True."""
+        pending_batches = self._pending_batches
+        while not predicate():
+            if not pending_batches:
+                raise RuntimeError("Waiting for tasks that were never scheduled")
+            self._finish_batch(*pending_batches.popleft())
+
+    @contextmanager
+    def _wrap_executor_cm(self):
+        """Wrap the executor's context manager to instead return self._schedule_batch and self._wait, and such that all
+        batches are finished before the executor shuts down."""
+        try:
+            with self._executor:
+                try:
+                    yield self._schedule_batch, self._wait
+                    while self._pending_batches:
+                        self._finish_batch(*self._pending_batches.popleft())
+                finally:
+                    # Only reached with pending batches if an exception occurred, in which case the remaining batches
+                    # are discarded.
+                    while self._pending_batches:
+                        future, shared_memory, _layout, _finish_args_list = self._pending_batches.popleft()
+                        future.cancel()
+                        self._release_shared_memory(shared_memory)
+        finally:
+            # The executor has shut down, so no worker process is using the shared memory anymore.
+            while self._free_shared_memory:
+                _destroy_shared_memory(self._free_shared_memory.pop())
+
+
+class _AutoBackendTaskScheduler:
+    """Runs the first tasks scheduled with BACKEND_AUTO on the calling thread, while sampling their sizes, until there
+    are enough to pick a backend for the remaining tasks."""
+    __slots__ = ("_consumer_function", "_new_backend_cm", "_batch_policy", "_can_use_processes", "_exit_stack",
+                 "_schedule_function", "_wait_function", "_sampled_task_sizes", "_sampled_size")
+
+    def __init__(self, consumer_cls, consumer_function, other_cpu_bound_threads_in_use, hard_max_threads, process_task,
+                 batch_policy):
+        def new_backend_cm(backend):
+            return consumer_cls._new_cpu_bound_cm(consumer_function, other_cpu_bound_threads_in_use, hard_max_threads,
+                                                  backend, process_task, batch_policy)
+        self._consumer_function = consumer_function
+        self._new_backend_cm = new_backend_cm
+        self._batch_policy = batch_policy
+        self._can_use_processes = process_task is not None and _MULTIPROCESSING_ENABLED
+        self._exit_stack = None
+        self._schedule_function = None
+        self._wait_function = None
+        self._sampled_task_sizes = []
+        self._sampled_size = 0
+
+    def _start_backend(self):
+        backend = self._batch_policy.choose_backend(self._sampled_task_sizes, self._can_use_processes)
+        self._schedule_function, self._wait_function = self._exit_stack.enter_context(self._new_backend_cm(backend))
+        self._sampled_task_sizes.clear()
+
+    def _schedule_task(self, *args):
+        schedule_function = self._schedule_function
+        if schedule_function is not None:
+            schedule_function(*args)
+            return
+        batch_policy = self._batch_policy
+        size = batch_policy.size_function(*args)
+        self._sampled_task_sizes.append(size)
+        self._sampled_size += size
+        # Sampled tasks are not held back, so that they don't wait for the backend to be picked.
+        self._consumer_function(*args)
+        if len(self._sampled_task_sizes) >= batch_policy.sample_count or self._sampled_size >= batch_policy.sample_size:
+            self._start_backend()
+
+    def _wait(self, predicate):
+        wait_function = self._wait_function
+        if wait_function is not None:
+            wait_function(predicate)
+        else:
+            # Sampled tasks have all been run already.
+            _wait_inline(predicate)
+
+    @contextmanager
+    def _wrap_cm(self):
+        # When fewer tasks than needed to pick a backend are scheduled, they have all been run already.
+        with ExitStack() as exit_stack:
+            self._exit_stack = exit_stack
+            yield self._schedule_task, self._wait
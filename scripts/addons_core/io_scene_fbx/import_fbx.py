@@ -180,8 +180,8 @@ def elem_props_find_first(elem, elem_prop_id):
         # When properties are not found... Should never happen, but happens - as usual.
         return None
     # support for templates (tuple of elems)
-    if type(elem) is not FBXElem:
-        assert(type(elem) is tuple)
+    # Note: elements may be `FBXElem` or `FBXElemLazy`, neither of which are exactly `tuple`.
+    if type(elem) is tuple:
         for e in elem:
             result = elem_props_find_first(e, elem_prop_id)
             if result is not None:
@@ -3041,7 +3041,8 @@ def load(operator, context, filepath="",
          primary_bone_axis='Y',
          secondary_bone_axis='X',
          use_prepost_rot=True,
-         colors_type='SRGB'):
+         colors_type='SRGB',
+         use_mmap=False):
 
     global fbx_elem_nil
     fbx_elem_nil = FBXElem('', (), (), ())
@@ -3081,7 +3082,8 @@ def load(operator, context, filepath="",
     # End ascii detection.
 
     try:
-        elem_root, version = parse_fbx.parse(filepath)
+        # With `use_mmap`, elements are only decoded as the importer accesses them, reducing peak memory usage.
+        elem_root, version = parse_fbx.parse(filepath, use_mmap=use_mmap)
     except Exception as e:
         import traceback
         traceback.print_exc()
@@ -3301,19 +3303,21 @@ def load(operator, context, filepath="",
         fbx_tmpl_tex = fbx_template_get((b'Texture', b'KFbxFileTexture'))
         fbx_tmpl_img = fbx_template_get((b'Video', b'KFbxVideo'))
 
-        # Important to run all 'Video' ones first, embedded images are stored in those nodes.
-        # XXX Note we simplify things here, assuming both matching Video and Texture will use same file path,
-        #     this may be a bit weak, if issue arise we'll fallback to plain connection stuff...
-        for fbx_uuid, fbx_item in fbx_table_nodes.items():
-            fbx_obj, blen_data = fbx_item
-            if fbx_obj.id != b'Video':
-                continue
-            fbx_item[1] = blen_read_texture_image(fbx_tmpl_img, fbx_obj, basedir, settings)
-        for fbx_uuid, fbx_item in fbx_table_nodes.items():
-            fbx_obj, blen_data = fbx_item
-            if fbx_obj.id != b'Texture':
-                continue
-            fbx_item[1] = blen_read_texture_image(fbx_tmpl_tex, fbx_obj, basedir, settings)
+        # Share directory listings between all image lookups, searching for images is slow otherwise.
+        with bpy.path.directory_index_session():
+            # Important to run all 'Video' ones first, embedded images are stored in those nodes.
+            # XXX Note we simplify things here, assuming both matching Video and Texture will use same file path,
+            #     this may be a bit weak, if issue arise we'll fallback to plain connection stuff...
+            for fbx_uuid, fbx_item in fbx_table_nodes.items():
+                fbx_obj, blen_data = fbx_item
+                if fbx_obj.id != b'Video':
+                    continue
+                fbx_item[1] = blen_read_texture_image(fbx_tmpl_img, fbx_obj, basedir, settings)
+            for fbx_uuid, fbx_item in fbx_table_nodes.items():
+                fbx_obj, blen_data = fbx_item
+                if fbx_obj.id != b'Texture':
+                    continue
+                fbx_item[1] = blen_read_texture_image(fbx_tmpl_tex, fbx_obj, basedir, settings)
     _()
     del _
 
@@ -8,15 +8,22 @@ __all__ = (
     "data_types",
     "parse_version",
     "FBXElem",
+    "FBXElemLazy",
 )
 
-from struct import unpack
+from struct import unpack, unpack_from
 import array
+import mmap
 import zlib
 from io import BytesIO
 
 from . import data_types
-from .fbx_utils_threading import MultiThreadedTaskConsumer
+from .fbx_utils_threading import (
+    MultiThreadedTaskConsumer,
+    ProcessTask,
+    TaskBatchPolicy,
+    BACKEND_THREAD,
+)
 
 # at the end of each nested block, there is a NUL record to indicate
 # that the sub-scope exists (i.e. to distinguish between P: and P : {})
@@ -66,7 +73,10 @@ def _create_array(data, length, array_type, array_stride, array_byteswap):
     # FBX file.
     assert(length * array_stride == len(data))
 
-    data_array = array.array(array_type, data)
+    # `data` may be any bytes-like object, `array.array(array_type, data)` would iterate a memoryview instead of reading
+    # its bytes.
+    data_array = array.array(array_type)
+    data_array.frombytes(data)
     if array_byteswap and _IS_BIG_ENDIAN:
         data_array.byteswap()
     return data_array
@@ -86,6 +96,34 @@ def _decompress_and_insert_array(elem_props_data, index_to_set, compressed_array
     elem_props_data[index_to_set] = _create_array(data, length, array_type, array_stride, array_byteswap)
 
 
+def _decompress_array_task_size(_elem_props_data, _index_to_set, compressed_array_args):
+    """The size of a decompression task, used to group small arrays into batches."""
+    _compressed_data, length, _array_type, array_stride, _array_byteswap = compressed_array_args
+    return length * array_stride
+
+
+# The equivalent of `_decompress_and_insert_array` for the process backend, where decompression is done in a separate
+# process and the array is created and inserted on the main thread.
+def _decompress_array_split(elem_props_data, index_to_set, compressed_array_args):
+    compressed_data, length, array_type, array_stride, array_byteswap = compressed_array_args
+    finish_args = (elem_props_data, index_to_set, length, array_type, array_stride, array_byteswap)
+    return compressed_data, length * array_stride, finish_args
+
+
+def _decompress_array_process(compressed_data, output_view):
+    data = zlib.decompress(compressed_data, bufsize=len(output_view))
+    output_view[:len(data)] = data
+    return len(data)
+
+
+def _decompress_array_finish(data, elem_props_data, index_to_set, length, array_type, array_stride, array_byteswap):
+    elem_props_data[index_to_set] = _create_array(data, length, array_type, array_stride, array_byteswap)
+
+
+_DECOMPRESS_ARRAY_PROCESS_TASK = ProcessTask(_decompress_array_split, _decompress_array_process,
+                                             _decompress_array_finish)
+
+
 def unpack_array(read, array_type, array_stride, array_byteswap):
     """Unpack an array from an FBX file being parsed.
 
@@ -236,6 +274,247 @@ def read_elem(read, tell, use_namedtuple, decompress_array_func, tell_file_offse
     return FBXElem(*args) if use_namedtuple else args
 
 
+# ----------------------------------------------------------------------------
+# Lazy, Memory-Mapped Parsing
+#
+# Instead of building the whole tree up-front, the file is memory-mapped and only the header of each element (its id
+# and the offsets of its properties and children) is read when the element is first reached. Properties, including
+# (compressed) arrays, are only decoded once `props` is accessed, and children are only walked once `elems` is
+# accessed, so parts of the file the importer never looks at are never decoded, nor even paged into memory.
+
+# Size in bytes of each scalar property type, used to skip over properties without decoding them.
+_lazy_data_size_dict = {
+    b'Z'[0]: 1,  # byte
+    b'Y'[0]: 2,  # 16 bit int
+    b'B'[0]: 1,  # 1 bit bool (yes/no)
+    b'C'[0]: 1,  # char
+    b'I'[0]: 4,  # 32 bit int
+    b'F'[0]: 4,  # 32 bit float
+    b'D'[0]: 8,  # 64 bit float
+    b'L'[0]: 8,  # 64 bit int
+}
+
+_lazy_data_format_dict = {
+    b'Z'[0]: b'<b',  # byte
+    b'Y'[0]: b'<h',  # 16 bit int
+    b'B'[0]: b'?',   # 1 bit bool (yes/no)
+    b'C'[0]: b'<c',  # char
+    b'I'[0]: b'<i',  # 32 bit int
+    b'F'[0]: b'<f',  # 32 bit float
+    b'D'[0]: b'<d',  # 64 bit float
+    b'L'[0]: b'<q',  # 64 bit int
+}
+
+# (array_type, array_stride, array_byteswap) for each array property type.
+_lazy_array_params_dict = {
+    b'b'[0]: (data_types.ARRAY_BOOL, 1, False),     # bool
+    b'c'[0]: (data_types.ARRAY_BYTE, 1, False),     # ubyte
+    b'i'[0]: (data_types.ARRAY_INT32, 4, True),     # int
+    b'l'[0]: (data_types.ARRAY_INT64, 8, True),     # long
+    b'f'[0]: (data_types.ARRAY_FLOAT32, 4, False),  # float
+    b'd'[0]: (data_types.ARRAY_FLOAT64, 8, False),  # double
+}
+
+
+class _FBXLazyFile:
+    """A memory-mapped FBX file, shared by all the FBXElemLazy elements read from it.
+
+    The mapping is closed once the last element referencing it is freed, or explicitly with close()."""
+    __slots__ = ("data", "_mmap", "elem_start_format", "elem_start_size", "sentinel_length", "sentinel_data")
+
+    def __init__(self, fn, fbx_version):
+        with open(fn, 'rb') as f:
+            # The mapping keeps its own handle to the file, so the file itself does not need to be kept open.
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        # Slicing a memoryview does not copy, unlike slicing the mmap itself.
+        self.data = memoryview(self._mmap)
+
+        # Same as `init_version`, but stored per-file rather than globally.
+        if fbx_version < 7500:
+            self.elem_start_format = b'<IIIB'
+            self.elem_start_size = 13
+        else:
+            self.elem_start_format = b'<QQQB'
+            self.elem_start_size = 25
+        self.sentinel_length = self.elem_start_size
+        self.sentinel_data = b'\0' * self.sentinel_length
+
+    def close(self):
+        self.data.release()
+        self._mmap.close()
+
+
+def _lazy_read_array(data, offset, array_type, array_stride, array_byteswap):
+    """Decode an array property starting at `offset` (just after its type byte), decompressing it if needed."""
+    length, encoding, comp_len = unpack_from(b'<III', data, offset)
+    offset += 12
+    array_data = data[offset:offset + comp_len]
+
+    if encoding == 1:
+        array_data = zlib.decompress(array_data, bufsize=length * array_stride)
+
+    # If size of the data does not match the expected size of the array, then something is wrong with the code or the
+    # FBX file.
+    assert(length * array_stride == len(array_data))
+
+    # `array.array(array_type, memoryview)` would iterate the memoryview, so use `frombytes` which accepts any buffer.
+    data_array = array.array(array_type)
+    data_array.frombytes(array_data)
+    if array_byteswap and _IS_BIG_ENDIAN:
+        data_array.byteswap()
+    return data_array
+
+
+class FBXElemLazy:
+    """An element of a memory-mapped FBX file with the same API as `FBXElem`.
+
+    Only the element's id and offsets are read on creation, `props`, `props_type` and `elems` are decoded from the
+    mapped file on first access and then kept."""
+    __slots__ = (
+        "id",
+        "_file",
+        "_props_offset",  # byte offset to the first property.
+        "_prop_count",
+        "_elems_offset",  # byte offset to the first child element (the end of the properties).
+        "_end_offset",  # byte offset to the end of the element, including its children.
+        "_props",
+        "_props_type",
+        "_elems",
+    )
+
+    # Allow `FBXElemLazy` to be used in place of the `FBXElem` namedtuple, including unpacking.
+    _fields = FBXElem._fields
+
+    def __init__(self, lazy_file, offset):
+        data = lazy_file.data
+        end_offset, prop_count, prop_length, elem_id_size = unpack_from(lazy_file.elem_start_format, data, offset)
+        offset += lazy_file.elem_start_size
+
+        self.id = bytes(data[offset:offset + elem_id_size])
+        self._file = lazy_file
+        self._props_offset = offset + elem_id_size
+        self._prop_count = prop_count
+        self._elems_offset = self._props_offset + prop_length
+        self._end_offset = end_offset
+        self._props = None
+        self._props_type = None
+        self._elems = None
+
+    def __repr__(self):
+        return "FBXElemLazy(id=%r, props=<%d>, end_offset=%d)" % (self.id, self._prop_count, self._end_offset)
+
+    def __len__(self):
+        return 4
+
+    def __iter__(self):
+        yield self.id
+        yield self.props
+        yield self.props_type
+        yield self.elems
+
+    def __getitem__(self, index):
+        return (self.id, self.props, self.props_type, self.elems)[index]
+
+    @property
+    def props_type(self):
+        props_type = self._props_type
+        if props_type is None:
+            # The types can be gathered by skipping over the property data, without decoding any of it.
+            data = self._file.data
+            props_type = bytearray(self._prop_count)
+            offset = self._props_offset
+            for i in range(self._prop_count):
+                data_type = data[offset]
+                offset += 1
+                if data_type in _lazy_array_params_dict:
+                    # Skip the array length and encoding, then the (compressed) array data.
+                    offset += 12 + unpack_from(b'<I', data, offset + 8)[0]
+                elif data_type in _lazy_data_size_dict:
+                    offset += _lazy_data_size_dict[data_type]
+                else:
+                    # Binary or string data, prefixed by its length.
+                    offset += 4 + unpack_from(b'<I', data, offset)[0]
+                props_type[i] = data_type
+            if offset != self._elems_offset:
+                raise IOError("property length not reached, something is wrong")
+            self._props_type = props_type
+        return props_type
+
+    @property
+    def props(self):
+        props = self._props
+        if props is None:
+            data = self._file.data
+            props = [None] * self._prop_count
+            offset = self._props_offset
+            for i, data_type in enumerate(self.props_type):
+                offset += 1
+                if data_type in _lazy_array_params_dict:
+                    props[i] = _lazy_read_array(data, offset, *_lazy_array_params_dict[data_type])
+                    offset += 12 + unpack_from(b'<I', data, offset + 8)[0]
+                elif data_type in _lazy_data_format_dict:
+                    props[i] = unpack_from(_lazy_data_format_dict[data_type], data, offset)[0]
+                    offset += _lazy_data_size_dict[data_type]
+                else:
+                    size = unpack_from(b'<I', data, offset)[0]
+                    offset += 4
+                    props[i] = bytes(data[offset:offset + size])
+                    offset += size
+            self._props = props
+        return props
+
+    @property
+    def elems(self):
+        elems = self._elems
+        if elems is None:
+            elems = []
+            lazy_file = self._file
+            offset = self._elems_offset
+            end_offset = self._end_offset
+
+            if offset < end_offset:
+                sentinel_length = lazy_file.sentinel_length
+                sub_tree_end = end_offset - sentinel_length
+                while offset < sub_tree_end:
+                    elem = FBXElemLazy(lazy_file, offset)
+                    elems.append(elem)
+                    offset = elem._end_offset
+
+                # At the end of each subtree there should be a sentinel (an empty element with all bytes set to zero).
+                if lazy_file.data[offset:offset + sentinel_length] != lazy_file.sentinel_data:
+                    raise IOError("failed to read nested block sentinel, "
+                                  "expected all bytes to be 0")
+                offset += sentinel_length
+
+            if offset != end_offset:
+                raise IOError("scope length not reached, something is wrong")
+            self._elems = elems
+        return elems
+
+
+def _parse_lazy(fn):
+    with open(fn, 'rb') as f:
+        read = f.read
+
+        if read(len(_HEAD_MAGIC)) != _HEAD_MAGIC:
+            raise IOError("Invalid header")
+
+        fbx_version = read_uint(read)
+        offset = f.tell()
+
+    lazy_file = _FBXLazyFile(fn, fbx_version)
+
+    # Only the headers of the root elements are read, all their contents are read on demand.
+    root_elems = []
+    data = lazy_file.data
+    while unpack_from(lazy_file.elem_start_format, data, offset)[0] != 0:
+        elem = FBXElemLazy(lazy_file, offset)
+        root_elems.append(elem)
+        offset = elem._end_offset
+
+    return FBXElem(b'', [], bytearray(0), root_elems), fbx_version
+
+
 def parse_version(fn):
     """
     Return the FBX version,
@@ -250,10 +529,27 @@ def parse_version(fn):
         return read_uint(read)
 
 
-def parse(fn, use_namedtuple=True):
+def parse(fn, use_namedtuple=True, use_mmap=False, array_backend=BACKEND_THREAD):
+    """Parse a binary FBX file, returning the root element and the FBX version.
+
+    When `use_mmap` is True, the file is memory-mapped and the returned elements are `FBXElemLazy` instances, which only
+    decode their contents when accessed (`use_namedtuple` is ignored in that case).
+
+    `array_backend` is the `fbx_utils_threading` backend used to decompress arrays. Files with many small arrays, such as
+    animation curves, are dominated by per-array Python overhead which does not benefit from threads, so may be faster
+    with BACKEND_PROCESS or BACKEND_AUTO."""
+    if use_mmap:
+        return _parse_lazy(fn)
+
     root_elems = []
 
-    multithread_decompress_array_cm = MultiThreadedTaskConsumer.new_cpu_bound_cm(_decompress_and_insert_array)
+    multithread_decompress_array_cm = MultiThreadedTaskConsumer.new_cpu_bound_cm(
+        _decompress_and_insert_array,
+        backend=array_backend,
+        process_task=_DECOMPRESS_ARRAY_PROCESS_TASK,
+        # Threads consume tasks one by one, as they always have.
+        batch_policy=None if array_backend == BACKEND_THREAD else TaskBatchPolicy(_decompress_array_task_size),
+    )
     with open(fn, 'rb') as f, multithread_decompress_array_cm as decompress_array_func:
         read = f.read
         tell = f.tell
@@ -1921,6 +1921,13 @@ class ImportGLTF2(Operator, ConvertGLTF2_Base, ImportHelper):
         default=True,
     )
 
+    import_strict_validation: BoolProperty(
+        name='Strict Validation',
+        description='Check the types of all values of the glTF file before importing it. '
+                    'Slower, reports invalid files instead of importing them',
+        default=False,
+    )
+
     def draw(self, context):
         operator = self
         layout = self.layout
@@ -2038,6 +2045,7 @@ def import_ux_panel(layout, operator):
     if body:
         body.prop(operator, 'import_select_created_objects')
         body.prop(operator, 'import_scene_extras')
+        body.prop(operator, 'import_strict_validation')
 
 def import_texture_panel(layout, operator):
     header, body = layout.panel("GLTF_import_texture", default_closed=False)
@@ -12,6 +12,7 @@ from ...io.com import gltf2_io, gltf2_io_extensions
 from ...io.com.path import path_to_uri, uri_to_path
 from ...io.com.constants import ComponentType, DataType
 from ...io.exp import binary_data as gltf2_io_binary_data, buffer as gltf2_io_buffer, image_data as gltf2_io_image_data
+from ...io.exp.unique_index import UniqueIndex
 from ...io.exp.user_extensions import export_user_extensions
 from .accessors import gather_accessor
 from .material.image import get_gltf_image_from_blender_image
@@ -68,9 +69,13 @@ class GlTF2Exporter:
 
         self.additional_data = AdditionalData()
 
-        self.__buffer = gltf2_io_buffer.Buffer()
+        # Binary data written to a file is kept in a temporary file rather than in memory.
+        self.__buffer = gltf2_io_buffer.Buffer(use_temp_file=export_settings['gltf_format'] != 'GLTF_EMBEDDED')
         self.__images = {}
 
+        # Indices of the lists items are appended to, to find existing items in constant time.
+        self.__unique_indices = {}
+
         # mapping of all glTFChildOfRootProperty types to their corresponding root level arrays
         self.__childOfRootPropertyTypeLookup = {
             gltf2_io.Accessor: self.__gltf.accessors,
@@ -114,7 +119,11 @@ class GlTF2Exporter:
         return self.__gltf
 
     def finalize_buffer(self, output_path=None, buffer_name=None, is_glb=False):
-        """Finalize the glTF and write buffers."""
+        """
+        Finalize the glTF and write buffers.
+
+        For GLB, return the binary buffer, to be written to the file with `Buffer.write_to`.
+        """
         if self.__finalized:
             raise RuntimeError("Tried to finalize buffers for finalized glTF file")
 
@@ -123,7 +132,7 @@ class GlTF2Exporter:
                 uri = None
             elif output_path and buffer_name:
                 with open(output_path + uri_to_path(buffer_name), 'wb') as f:
-                    f.write(self.__buffer.to_bytes())
+                    self.__buffer.write_to(f)
                 uri = buffer_name
             else:
                 uri = self.__buffer.to_embed_string()
@@ -140,7 +149,7 @@ class GlTF2Exporter:
         self.__finalized = True
 
         if is_glb:
-            return self.__buffer.to_bytes()
+            return self.__buffer
 
     def add_draco_extension(self):
         """
@@ -410,14 +419,12 @@ class GlTF2Exporter:
 
         return self.__append_unique_and_get_index(gltf_list, property)
 
-    @staticmethod
-    def __append_unique_and_get_index(target: list, obj):
-        if obj in target:
-            return target.index(obj)
-        else:
-            index = len(target)
-            target.append(obj)
-            return index
+    def __append_unique_and_get_index(self, target: list, obj):
+        unique_index = self.__unique_indices.get(id(target))
+        if unique_index is None or unique_index.target is not target:
+            unique_index = UniqueIndex(target)
+            self.__unique_indices[id(target)] = unique_index
+        return unique_index.append_unique_and_get_index(obj)
 
     def __add_image(self, image: gltf2_io_image_data.ImageData):
         name = image.adjusted_name()
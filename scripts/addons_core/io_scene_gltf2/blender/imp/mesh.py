@@ -278,10 +278,6 @@ def do_primitives(gltf, mesh_idx, skin_idx, mesh, ob):
                 )
                 attribute_data[idx] = np.concatenate((attribute_data[idx], attr_data))
 
-    # Accessors are cached in case they are shared between primitives; clear
-    # the cache now that all prims are done.
-    gltf.decode_accessor_cache = {}
-
     if gltf.import_settings['merge_vertices']:
         vert_locs, vert_normals, vert_joints, vert_weights, \
             sk_vert_locs, loop_vidxs, edge_vidxs, attribute_data = \
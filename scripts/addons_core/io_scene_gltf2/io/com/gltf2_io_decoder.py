@@ -0,0 +1,424 @@
+# SPDX-FileCopyrightText: 2018-2026 The glTF-Blender-IO authors
+#
+# SPDX-License-Identifier: Apache-2.0
+
+# Fast decoder of glTF JSON data to the `gltf2_io` classes, giving the same result as `gltf2_io.gltf_from_dict`.
+#
+# Each class is decoded using a table of its fields built once, instead of trying converters for each value.
+# Straight-line functions are generated from these tables, objects are created without calling the constructors.
+# Property objects don't use `__slots__`, since the importer stores its own data on them.
+# By default, only the structure is validated (objects, arrays and required properties), which is enough for
+# the importer to work on valid files. In strict mode, the types of all values are checked like `gltf_from_dict`.
+# Errors are reported with the path of the invalid value in the JSON data.
+
+import inspect
+
+from . import gltf2_io
+
+
+class DecodeError(Exception):
+    """Invalid glTF JSON data, with the path of the invalid value."""
+
+    def __init__(self, message):
+        super().__init__(message)
+        self.message = message
+        self.path = []
+
+    def __str__(self):
+        path = "".join("[{}]".format(key) if isinstance(key, int) else "." + key for key in self.path)
+        return "{}: {}".format(path.lstrip(".") or "glTF", self.message)
+
+
+# Field kinds, other kinds are classes (or lists of classes) decoded as objects.
+INT = 'INT'
+FLOAT = 'FLOAT'
+STR = 'STR'
+BOOL = 'BOOL'
+INT_LIST = 'INT_LIST'
+FLOAT_LIST = 'FLOAT_LIST'
+STR_LIST = 'STR_LIST'
+INT_DICT = 'INT_DICT'
+INT_DICT_LIST = 'INT_DICT_LIST'
+EXTENSIONS = 'EXTENSIONS'
+EXTRAS = 'EXTRAS'
+
+# Kind of each field of the classes, and the required fields. Field names are the arguments of the class
+# constructor, properties in the JSON data have the same name in camel case.
+_COMMON_FIELDS = {'extensions': EXTENSIONS, 'extras': EXTRAS}
+_SCHEMA = {
+    gltf2_io.AccessorSparseIndices: (
+        {'buffer_view': INT, 'byte_offset': INT, 'component_type': INT},
+        ('buffer_view', 'component_type'),
+    ),
+    gltf2_io.AccessorSparseValues: (
+        {'buffer_view': INT, 'byte_offset': INT},
+        ('buffer_view',),
+    ),
+    gltf2_io.AccessorSparse: (
+        {'count': INT, 'indices': gltf2_io.AccessorSparseIndices, 'values': gltf2_io.AccessorSparseValues},
+        ('count', 'indices', 'values'),
+    ),
+    gltf2_io.Accessor: (
+        {
+            'buffer_view': INT, 'byte_offset': INT, 'component_type': INT, 'count': INT, 'max': FLOAT_LIST,
+            'min': FLOAT_LIST, 'name': STR, 'normalized': BOOL, 'sparse': gltf2_io.AccessorSparse, 'type': STR,
+        },
+        ('component_type', 'count', 'type'),
+    ),
+    gltf2_io.AnimationChannelTarget: (
+        {'node': INT, 'path': STR},
+        ('path',),
+    ),
+    gltf2_io.AnimationChannel: (
+        {'sampler': INT, 'target': gltf2_io.AnimationChannelTarget},
+        ('sampler', 'target'),
+    ),
+    gltf2_io.AnimationSampler: (
+        {'input': INT, 'interpolation': STR, 'output': INT},
+        ('input', 'output'),
+    ),
+    gltf2_io.Animation: (
+        {'channels': [gltf2_io.AnimationChannel], 'name': STR, 'samplers': [gltf2_io.AnimationSampler]},
+        ('channels', 'samplers'),
+    ),
+    gltf2_io.Asset: (
+        {'copyright': STR, 'generator': STR, 'min_version': STR, 'version': STR},
+        ('version',),
+    ),
+    gltf2_io.BufferView: (
+        {'buffer': INT, 'byte_length': INT, 'byte_offset': INT, 'byte_stride': INT, 'name': STR, 'target': INT},
+        ('buffer', 'byte_length'),
+    ),
+    gltf2_io.Buffer: (
+        {'byte_length': INT, 'name': STR, 'uri': STR},
+        ('byte_length',),
+    ),
+    gltf2_io.CameraOrthographic: (
+        {'xmag': FLOAT, 'ymag': FLOAT, 'zfar': FLOAT, 'znear': FLOAT},
+        ('xmag', 'ymag', 'zfar', 'znear'),
+    ),
+    gltf2_io.CameraPerspective: (
+        {'aspect_ratio': FLOAT, 'yfov': FLOAT, 'zfar': FLOAT, 'znear': FLOAT},
+        ('yfov', 'znear'),
+    ),
+    gltf2_io.Camera: (
+        {
+            'name': STR, 'orthographic': gltf2_io.CameraOrthographic,
+            'perspective': gltf2_io.CameraPerspective, 'type': STR,
+        },
+        ('type',),
+    ),
+    gltf2_io.Image: (
+        {'buffer_view': INT, 'mime_type': STR, 'name': STR, 'uri': STR},
+        (),
+    ),
+    gltf2_io.TextureInfo: (
+        {'index': INT, 'tex_coord': INT},
+        ('index',),
+    ),
+    gltf2_io.MaterialNormalTextureInfoClass: (
+        {'index': INT, 'scale': FLOAT, 'tex_coord': INT},
+        ('index',),
+    ),
+    gltf2_io.MaterialOcclusionTextureInfoClass: (
+        {'index': INT, 'strength': FLOAT, 'tex_coord': INT},
+        ('index',),
+    ),
+    gltf2_io.MaterialPBRMetallicRoughness: (
+        {
+            'base_color_factor': FLOAT_LIST, 'base_color_texture': gltf2_io.TextureInfo, 'metallic_factor': FLOAT,
+            'metallic_roughness_texture': gltf2_io.TextureInfo, 'roughness_factor': FLOAT,
+        },
+        (),
+    ),
+    gltf2_io.Material: (
+        {
+            'alpha_cutoff': FLOAT, 'alpha_mode': STR, 'double_sided': BOOL, 'emissive_factor': FLOAT_LIST,
+            'emissive_texture': gltf2_io.TextureInfo, 'name': STR,
+            'normal_texture': gltf2_io.MaterialNormalTextureInfoClass,
+            'occlusion_texture': gltf2_io.MaterialOcclusionTextureInfoClass,
+            'pbr_metallic_roughness': gltf2_io.MaterialPBRMetallicRoughness,
+        },
+        (),
+    ),
+    gltf2_io.MeshPrimitive: (
+        {'attributes': INT_DICT, 'indices': INT, 'material': INT, 'mode': INT, 'targets': INT_DICT_LIST},
+        ('attributes',),
+    ),
+    gltf2_io.Mesh: (
+        {'name': STR, 'primitives': [gltf2_io.MeshPrimitive], 'weights': FLOAT_LIST},
+        ('primitives',),
+    ),
+    gltf2_io.Node: (
+        {
+            'camera': INT, 'children': INT_LIST, 'matrix': FLOAT_LIST, 'mesh': INT, 'name': STR,
+            'rotation': FLOAT_LIST, 'scale': FLOAT_LIST, 'skin': INT, 'translation': FLOAT_LIST,
+            'weights': FLOAT_LIST,
+        },
+        (),
+    ),
+    gltf2_io.Sampler: (
+        {'mag_filter': INT, 'min_filter': INT, 'name': STR, 'wrap_s': INT, 'wrap_t': INT},
+        (),
+    ),
+    gltf2_io.Scene: (
+        {'name': STR, 'nodes': INT_LIST},
+        (),
+    ),
+    gltf2_io.Skin: (
+        {'inverse_bind_matrices': INT, 'joints': INT_LIST, 'name': STR, 'skeleton': INT},
+        ('joints',),
+    ),
+    gltf2_io.Texture: (
+        {'name': STR, 'sampler': INT, 'source': INT},
+        (),
+    ),
+    gltf2_io.Gltf: (
+        {
+            'accessors': [gltf2_io.Accessor], 'animations': [gltf2_io.Animation], 'asset': gltf2_io.Asset,
+            'buffers': [gltf2_io.Buffer], 'buffer_views': [gltf2_io.BufferView], 'cameras': [gltf2_io.Camera],
+            'extensions_required': STR_LIST, 'extensions_used': STR_LIST, 'images': [gltf2_io.Image],
+            'materials': [gltf2_io.Material], 'meshes': [gltf2_io.Mesh], 'nodes': [gltf2_io.Node],
+            'samplers': [gltf2_io.Sampler], 'scene': INT, 'scenes': [gltf2_io.Scene], 'skins': [gltf2_io.Skin],
+            'textures': [gltf2_io.Texture],
+        },
+        ('asset',),
+    ),
+}
+
+
+def _check_int(x):
+    if not isinstance(x, int) or isinstance(x, bool):
+        raise DecodeError("expected an integer, got {!r}".format(x))
+    return x
+
+
+def _check_float(x):
+    if not isinstance(x, (float, int)) or isinstance(x, bool):
+        raise DecodeError("expected a number, got {!r}".format(x))
+    return float(x)
+
+
+def _to_float(x):
+    try:
+        return float(x)
+    except (TypeError, ValueError):
+        raise DecodeError("expected a number, got {!r}".format(x)) from None
+
+
+def _check_str(x):
+    if not isinstance(x, str):
+        raise DecodeError("expected a string, got {!r}".format(x))
+    return x
+
+
+def _check_bool(x):
+    if not isinstance(x, bool):
+        raise DecodeError("expected a boolean, got {!r}".format(x))
+    return x
+
+
+def _check_list(x):
+    if not isinstance(x, list):
+        raise DecodeError("expected an array, got {!r}".format(x))
+    return x
+
+
+def _check_dict(x):
+    if not isinstance(x, dict):
+        raise DecodeError("expected an object, got {!r}".format(x))
+    return x
+
+
+def _list_decoder(decode):
+    def decode_list(x):
+        if not isinstance(x, list):
+            raise DecodeError("expected an array, got {!r}".format(x))
+        try:
+            return [decode(y) for y in x]
+        except DecodeError as e:
+            # Find the index of the invalid item, only when there is an error.
+            for i, y in enumerate(x):
+                try:
+                    decode(y)
+                except DecodeError:
+                    e.path.insert(0, i)
+                    break
+            raise
+    return decode_list
+
+
+def _dict_decoder(decode):
+    def decode_dict(x):
+        if not isinstance(x, dict):
+            raise DecodeError("expected an object, got {!r}".format(x))
+        result = {}
+        for key, value in x.items():
+            try:
+                result[key] = decode(value)
+            except DecodeError as e:
+                e.path.insert(0, key)
+                raise
+        return result
+    return decode_dict
+
+
+def _to_float_list(x):
+    if not isinstance(x, list):
+        raise DecodeError("expected an array, got {!r}".format(x))
+    try:
+        return list(map(float, x))
+    except (TypeError, ValueError):
+        return _list_decoder(_to_float)(x)
+
+
+def _check_extensions(x):
+    if not isinstance(x, dict):
+        raise DecodeError("expected an object, got {!r}".format(x))
+    for key, value in x.items():
+        if not isinstance(value, dict):
+            error = DecodeError("expected an object, got {!r}".format(value))
+            error.path.append(key)
+            raise error
+    return x
+
+
+# Decoders of each field kind, for the default and the strict mode. None keeps the value as is.
+_DECODERS = {
+    INT: (None, _check_int),
+    FLOAT: (_to_float, _check_float),
+    STR: (None, _check_str),
+    BOOL: (None, _check_bool),
+    INT_LIST: (_check_list, _list_decoder(_check_int)),
+    FLOAT_LIST: (_to_float_list, _list_decoder(_check_float)),
+    STR_LIST: (_check_list, _list_decoder(_check_str)),
+    INT_DICT: (_check_dict, _dict_decoder(_check_int)),
+    INT_DICT_LIST: (_check_list, _list_decoder(_dict_decoder(_check_int))),
+    # Like `gltf_from_dict`, each extension must be an object.
+    EXTENSIONS: (_check_extensions, _dict_decoder(_dict_decoder(lambda x: x))),
+    EXTRAS: (None, None),
+}
+
+
+def _camel_case(name):
+    words = name.split("_")
+    return words[0] + "".join(word.capitalize() for word in words[1:])
+
+
+class _ClassDecoder:
+    """Decode objects of a class using the table of its fields."""
+
+    __slots__ = ("cls", "fields")
+
+    def __init__(self, cls):
+        self.cls = cls
+        self.fields = ()
+
+    def init_fields(self, decoders, strict):
+        kinds, required = _SCHEMA[self.cls]
+        fields = []
+        # Same order as the attributes set by the constructor.
+        for name in inspect.signature(self.cls.__init__).parameters:
+            if name == "self":
+                continue
+            kind = kinds.get(name) or _COMMON_FIELDS[name]
+            if isinstance(kind, list):
+                decode = _list_decoder(decoders[kind[0]])
+            elif kind in decoders:
+                decode = decoders[kind]
+            else:
+                decode = _DECODERS[kind][strict]
+            fields.append((name, _camel_case(name), decode, name in required))
+        self.fields = tuple(fields)
+
+    def __call__(self, obj):
+        if not isinstance(obj, dict):
+            raise DecodeError("expected an object, got {!r}".format(obj))
+        values = {}
+        for name, key, decode, required in self.fields:
+            value = obj.get(key)
+            if value is None:
+                if required:
+                    raise DecodeError("missing required property '{}'".format(key))
+            elif decode is not None:
+                try:
+                    value = decode(value)
+                except DecodeError as e:
+                    e.path.insert(0, key)
+                    raise
+            values[name] = value
+        # Bypass the constructor, setting all attributes at once.
+        instance = self.cls.__new__(self.cls)
+        instance.__dict__ = values
+        return instance
+
+
+def _compile_decoders(decoders):
+    """
+    Generate a function decoding each class with straight-line code, for speed. Errors are raised without
+    their path, the decoders using the tables of fields are used again to find it.
+    """
+    namespace = {'DecodeError': DecodeError}
+    lines = []
+    for cls, decoder in decoders.items():
+        kinds, _required = _SCHEMA[cls]
+        namespace['cls_' + cls.__name__] = cls
+        lines.append("def decode_{}(obj):".format(cls.__name__))
+        lines.append("    if not isinstance(obj, dict):")
+        lines.append("        raise DecodeError('expected an object')")
+        lines.append("    get = obj.get")
+        items = []
+        for i, (name, key, decode, required) in enumerate(decoder.fields):
+            kind = kinds.get(name)
+            lines.append("    v{} = get({!r})".format(i, key))
+            if required:
+                lines.append("    if v{} is None:".format(i))
+                lines.append("        raise DecodeError('missing required property')")
+            if isinstance(kind, list):
+                lines.append("    if v{} is not None:".format(i))
+                lines.append("        if not isinstance(v{}, list):".format(i))
+                lines.append("            raise DecodeError('expected an array')")
+                lines.append("        v{0} = [decode_{1}(x) for x in v{0}]".format(i, kind[0].__name__))
+            elif kind in decoders:
+                lines.append("    if v{} is not None:".format(i))
+                lines.append("        v{0} = decode_{1}(v{0})".format(i, kind.__name__))
+            elif decode is not None:
+                namespace["{}_{}".format(cls.__name__, name)] = decode
+                lines.append("    if v{} is not None:".format(i))
+                lines.append("        v{0} = {1}_{2}(v{0})".format(i, cls.__name__, name))
+            items.append("{!r}: v{}".format(name, i))
+        lines.append("    instance = cls_{0}.__new__(cls_{0})".format(cls.__name__))
+        lines.append("    instance.__dict__ = {{{}}}".format(", ".join(items)))
+        lines.append("    return instance")
+        lines.append("")
+    exec("\n".join(lines), namespace)
+    return {cls: namespace['decode_' + cls.__name__] for cls in decoders}
+
+
+def _create_decoders(strict):
+    decoders = {cls: _ClassDecoder(cls) for cls in _SCHEMA}
+    for decoder in decoders.values():
+        decoder.init_fields(decoders, strict)
+    return decoders, _compile_decoders(decoders)
+
+
+_decoders_from_strict = {}
+
+
+def decode_gltf(obj, strict=False):
+    """
+    Decode glTF JSON data to a `gltf2_io.Gltf`, raising DecodeError for invalid data.
+
+    :param strict: Check the types of all values, like `gltf2_io.gltf_from_dict`.
+    """
+    strict = bool(strict)
+    decoders = _decoders_from_strict.get(strict)
+    if decoders is None:
+        decoders = _decoders_from_strict[strict] = _create_decoders(strict)
+    decoders_from_fields, compiled_decoders = decoders
+    try:
+        return compiled_decoders[gltf2_io.Gltf](obj)
+    except DecodeError:
+        # Decode again to report the error with its path.
+        decoders_from_fields[gltf2_io.Gltf](obj)
+        raise
@@ -3,6 +3,9 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import base64
+import os
+import shutil
+import tempfile
 
 from ...io.com import gltf2_io
 from ...io.exp import binary_data as gltf2_io_binary_data
@@ -11,22 +14,38 @@ from ...io.exp import binary_data as gltf2_io_binary_data
 class Buffer:
     """Class representing binary data for use in a glTF file as 'buffer' property."""
 
-    def __init__(self, buffer_index=0, initial_data=None):
+    def __init__(self, buffer_index=0, initial_data=None, use_temp_file=False):
+        """
+        When use_temp_file is set, the data is written to a temporary file instead of being kept in memory,
+        it can then be copied to the output file with `write_to`.
+        """
         self.__data = bytearray(b"")
+        self.__file = None
+        self.__byte_length = 0
+        if use_temp_file:
+            self.__data = None
+            self.__file = tempfile.TemporaryFile()
         if initial_data is not None:
-            self.__data = bytearray(initial_data.tobytes())
+            self.__extend(initial_data.tobytes())
         self.__buffer_index = buffer_index
 
+    def __extend(self, data):
+        if self.__file is not None:
+            self.__file.write(data)
+        else:
+            self.__data.extend(data)
+        self.__byte_length += len(data)
+
     def add_and_get_view(self, binary_data: gltf2_io_binary_data.BinaryData) -> gltf2_io.BufferView:
         """Add binary data to the buffer. Return a glTF BufferView."""
-        offset = len(self.__data)
-        self.__data.extend(binary_data.data)
+        offset = self.__byte_length
+        self.__extend(binary_data.data)
 
         length = binary_data.byte_length
 
         # offsets should be a multiple of 4 --> therefore add padding if necessary
         padding = (4 - (length % 4)) % 4
-        self.__data.extend(b"\x00" * padding)
+        self.__extend(b"\x00" * padding)
 
         buffer_view = gltf2_io.BufferView(
             buffer=self.__buffer_index,
@@ -42,13 +61,47 @@ class Buffer:
 
     @property
     def byte_length(self):
-        return len(self.__data)
+        return self.__byte_length
 
     def to_bytes(self):
+        if self.__file is not None:
+            self.__file.seek(0)
+            data = self.__file.read()
+            self.__file.seek(0, os.SEEK_END)
+            return data
         return self.__data
 
+    def write_to(self, file):
+        """Write the data to a binary file, without loading it all in memory when using a temporary file."""
+        if self.__file is None:
+            file.write(self.__data)
+            return
+
+        self.__file.flush()
+        file.flush()
+        offset = 0
+        try:
+            # Copy in kernel space when possible.
+            while offset < self.__byte_length:
+                sent = os.sendfile(file.fileno(), self.__file.fileno(), offset, self.__byte_length - offset)
+                if sent == 0:
+                    break
+                offset += sent
+        except (AttributeError, OSError):
+            pass
+        if offset < self.__byte_length:
+            self.__file.seek(offset)
+            shutil.copyfileobj(self.__file, file)
+        # Synchronize the position of the (buffered) file object with the file descriptor.
+        file.seek(0, os.SEEK_END)
+        self.__file.seek(0, os.SEEK_END)
+
     def clear(self):
+        if self.__file is not None:
+            self.__file.close()
+            self.__file = None
         self.__data = b""
+        self.__byte_length = 0
 
     def to_embed_string(self):
-        return 'data:application/octet-stream;base64,' + base64.b64encode(self.__data).decode('ascii')
+        return 'data:application/octet-stream;base64,' + base64.b64encode(self.to_bytes()).decode('ascii')
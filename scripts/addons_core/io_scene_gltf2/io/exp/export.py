@@ -85,13 +85,14 @@ def save_gltf(gltf, export_settings, encoder, glb_buffer):
         file = open(export_settings['gltf_filepath'], "wb")
 
         gltf_data = gltf_encoded.encode()
+        # Either bytes, or a buffer streamed to the file without loading it in memory.
         binary = glb_buffer
 
         length_gltf = len(gltf_data)
         spaces_gltf = (4 - (length_gltf & 3)) & 3
         length_gltf += spaces_gltf
 
-        length_bin = len(binary)
+        length_bin = binary.byte_length if hasattr(binary, "write_to") else len(binary)
         zeros_bin = (4 - (length_bin & 3)) & 3
         length_bin += zeros_bin
 
@@ -114,7 +115,10 @@ def save_gltf(gltf, export_settings, encoder, glb_buffer):
         if length_bin > 0:
             file.write(struct.pack("I", length_bin))
             file.write('BIN\0'.encode())
-            file.write(binary)
+            if hasattr(binary, "write_to"):
+                binary.write_to(file)
+            else:
+                file.write(binary)
             file.write(b'\0' * zeros_bin)
 
         file.close()
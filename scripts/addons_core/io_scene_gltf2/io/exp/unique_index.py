@@ -0,0 +1,94 @@
+# SPDX-FileCopyrightText: 2018-2026 The glTF-Blender-IO authors
+#
+# SPDX-License-Identifier: Apache-2.0
+
+def hash_key(obj):
+    """
+    Return a hashable key of obj, so that keys are equal when the objects are equal.
+
+    Dictionaries, lists and tuples (like extension data) are compared by content. Other objects, like glTF
+    properties, use their own hash, which is their identity unless they define it.
+    Return None for objects that can't be hashed.
+    """
+    if isinstance(obj, dict):
+        items = []
+        for key, value in obj.items():
+            value_key = hash_key(value)
+            if value_key is None:
+                return None
+            items.append((key, value_key))
+        return (dict, frozenset(items))
+
+    if isinstance(obj, (list, tuple)):
+        items = []
+        for value in obj:
+            value_key = hash_key(value)
+            if value_key is None:
+                return None
+            items.append(value_key)
+        return (type(obj), tuple(items))
+
+    try:
+        hash(obj)
+    except TypeError:
+        return None
+    return obj
+
+
+class UniqueIndex:
+    """
+    Index of the items of a list, to append unique items to it in constant time.
+
+    The list may only grow by appending items, items appended by other means are indexed when needed.
+    Items of the list must not be replaced, or modified in a way changing their equality.
+    """
+
+    def __init__(self, target: list):
+        self.target = target
+        self.__indices = {}
+        self.__length = 0
+        self.__has_unhashable = False
+
+    def __clear(self):
+        self.__indices.clear()
+        self.__length = 0
+        self.__has_unhashable = False
+
+    def __update(self):
+        target = self.target
+        if len(target) < self.__length:
+            self.__clear()
+
+        for index in range(self.__length, len(target)):
+            key = hash_key(target[index])
+            if key is None:
+                self.__has_unhashable = True
+            else:
+                # Same as `list.index`, the first equal item is used.
+                self.__indices.setdefault(key, index)
+        self.__length = len(target)
+
+    def append_unique_and_get_index(self, obj) -> int:
+        """Return the index of the first item of the list equal to obj, appending it if there is none."""
+        target = self.target
+        self.__update()
+
+        key = None if self.__has_unhashable else hash_key(obj)
+        if key is None:
+            # Items which can't be hashed may be equal to any other item.
+            if obj in target:
+                return target.index(obj)
+        else:
+            index = self.__indices.get(key)
+            if index is not None:
+                item = target[index]
+                if item is obj or item == obj:
+                    return index
+                # The list was modified by other means, check it again.
+                self.__clear()
+                if obj in target:
+                    return target.index(obj)
+
+        index = len(target)
+        target.append(obj)
+        return index
@@ -3,11 +3,67 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import struct
+from collections import OrderedDict
 import numpy as np
 
 from ..com.gltf2_io import Accessor
 from ..com.constants import ComponentType, DataType
 
+# Maximum total size of the decoded accessors kept in the cache.
+ACCESSOR_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# Divisor to convert normalized integer components to floats, and whether the type is signed.
+NORMALIZATION_DIVISORS = {
+    5120: (127.0, True),  # int8
+    5121: (255.0, False),  # uint8
+    5122: (32767.0, True),  # int16
+    5123: (65535.0, False),  # uint16
+}
+
+
+class AccessorCache():
+    """Decoded accessors, the least recently used ones are evicted when above a total size in bytes."""
+
+    def __init__(self, max_bytes=ACCESSOR_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.num_bytes = 0
+        self.__arrays = OrderedDict()
+
+    def __contains__(self, accessor_idx):
+        return accessor_idx in self.__arrays
+
+    def __len__(self):
+        return len(self.__arrays)
+
+    def get(self, accessor_idx):
+        array = self.__arrays.get(accessor_idx)
+        if array is not None:
+            self.__arrays.move_to_end(accessor_idx)
+        return array
+
+    def put(self, accessor_idx, array):
+        # Prevent accidentally modifying cached arrays
+        array.flags.writeable = False
+
+        self.discard(accessor_idx)
+        if array.nbytes > self.max_bytes:
+            return
+        self.__arrays[accessor_idx] = array
+        self.num_bytes += array.nbytes
+
+        while self.num_bytes > self.max_bytes:
+            _, evicted = self.__arrays.popitem(last=False)
+            self.num_bytes -= evicted.nbytes
+
+    def discard(self, accessor_idx):
+        array = self.__arrays.pop(accessor_idx, None)
+        if array is not None:
+            self.num_bytes -= array.nbytes
+
+    def clear(self):
+        self.__arrays.clear()
+        self.num_bytes = 0
+
 
 class BinaryData():
     """Binary reader."""
@@ -65,16 +121,15 @@ class BinaryData():
     @staticmethod
     def decode_accessor(gltf, accessor_idx, cache=False):
         """Decodes accessor to 2D numpy array (count x num_components)."""
-        if accessor_idx in gltf.decode_accessor_cache:
-            return gltf.accessor_cache[accessor_idx]
+        array = gltf.decode_accessor_cache.get(accessor_idx)
+        if array is not None:
+            return array
 
         accessor = gltf.data.accessors[accessor_idx]
         array = BinaryData.decode_accessor_obj(gltf, accessor)
 
         if cache:
-            gltf.accessor_cache[accessor_idx] = array
-            # Prevent accidentally modifying cached arrays
-            array.flags.writeable = False
+            gltf.decode_accessor_cache.put(accessor_idx, array)
 
         return array
 
@@ -179,25 +234,35 @@ class BinaryData():
             })
             sparse_values = BinaryData.decode_accessor_obj(gltf, sparse_values_obj)
 
+            if accessor.normalized:
+                # Normalization below creates a new array, and normalizes the sparse values too.
+                array = BinaryData.normalize(array, accessor.component_type)
+                array[sparse_indices] = BinaryData.normalize(sparse_values, accessor.component_type)
+                return array
+
             if not array.flags.writeable:
                 array = array.copy()
             array[sparse_indices] = sparse_values
 
         # Normalization
         if accessor.normalized:
-            if accessor.component_type == 5120:  # int8
-                array = np.maximum(-1.0, array / 127.0)
-            elif accessor.component_type == 5121:  # uint8
-                array = array / 255.0
-            elif accessor.component_type == 5122:  # int16
-                array = np.maximum(-1.0, array / 32767.0)
-            elif accessor.component_type == 5123:  # uint16
-                array = array / 65535.0
-
-            array = array.astype(np.float32, copy=False)
+            array = BinaryData.normalize(array, accessor.component_type)
 
         return array
 
+    @staticmethod
+    def normalize(array, component_type):
+        """Convert normalized integers to a new float32 array in a single pass."""
+        if component_type not in NORMALIZATION_DIVISORS:
+            return array.astype(np.float32)
+
+        divisor, signed = NORMALIZATION_DIVISORS[component_type]
+        # The result is the same as dividing in double precision then rounding to float32.
+        result = np.divide(array, np.float32(divisor), dtype=np.float32)
+        if signed:
+            np.maximum(result, np.float32(-1.0), out=result)
+        return result
+
     @staticmethod
     def get_image_data(gltf, img_idx):
         """Get data from image."""
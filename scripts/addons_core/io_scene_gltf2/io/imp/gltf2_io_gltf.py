@@ -3,10 +3,12 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from ...io.com.path import uri_to_path
-from ..com.gltf2_io import gltf_from_dict
+from ..com.gltf2_io_decoder import decode_gltf, DecodeError
 from ..com.debug import Log
+from .gltf2_io_binary import AccessorCache
 import logging
 import json
+import mmap
 import struct
 import base64
 from os.path import dirname, join, isfile
@@ -27,7 +29,7 @@ class glTFImporter():
         self.glb_buffer = None
         self.buffers = {}
         self.accessor_cache = {}
-        self.decode_accessor_cache = {}
+        self.decode_accessor_cache = AccessorCache()
         self.import_user_extensions = import_settings['import_user_extensions']
         self.variant_mapping = {}  # Used to map between mgltf material idx and blender material, for Variants
 
@@ -77,7 +79,7 @@ class glTFImporter():
 
     @staticmethod
     def check_version(gltf):
-        """Check version. This is done *before* gltf_from_dict."""
+        """Check version. This is done *before* decode_gltf."""
         if not isinstance(gltf, dict) or 'asset' not in gltf:
             raise ImportError("Bad glTF: no asset in json")
         if 'version' not in gltf['asset']:
@@ -147,8 +149,7 @@ class glTFImporter():
         if not isfile(self.filename):
             raise ImportError("Please select a file")
 
-        with open(self.filename, 'rb') as f:
-            content = memoryview(f.read())
+        content = glTFImporter.map_file(self.filename)
 
         if content[:4] == b'glTF':
             gltf, self.glb_buffer = self.load_glb(content)
@@ -159,11 +160,22 @@ class glTFImporter():
         glTFImporter.check_version(gltf)
 
         try:
-            self.data = gltf_from_dict(gltf)
-        except AssertionError:
-            import traceback
-            traceback.print_exc()
-            raise ImportError("Couldn't parse glTF. Check that the file is valid")
+            self.data = decode_gltf(gltf, strict=self.import_settings.get('import_strict_validation', False))
+        except DecodeError as e:
+            raise ImportError("Couldn't parse glTF. Check that the file is valid: " + str(e))
+
+    @staticmethod
+    def map_file(path):
+        """
+        Return a read-only memoryview of the file, mapped in memory when possible so that
+        only the parts used are read. The file stays mapped while the memoryview is referenced.
+        """
+        with open(path, 'rb') as f:
+            try:
+                return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+            except (ValueError, OSError):
+                # Empty files, or files that can't be mapped.
+                return memoryview(f.read())
 
     def load_buffer(self, buffer_idx):
         """Load buffer."""
@@ -191,8 +203,7 @@ class glTFImporter():
 
         path = join(dirname(self.filename), uri_to_path(uri))
         try:
-            with open(path, 'rb') as f_:
-                return memoryview(f_.read())
+            return glTFImporter.map_file(path)
         except Exception:
             self.log.error("Couldn't read file: " + path)
             return None
@@ -76,28 +76,34 @@ class UI_OT_i18n_updatetranslation_work_repo(Operator):
 
         # Now we should have a valid POT file, we have to merge it in all languages po's...
         pot = utils_i18n.I18nMessages(kind='PO', src=self.settings.FILE_NAME_POT, settings=self.settings)
-        for progress, lng in enumerate(i18n_sett.langs):
-            utils_i18n.I18nMessages.update_from_pot_callback(pot, dict(lng.items()), self.settings)
-            context.window_manager.progress_update(progress + 2)
-        # NOTE: While on linux sub-processes are `os.fork`ed by default,
-        #       on Windows and OSX they are `spawn`ed.
-        #       See https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods
-        #       This is a problem because spawned processes do not inherit the whole environment
-        #       of the current (Blender-customized) python. In pratice, the `bpy` module won't load e.g.
-        #       So care must be taken that the callback passed to the executor does not rely on any
-        #       Blender-specific modules etc. This is why it is using a class method from `bl_i18n_utils`
-        #       module, rather than a local function of this current Blender-only module.
-        # FIXME: This can easily deadlock on powerful machine with lots of RAM (128GB) and cores (32)...
-        # ~ with concurrent.futures.ProcessPoolExecutor() as exctr:
-            # ~ pot = utils_i18n.I18nMessages(kind='PO', src=self.settings.FILE_NAME_POT, settings=self.settings)
-            # ~ for progress, _ in enumerate(
-            # ~ exctr.map(utils_i18n.I18nMessages.update_from_pot_callback,
-            # ~ (pot,) * num_langs,
-            # ~ [dict(lng.items()) for lng in i18n_sett.langs],
-            # ~ (self.settings,) * num_langs,
-            # ~ chunksize=4,
-            # ~ timeout=60)):
-            # ~ context.window_manager.progress_update(progress + 2)
+        langs = [dict(lng.items()) for lng in i18n_sett.langs]
+        processes = self.settings.UPDATE_PROCESSES
+        if processes <= 0:
+            processes = os.cpu_count() or 1
+        if processes == 1 or len(langs) < 2:
+            for progress, lng in enumerate(langs):
+                utils_i18n.I18nMessages.update_from_pot_callback(pot, lng, self.settings)
+                context.window_manager.progress_update(progress + 2)
+        else:
+            # NOTE: While on linux sub-processes are `os.fork`ed by default,
+            #       on Windows and OSX they are `spawn`ed.
+            #       See https://docs.python.org/3/library/multiprocessing.html#contexts-and-start-methods
+            #       This is a problem because spawned processes do not inherit the whole environment
+            #       of the current (Blender-customized) python. In pratice, the `bpy` module won't load e.g.
+            #       So care must be taken that the callback passed to the executor does not rely on any
+            #       Blender-specific modules etc. This is why it is using a class method from `bl_i18n_utils`
+            #       module, rather than a local function of this current Blender-only module.
+            # NOTE: This used to easily deadlock on powerful machines with lots of RAM and cores,
+            #       so it is only used when enabled in the settings (`UPDATE_PROCESSES`), with a bounded number
+            #       of workers, each of them updating a single language at a time without nested processes.
+            with concurrent.futures.ProcessPoolExecutor(max_workers=min(processes, len(langs))) as exctr:
+                futures = [
+                    exctr.submit(utils_i18n.I18nMessages.update_from_pot_callback, pot, lng, self.settings, 1)
+                    for lng in langs
+                ]
+                for progress, future in enumerate(concurrent.futures.as_completed(futures)):
+                    future.result()
+                    context.window_manager.progress_update(progress + 2)
 
         context.window_manager.progress_end()
         print("", flush=True)
@@ -80,8 +80,6 @@ from freestyle.utils import (
     curvature_from_stroke_vertex,
     getCurrentScene,
     iter_distance_along_stroke,
-    iter_distance_from_camera,
-    iter_distance_from_object,
     iter_material_value,
     iter_t2d_along_stroke,
     normal_at_I0D,
@@ -100,7 +98,13 @@ import bpy
 
 from mathutils import Vector
 from math import pi, sin, cos, acos, radians
-from itertools import cycle
+from itertools import chain, cycle
+
+try:
+    import numpy as np
+except ImportError:
+    # Modifiers shade one vertex at a time without NumPy.
+    np = None
 
 # WARNING: highly experimental, not a stable API
 # lists of callback functions
@@ -110,6 +114,55 @@ callbacks_modifiers_post = []
 callbacks_lineset_post = []
 
 
+# Size of the tables of curve mappings, same as the table of a CurveMap (CM_TABLE).
+CURVE_TABLE_SIZE = 256
+
+# Ramp blend types blended as arrays, other types are blended one vertex at a time.
+RAMP_BLEND_ARRAY_TYPES = {
+    'MIX', 'ADD', 'MULTIPLY', 'SUBTRACT', 'SCREEN', 'DIVIDE', 'DIFFERENCE', 'DARKEN', 'LIGHTEN',
+}
+
+
+def vectors_to_array(vectors, count, size, dtype=None):
+    """Returns an array of shape (count, size) from an iterable of vectors."""
+    values = np.fromiter(chain.from_iterable(vectors), dtype=dtype or np.float64, count=count * size)
+    return values.reshape(count, size)
+
+
+def t2d_along_stroke(stroke, sverts):
+    """Returns the progress along the stroke of every vertex, like iter_t2d_along_stroke()."""
+    total = stroke.length_2d
+    if np is None:
+        return list(iter_t2d_along_stroke(stroke))
+    if total == 0.0:
+        return np.zeros(len(sverts))
+    points = vectors_to_array((svert.point for svert in sverts), len(sverts), 2)
+    distances = np.zeros(len(sverts))
+    np.cumsum(np.hypot(*np.diff(points, axis=0).T), out=distances[1:])
+    return np.minimum(distances / total, 1.0)
+
+
+def distance_from_point(sverts, location, range_min, range_max, normfac):
+    """
+    Returns the distance of every vertex to a location in the camera coordinate, relative to the
+    given range, like iter_distance_from_camera() and iter_distance_from_object().
+    """
+    if np is None:
+        distances = ((svert.point_3d - location).length for svert in sverts)
+        return [(distance - range_min) / normfac if range_min < distance < range_max else
+                0.0 if distance < range_min else 1.0 for distance in distances]
+    points = vectors_to_array((svert.point_3d for svert in sverts), len(sverts), 3) - tuple(location)
+    distances = np.sqrt(np.einsum('ij,ij->i', points, points))
+    inside = (range_min < distances) & (distances < range_max)
+    return np.where(inside, (distances - range_min) / normfac, np.where(distances < range_min, 0.0, 1.0))
+
+
+def split_vertex_values(pairs):
+    """Splits pairs of a stroke vertex and a value into a tuple of vertices and a list of values."""
+    pairs = list(pairs)
+    return tuple(svert for svert, _ in pairs), [value for _, value in pairs]
+
+
 class ColorRampModifier(StrokeShader):
     """Primitive for the color modifiers."""
 
@@ -118,6 +171,7 @@ class ColorRampModifier(StrokeShader):
         self.blend = blend
         self.influence = influence
         self.ramp = ramp
+        self.ramp_table = None
 
     def evaluate(self, t):
         col = evaluateColorRamp(self.ramp, t)
@@ -126,6 +180,88 @@ class ColorRampModifier(StrokeShader):
     def blend_ramp(self, a, b):
         return blendRamp(self.blend, a, self.influence, b)
 
+    def evaluate_array(self, ts):
+        """Evaluates the ramp for an array of positions, returns an array of RGB colors."""
+        ramp = self.ramp
+        ts = np.asarray(ts, dtype=np.float32)
+        if ramp.color_mode != 'RGB' or ramp.interpolation not in {'LINEAR', 'EASE', 'CONSTANT'}:
+            colors = [self.evaluate(t) for t in ts.tolist()]
+            return vectors_to_array(colors, len(colors), 3, np.float32)
+
+        # Same as BKE_colorband_evaluate(), from the positions and colors of the elements.
+        if self.ramp_table is None:
+            elements = ramp.elements
+            positions = np.array([elem.position for elem in elements], dtype=np.float32)
+            colors = vectors_to_array((elem.color[0:3] for elem in elements), len(elements), 3, np.float32)
+            self.ramp_table = (positions, colors)
+        positions, colors = self.ramp_table
+
+        # Index of the first element after each position.
+        index = np.searchsorted(positions, ts, side='right')
+        if len(positions) == 1 or ramp.interpolation == 'CONSTANT':
+            return colors[np.maximum(index - 1, 0)]
+
+        right = np.clip(index, 1, len(positions) - 1)
+        left = right - 1
+        with np.errstate(divide='ignore', invalid='ignore'):
+            fac = (ts - positions[right]) / (positions[left] - positions[right])
+        if ramp.interpolation == 'EASE':
+            fac2 = fac * fac
+            fac = np.float32(3.0) * fac2 - np.float32(2.0) * fac2 * fac
+        fac = fac[:, np.newaxis]
+        result = (np.float32(1.0) - fac) * colors[right] + fac * colors[left]
+        result[ts <= positions[0]] = colors[0]
+        result[index == len(positions)] = colors[-1]
+        return result
+
+    def blend_ramp_array(self, a, b):
+        """Blends arrays of RGB colors, like blend_ramp()."""
+        blend = self.blend
+        if blend not in RAMP_BLEND_ARRAY_TYPES:
+            colors = [self.blend_ramp(x, y) for x, y in zip(a.tolist(), b.tolist())]
+            return vectors_to_array(colors, len(colors), 3, np.float32)
+
+        # Same as ramp_blend(), in single precision.
+        fac = np.float32(self.influence)
+        facm = np.float32(1.0) - fac
+        if blend == 'MIX':
+            return facm * a + fac * b
+        elif blend == 'ADD':
+            return a + fac * b
+        elif blend == 'MULTIPLY':
+            return a * (facm + fac * b)
+        elif blend == 'SUBTRACT':
+            return a - fac * b
+        elif blend == 'SCREEN':
+            return np.float32(1.0) - (facm + fac * (np.float32(1.0) - b)) * (np.float32(1.0) - a)
+        elif blend == 'DIVIDE':
+            nonzero = b != 0.0
+            return np.where(nonzero, facm * a + fac * a / np.where(nonzero, b, np.float32(1.0)), a)
+        elif blend == 'DIFFERENCE':
+            return facm * a + fac * np.abs(a - b)
+        elif blend == 'DARKEN':
+            return np.minimum(a, b) * fac + a * facm
+        else:  # 'LIGHTEN'
+            return np.maximum(a, b) * fac + a * facm
+
+    def blend_colors(self, sverts, colors):
+        """Blends the given RGB colors into the colors of the stroke vertices."""
+        if np is None:
+            for svert, b in zip(sverts, colors):
+                svert.attribute.color = self.blend_ramp(svert.attribute.color, b)
+            return
+        a = vectors_to_array((svert.attribute.color for svert in sverts), len(sverts), 3, np.float32)
+        b = np.asarray(colors, dtype=np.float32).reshape(-1, 3)
+        for svert, color in zip(sverts, self.blend_ramp_array(a, b).tolist()):
+            svert.attribute.color = color
+
+    def shade_ramp(self, sverts, ts):
+        """Blends the ramp, evaluated at a position for each stroke vertex, into the colors of the vertices."""
+        if np is None:
+            self.blend_colors(sverts, [self.evaluate(t) for t in ts])
+        else:
+            self.blend_colors(sverts, self.evaluate_array(ts))
+
 
 class ScalarBlendModifier(StrokeShader):
     """Primitive for alpha and thickness modifiers."""
@@ -158,14 +294,50 @@ class ScalarBlendModifier(StrokeShader):
             raise ValueError("unknown curve blend type: " + self.blend_type)
         return v1
 
+    def blend_array(self, v1, v2):
+        """Blends arrays of values, like blend()."""
+        fac = self.influence
+        facm = 1.0 - fac
+        if self.blend_type == 'MIX':
+            return facm * v1 + fac * v2
+        elif self.blend_type == 'ADD':
+            return v1 + fac * v2
+        elif self.blend_type == 'MULTIPLY':
+            return v1 * (facm + fac * v2)
+        elif self.blend_type == 'SUBTRACT':
+            return v1 - fac * v2
+        elif self.blend_type == 'DIVIDE':
+            nonzero = v2 != 0.0
+            return np.where(nonzero, facm * v1 + fac * v1 / np.where(nonzero, v2, 1.0), v1)
+        elif self.blend_type == 'DIFFERENCE':
+            return facm * v1 + fac * np.abs(v1 - v2)
+        elif self.blend_type == 'MINIMUM':
+            return np.minimum(fac * v2, v1)
+        elif self.blend_type == 'MAXIMUM':
+            return np.maximum(fac * v2, v1)
+        else:
+            raise ValueError("unknown curve blend type: " + self.blend_type)
+
+    def blend_alphas(self, sverts, values):
+        """Blends the given values into the alpha of the stroke vertices."""
+        if np is None:
+            for svert, b in zip(sverts, values):
+                svert.attribute.alpha = self.blend(svert.attribute.alpha, b)
+            return
+        a = np.fromiter((svert.attribute.alpha for svert in sverts), dtype=np.float64, count=len(sverts))
+        for svert, alpha in zip(sverts, self.blend_array(a, np.asarray(values, dtype=np.float64)).tolist()):
+            svert.attribute.alpha = alpha
+
 
 class CurveMappingModifier(ScalarBlendModifier):
     def __init__(self, blend, influence, mapping, invert, curve):
         ScalarBlendModifier.__init__(self, blend, influence)
         assert mapping in {'LINEAR', 'CURVE'}
         self.evaluate = getattr(self, mapping)
+        self.evaluate_array = getattr(self, mapping + "_array")
         self.invert = invert
         self.curve = curve
+        self.curve_table = None
 
     def LINEAR(self, t):
         return (1.0 - t) if self.invert else t
@@ -179,6 +351,46 @@ class CurveMappingModifier(ScalarBlendModifier):
         # therefore, bound the result by the curve's min and max values
         return bound(curve.clip_min_y, result, curve.clip_max_y)
 
+    def LINEAR_array(self, ts):
+        ts = np.asarray(ts, dtype=np.float64)
+        return (1.0 - ts) if self.invert else ts
+
+    def CURVE_array(self, ts):
+        curve = self.curve
+        curve_map = curve.curves[0]
+        if self.curve_table is None:
+            # Sample the curve at the same positions as its own table, see curvemap_make_table(),
+            # so that interpolating the samples gives the same result as evaluating the curve.
+            curve.initialize()
+            x = [point.location[0] for point in curve_map.points]
+            xs = np.linspace(min(curve.clip_min_x, *x), max(curve.clip_max_x, *x), CURVE_TABLE_SIZE + 1)
+            ys = np.array([curve.evaluate(curve=curve_map, position=x) for x in xs.tolist()])
+            self.curve_table = (xs, ys)
+        xs, ys = self.curve_table
+
+        ts = np.asarray(ts, dtype=np.float64)
+        result = np.interp(ts, xs, ys)
+        # Positions outside of the table are extrapolated by the curve.
+        outside = (ts < xs[0]) | (ts > xs[-1])
+        if outside.any():
+            result[outside] = [curve.evaluate(curve=curve_map, position=t) for t in ts[outside].tolist()]
+        return np.clip(result, curve.clip_min_y, curve.clip_max_y)
+
+    def evaluate_all(self, ts, bounds=None):
+        """
+        Evaluates the mapping at a position for each stroke vertex, mapped to the bounds when given.
+        Returns an array, or a list without NumPy.
+        """
+        if np is None:
+            values = [self.evaluate(t) for t in ts]
+            return values if bounds is None else [bounds.min + value * bounds.delta for value in values]
+        values = self.evaluate_array(ts)
+        return values if bounds is None else bounds.min + values * bounds.delta
+
+    def shade_alpha(self, sverts, ts):
+        """Blends the mapping, evaluated at a position for each stroke vertex, into the alpha of the vertices."""
+        self.blend_alphas(sverts, self.evaluate_all(ts))
+
 
 class ThicknessModifierMixIn:
     def __init__(self):
@@ -220,6 +432,30 @@ class ThicknessBlenderMixIn(ThicknessModifierMixIn):
                 thickness = sum(thickness)
             self.blend_thickness_symmetric(svert, thickness)
 
+    def blend_thicknesses(self, sverts, values):
+        """Blends and sets the thickness of the stroke vertices, like blend_thickness_symmetric()."""
+        if np is None:
+            for svert, v in zip(sverts, values):
+                self.blend_thickness_symmetric(svert, v)
+            return
+        thickness = vectors_to_array((svert.attribute.thickness for svert in sverts), len(sverts), 2)
+        v = self.blend_array(thickness[:, 0] + thickness[:, 1], np.asarray(values, dtype=np.float64))
+
+        if self.position == 'CENTER':
+            outer = inner = v * 0.5
+        elif self.position == 'INSIDE':
+            outer, inner = np.zeros_like(v), v
+        elif self.position == 'OUTSIDE':
+            outer, inner = v, np.zeros_like(v)
+        elif self.position == 'RELATIVE':
+            outer = v * self.ratio
+            inner = v - outer
+        else:
+            raise ValueError("unknown thickness position: " + self.position)
+
+        for svert, outer, inner in zip(sverts, outer.tolist(), inner.tolist()):
+            self.set_thickness(svert, outer, inner)
+
     def blend_thickness_symmetric(self, svert, v):
         """Blends and sets the thickness. Thickness is equal on each side of the backbone"""
         outer, inner = svert.attribute.thickness
@@ -292,20 +528,16 @@ class ColorAlongStrokeShader(ColorRampModifier):
     """Maps a ramp to the color of the stroke, using the curvilinear abscissa (t)."""
 
     def shade(self, stroke):
-        for svert, t in zip(stroke, iter_t2d_along_stroke(stroke)):
-            a = svert.attribute.color
-            b = self.evaluate(t)
-            svert.attribute.color = self.blend_ramp(a, b)
+        sverts = tuple(stroke)
+        self.shade_ramp(sverts, t2d_along_stroke(stroke, sverts))
 
 
 class AlphaAlongStrokeShader(CurveMappingModifier):
     """Maps a curve to the alpha/transparency of the stroke, using the curvilinear abscissa (t)."""
 
     def shade(self, stroke):
-        for svert, t in zip(stroke, iter_t2d_along_stroke(stroke)):
-            a = svert.attribute.alpha
-            b = self.evaluate(t)
-            svert.attribute.alpha = self.blend(a, b)
+        sverts = tuple(stroke)
+        self.shade_alpha(sverts, t2d_along_stroke(stroke, sverts))
 
 
 class ThicknessAlongStrokeShader(ThicknessBlenderMixIn, CurveMappingModifier):
@@ -318,9 +550,8 @@ class ThicknessAlongStrokeShader(ThicknessBlenderMixIn, CurveMappingModifier):
         self.value = BoundedProperty(value_min, value_max)
 
     def shade(self, stroke):
-        for svert, t in zip(stroke, iter_t2d_along_stroke(stroke)):
-            b = self.value.min + self.evaluate(t) * self.value.delta
-            self.blend_thickness(svert, b)
+        sverts = tuple(stroke)
+        self.blend_thicknesses(sverts, self.evaluate_all(t2d_along_stroke(stroke, sverts), self.value))
 
 
 # -- Distance from Camera modifiers -- #
@@ -333,11 +564,8 @@ class ColorDistanceFromCameraShader(ColorRampModifier):
         self.range = BoundedProperty(range_min, range_max)
 
     def shade(self, stroke):
-        it = iter_distance_from_camera(stroke, *self.range)
-        for svert, t in it:
-            a = svert.attribute.color
-            b = self.evaluate(t)
-            svert.attribute.color = self.blend_ramp(a, b)
+        sverts = tuple(stroke)
+        self.shade_ramp(sverts, distance_from_point(sverts, Vector(), *self.range))
 
 
 class AlphaDistanceFromCameraShader(CurveMappingModifier):
@@ -348,11 +576,8 @@ class AlphaDistanceFromCameraShader(CurveMappingModifier):
         self.range = BoundedProperty(range_min, range_max)
 
     def shade(self, stroke):
-        it = iter_distance_from_camera(stroke, *self.range)
-        for svert, t in it:
-            a = svert.attribute.alpha
-            b = self.evaluate(t)
-            svert.attribute.alpha = self.blend(a, b)
+        sverts = tuple(stroke)
+        self.shade_alpha(sverts, distance_from_point(sverts, Vector(), *self.range))
 
 
 class ThicknessDistanceFromCameraShader(ThicknessBlenderMixIn, CurveMappingModifier):
@@ -366,9 +591,9 @@ class ThicknessDistanceFromCameraShader(ThicknessBlenderMixIn, CurveMappingModif
         self.value = BoundedProperty(value_min, value_max)
 
     def shade(self, stroke):
-        for (svert, t) in iter_distance_from_camera(stroke, *self.range):
-            b = self.value.min + self.evaluate(t) * self.value.delta
-            self.blend_thickness(svert, b)
+        sverts = tuple(stroke)
+        ts = distance_from_point(sverts, Vector(), *self.range)
+        self.blend_thicknesses(sverts, self.evaluate_all(ts, self.value))
 
 
 # Distance from Object modifiers
@@ -387,11 +612,8 @@ class ColorDistanceFromObjectShader(ColorRampModifier):
         self.loc = matrix @ target.location
 
     def shade(self, stroke):
-        it = iter_distance_from_object(stroke, self.loc, *self.range)
-        for svert, t in it:
-            a = svert.attribute.color
-            b = self.evaluate(t)
-            svert.attribute.color = self.blend_ramp(a, b)
+        sverts = tuple(stroke)
+        self.shade_ramp(sverts, distance_from_point(sverts, self.loc, *self.range))
 
 
 class AlphaDistanceFromObjectShader(CurveMappingModifier):
@@ -408,11 +630,8 @@ class AlphaDistanceFromObjectShader(CurveMappingModifier):
         self.loc = matrix @ target.location
 
     def shade(self, stroke):
-        it = iter_distance_from_object(stroke, self.loc, *self.range)
-        for svert, t in it:
-            a = svert.attribute.alpha
-            b = self.evaluate(t)
-            svert.attribute.alpha = self.blend(a, b)
+        sverts = tuple(stroke)
+        self.shade_alpha(sverts, distance_from_point(sverts, self.loc, *self.range))
 
 
 class ThicknessDistanceFromObjectShader(ThicknessBlenderMixIn, CurveMappingModifier):
@@ -432,10 +651,9 @@ class ThicknessDistanceFromObjectShader(ThicknessBlenderMixIn, CurveMappingModif
         self.loc = matrix @ target.location
 
     def shade(self, stroke):
-        it = iter_distance_from_object(stroke, self.loc, *self.range)
-        for svert, t in it:
-            b = self.value.min + self.evaluate(t) * self.value.delta
-            self.blend_thickness(svert, b)
+        sverts = tuple(stroke)
+        ts = distance_from_point(sverts, self.loc, *self.range)
+        self.blend_thicknesses(sverts, self.evaluate_all(ts, self.value))
 
 
 # Material modifiers
@@ -451,6 +669,8 @@ class ColorMaterialShader(ColorRampModifier):
     def shade(self, stroke, attributes={'DIFF', 'SPEC', 'LINE'}):
         it = Interface0DIterator(stroke)
         if not self.use_ramp and self.attribute in attributes:
+            sverts = []
+            colors = []
             for svert in it:
                 material = self.func(it)
                 if self.attribute == 'LINE':
@@ -459,13 +679,11 @@ class ColorMaterialShader(ColorRampModifier):
                     b = material.diffuse[0:3]
                 else:
                     b = material.specular[0:3]
-                a = svert.attribute.color
-                svert.attribute.color = self.blend_ramp(a, b)
+                sverts.append(svert)
+                colors.append(b)
+            self.blend_colors(sverts, colors)
         else:
-            for svert, value in iter_material_value(stroke, self.func, self.attribute):
-                a = svert.attribute.color
-                b = self.evaluate(value)
-                svert.attribute.color = self.blend_ramp(a, b)
+            self.shade_ramp(*split_vertex_values(iter_material_value(stroke, self.func, self.attribute)))
 
 
 class AlphaMaterialShader(CurveMappingModifier):
@@ -477,10 +695,7 @@ class AlphaMaterialShader(CurveMappingModifier):
         self.func = CurveMaterialF0D()
 
     def shade(self, stroke):
-        for svert, value in iter_material_value(stroke, self.func, self.attribute):
-            a = svert.attribute.alpha
-            b = self.evaluate(value)
-            svert.attribute.alpha = self.blend(a, b)
+        self.shade_alpha(*split_vertex_values(iter_material_value(stroke, self.func, self.attribute)))
 
 
 class ThicknessMaterialShader(ThicknessBlenderMixIn, CurveMappingModifier):
@@ -495,9 +710,8 @@ class ThicknessMaterialShader(ThicknessBlenderMixIn, CurveMappingModifier):
         self.func = CurveMaterialF0D()
 
     def shade(self, stroke):
-        for svert, value in iter_material_value(stroke, self.func, self.attribute):
-            b = self.value.min + self.evaluate(value) * self.value.delta
-            self.blend_thickness(svert, b)
+        sverts, values = split_vertex_values(iter_material_value(stroke, self.func, self.attribute))
+        self.blend_thicknesses(sverts, self.evaluate_all(values, self.value))
 
 
 # Calligraphic thickness modifier
@@ -515,6 +729,8 @@ class CalligraphicThicknessShader(ThicknessBlenderMixIn, ScalarBlendModifier):
 
     def shade(self, stroke):
         it = Interface0DIterator(stroke)
+        sverts = []
+        values = []
         for svert in it:
             dir = self.func(it)
             if dir.length != 0.0:
@@ -523,7 +739,9 @@ class CalligraphicThicknessShader(ThicknessBlenderMixIn, ScalarBlendModifier):
                 b = self.thickness.min + fac * self.thickness.delta
             else:
                 b = self.thickness.min
-            self.blend_thickness(svert, b)
+            sverts.append(svert)
+            values.append(b)
+        self.blend_thicknesses(sverts, values)
 
 
 # - Tangent Modifiers - #
@@ -533,11 +751,7 @@ class TangentColorShader(ColorRampModifier):
 
     def shade(self, stroke):
         it = Interface0DIterator(stroke)
-        for svert in it:
-            angle = angle_x_normal(it)
-            fac = self.evaluate(angle / pi)
-            a = svert.attribute.color
-            svert.attribute.color = self.blend_ramp(a, fac)
+        self.shade_ramp(*split_vertex_values((svert, angle_x_normal(it) / pi) for svert in it))
 
 
 class TangentAlphaShader(CurveMappingModifier):
@@ -545,11 +759,7 @@ class TangentAlphaShader(CurveMappingModifier):
 
     def shade(self, stroke):
         it = Interface0DIterator(stroke)
-        for svert in it:
-            angle = angle_x_normal(it)
-            fac = self.evaluate(angle / pi)
-            a = svert.attribute.alpha
-            svert.attribute.alpha = self.blend(a, fac)
+        self.shade_alpha(*split_vertex_values((svert, angle_x_normal(it) / pi) for svert in it))
 
 
 class TangentThicknessShader(ThicknessBlenderMixIn, CurveMappingModifier):
@@ -563,10 +773,8 @@ class TangentThicknessShader(ThicknessBlenderMixIn, CurveMappingModifier):
 
     def shade(self, stroke):
         it = Interface0DIterator(stroke)
-        for svert in it:
-            angle = angle_x_normal(it)
-            thickness = self.thickness.min + self.evaluate(angle / pi) * self.thickness.delta
-            self.blend_thickness(svert, thickness)
+        sverts, ts = split_vertex_values((svert, angle_x_normal(it) / pi) for svert in it)
+        self.blend_thicknesses(sverts, self.evaluate_all(ts, self.thickness))
 
 
 # - Noise Modifiers - #
@@ -616,9 +824,8 @@ class ColorNoiseShader(ColorRampModifier, NoiseShader):
         NoiseShader.__init__(self, amplitude, period, seed)
 
     def shade(self, stroke):
-        for svert, noiseval1, noiseval2 in self.noisegen(stroke):
-            position = abs(noiseval1 + noiseval2)
-            svert.attribute.color = self.blend_ramp(svert.attribute.color, self.evaluate(position))
+        self.shade_ramp(*split_vertex_values((svert, abs(noiseval1 + noiseval2))
+                                             for svert, noiseval1, noiseval2 in self.noisegen(stroke)))
 
 
 class AlphaNoiseShader(CurveMappingModifier, NoiseShader):
@@ -629,9 +836,8 @@ class AlphaNoiseShader(CurveMappingModifier, NoiseShader):
         NoiseShader.__init__(self, amplitude, period, seed)
 
     def shade(self, stroke, n1=Noise(), n2=Noise()):
-        for svert, noiseval1, noiseval2 in self.noisegen(stroke):
-            position = abs(noiseval1 + noiseval2)
-            svert.attribute.alpha = self.blend(svert.attribute.alpha, self.evaluate(position))
+        self.shade_alpha(*split_vertex_values((svert, abs(noiseval1 + noiseval2))
+                                              for svert, noiseval1, noiseval2 in self.noisegen(stroke)))
 
 
 # - Crease Angle Modifiers - #
@@ -646,6 +852,14 @@ def crease_angle(svert):
     return acos(product)
 
 
+def iter_crease_angle(stroke, bounded_angle):
+    """Yields the crease angle interpolated in the bounds, for every StrokeVertex on a crease."""
+    for svert in stroke:
+        angle = crease_angle(svert)
+        if angle is not None:
+            yield (svert, bounded_angle.interpolate(angle))
+
+
 class CreaseAngleColorShader(ColorRampModifier):
     """Color based on the crease angle between two adjacent faces on the underlying geometry"""
 
@@ -655,12 +869,7 @@ class CreaseAngleColorShader(ColorRampModifier):
         self.angle = BoundedProperty(angle_min, angle_max)
 
     def shade(self, stroke):
-        for svert in stroke:
-            angle = crease_angle(svert)
-            if angle is None:
-                continue
-            t = self.angle.interpolate(angle)
-            svert.attribute.color = self.blend_ramp(svert.attribute.color, self.evaluate(t))
+        self.shade_ramp(*split_vertex_values(iter_crease_angle(stroke, self.angle)))
 
 
 class CreaseAngleAlphaShader(CurveMappingModifier):
@@ -672,12 +881,7 @@ class CreaseAngleAlphaShader(CurveMappingModifier):
         self.angle = BoundedProperty(angle_min, angle_max)
 
     def shade(self, stroke):
-        for svert in stroke:
-            angle = crease_angle(svert)
-            if angle is None:
-                continue
-            t = self.angle.interpolate(angle)
-            svert.attribute.alpha = self.blend(svert.attribute.alpha, self.evaluate(t))
+        self.shade_alpha(*split_vertex_values(iter_crease_angle(stroke, self.angle)))
 
 
 class CreaseAngleThicknessShader(ThicknessBlenderMixIn, CurveMappingModifier):
@@ -692,13 +896,8 @@ class CreaseAngleThicknessShader(ThicknessBlenderMixIn, CurveMappingModifier):
         self.thickness = BoundedProperty(thickness_min, thickness_max)
 
     def shade(self, stroke):
-        for svert in stroke:
-            angle = crease_angle(svert)
-            if angle is None:
-                continue
-            t = self.angle.interpolate(angle)
-            thickness = self.thickness.min + self.evaluate(t) * self.thickness.delta
-            self.blend_thickness(svert, thickness)
+        sverts, ts = split_vertex_values(iter_crease_angle(stroke, self.angle))
+        self.blend_thicknesses(sverts, self.evaluate_all(ts, self.thickness))
 
 
 # - Curvature3D Modifiers - #
@@ -725,11 +924,8 @@ class Curvature3DColorShader(ColorRampModifier):
         self.curvature = BoundedProperty(curvature_min, curvature_max)
 
     def shade(self, stroke):
-        for svert in stroke:
-            t = normalized_absolute_curvature(svert, self.curvature)
-            a = svert.attribute.color
-            b = self.evaluate(t)
-            svert.attribute.color = self.blend_ramp(a, b)
+        sverts = tuple(stroke)
+        self.shade_ramp(sverts, [normalized_absolute_curvature(svert, self.curvature) for svert in sverts])
 
 
 class Curvature3DAlphaShader(CurveMappingModifier):
@@ -740,11 +936,8 @@ class Curvature3DAlphaShader(CurveMappingModifier):
         self.curvature = BoundedProperty(curvature_min, curvature_max)
 
     def shade(self, stroke):
-        for svert in stroke:
-            t = normalized_absolute_curvature(svert, self.curvature)
-            a = svert.attribute.alpha
-            b = self.evaluate(t)
-            svert.attribute.alpha = self.blend(a, b)
+        sverts = tuple(stroke)
+        self.shade_alpha(sverts, [normalized_absolute_curvature(svert, self.curvature) for svert in sverts])
 
 
 class Curvature3DThicknessShader(ThicknessBlenderMixIn, CurveMappingModifier):
@@ -758,10 +951,9 @@ class Curvature3DThicknessShader(ThicknessBlenderMixIn, CurveMappingModifier):
         self.thickness = BoundedProperty(thickness_min, thickness_max)
 
     def shade(self, stroke):
-        for svert in stroke:
-            t = normalized_absolute_curvature(svert, self.curvature)
-            thickness = self.thickness.min + self.evaluate(t) * self.thickness.delta
-            self.blend_thickness(svert, thickness)
+        sverts = tuple(stroke)
+        ts = [normalized_absolute_curvature(svert, self.curvature) for svert in sverts]
+        self.blend_thicknesses(sverts, self.evaluate_all(ts, self.thickness))
 
 
 # Geometry modifiers
@@ -183,6 +183,139 @@ def _fake_module(mod_name, mod_path, speedy=True):
         return None
 
 
+# -----------------------------------------------------------------------------
+# Add-on Meta-Data Cache
+#
+# Extracting `bl_info` from legacy add-ons requires reading & parsing their `__init__.py`,
+# which is slow for many add-ons (especially on network file-systems).
+# Store the meta-data on disk so only add-ons which changed since it was written need to be parsed.
+#
+# Format:
+#
+# - The cache is ZLIB compressed pickled Python dictionary (see `_pickle_zlib_file_read`).
+# - The dictionary keys are as follows:
+#   `"blender": (bpy.app.version, python_version, magic_number)`
+#   `"bl_info": {mod_path: ((mtime_ns, size), bl_info), ...}`
+#
+# Failure to load will simply ignore the file and regenerate the file as needed.
+
+# The cache (loaded on first use), see `_bl_info_cache_ensure`.
+_bl_info_cache = None
+# Set when the cache needs to be written.
+_bl_info_cache_is_modified = False
+
+
+def _bl_info_cache_filepath():
+    import os
+    # Unlikely, but the configuration directory may not be known.
+    if not (config_dir := _bpy.utils.user_resource('CONFIG')):
+        return ""
+    return os.path.join(config_dir, "addons_bl_info.dat")
+
+
+def _bl_info_cache_blender_id():
+    import sys
+
+    # Number to bump to change this format and force re-generation.
+    magic_number = 0
+
+    return (_bpy.app.version, sys.version_info[0:2], magic_number)
+
+
+def _bl_info_cache_ensure():
+    global _bl_info_cache
+    import os
+
+    if _bl_info_cache is not None:
+        return _bl_info_cache
+
+    filepath = _bl_info_cache_filepath()
+    cache_data = None
+    if filepath and os.path.exists(filepath):
+        try:
+            cache_data = _pickle_zlib_file_read(filepath)
+        except Exception as ex:
+            print("Add-ons: reading meta-data cache failed ({:s}), creating...".format(str(ex)))
+
+    if not (
+            isinstance(cache_data, dict) and
+            cache_data.get("blender") == _bl_info_cache_blender_id() and
+            isinstance(cache_data.get("bl_info"), dict)
+    ):
+        cache_data = {"blender": _bl_info_cache_blender_id(), "bl_info": {}}
+
+    _bl_info_cache = cache_data
+    return _bl_info_cache
+
+
+def _bl_info_cache_write_if_modified(mod_paths_used):
+    # Write the cache, removing add-ons which no longer exist.
+    global _bl_info_cache_is_modified
+    import os
+
+    bl_info_map = _bl_info_cache_ensure()["bl_info"]
+    for mod_path in [mod_path for mod_path in bl_info_map.keys() if mod_path not in mod_paths_used]:
+        del bl_info_map[mod_path]
+        _bl_info_cache_is_modified = True
+
+    if not _bl_info_cache_is_modified:
+        return
+
+    if not (filepath := _bl_info_cache_filepath()):
+        return
+    try:
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        _pickle_zlib_file_write(filepath, _bl_info_cache)
+    except Exception as ex:
+        # Should be rare but should not cause add-ons to fail to load, attempt to write again next time.
+        print("Add-ons: writing meta-data cache failed ({:s}).".format(str(ex)))
+        return
+    _bl_info_cache_is_modified = False
+
+
+def _fake_module_cached(mod_name, mod_path, mod_paths_used):
+    # A version of `_fake_module` for legacy add-ons which uses the meta-data cache,
+    # when the file is unchanged (by modification time & size).
+    global _bl_info_cache_is_modified
+    import os
+
+    try:
+        st = os.stat(mod_path)
+    except OSError:
+        return _fake_module(mod_name, mod_path)
+
+    bl_info_map = _bl_info_cache_ensure()["bl_info"]
+    file_key = (st.st_mtime_ns, st.st_size)
+
+    if (item := bl_info_map.get(mod_path)) is not None and item[0] == file_key:
+        mod_paths_used.add(mod_path)
+        ModuleType = type(os)
+        mod = ModuleType(mod_name)
+        # Copy as `module_bl_info` initializes defaults in-place.
+        mod.bl_info = item[1].copy()
+        mod.__file__ = mod_path
+        mod.__time__ = st.st_mtime
+        return mod
+
+    mod = _fake_module(mod_name, mod_path)
+    if mod is not None:
+        mod_paths_used.add(mod_path)
+        bl_info_map[mod_path] = (file_key, mod.bl_info.copy())
+        _bl_info_cache_is_modified = True
+    return mod
+
+
+def _module_names_from_paths(addon_paths):
+    # Return the result of `bpy.path.module_names` for each `(path, package)` in `addon_paths`.
+    # Directories are scanned in parallel since this is mostly waiting on the file-system.
+    if len(addon_paths) <= 1:
+        return [_bpy.path.module_names(path, package=pkg_id) for path, pkg_id in addon_paths]
+
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=min(len(addon_paths), 8)) as executor:
+        return list(executor.map(lambda item: _bpy.path.module_names(item[0], package=item[1]), addon_paths))
+
+
 def modules_refresh(*, module_cache=addons_fake_modules):
     global error_encoding
     import os
@@ -192,8 +325,12 @@ def modules_refresh(*, module_cache=addons_fake_modules):
 
     modules_stale = set(module_cache.keys())
 
-    for path, pkg_id in _paths_with_extension_repos():
-        for mod_name, mod_path in _bpy.path.module_names(path, package=pkg_id):
+    # Legacy add-ons found in the meta-data cache.
+    mod_paths_used = set()
+
+    addon_paths = _paths_with_extension_repos()
+    for (path, pkg_id), mod_names in zip(addon_paths, _module_names_from_paths(addon_paths), strict=True):
+        for mod_name, mod_path in mod_names:
             modules_stale.discard(mod_name)
             mod = module_cache.get(mod_name)
             if mod is not None:
@@ -215,18 +352,30 @@ def modules_refresh(*, module_cache=addons_fake_modules):
                     mod = None
 
             if mod is None:
-                mod = _fake_module(
-                    mod_name,
-                    mod_path,
-                )
+                if pkg_id:
+                    mod = _fake_module(
+                        mod_name,
+                        mod_path,
+                    )
+                else:
+                    mod = _fake_module_cached(
+                        mod_name,
+                        mod_path,
+                        mod_paths_used,
+                    )
                 if mod:
                     module_cache[mod_name] = mod
+            elif not pkg_id:
+                # Keep the cache for add-ons loaded by a previous refresh.
+                mod_paths_used.add(mod.__file__)
 
     # just in case we get stale modules, not likely
     for mod_stale in modules_stale:
         del module_cache[mod_stale]
     del modules_stale
 
+    _bl_info_cache_write_if_modified(mod_paths_used)
+
 
 def modules(*, module_cache=addons_fake_modules, refresh=True):
     if refresh or ((module_cache is addons_fake_modules) and modules._is_first):
@@ -666,6 +666,10 @@ SPELL_CACHE = os.path.join("/tmp", ".spell_cache")
 # Threshold defining whether a new msgid is similar enough with an old one to reuse its translation...
 SIMILAR_MSGID_THRESHOLD = 0.75
 
+# Number of processes used when updating PO files from the POT (to search for similar msgids, or to update
+# several languages at once), 1 disables multiprocessing and 0 uses all CPUs.
+UPDATE_PROCESSES = 1
+
 # Additional import paths to add to `sys.path` (';' separated)...
 INTERN_PY_SYS_PATHS = ""
 
@@ -66,6 +66,155 @@ def get_best_similar(data):
     return key, tmp
 
 
+class SimilarMsgidIndex:
+    """
+    Find the most similar msgid from a pool of msgids, results are identical to :func:`get_best_similar`
+    (the last msgid of the pool with the best ``difflib.SequenceMatcher`` ratio, at least ``use_similar``).
+
+    A character n-gram inverted index gives the candidates sharing most n-grams with the searched msgid,
+    these are checked first so the best ratio quickly gets high. A character inverted index then gives
+    the ``SequenceMatcher.quick_ratio`` upper bound of all candidates at once,
+    only candidates which can reach the best ratio found so far are checked.
+    """
+    __slots__ = (
+        "pool",
+        "pool_lengths",
+        # Pool indices sorted by the length of their msgid, and the sorted lengths.
+        # Indices in this order are called "positions".
+        "indices_sorted",
+        "lengths_sorted",
+        # Map a character to sorted lists of positions, the list at index `i` contains msgids
+        # with at least `i + 1` occurrences of the character.
+        "positions_from_char_count",
+        # Map an n-gram to the indices of msgids containing it in the pool.
+        "indices_from_ngram",
+    )
+
+    NGRAM_SIZE = 3
+    # The number of candidates sharing the most n-grams to check first.
+    NGRAM_CANDIDATES_NUM = 8
+    # N-grams found in more than this fraction of the pool are too common to find relevant candidates.
+    NGRAM_COMMON_FACTOR = 0.05
+
+    def __init__(self, pool):
+        self.pool = tuple(pool)
+        self.pool_lengths = tuple(len(msgid) for msgid in self.pool)
+        self.indices_sorted = tuple(sorted(range(len(self.pool)), key=self.pool_lengths.__getitem__))
+        self.lengths_sorted = tuple(self.pool_lengths[index] for index in self.indices_sorted)
+
+        positions_from_char_count = {}
+        for position, index in enumerate(self.indices_sorted):
+            for char, count in collections.Counter(self.pool[index]).items():
+                levels = positions_from_char_count.setdefault(char, [])
+                while len(levels) < count:
+                    levels.append([])
+                for level in range(count):
+                    levels[level].append(position)
+
+        indices_from_ngram = {}
+        ngram_size = self.NGRAM_SIZE
+        for index, msgid in enumerate(self.pool):
+            for ngram in {msgid[i:i + ngram_size] for i in range(len(msgid) - ngram_size + 1)}:
+                indices_from_ngram.setdefault(ngram, []).append(index)
+
+        ngram_common_num = max(self.NGRAM_CANDIDATES_NUM, int(len(self.pool) * self.NGRAM_COMMON_FACTOR))
+        self.positions_from_char_count = positions_from_char_count
+        self.indices_from_ngram = {
+            ngram: indices for ngram, indices in indices_from_ngram.items() if len(indices) <= ngram_common_num
+        }
+
+    def best_similar(self, msgid, use_similar):
+        import bisect
+        import difflib
+
+        pool = self.pool
+        pool_lengths = self.pool_lengths
+        s = difflib.SequenceMatcher()
+        s.set_seq2(msgid)
+        len_key = len(msgid)
+        # See `get_best_similar`.
+        min_len = len_key // 2
+        max_len = len_key * 2
+
+        # Like `get_best_similar`, a later msgid in the pool with the same ratio is preferred.
+        best_ratio = use_similar
+        best_index = -1
+
+        # Check the candidates most likely to be similar first.
+        indices_checked = set()
+        ngram_size = self.NGRAM_SIZE
+        ngram_counts = collections.Counter()
+        for ngram in {msgid[i:i + ngram_size] for i in range(len_key - ngram_size + 1)}:
+            if (indices := self.indices_from_ngram.get(ngram)) is not None:
+                ngram_counts.update(indices)
+        for index, _count in ngram_counts.most_common(self.NGRAM_CANDIDATES_NUM):
+            if not (min_len < pool_lengths[index] < max_len):
+                continue
+            indices_checked.add(index)
+            s.set_seq1(pool[index])
+            if s.real_quick_ratio() >= best_ratio and s.quick_ratio() >= best_ratio:
+                sratio = s.ratio()
+                if sratio > best_ratio or (sratio == best_ratio and index > best_index):
+                    best_ratio = sratio
+                    best_index = index
+
+        # Only lengths which can reach the best ratio (as `SequenceMatcher.real_quick_ratio`),
+        # one more on each side is harmless and avoids precision issues.
+        len_range_min = min_len + 1
+        len_range_max = max_len - 1
+        if best_ratio > 0.0:
+            len_range_min = max(len_range_min, int(best_ratio * len_key / (2.0 - best_ratio)) - 1)
+            len_range_max = min(len_range_max, int(len_key * (2.0 - best_ratio) / best_ratio) + 2)
+        position_min = bisect.bisect_left(self.lengths_sorted, len_range_min)
+        position_max = bisect.bisect_right(self.lengths_sorted, len_range_max)
+
+        # The number of matching characters of all candidates (as computed by `SequenceMatcher.quick_ratio`).
+        char_matches = collections.Counter()
+        for char, count in collections.Counter(msgid).items():
+            if (levels := self.positions_from_char_count.get(char)) is not None:
+                for positions in levels[:count]:
+                    char_matches.update(positions[
+                        bisect.bisect_left(positions, position_min):
+                        bisect.bisect_left(positions, position_max)
+                    ])
+
+        # Check the remaining candidates by decreasing `quick_ratio`, until it can't reach the best ratio.
+        candidates = []
+        indices_sorted = self.indices_sorted
+        for position, matches in char_matches.items():
+            index = indices_sorted[position]
+            # Same as `difflib._calculate_ratio`.
+            if (ratio_max := 2.0 * matches / (pool_lengths[index] + len_key)) >= best_ratio:
+                if index not in indices_checked:
+                    candidates.append((ratio_max, index))
+        candidates.sort(reverse=True)
+
+        for ratio_max, index in candidates:
+            if ratio_max < best_ratio:
+                break
+            s.set_seq1(pool[index])
+            sratio = s.ratio()
+            if sratio > best_ratio or (sratio == best_ratio and index > best_index):
+                best_ratio = sratio
+                best_index = index
+
+        return pool[best_index] if best_index != -1 else None
+
+
+# The index used by `_get_best_similar_from_index` (set for each process of a multiprocessing pool).
+_similar_msgid_index = None
+
+
+def _similar_msgid_index_init(pool):
+    global _similar_msgid_index
+    _similar_msgid_index = SimilarMsgidIndex(pool)
+
+
+def _get_best_similar_from_index(data):
+    key, use_similar = data
+    return key, _similar_msgid_index.best_similar(key[1], use_similar)
+
+
 _locale_explode_re = re.compile(r"^([a-z]{2,})(?:_([A-Za-z]{2,}))?(?:@([a-z]{2,}))?$")
 
 
@@ -599,12 +748,13 @@ class I18nMessages:
                 sm.is_fuzzy = m.is_fuzzy
                 sm.comment_lines = m.comment_lines
 
-    def update(self, ref, use_similar=None, keep_old_commented=True):
+    def update(self, ref, use_similar=None, keep_old_commented=True, processes=None):
         """
         Update this I18nMessage with the ref one. Translations from ref are never used. Source comments from ref
         completely replace current ones. If use_similar is not 0.0, it will try to match new messages in ref with an
         existing one. Messages no more found in ref will be marked as commented if keep_old_commented is True,
-        or removed.
+        or removed. processes is the number of processes used to match new messages (settings' UPDATE_PROCESSES
+        when None, 0 uses all CPUs).
         """
         if use_similar is None:
             use_similar = self.settings.SIMILAR_MSGID_THRESHOLD
@@ -630,8 +780,32 @@ class I18nMessages:
 
         # Next process new keys.
         if use_similar > 0.0:
-            for key, msgid in map(get_best_similar,
-                                  tuple((nk, use_similar, tuple(similar_pool.keys())) for nk in new_keys)):
+            if processes is None:
+                processes = self.settings.UPDATE_PROCESSES
+            if processes <= 0:
+                processes = os.cpu_count() or 1
+            if processes > 1 and len(new_keys) > processes:
+                import concurrent.futures
+                similar_search_data = tuple((nk, use_similar) for nk in new_keys)
+                with concurrent.futures.ProcessPoolExecutor(
+                        max_workers=processes,
+                        initializer=_similar_msgid_index_init,
+                        initargs=(tuple(similar_pool.keys()),),
+                ) as executor:
+                    similar_search_result = tuple(executor.map(
+                        _get_best_similar_from_index,
+                        similar_search_data,
+                        chunksize=max(1, len(similar_search_data) // (processes * 4)),
+                    ))
+                del similar_search_data
+            else:
+                similar_msgid_index = SimilarMsgidIndex(similar_pool.keys())
+                similar_search_result = tuple(
+                    (nk, similar_msgid_index.best_similar(nk[1], use_similar)) for nk in new_keys
+                )
+                del similar_msgid_index
+
+            for key, msgid in similar_search_result:
                 if msgid:
                     # Try to get the same context, else just get one...
                     skey = (key[0], msgid)
@@ -1216,11 +1390,12 @@ class I18nMessages:
     }
 
     @classmethod
-    def update_from_pot_callback(cls, pot, lng, settings):
+    def update_from_pot_callback(cls, pot, lng, settings, processes=None):
         """
         Update or create a single PO file (specified by a filepath) from the given POT `I18nMessages` data.
 
         Callback usable in a context where Blender specific modules (like ``bpy``) are not available.
+        processes is passed to ``update``, use 1 when several languages are already updated in parallel.
         """
         import sys
         sys.stdout.reconfigure(encoding="utf-8")
@@ -1229,7 +1404,7 @@ class I18nMessages:
             return
         if os.path.isfile(lng['po_path']):
             po = cls(uid=lng['uid'], kind='PO', src=lng['po_path'], settings=settings)
-            po.update(pot)
+            po.update(pot, processes=processes)
         else:
             po = pot
         po.write(kind="PO", dest=lng['po_path'])
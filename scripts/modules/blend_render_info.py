@@ -16,9 +16,153 @@
 
 __all__ = (
     "read_blend_rend_chunk",
+    "ZstdSeekableReader",
 )
 
 
+class ZstdSeekableReader:
+    """
+    Read-only file-like access to the uncompressed data of a Z-standard file written with a seek table
+    (as Blender does, see ``filereader_zstd.cc``), only decompressing the frames containing the data that is read,
+    skipped frames are never decompressed.
+
+    Also used by ``tools/modules/blendfile.py``.
+    """
+    __slots__ = (
+        # The compressed file handle.
+        "_handle",
+        # Frame offsets in the compressed & uncompressed data (with the end offsets appended).
+        "_compressed_offsets",
+        "_uncompressed_offsets",
+        # The position in the uncompressed data.
+        "_offset",
+        # The index & data of the last decompressed frame.
+        "_frame_index",
+        "_frame_data",
+        "_decompressor",
+    )
+
+    def __init__(self, handle, frames):
+        import zstandard
+
+        self._handle = handle
+        self._compressed_offsets = [0]
+        self._uncompressed_offsets = [0]
+        for compressed_size, uncompressed_size in frames:
+            self._compressed_offsets.append(self._compressed_offsets[-1] + compressed_size)
+            self._uncompressed_offsets.append(self._uncompressed_offsets[-1] + uncompressed_size)
+        self._offset = 0
+        self._frame_index = -1
+        self._frame_data = b''
+        self._decompressor = zstandard.ZstdDecompressor()
+
+    @classmethod
+    def from_handle(cls, handle):
+        """
+        Return a reader for the compressed file ``handle`` or None when it has no (valid) seek table,
+        in this case the file must be decompressed as a stream.
+        """
+        if (frames := cls.read_seek_table(handle)) is None:
+            return None
+        return cls(handle, frames)
+
+    @staticmethod
+    def read_seek_table(handle):
+        """
+        Return ``[(compressed_size, uncompressed_size), ...]`` or None when there is no seek table.
+        See ``zstd_read_seek_table`` in ``filereader_zstd.cc``.
+        """
+        import struct
+        from os import SEEK_END
+
+        file_size = handle.seek(0, SEEK_END)
+        # Skippable frame magic & length, followed by the table and its footer: frames_num, flags & magic.
+        if file_size < 17:
+            return None
+        handle.seek(-9, SEEK_END)
+        frames_num, flags, magic = struct.unpack('<IBI', handle.read(9))
+        # Bit 7 indicates check-sums. Bits 5 and 6 must be zero.
+        if magic != 0x8F92EAB1 or (flags & 0x60):
+            return None
+        frame_entry = struct.Struct('<II4x' if (flags & 0x80) else '<II')
+        # The skippable frame length doesn't include its own magic and length.
+        frame_length = frames_num * frame_entry.size + 9
+        seek_frame_start = file_size - frame_length - 8
+        # Before the start of the seek table frame there must be `frames_num` frames, each at least 8 bytes long.
+        if seek_frame_start < frames_num * 8:
+            return None
+        handle.seek(seek_frame_start)
+        data = handle.read(frame_length + 8)
+        if struct.unpack_from('<II', data, 0) != (0x184D2A5E, frame_length):
+            return None
+        frames = list(frame_entry.iter_unpack(data[8:8 + frames_num * frame_entry.size]))
+        if sum(compressed_size for compressed_size, _ in frames) != seek_frame_start:
+            return None
+        return frames
+
+    def _frame_data_from_index(self, frame_index):
+        if frame_index != self._frame_index:
+            handle = self._handle
+            handle.seek(self._compressed_offsets[frame_index])
+            self._frame_data = self._decompressor.decompress(
+                handle.read(self._compressed_offsets[frame_index + 1] - self._compressed_offsets[frame_index]),
+                max_output_size=(
+                    self._uncompressed_offsets[frame_index + 1] - self._uncompressed_offsets[frame_index]
+                ),
+            )
+            self._frame_index = frame_index
+        return self._frame_data
+
+    def size(self):
+        return self._uncompressed_offsets[-1]
+
+    def read(self, size=-1):
+        import bisect
+
+        end = self.size()
+        if size is not None and size >= 0:
+            end = min(end, self._offset + size)
+        data = []
+        while self._offset < end:
+            frame_index = bisect.bisect_right(
+                self._uncompressed_offsets, self._offset, hi=len(self._uncompressed_offsets) - 1,
+            ) - 1
+            frame_start = self._uncompressed_offsets[frame_index]
+            chunk = self._frame_data_from_index(frame_index)[self._offset - frame_start:end - frame_start]
+            if not chunk:
+                raise OSError("zstd frame {:d} is smaller than its seek table entry".format(frame_index))
+            data.append(chunk)
+            self._offset += len(chunk)
+        return data[0] if len(data) == 1 else b''.join(data)
+
+    def seek(self, offset, whence=0):
+        from os import SEEK_CUR, SEEK_END, SEEK_SET
+
+        if whence == SEEK_CUR:
+            offset += self._offset
+        elif whence == SEEK_END:
+            offset += self.size()
+        elif whence != SEEK_SET:
+            raise ValueError("Unsupported whence: {!r}".format(whence))
+        if offset < 0:
+            raise ValueError("Negative seek position: {:d}".format(offset))
+        self._offset = offset
+        return offset
+
+    def tell(self):
+        return self._offset
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def close(self):
+        self._handle.close()
+        self._frame_data = b''
+
+
 class RawBlendFileReader:
     """
     Return a file handle to the raw blend file data (abstracting compressed formats).
@@ -47,9 +191,12 @@ class RawBlendFileReader:
             blendfile_base = blendfile
             blendfile = gzip.open(blendfile, "rb")
         elif head[0:4] == b'\x28\xb5\x2f\xfd':  # Z-standard magic.
-            import zstandard
             blendfile_base = blendfile
-            blendfile = zstandard.open(blendfile, "rb")
+            # Blender writes a seek table, allowing the data of blocks that are skipped not to be decompressed.
+            if (blendfile := ZstdSeekableReader.from_handle(blendfile_base)) is None:
+                import zstandard
+                blendfile_base.seek(0)
+                blendfile = zstandard.open(blendfile_base, "rb")
 
         self._blendfile_base = blendfile_base
         self._blendfile = blendfile
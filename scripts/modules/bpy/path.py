@@ -11,6 +11,9 @@ __all__ = (
     "abspath",
     "basename",
     "clean_name",
+    "directory_index_invalidate",
+    "directory_index_session",
+    "directory_index_walk",
     "display_name",
     "display_name_to_filepath",
     "display_name_from_filepath",
@@ -27,6 +30,7 @@ __all__ = (
 )
 
 import bpy as _bpy
+import contextlib as _contextlib
 import os as _os
 
 from _bpy_path import (
@@ -268,6 +272,7 @@ def resolve_ncase(path):
     """
     Resolve a case insensitive path on a case sensitive system,
     returning a string with the path if found else return the original path.
+    Directory listings are cached while a :func:`directory_index_session` is active.
 
     :arg path: The path name to resolve.
     :type path: str
@@ -303,22 +308,23 @@ def resolve_ncase(path):
         # at this point, the directory exists but not the file
 
         # we are expecting 'dirpath' to be a directory, but it could be a file
-        if _os.path.isdir(dirpath):
-            try:
-                files = _os.listdir(dirpath)
-            except PermissionError:
-                # We might not have the permission to list dirpath...
-                return path, False
-        else:
+        if not _os.path.isdir(dirpath):
             return path, False
 
         filename_low = filename.lower()
         f_iter_nocase = None
 
-        for f_iter in files:
-            if f_iter.lower() == filename_low:
-                f_iter_nocase = f_iter
-                break
+        try:
+            if _directory_index is not None:
+                f_iter_nocase = _directory_index.listing_ncase(dirpath).get(filename_low)
+            else:
+                for f_iter in _os.listdir(dirpath):
+                    if f_iter.lower() == filename_low:
+                        f_iter_nocase = f_iter
+                        break
+        except PermissionError:
+            # We might not have the permission to list dirpath...
+            return path, False
 
         if f_iter_nocase:
             return _os.path.join(dirpath, f_iter_nocase) + suffix, True
@@ -330,6 +336,160 @@ def resolve_ncase(path):
     return ncase_path if found else path
 
 
+class _DirectoryIndex:
+    """
+    Directory contents cached for the duration of a :func:`directory_index_session`.
+    """
+    __slots__ = (
+        # Directory path -> dict mapping lower case names to the first matching name.
+        "listings",
+        # Directory path -> dict mapping lower case file names to paths, see `directory_index_walk`.
+        "walks",
+    )
+
+    def __init__(self):
+        self.listings = {}
+        self.walks = {}
+
+    def listing_ncase(self, dirpath):
+        listing = self.listings.get(dirpath)
+        if listing is None:
+            listing = {}
+            for filename in _os.listdir(dirpath):
+                listing.setdefault(filename.lower(), filename)
+            self.listings[dirpath] = listing
+        return listing
+
+    def walk(self, top):
+        walk = self.walks.get(top)
+        if walk is None:
+            walk = self.walks[top] = _directory_index_walk_build(top)
+        return walk
+
+    def invalidate(self, path):
+        self.listings.pop(path, None)
+        for top in [top for top in self.walks if top == path or is_subdir(path, top)]:
+            del self.walks[top]
+
+
+# The index of the active session, `None` when no session is active.
+_directory_index = None
+
+
+def _directory_index_scan(dirpath):
+    # Split the contents of `dirpath` the same way as `os.walk` does,
+    # returning None when the directory can't be read.
+    filenames = []
+    dirpaths = []
+    try:
+        with _os.scandir(dirpath) as it:
+            for entry in it:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if not is_dir:
+                    filenames.append(entry.name)
+                    continue
+                # Like `os.walk`, don't follow symbolic links to directories.
+                try:
+                    is_symlink = entry.is_symlink()
+                except OSError:
+                    is_symlink = False
+                if not is_symlink:
+                    dirpaths.append(entry.path)
+    except OSError:
+        return None
+    return filenames, dirpaths
+
+
+def _directory_index_walk_build(top):
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Scan each level of the directory tree in parallel,
+    # reading directories is mostly waiting on the file system (especially over a network).
+    scans = {}
+    with ThreadPoolExecutor() as executor:
+        dirpaths = [top]
+        while dirpaths:
+            dirpaths_next = []
+            for dirpath, scan in zip(dirpaths, executor.map(_directory_index_scan, dirpaths)):
+                scans[dirpath] = scan
+                if scan is not None:
+                    dirpaths_next.extend(scan[1])
+            dirpaths = dirpaths_next
+
+    # Add the files in `os.walk` (top-down, depth first) order, so the first match is the same.
+    walk = {}
+    dirpaths = [top]
+    while dirpaths:
+        dirpath = dirpaths.pop()
+        scan = scans[dirpath]
+        if scan is None:
+            continue
+        filenames, dirpaths_sub = scan
+        for filename in filenames:
+            walk.setdefault(filename.lower(), []).append(_os.path.join(dirpath, filename))
+        dirpaths.extend(reversed(dirpaths_sub))
+    return walk
+
+
+@_contextlib.contextmanager
+def directory_index_session():
+    """
+    Context manager which caches directory contents while it's active,
+    so path lookups don't read the same directories over and over.
+    Used by :func:`resolve_ncase` and :func:`directory_index_walk`,
+    importers resolving many file paths can opt in to this by running the lookups in a session.
+
+    Nested sessions share the index of the outermost session.
+    Files created or removed while a session is active may not be found,
+    call :func:`directory_index_invalidate` when writing into directories which may have been indexed.
+    """
+    global _directory_index
+    if _directory_index is not None:
+        yield
+        return
+
+    _directory_index = _DirectoryIndex()
+    try:
+        yield
+    finally:
+        _directory_index = None
+
+
+def directory_index_invalidate(path=None):
+    """
+    Discard cached directory contents of the active :func:`directory_index_session`.
+
+    :arg path: The directory which has changed, when None the whole index is discarded.
+    :type path: str | bytes | None
+    """
+    if _directory_index is None:
+        return
+    if path is None:
+        _directory_index.listings.clear()
+        _directory_index.walks.clear()
+    else:
+        _directory_index.invalidate(path)
+
+
+def directory_index_walk(path):
+    """
+    Return all files found by recursively searching *path*,
+    scanning the directories in parallel the first time *path* is searched within a session.
+
+    :arg path: The directory to search.
+    :type path: str | bytes
+    :return: A dictionary mapping lower case file names to their paths, in the order ``os.walk`` finds them,
+       or None when no :func:`directory_index_session` is active.
+    :rtype: dict[str, list[str]] | None
+    """
+    if _directory_index is None:
+        return None
+    return _directory_index.walk(path)
+
+
 def ensure_ext(filepath, ext, *, case_sensitive=False):
     """
     Return the path with the extension added if it is not already set.
@@ -375,7 +535,13 @@ def module_names(path, *, recursive=False, package=""):
 
     package_prefix = (package + ".") if package else ""
 
-    for filename in sorted(_os.listdir(path)):
+    # Use `scandir` since the file type is known without having to access every file,
+    # relevant for paths on network file-systems.
+    with _os.scandir(path) as it:
+        entries = sorted(it, key=lambda entry: entry.name)
+
+    for entry in entries:
+        filename = entry.name
         if (filename == "modules") and (not package_prefix):
             pass  # XXX, hard coded exception.
         elif filename.endswith(".py") and filename != "__init__.py":
@@ -383,6 +549,11 @@ def module_names(path, *, recursive=False, package=""):
             modules.append((package_prefix + filename[0:-3], fullpath))
         elif not filename.startswith("."):
             # Skip hidden files since they are used by for version control.
+            try:
+                if not entry.is_dir():
+                    continue
+            except OSError:
+                continue
             directory = join(path, filename)
             fullpath = join(directory, "__init__.py")
             if isfile(fullpath):
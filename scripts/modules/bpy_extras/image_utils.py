@@ -36,6 +36,8 @@ def load_image(
     :arg recursive: If True, directories will be recursively searched.
        Be careful with this if you have files in your root directory because
        it may take a long time.
+       When loading many images, run the calls in a :func:`bpy.path.directory_index_session`
+       so each directory is only searched once.
     :type recursive: bool
     :arg ncase_cmp: on non windows systems, find the correct case for the file.
     :type ncase_cmp: bool
@@ -121,8 +123,19 @@ def load_image(
 
         return image
 
-    def _recursive_search(paths, filename_check):
+    def _recursive_search(paths, filename_check, filename):
         for path in paths:
+            walk = bpy.path.directory_index_walk(path)
+            if walk is not None:
+                # skip '.svn', every `dirpath` below starts with `path`.
+                if path[0] in {".", b'.'}:
+                    continue
+
+                for filepath in walk.get(filename.lower(), ()):
+                    if filename_check(os.path.basename(filepath)):
+                        yield filepath
+                continue
+
             for dirpath, _dirnames, filenames in os.walk(path):
 
                 # skip '.svn'
@@ -182,7 +195,7 @@ def load_image(
             def image_filter(fn):
                 return (imagepath_base == fn)
 
-        nfilepath = next(_recursive_search(search_paths, image_filter), None)
+        nfilepath = next(_recursive_search(search_paths, image_filter, imagepath_base), None)
         if nfilepath is not None:
             return _image_load(nfilepath)
 
@@ -13,6 +13,49 @@ __all__ = (
 )
 
 
+def _linked_components(num, a, b):
+    """
+    Returns an array with the component of each of ``num`` elements, linked by the pairs of elements
+    in the integer arrays ``a`` and ``b``. Each component is labeled with its smallest element.
+    """
+    import numpy as np
+
+    parent = np.arange(num)
+    while True:
+        root_a = parent[a]
+        root_b = parent[b]
+        unlinked = root_a != root_b
+        if not unlinked.any():
+            return parent
+        # Pairs with the same root stay linked, only check the others again.
+        a = a[unlinked]
+        b = b[unlinked]
+        root_a = root_a[unlinked]
+        root_b = root_b[unlinked]
+
+        # Union: hook the larger root of each pair to the smaller one.
+        np.minimum.at(parent, np.maximum(root_a, root_b), np.minimum(root_a, root_b))
+        # Find: compress the paths, so that each element points to the root of its component.
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                break
+            parent = grandparent
+
+
+def _group_by_component(components):
+    """
+    Returns lists of element indices with the same component,
+    ordered by component, and by index within each component.
+    """
+    import numpy as np
+
+    order = np.argsort(components, kind='stable')
+    bounds = (np.flatnonzero(np.diff(components[order])) + 1).tolist()
+    order = order.tolist()
+    return [order[start:end] for start, end in zip([0] + bounds, bounds + [len(order)]) if start != end]
+
+
 def mesh_linked_uv_islands(mesh):
     """
     Returns lists of polygon indices connected by UV islands.
@@ -22,6 +65,7 @@ def mesh_linked_uv_islands(mesh):
     :return: list of lists containing polygon indices
     :rtype: list[list[int]]
     """
+    import numpy as np
 
     if mesh.polygons and not mesh.uv_layers.active.data:
         # Currently, when in edit mode, UV Layer data will always be empty
@@ -31,54 +75,28 @@ def mesh_linked_uv_islands(mesh):
             "Use bmesh and bpy_extras.bmesh_utils.bmesh_linked_uv_islands instead."
         )
 
-    uv_loops = [luv.uv[:] for luv in mesh.uv_layers.active.data]
-    poly_loops = [poly.loop_indices for poly in mesh.polygons]
-    luv_hash = {}
-    luv_hash_get = luv_hash.get
-    luv_hash_ls = [None] * len(uv_loops)
-    for pi, poly_indices in enumerate(poly_loops):
-        for li in poly_indices:
-            uv = uv_loops[li]
-            uv_hub = luv_hash_get(uv)
-            if uv_hub is None:
-                uv_hub = luv_hash[uv] = [pi]
-            else:
-                uv_hub.append(pi)
-            luv_hash_ls[li] = uv_hub
-
-    poly_islands = []
-
-    # 0 = none, 1 = added, 2 = searched
-    poly_tag = [0] * len(poly_loops)
-
-    while True:
-        poly_index = -1
-        for i in range(len(poly_loops)):
-            if poly_tag[i] == 0:
-                poly_index = i
-                break
+    polygons = mesh.polygons
+    num_polys = len(polygons)
+    if num_polys == 0:
+        return []
 
-        if poly_index != -1:
-            island = [poly_index]
-            poly_tag[poly_index] = 1
-            poly_islands.append(island)
-        else:
-            break  # we're done
+    loop_totals = np.empty(num_polys, dtype=np.int32)
+    polygons.foreach_get("loop_total", loop_totals)
+    loop_polys = np.repeat(np.arange(num_polys), loop_totals)
 
-        added = True
-        while added:
-            added = False
-            for poly_index in island[:]:
-                if poly_tag[poly_index] == 1:
-                    for li in poly_loops[poly_index]:
-                        for poly_index_shared in luv_hash_ls[li]:
-                            if poly_tag[poly_index_shared] == 0:
-                                added = True
-                                poly_tag[poly_index_shared] = 1
-                                island.append(poly_index_shared)
-                    poly_tag[poly_index] = 2
+    uv_data = mesh.uv_layers.active.data
+    uvs = np.empty(len(uv_data) * 2, dtype=np.float32)
+    uv_data.foreach_get("uv", uvs)
+    # Polygons are linked when any of their loops have the same UV coordinates. Adding zero turns
+    # negative zero into zero, so that the bits of equal coordinates are equal.
+    uvs += np.float32(0.0)
+    uv_keys = uvs.view(np.uint64)
 
-    return poly_islands
+    order = np.argsort(uv_keys, kind='stable')
+    same_uv = uv_keys[order[1:]] == uv_keys[order[:-1]]
+    order_polys = loop_polys[order]
+    components = _linked_components(num_polys, order_polys[:-1][same_uv], order_polys[1:][same_uv])
+    return _group_by_component(components)
 
 
 def mesh_linked_triangles(mesh):
@@ -91,50 +109,30 @@ def mesh_linked_triangles(mesh):
     :return: Lists of lists containing triangles.
     :rtype: list[list[:class:`bpy.types.MeshLoopTriangle`]]
     """
+    import numpy as np
 
-    # Build vert face connectivity
-    vert_tris = [[] for i in range(len(mesh.vertices))]
-    for t in mesh.loop_triangles:
-        for v in t.vertices:
-            vert_tris[v].append(t)
-
-    # sort triangles into connectivity groups
-    tri_groups = [[t] for t in mesh.loop_triangles]
-    # map old, new tri location
-    tri_mapping = list(range(len(mesh.loop_triangles)))
-
-    # Now clump triangles iteratively
-    ok = True
-    while ok:
-        ok = False
-
-        for t in mesh.loop_triangles:
-            mapped_index = tri_mapping[t.index]
-            mapped_group = tri_groups[mapped_index]
-
-            for v in t.vertices:
-                for nxt_t in vert_tris[v]:
-                    if nxt_t != t:
-                        nxt_mapped_index = tri_mapping[nxt_t.index]
-
-                        # We are not a part of the same group
-                        if mapped_index != nxt_mapped_index:
-                            ok = True
-
-                            # Assign mapping to this group so they
-                            # all map to this group
-                            for grp_t in tri_groups[nxt_mapped_index]:
-                                tri_mapping[grp_t.index] = mapped_index
+    loop_triangles = mesh.loop_triangles
+    tri_verts = np.empty(len(loop_triangles) * 3, dtype=np.int32)
+    loop_triangles.foreach_get("vertices", tri_verts)
+    tri_verts = tri_verts.reshape(-1, 3)
 
-                            # Move triangles into this group
-                            mapped_group.extend(tri_groups[nxt_mapped_index])
+    # Triangles are connected by their vertices, link the vertices of each triangle.
+    vert_components = _linked_components(
+        len(mesh.vertices),
+        np.concatenate((tri_verts[:, 0], tri_verts[:, 0])),
+        np.concatenate((tri_verts[:, 1], tri_verts[:, 2])),
+    )
 
-                            # remove reference to the list
-                            tri_groups[nxt_mapped_index] = None
+    # Label the triangles of each component with its first triangle, to order the groups by it.
+    tri_components = vert_components[tri_verts[:, 0]]
+    first_tris = np.full(len(mesh.vertices), len(tri_verts))
+    np.minimum.at(first_tris, tri_components, np.arange(len(tri_verts)))
 
-    # return all tri groups that are not null
-    # this is all the triangles that are connected in their own lists.
-    return [tg for tg in tri_groups if tg]
+    tris = loop_triangles[:]
+    return [
+        [tris[i] for i in tri_indices]
+        for tri_indices in _group_by_component(first_tris[tri_components])
+    ]
 
 
 def edge_face_count_dict(mesh):
@@ -178,54 +176,80 @@ def edge_loops_from_edges(mesh, edges=None):
 
     closed loops have matching start and end values.
     """
-    line_polys = []
+    from collections import deque
 
-    # Get edges not used by a face
     if edges is None:
         edges = mesh.edges
+        edge_verts = [0] * (len(edges) * 2)
+        edges.foreach_get("vertices", edge_verts)
+        edge_verts = list(zip(edge_verts[0::2], edge_verts[1::2]))
+    else:
+        edge_verts = [tuple(ed.vertices) for ed in edges]
+        # Edges given in a list are used up, like when the edges were removed from it one at a time.
+        if hasattr(edges, "pop"):
+            edges.clear()
+
+    # Indices of the edges using each vertex, in ascending order.
+    vert_edges = {}
+    for i, (v1, v2) in enumerate(edge_verts):
+        vert_edges.setdefault(v1, []).append(i)
+        if v2 != v1:
+            vert_edges.setdefault(v2, []).append(i)
+
+    used = bytearray(len(edge_verts))
 
-    if not hasattr(edges, "pop"):
-        edges = edges[:]
-
-    while edges:
-        current_edge = edges.pop()
-        vert_end, vert_start = current_edge.vertices[:]
-        line_poly = [vert_start, vert_end]
-
-        ok = True
-        while ok:
-            ok = False
-            # for i, ed in enumerate(edges):
-            i = len(edges)
-            while i:
-                i -= 1
-                ed = edges[i]
-                v1, v2 = ed.vertices
-                if v1 == vert_end:
-                    line_poly.append(v2)
-                    vert_end = line_poly[-1]
-                    ok = 1
-                    del edges[i]
-                    # break
-                elif v2 == vert_end:
-                    line_poly.append(v1)
-                    vert_end = line_poly[-1]
-                    ok = 1
-                    del edges[i]
-                    # break
-                elif v1 == vert_start:
-                    line_poly.insert(0, v2)
-                    vert_start = line_poly[0]
-                    ok = 1
-                    del edges[i]
-                    # break
-                elif v2 == vert_start:
-                    line_poly.insert(0, v1)
-                    vert_start = line_poly[0]
-                    ok = 1
-                    del edges[i]
-                    # break
-        line_polys.append(line_poly)
+    line_polys = []
+    last = len(edge_verts)
+    while True:
+        # Start each loop from the last unused edge.
+        last -= 1
+        while last >= 0 and used[last]:
+            last -= 1
+        if last < 0:
+            break
+        used[last] = 1
+        vert_end, vert_start = edge_verts[last]
+        line_poly = deque((vert_start, vert_end))
+
+        # Edges are added in passes over the remaining edges in descending order, an edge is added
+        # when it uses either end of the loop at the time it's passed. Instead of passing over all
+        # edges, go to the next edge using either end of the loop in the pass.
+        below = len(edge_verts)
+        added = False
+        while True:
+            # The last unused edge before the current one, using either end of the loop.
+            i = -1
+            for vert in (vert_end, vert_start):
+                for j in reversed(vert_edges[vert]):
+                    if j < below and not used[j]:
+                        if j > i:
+                            i = j
+                        break
+            if i == -1:
+                if not added:
+                    break
+                # Start another pass.
+                below = len(edge_verts)
+                added = False
+                continue
+
+            used[i] = 1
+            below = i
+            added = True
+            v1, v2 = edge_verts[i]
+            if v1 == vert_end:
+                line_poly.append(v2)
+                vert_end = v2
+            elif v2 == vert_end:
+                line_poly.append(v1)
+                vert_end = v1
+            elif v1 == vert_start:
+                line_poly.appendleft(v2)
+                vert_start = v2
+            else:
+                line_poly.appendleft(v1)
+                vert_start = v1
+        line_polys.append(list(line_poly))
 
     return line_polys
 
@@ -4,6 +4,7 @@
 
 import bpy
 from bpy.types import Operator
+from bpy.app.translations import pgettext_rpt as rpt_
 import mathutils
 
 
@@ -223,6 +224,323 @@ class prettyface:
         return self.width, self.height
 
 
+# Shelf packing, an alternative to `prettyface` that handles all faces as arrays.
+#
+# Every face (or pair of triangles) becomes a box, each face corner gets a location within its box
+# in the [0, 1] range and the boxes are packed onto horizontal shelves.
+
+# Local box coordinates of quad corners, matching `prettyface.place`.
+_QUAD_LOCAL = ((1.0, 0.0), (0.0, 0.0), (0.0, 1.0), (1.0, 1.0))
+
+# Local box coordinates of triangle corners, ordered by the length of the opposite edge
+# (smallest, middle and largest angle). A second triangle fills the other half of the box.
+# The corners along the diagonal are moved inwards by the margin.
+_TRI_LOCAL = (
+    (((1.0, 0.0), (0.0, 1.0), (0.0, 0.0)), ((-1.0, 0.0), (0.0, -1.0), (0.0, 0.0))),
+    (((0.0, 1.0), (1.0, 0.0), (1.0, 1.0)), ((1.0, 0.0), (0.0, 1.0), (0.0, 0.0))),
+)
+
+
+def _lightmap_faces_extract(meshes, sel_only):
+    """
+    Return the face corners to unwrap from all meshes, as arrays of corners ordered by face:
+    the mesh index, the loop index and location of each corner and the number of corners of each face.
+    """
+    import numpy as np
+
+    corner_mesh = []
+    corner_loop = []
+    corner_co = []
+    face_totals = []
+
+    for mesh_index, me in enumerate(meshes):
+        polygons = me.polygons
+        loop_start = np.empty(len(polygons), dtype=np.int32)
+        loop_total = np.empty(len(polygons), dtype=np.int32)
+        select = np.empty(len(polygons), dtype=bool)
+        polygons.foreach_get(("loop_start", "loop_total", "select"), (loop_start, loop_total, select))
+
+        if sel_only:
+            loop_start = loop_start[select]
+            loop_total = loop_total[select]
+
+        vertex_co = np.empty(len(me.vertices) * 3, dtype=np.float64)
+        me.vertices.foreach_get("co", vertex_co)
+        loop_vertex = np.empty(len(me.loops), dtype=np.int32)
+        me.loops.foreach_get("vertex_index", loop_vertex)
+
+        # Loop indices of the faces, in face order.
+        face_offset = np.cumsum(loop_total) - loop_total
+        loops = np.arange(loop_total.sum()) + np.repeat(loop_start - face_offset, loop_total)
+
+        corner_mesh.append(np.full(len(loops), mesh_index, dtype=np.int32))
+        corner_loop.append(loops)
+        corner_co.append(vertex_co.reshape(-1, 3)[loop_vertex[loops]])
+        face_totals.append(loop_total)
+
+    return (
+        np.concatenate(corner_mesh),
+        np.concatenate(corner_loop),
+        np.concatenate(corner_co),
+        np.concatenate(face_totals),
+    )
+
+
+def _lightmap_boxes_from_faces(corner_co, face_total):
+    """
+    Return the size of each box (width & height) and, for each face corner,
+    the box it's placed in, its location in the box and the direction of its margin inset.
+    """
+    import numpy as np
+
+    num_corners = len(corner_co)
+    face_start = np.cumsum(face_total) - face_total
+
+    corner_box = np.empty(num_corners, dtype=np.int64)
+    corner_local = np.empty((num_corners, 2))
+    corner_inset = np.zeros((num_corners, 2))
+    box_sizes = []
+
+    def boxes_add(sizes):
+        box_first = sum(len(s) for s in box_sizes)
+        box_sizes.append(sizes)
+        return np.arange(box_first, box_first + len(sizes))
+
+    # Quads, the width & height are the average length of opposite edges.
+    quad_start = face_start[face_total == 4]
+    if len(quad_start):
+        quad_corners = quad_start[:, None] + np.arange(4)
+        co = corner_co[quad_corners]
+        edge_len = np.linalg.norm(co - np.roll(co, -1, axis=1), axis=2)
+        boxes = boxes_add(np.stack((
+            (edge_len[:, 0] + edge_len[:, 2]) / 2.0,
+            (edge_len[:, 1] + edge_len[:, 3]) / 2.0,
+        ), axis=1))
+        corner_box[quad_corners] = boxes[:, None]
+        corner_local[quad_corners] = _QUAD_LOCAL
+
+    # N-gons, projected on the plane of the face and aligned to the dominant direction of its edges.
+    is_ngon = face_total > 4
+    if is_ngon.any():
+        ngon_total = face_total[is_ngon]
+        ngon_corners = np.flatnonzero(np.repeat(is_ngon, face_total))
+        ngon_offset = np.cumsum(ngon_total) - ngon_total
+        ngon_of_corner = np.repeat(np.arange(len(ngon_total)), ngon_total)
+        co = corner_co[ngon_corners]
+        # Next corner of the face, wrapping around to the first corner.
+        corner_next = np.arange(len(ngon_corners)) + 1
+        corner_next[ngon_offset + ngon_total - 1] = ngon_offset
+
+        # Newell's method for the normals, robust for concave faces.
+        normal = np.add.reduceat(np.cross(co, co[corner_next]), ngon_offset)
+        normal /= np.maximum(np.linalg.norm(normal, axis=1), 1e-30)[:, None]
+        helper = np.where((np.abs(normal[:, 2]) < 0.9)[:, None], (0.0, 0.0, 1.0), (1.0, 0.0, 0.0))
+        tangent = np.cross(helper, normal)
+        tangent /= np.linalg.norm(tangent, axis=1)[:, None]
+        bitangent = np.cross(normal, tangent)
+        co_2d = np.stack((
+            np.einsum("ij,ij->i", co, tangent[ngon_of_corner]),
+            np.einsum("ij,ij->i", co, bitangent[ngon_of_corner]),
+        ), axis=1)
+
+        # Edges at right angles reinforce each other when their angle is multiplied by four,
+        # so the box follows the edges of rectangular faces.
+        edge = co_2d[corner_next] - co_2d
+        edge_len = np.hypot(edge[:, 0], edge[:, 1])
+        edge_angle = np.arctan2(edge[:, 1], edge[:, 0]) * 4.0
+        angle = np.arctan2(
+            np.add.reduceat(edge_len * np.sin(edge_angle), ngon_offset),
+            np.add.reduceat(edge_len * np.cos(edge_angle), ngon_offset),
+        ) / 4.0
+        cos_angle = np.cos(angle)[ngon_of_corner]
+        sin_angle = np.sin(angle)[ngon_of_corner]
+        co_2d = np.stack((
+            co_2d[:, 0] * cos_angle + co_2d[:, 1] * sin_angle,
+            co_2d[:, 1] * cos_angle - co_2d[:, 0] * sin_angle,
+        ), axis=1)
+
+        co_min = np.minimum.reduceat(co_2d, ngon_offset)
+        span = np.maximum.reduceat(co_2d, ngon_offset) - co_min
+        is_degenerate = (span < 0.0000001).any(axis=1)
+        span[is_degenerate] = 1.0
+        local = (co_2d - co_min[ngon_of_corner]) / span[ngon_of_corner]
+        local[is_degenerate[ngon_of_corner]] = 0.0
+        span[is_degenerate] = 0.0
+
+        boxes = boxes_add(span)
+        corner_box[ngon_corners] = boxes[ngon_of_corner]
+        corner_local[ngon_corners] = local
+
+    # Triangles, paired with a triangle of similar shape to fill a box.
+    # Each triangle is placed with the corner of the largest angle in a corner of the box,
+    # the width & height are the lengths of its adjacent edges.
+    tri_start = face_start[face_total == 3]
+    if len(tri_start):
+        tri_corners = tri_start[:, None] + np.arange(3)
+        co = corner_co[tri_corners]
+        # Length of the edge opposite of each corner.
+        edge_len = np.linalg.norm(np.roll(co, -1, axis=1) - np.roll(co, 1, axis=1), axis=2)
+        corner_order = np.argsort(edge_len, axis=1)
+        tri_corners = np.take_along_axis(tri_corners, corner_order, axis=1)
+        edge_len = np.take_along_axis(edge_len, corner_order, axis=1)
+
+        # Triangles of a similar shape are next to each other once sorted by their edge lengths.
+        tri_order = np.lexsort((edge_len[:, 0], edge_len[:, 1], edge_len[:, 2]))
+        num_pairs = len(tri_order) // 2
+        tri_a = tri_order[0:num_pairs * 2:2]
+        tri_b = tri_order[1:num_pairs * 2:2]
+        tri_single = tri_order[num_pairs * 2:]
+
+        boxes = boxes_add(np.concatenate((
+            (edge_len[tri_a][:, 1::-1] + edge_len[tri_b][:, 1::-1]) / 2.0,
+            edge_len[tri_single][:, 1::-1],
+        )))
+        tri_box = np.empty(len(tri_order), dtype=np.int64)
+        tri_box[np.concatenate((tri_a, tri_single))] = boxes
+        tri_box[tri_b] = boxes[:num_pairs]
+        is_tri_b = np.zeros(len(tri_order), dtype=bool)
+        is_tri_b[tri_b] = True
+
+        corner_box[tri_corners] = tri_box[:, None]
+        tri_local = np.array(_TRI_LOCAL)
+        corner_local[tri_corners] = tri_local[is_tri_b.astype(np.intp), 0]
+        corner_inset[tri_corners] = tri_local[is_tri_b.astype(np.intp), 1]
+
+    return np.concatenate(box_sizes), corner_box, corner_local, corner_inset
+
+
+def _lightmap_shelf_pack(box_width, box_height, strip_width):
+    """
+    Pack boxes onto shelves of a strip of the given width,
+    taller boxes first (next fit decreasing height).
+    Return the location of every box and the width & height used.
+    """
+    import numpy as np
+
+    num_boxes = len(box_width)
+    box_order = np.lexsort((-box_width, -box_height))
+    width_sorted = box_width[box_order]
+    height_sorted = box_height[box_order]
+    width_cumulative = np.concatenate(((0.0,), np.cumsum(width_sorted)))
+
+    box_x = np.empty(num_boxes)
+    box_y = np.empty(num_boxes)
+    pack_width = 0.0
+    pack_height = 0.0
+    start = 0
+    while start < num_boxes:
+        # All boxes that fit in the strip, at least one box per shelf.
+        end = int(np.searchsorted(width_cumulative, width_cumulative[start] + strip_width, side='right')) - 1
+        end = max(end, start + 1)
+
+        shelf = box_order[start:end]
+        box_x[shelf] = width_cumulative[start:end] - width_cumulative[start]
+        box_y[shelf] = pack_height
+        pack_width = max(pack_width, width_cumulative[end] - width_cumulative[start])
+        pack_height += height_sorted[start]
+        start = end
+
+    return box_x, box_y, pack_width, pack_height
+
+
+def _lightmap_uvpack_shelves(
+        meshes,
+        PREF_SEL_ONLY=True,
+        PREF_PACK_IN_ONE=False,
+        PREF_MARGIN_DIV=512,
+        PREF_QUALITY=True,
+):
+    """
+    Unwrap every face to its own box and pack the boxes onto shelves.
+
+    Box heights are rounded to a set of sizes so the boxes fill the shelves,
+    with PREF_QUALITY the sizes are closer together (less distortion)
+    and several shelf widths are tried to use the most of the UV space.
+
+    Return the packing efficiency (the fraction of the UV space covered by boxes) of each packed group.
+    """
+    import time
+    import numpy as np
+
+    t = time.time()
+
+    if PREF_PACK_IN_ONE:
+        mesh_groups = [meshes]
+    else:
+        mesh_groups = [[me] for me in meshes]
+
+    efficiencies = []
+    for mesh_group in mesh_groups:
+        print("\nStarting unwrap")
+
+        corner_mesh, corner_loop, corner_co, face_total = _lightmap_faces_extract(mesh_group, PREF_SEL_ONLY)
+        if not len(face_total):
+            continue
+
+        box_size, corner_box, corner_local, corner_inset = _lightmap_boxes_from_faces(corner_co, face_total)
+
+        # Don't allow boxes smaller than the margin,
+        # since we contract on the margin, boxes that are smaller will create errors.
+        side_len = np.sqrt(box_size.prod(axis=1).sum())
+        min_len = (4.0 * side_len / PREF_MARGIN_DIV) or 1.0
+        box_size = np.maximum(box_size, min_len)
+
+        # Make all boxes wider than tall, rotating their corners.
+        is_rotated = box_size[:, 1] > box_size[:, 0]
+        box_size[is_rotated] = box_size[is_rotated, ::-1]
+        corner_is_rotated = is_rotated[corner_box]
+        corner_local[corner_is_rotated] = np.stack((
+            corner_local[corner_is_rotated, 1],
+            1.0 - corner_local[corner_is_rotated, 0],
+        ), axis=1)
+        corner_inset[corner_is_rotated] = np.stack((
+            corner_inset[corner_is_rotated, 1],
+            -corner_inset[corner_is_rotated, 0],
+        ), axis=1)
+
+        # Round heights to a power of a step size, so boxes on the same shelf have the same height.
+        height_step = 2.0 ** 0.25 if PREF_QUALITY else 2.0
+        box_size[:, 1] = min_len * height_step ** np.round(np.log(box_size[:, 1] / min_len) / np.log(height_step))
+        box_area = box_size.prod(axis=1).sum()
+
+        print("\tPacking Boxes", len(box_size), end="...")
+        if PREF_QUALITY:
+            strip_widths = np.sqrt(box_area) * np.linspace(0.9, 1.3, 9)
+        else:
+            strip_widths = (np.sqrt(box_area) * 1.1,)
+
+        # Pick the layout closest to filling a square.
+        pack_best = None
+        for strip_width in strip_widths:
+            pack = _lightmap_shelf_pack(box_size[:, 0], box_size[:, 1], max(strip_width, box_size[:, 0].max()))
+            if pack_best is None or max(pack[2], pack[3]) < max(pack_best[2], pack_best[3]):
+                pack_best = pack
+        box_x, box_y, pack_width, pack_height = pack_best
+        efficiency = float(box_area / (pack_width * pack_height))
+        efficiencies.append(efficiency)
+        print("done, {:.1%} of the UV space used".format(efficiency))
+
+        # Apply the boxes back to the UV coords, scaled to the UV space inside the margins.
+        print("\twriting back UVs", end="")
+        margin = 1.0 / PREF_MARGIN_DIV
+        box_min = np.stack((box_x / pack_width, box_y / pack_height), axis=1) + margin
+        # Boxes too small for their margins are collapsed rather than flipped.
+        box_span = np.maximum(box_size / (pack_width, pack_height) - 2.0 * margin, 0.0)
+        corner_uv = box_min[corner_box] + corner_local * box_span[corner_box] + corner_inset * margin
+
+        for mesh_index, me in enumerate(mesh_group):
+            is_mesh = corner_mesh == mesh_index
+            uv_layer = me.uv_layers.active.data
+            uv = np.empty((len(uv_layer), 2), dtype=np.float32)
+            uv_layer.foreach_get("uv", uv.ravel())
+            uv[corner_loop[is_mesh]] = corner_uv[is_mesh]
+            uv_layer.foreach_set("uv", uv.ravel())
+        print("done")
+
+    print("finished all {:.2f} ".format(time.time() - t))
+    return efficiencies
+
+
 def lightmap_uvpack(
         meshes,
         PREF_SEL_ONLY=True,
@@ -230,20 +548,47 @@ def lightmap_uvpack(
         PREF_PACK_IN_ONE=False,
         PREF_BOX_DIV=8,
         PREF_MARGIN_DIV=512,
+        PREF_PACK_PRESET='CLASSIC',
 ):
     """
     BOX_DIV if the maximum division of the UV map that
     a box may be consolidated into.
     A lower value will create more clumpy boxes and more wasted space,
     and a higher value will be slower but waste less space
+
+    PACK_PRESET selects the packing: 'CLASSIC' consolidates boxes (using BOX_DIV),
+    'QUALITY' and 'SPEED' pack boxes onto shelves, see `_lightmap_uvpack_shelves`.
+
+    Return the packing efficiency of each packed group.
     """
     import time
     from math import sqrt
 
     if not meshes:
-        return
+        return []
+
+    if PREF_PACK_PRESET != 'CLASSIC':
+        for me in meshes:
+            if PREF_NEW_UVLAYER:
+                me.uv_layers.new()
+            if not me.uv_layers:
+                me.uv_layers.new()
+
+        efficiencies = _lightmap_uvpack_shelves(
+            meshes,
+            PREF_SEL_ONLY=PREF_SEL_ONLY,
+            PREF_PACK_IN_ONE=PREF_PACK_IN_ONE,
+            PREF_MARGIN_DIV=PREF_MARGIN_DIV,
+            PREF_QUALITY=(PREF_PACK_PRESET == 'QUALITY'),
+        )
+
+        for me in meshes:
+            me.update()
+
+        return efficiencies
 
     t = time.time()
+    efficiencies = []
 
     if PREF_PACK_IN_ONE:
         face_groups = [[]]
@@ -539,6 +884,7 @@ def lightmap_uvpack(
         margin_h = ((packHeight) / PREF_MARGIN_DIV) / packHeight
 
         # print(margin_w, margin_h)
+        efficiencies.append(sum(pf.width * pf.height for pf in pretty_faces) / (packWidth * packHeight))
         print("done")
 
         # Apply the boxes back to the UV coords.
@@ -552,6 +898,7 @@ def lightmap_uvpack(
         me.update()
 
     print("finished all {:.2f} ".format(time.time() - t))
+    return efficiencies
 
 
 def unwrap(operator, context, **kwargs):
@@ -574,7 +921,14 @@ def unwrap(operator, context, **kwargs):
         operator.report({'ERROR'}, "No mesh object")
         return {'CANCELLED'}
 
-    lightmap_uvpack(meshes, **kwargs)
+    efficiencies = lightmap_uvpack(meshes, **kwargs)
+    if efficiencies:
+        operator.report(
+            {'INFO'},
+            rpt_("Packed {:d} UV map(s), {:.1f}% of the UV space used").format(
+                len(efficiencies), 100.0 * sum(efficiencies) / len(efficiencies),
+            ),
+        )
 
     # switch back to edit mode
     if is_editmode:
@@ -583,7 +937,7 @@ def unwrap(operator, context, **kwargs):
     return {'FINISHED'}
 
 
-from bpy.props import BoolProperty, FloatProperty, IntProperty
+from bpy.props import BoolProperty, EnumProperty, FloatProperty, IntProperty
 
 
 class LightMapPack(Operator):
@@ -624,6 +978,16 @@ class LightMapPack(Operator):
         default=False,
     )
     # UV Packing...
+    PREF_PACK_PRESET: EnumProperty(
+        name="Packing",
+        description="Method used to pack the faces into the UV space",
+        items=(
+            ('QUALITY', "Quality", "Pack faces onto shelves, trying several layouts to waste less space"),
+            ('SPEED', "Speed", "Pack faces onto shelves in a single pass, for very dense meshes"),
+            ('CLASSIC', "Classic", "Group faces into boxes of powers of two before packing them, slow on dense meshes"),
+        ),
+        default='QUALITY',
+    )
     PREF_BOX_DIV: IntProperty(
         name="Pack Quality",
         description=(
@@ -651,7 +1015,10 @@ class LightMapPack(Operator):
 
         layout.prop(self, "PREF_PACK_IN_ONE")
         layout.prop(self, "PREF_NEW_UVLAYER")
-        layout.prop(self, "PREF_BOX_DIV")
+        layout.prop(self, "PREF_PACK_PRESET")
+        row = layout.row()
+        row.active = self.PREF_PACK_PRESET == 'CLASSIC'
+        row.prop(self, "PREF_BOX_DIV")
         layout.prop(self, "PREF_MARGIN_DIV")
 
     @classmethod
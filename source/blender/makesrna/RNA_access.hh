@@ -600,6 +600,23 @@ int RNA_property_collection_raw_set(ReportList *reports,
                                     void *array,
                                     RawPropertyType type,
                                     int len);
+/**
+ * Get or set several properties of all items in a collection, where each of `arrays`
+ * is used like the `array` of #RNA_property_collection_raw_get (its `stride` is ignored).
+ * The items are visited once for all properties that can't be accessed as raw arrays.
+ */
+int RNA_property_collection_raw_get_multi(ReportList *reports,
+                                          PointerRNA *ptr,
+                                          PropertyRNA *prop,
+                                          const char **propnames,
+                                          const RawArray *arrays,
+                                          int arrays_num);
+int RNA_property_collection_raw_set_multi(ReportList *reports,
+                                          PointerRNA *ptr,
+                                          PropertyRNA *prop,
+                                          const char **propnames,
+                                          const RawArray *arrays,
+                                          int arrays_num);
 size_t RNA_raw_type_sizeof(RawPropertyType type);
 RawPropertyType RNA_property_raw_type(PropertyRNA *prop);
 
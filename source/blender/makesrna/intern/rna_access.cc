@@ -27,6 +27,7 @@
 #include "BLI_string.h"
 #include "BLI_threads.h"
 #include "BLI_utildefines.h"
+#include "BLI_vector.hh"
 
 #include "BLT_translation.hh"
 
@@ -4900,47 +4901,107 @@ static int rna_property_array_length_all_dimensions(PointerRNA *ptr, PropertyRNA
   return size;
 }
 
-static int rna_raw_access(ReportList *reports,
-                          PointerRNA *ptr,
-                          PropertyRNA *prop,
-                          const char *propname,
-                          void *inarray,
-                          RawPropertyType intype,
-                          int inlen,
-                          int set)
+/** State of accessing one property of all items in a collection, see #rna_raw_access. */
+struct RawAccess {
+  const char *propname;
+  /** The array of the caller, its stride is zero. */
+  RawArray in;
+  /** The raw array of the items, when `use_raw_array` is set. */
+  RawArray out;
+  bool use_raw_array;
+  /** The property of the items, null when it has to be looked up for each item. */
+  PropertyRNA *itemprop;
+  PropertyType itemtype;
+  int itemlen;
+  /** Number of values in `in` accessed so far. */
+  int a;
+  bool needconv;
+  void *tmparray;
+  int tmplen;
+};
+
+/**
+ * Access a raw array with a type that doesn't match `in`, converting each value.
+ * Integers are converted through `int64_t` to keep their precision.
+ */
+static void rna_raw_access_convert(RawArray *in, const RawArray *out, const int arraylen, bool set)
+{
+  const bool use_double = ELEM(in->type, PROP_RAW_FLOAT, PROP_RAW_DOUBLE) ||
+                          ELEM(out->type, PROP_RAW_FLOAT, PROP_RAW_DOUBLE);
+  RawArray item = *out;
+  int a = 0;
+
+  for (int i = 0; i < out->len; i++) {
+    item.array = (char *)out->array + size_t(i) * size_t(out->stride);
+    for (int j = 0; j < arraylen; j++, a++) {
+      if (use_double) {
+        double value;
+        if (set) {
+          RAW_GET(double, value, (*in), a);
+          RAW_SET(double, item, j, value);
+        }
+        else {
+          RAW_GET(double, value, item, j);
+          RAW_SET(double, (*in), a, value);
+        }
+      }
+      else {
+        int64_t value;
+        if (set) {
+          RAW_GET(int64_t, value, (*in), a);
+          RAW_SET(int64_t, item, j, value);
+        }
+        else {
+          RAW_GET(int64_t, value, item, j);
+          RAW_SET(int64_t, (*in), a, value);
+        }
+      }
+    }
+  }
+}
+
+/**
+ * Look up the property of the items and check `in` matches its length,
+ * without accessing the items so nothing is modified when any of the properties is invalid.
+ *
+ * When the property is stored in a raw array `use_raw_array` is set and it can be accessed
+ * at once with #rna_raw_access_array, otherwise the items must be accessed one at a time
+ * with #rna_raw_access_item.
+ *
+ * \return false on error.
+ */
+static bool rna_raw_access_begin(
+    ReportList *reports, PointerRNA *ptr, PropertyRNA *prop, RawAccess *access, bool set)
 {
   StructRNA *ptype;
-  PropertyRNA *itemprop, *iprop;
+  PropertyRNA *itemprop;
   PropertyType itemtype = PropertyType(0);
-  RawArray in;
+  RawArray &in = access->in;
   int itemlen = 0;
 
-  /* initialize in array, stride assumed 0 in following code */
-  in.array = inarray;
-  in.type = intype;
-  in.len = inlen;
-  in.stride = 0;
+  access->use_raw_array = false;
 
   ptype = RNA_property_pointer_type(ptr, prop);
 
   /* try to get item property pointer */
   PointerRNA itemptr_base = RNA_pointer_create_discrete(nullptr, ptype, nullptr);
-  itemprop = RNA_struct_find_property(&itemptr_base, propname);
+  itemprop = RNA_struct_find_property(&itemptr_base, access->propname);
 
   if (itemprop) {
     /* we have item property pointer */
-    RawArray out;
+    RawArray &out = access->out;
 
     /* check type */
     itemtype = RNA_property_type(itemprop);
 
     if (!ELEM(itemtype, PROP_BOOLEAN, PROP_INT, PROP_FLOAT, PROP_ENUM)) {
       BKE_report(reports, RPT_ERROR, "Only boolean, int, float, and enum properties supported");
-      return 0;
+      return false;
     }
 
     /* check item array */
     itemlen = RNA_property_array_length(&itemptr_base, itemprop);
+    const int arraylen = (itemlen == 0) ? 1 : itemlen;
 
     /* dynamic array? need to get length per item */
     if (itemprop->getlength) {
@@ -4948,305 +5009,403 @@ static int rna_raw_access(ReportList *reports,
     }
     /* try to access as raw array */
     else if (RNA_property_collection_raw_array(ptr, prop, itemprop, set, &out)) {
-      int arraylen = (itemlen == 0) ? 1 : itemlen;
       if (in.len != arraylen * out.len) {
         BKE_reportf(reports,
                     RPT_ERROR,
                     "Array length mismatch (expected %d, got %d)",
                     out.len * arraylen,
                     in.len);
-        return 0;
+        return false;
+      }
+      access->use_raw_array = true;
+      access->itemlen = itemlen;
+      return true;
+    }
+    else {
+      /* The items are accessed one at a time, check the length up-front
+       * so the items aren't modified when it's too short. */
+      const int len = arraylen * RNA_property_collection_length(ptr, prop);
+      if (in.len < len) {
+        BKE_reportf(
+            reports, RPT_ERROR, "Array length mismatch (expected %d, got %d)", len, in.len);
+        return false;
       }
+    }
+    BLI_assert_msg(itemlen == 0 || itemtype != PROP_ENUM,
+                   "Enum array properties should not exist");
+  }
+
+  access->itemprop = itemprop;
+  access->itemtype = itemtype;
+  access->itemlen = itemlen;
+  access->a = 0;
+  access->tmparray = nullptr;
+  access->tmplen = 0;
+  access->needconv = true;
+
+  if (((itemtype == PROP_INT) && (in.type == PROP_RAW_INT)) ||
+      ((itemtype == PROP_BOOLEAN) && (in.type == PROP_RAW_BOOLEAN)) ||
+      ((itemtype == PROP_FLOAT) && (in.type == PROP_RAW_FLOAT)))
+  {
+    /* avoid creating temporary buffer if the data type match */
+    access->needconv = false;
+  }
+  return true;
+}
 
-      /* matching raw types */
-      if (out.type == in.type) {
-        void *inp = in.array;
-        void *outp = out.array;
-        size_t size;
+/**
+ * Access the property of all items at once, for properties stored in a raw array.
+ */
+static void rna_raw_access_array(RawAccess *access, bool set)
+{
+  RawArray &in = access->in;
+  const RawArray &out = access->out;
+  const int arraylen = (access->itemlen == 0) ? 1 : access->itemlen;
 
-        size = RNA_raw_type_sizeof(out.type) * arraylen;
+  /* matching raw types */
+  if (out.type == in.type) {
+    void *inp = in.array;
+    void *outp = out.array;
+    size_t size;
 
-        if (size == out.stride) {
-          /* The property is stored contiguously so the entire array can be copied at once. */
-          if (set) {
-            memcpy(outp, inp, size * out.len);
-          }
-          else {
-            memcpy(inp, outp, size * out.len);
-          }
+    size = RNA_raw_type_sizeof(out.type) * arraylen;
+
+    if (size == out.stride) {
+      /* The property is stored contiguously so the entire array can be copied at once. */
+      if (set) {
+        memcpy(outp, inp, size * out.len);
+      }
+      else {
+        memcpy(inp, outp, size * out.len);
+      }
+    }
+    else {
+      for (int a = 0; a < out.len; a++) {
+        if (set) {
+          memcpy(outp, inp, size);
         }
         else {
-          for (int a = 0; a < out.len; a++) {
-            if (set) {
-              memcpy(outp, inp, size);
-            }
-            else {
-              memcpy(inp, outp, size);
-            }
-
-            inp = (char *)inp + size;
-            outp = (char *)outp + out.stride;
-          }
+          memcpy(inp, outp, size);
         }
 
-        return 1;
+        inp = (char *)inp + size;
+        outp = (char *)outp + out.stride;
       }
+    }
+    return;
+  }
+
+  rna_raw_access_convert(&in, &out, arraylen, set);
+}
 
-      /* Could also be faster with non-matching types,
-       * for now we just do slower loop. */
+/**
+ * Access the property of a single item, for properties that aren't stored in a raw array.
+ *
+ * \return false on error.
+ */
+static bool rna_raw_access_item(ReportList *reports,
+                                PointerRNA *itemptr,
+                                RawAccess *access,
+                                bool set)
+{
+  PropertyRNA *iprop;
+  const RawArray &in = access->in;
+  int &a = access->a;
+  int j;
+
+  if (access->itemprop) {
+    /* we got the property already */
+    iprop = access->itemprop;
+  }
+  else {
+    /* not yet, look it up and verify if it is valid */
+    iprop = RNA_struct_find_property(itemptr, access->propname);
+
+    if (iprop) {
+      access->itemlen = rna_property_array_length_all_dimensions(itemptr, iprop);
+      access->itemtype = RNA_property_type(iprop);
     }
-    BLI_assert_msg(itemlen == 0 || itemtype != PROP_ENUM,
+    else {
+      BKE_reportf(reports, RPT_ERROR, "Property named '%s' not found", access->propname);
+      return false;
+    }
+
+    if (!ELEM(access->itemtype, PROP_BOOLEAN, PROP_INT, PROP_FLOAT, PROP_ENUM)) {
+      BKE_report(reports, RPT_ERROR, "Only boolean, int, float and enum properties supported");
+      return false;
+    }
+    BLI_assert_msg(access->itemlen == 0 || access->itemtype != PROP_ENUM,
                    "Enum array properties should not exist");
   }
 
-  {
-    void *tmparray = nullptr;
-    int tmplen = 0;
-    int err = 0, j, a = 0;
-    int needconv = 1;
-
-    if (((itemtype == PROP_INT) && (in.type == PROP_RAW_INT)) ||
-        ((itemtype == PROP_BOOLEAN) && (in.type == PROP_RAW_BOOLEAN)) ||
-        ((itemtype == PROP_FLOAT) && (in.type == PROP_RAW_FLOAT)))
-    {
-      /* avoid creating temporary buffer if the data type match */
-      needconv = 0;
-    }
-    /* no item property pointer, can still be id property, or
-     * property of a type derived from the collection pointer type */
-    RNA_PROP_BEGIN (ptr, itemptr, prop) {
-      if (itemptr.data) {
-        if (itemprop) {
-          /* we got the property already */
-          iprop = itemprop;
+  const PropertyType itemtype = access->itemtype;
+  const int itemlen = access->itemlen;
+
+  /* editable check */
+  if (set && !RNA_property_editable(itemptr, iprop)) {
+    return true;
+  }
+
+  if (a + itemlen > in.len) {
+    BKE_reportf(reports, RPT_ERROR, "Array length mismatch (got %d, expected more)", in.len);
+    return false;
+  }
+
+  if (itemlen == 0) {
+    /* handle conversions */
+    if (set) {
+      switch (itemtype) {
+        case PROP_BOOLEAN: {
+          int b;
+          RAW_GET(bool, b, in, a);
+          RNA_property_boolean_set(itemptr, iprop, b);
+          break;
         }
-        else {
-          /* not yet, look it up and verify if it is valid */
-          iprop = RNA_struct_find_property(&itemptr, propname);
+        case PROP_INT: {
+          int i;
+          RAW_GET(int, i, in, a);
+          RNA_property_int_set(itemptr, iprop, i);
+          break;
+        }
+        case PROP_FLOAT: {
+          float f;
+          RAW_GET(float, f, in, a);
+          RNA_property_float_set(itemptr, iprop, f);
+          break;
+        }
+        case PROP_ENUM: {
+          int i;
+          RAW_GET(int, i, in, a);
+          RNA_property_enum_set(itemptr, iprop, i);
+          break;
+        }
+        default:
+          BLI_assert_unreachable();
+          break;
+      }
+    }
+    else {
+      switch (itemtype) {
+        case PROP_BOOLEAN: {
+          int b = RNA_property_boolean_get(itemptr, iprop);
+          RAW_SET(bool, in, a, b);
+          break;
+        }
+        case PROP_INT: {
+          int i = RNA_property_int_get(itemptr, iprop);
+          RAW_SET(int, in, a, i);
+          break;
+        }
+        case PROP_FLOAT: {
+          float f = RNA_property_float_get(itemptr, iprop);
+          RAW_SET(float, in, a, f);
+          break;
+        }
+        case PROP_ENUM: {
+          int i = RNA_property_enum_get(itemptr, iprop);
+          RAW_SET(int, in, a, i);
+          break;
+        }
+        default:
+          BLI_assert_unreachable();
+          break;
+      }
+    }
+    a++;
+  }
+  else if (access->needconv) {
+    /* allocate temporary array if needed */
+    if (access->tmparray && access->tmplen != itemlen) {
+      MEM_freeN(access->tmparray);
+      access->tmparray = nullptr;
+    }
+    if (!access->tmparray) {
+      access->tmparray = MEM_callocN(sizeof(float) * itemlen, "RNA tmparray");
+      access->tmplen = itemlen;
+    }
+    void *tmparray = access->tmparray;
 
-          if (iprop) {
-            itemlen = rna_property_array_length_all_dimensions(&itemptr, iprop);
-            itemtype = RNA_property_type(iprop);
+    /* handle conversions */
+    if (set) {
+      switch (itemtype) {
+        case PROP_BOOLEAN: {
+          bool *array = static_cast<bool *>(tmparray);
+          for (j = 0; j < itemlen; j++, a++) {
+            RAW_GET(bool, array[j], in, a);
           }
-          else {
-            BKE_reportf(reports, RPT_ERROR, "Property named '%s' not found", propname);
-            err = 1;
-            break;
-          }
-
-          if (!ELEM(itemtype, PROP_BOOLEAN, PROP_INT, PROP_FLOAT, PROP_ENUM)) {
-            BKE_report(
-                reports, RPT_ERROR, "Only boolean, int, float and enum properties supported");
-            err = 1;
-            break;
+          RNA_property_boolean_set_array(itemptr, iprop, array);
+          break;
+        }
+        case PROP_INT: {
+          int *array = static_cast<int *>(tmparray);
+          for (j = 0; j < itemlen; j++, a++) {
+            RAW_GET(int, array[j], in, a);
           }
-          BLI_assert_msg(itemlen == 0 || itemtype != PROP_ENUM,
-                         "Enum array properties should not exist");
+          RNA_property_int_set_array(itemptr, iprop, array);
+          break;
         }
-
-        /* editable check */
-        if (!set || RNA_property_editable(&itemptr, iprop)) {
-          if (a + itemlen > in.len) {
-            BKE_reportf(
-                reports, RPT_ERROR, "Array length mismatch (got %d, expected more)", in.len);
-            err = 1;
-            break;
+        case PROP_FLOAT: {
+          float *array = static_cast<float *>(tmparray);
+          for (j = 0; j < itemlen; j++, a++) {
+            RAW_GET(float, array[j], in, a);
           }
-
-          if (itemlen == 0) {
-            /* handle conversions */
-            if (set) {
-              switch (itemtype) {
-                case PROP_BOOLEAN: {
-                  int b;
-                  RAW_GET(bool, b, in, a);
-                  RNA_property_boolean_set(&itemptr, iprop, b);
-                  break;
-                }
-                case PROP_INT: {
-                  int i;
-                  RAW_GET(int, i, in, a);
-                  RNA_property_int_set(&itemptr, iprop, i);
-                  break;
-                }
-                case PROP_FLOAT: {
-                  float f;
-                  RAW_GET(float, f, in, a);
-                  RNA_property_float_set(&itemptr, iprop, f);
-                  break;
-                }
-                case PROP_ENUM: {
-                  int i;
-                  RAW_GET(int, i, in, a);
-                  RNA_property_enum_set(&itemptr, iprop, i);
-                  break;
-                }
-                default:
-                  BLI_assert_unreachable();
-                  break;
-              }
-            }
-            else {
-              switch (itemtype) {
-                case PROP_BOOLEAN: {
-                  int b = RNA_property_boolean_get(&itemptr, iprop);
-                  RAW_SET(bool, in, a, b);
-                  break;
-                }
-                case PROP_INT: {
-                  int i = RNA_property_int_get(&itemptr, iprop);
-                  RAW_SET(int, in, a, i);
-                  break;
-                }
-                case PROP_FLOAT: {
-                  float f = RNA_property_float_get(&itemptr, iprop);
-                  RAW_SET(float, in, a, f);
-                  break;
-                }
-                case PROP_ENUM: {
-                  int i = RNA_property_enum_get(&itemptr, iprop);
-                  RAW_SET(int, in, a, i);
-                  break;
-                }
-                default:
-                  BLI_assert_unreachable();
-                  break;
-              }
-            }
-            a++;
+          RNA_property_float_set_array(itemptr, iprop, array);
+          break;
+        }
+        default:
+          BLI_assert_unreachable();
+          break;
+      }
+    }
+    else {
+      switch (itemtype) {
+        case PROP_BOOLEAN: {
+          bool *array = static_cast<bool *>(tmparray);
+          RNA_property_boolean_get_array(itemptr, iprop, array);
+          for (j = 0; j < itemlen; j++, a++) {
+            RAW_SET(int, in, a, ((bool *)tmparray)[j]);
           }
-          else if (needconv == 1) {
-            /* allocate temporary array if needed */
-            if (tmparray && tmplen != itemlen) {
-              MEM_freeN(tmparray);
-              tmparray = nullptr;
-            }
-            if (!tmparray) {
-              tmparray = MEM_callocN(sizeof(float) * itemlen, "RNA tmparray");
-              tmplen = itemlen;
-            }
-
-            /* handle conversions */
-            if (set) {
-              switch (itemtype) {
-                case PROP_BOOLEAN: {
-                  bool *array = static_cast<bool *>(tmparray);
-                  for (j = 0; j < itemlen; j++, a++) {
-                    RAW_GET(bool, array[j], in, a);
-                  }
-                  RNA_property_boolean_set_array(&itemptr, iprop, array);
-                  break;
-                }
-                case PROP_INT: {
-                  int *array = static_cast<int *>(tmparray);
-                  for (j = 0; j < itemlen; j++, a++) {
-                    RAW_GET(int, array[j], in, a);
-                  }
-                  RNA_property_int_set_array(&itemptr, iprop, array);
-                  break;
-                }
-                case PROP_FLOAT: {
-                  float *array = static_cast<float *>(tmparray);
-                  for (j = 0; j < itemlen; j++, a++) {
-                    RAW_GET(float, array[j], in, a);
-                  }
-                  RNA_property_float_set_array(&itemptr, iprop, array);
-                  break;
-                }
-                default:
-                  BLI_assert_unreachable();
-                  break;
-              }
-            }
-            else {
-              switch (itemtype) {
-                case PROP_BOOLEAN: {
-                  bool *array = static_cast<bool *>(tmparray);
-                  RNA_property_boolean_get_array(&itemptr, iprop, array);
-                  for (j = 0; j < itemlen; j++, a++) {
-                    RAW_SET(int, in, a, ((bool *)tmparray)[j]);
-                  }
-                  break;
-                }
-                case PROP_INT: {
-                  int *array = static_cast<int *>(tmparray);
-                  RNA_property_int_get_array(&itemptr, iprop, array);
-                  for (j = 0; j < itemlen; j++, a++) {
-                    RAW_SET(int, in, a, array[j]);
-                  }
-                  break;
-                }
-                case PROP_FLOAT: {
-                  float *array = static_cast<float *>(tmparray);
-                  RNA_property_float_get_array(&itemptr, iprop, array);
-                  for (j = 0; j < itemlen; j++, a++) {
-                    RAW_SET(float, in, a, array[j]);
-                  }
-                  break;
-                }
-                default:
-                  BLI_assert_unreachable();
-                  break;
-              }
-            }
+          break;
+        }
+        case PROP_INT: {
+          int *array = static_cast<int *>(tmparray);
+          RNA_property_int_get_array(itemptr, iprop, array);
+          for (j = 0; j < itemlen; j++, a++) {
+            RAW_SET(int, in, a, array[j]);
           }
-          else {
-            if (set) {
-              switch (itemtype) {
-                case PROP_BOOLEAN: {
-                  RNA_property_boolean_set_array(&itemptr, iprop, &((bool *)in.array)[a]);
-                  a += itemlen;
-                  break;
-                }
-                case PROP_INT: {
-                  RNA_property_int_set_array(&itemptr, iprop, &((int *)in.array)[a]);
-                  a += itemlen;
-                  break;
-                }
-                case PROP_FLOAT: {
-                  RNA_property_float_set_array(&itemptr, iprop, &((float *)in.array)[a]);
-                  a += itemlen;
-                  break;
-                }
-                default:
-                  BLI_assert_unreachable();
-                  break;
-              }
-            }
-            else {
-              switch (itemtype) {
-                case PROP_BOOLEAN: {
-                  RNA_property_boolean_get_array(&itemptr, iprop, &((bool *)in.array)[a]);
-                  a += itemlen;
-                  break;
-                }
-                case PROP_INT: {
-                  RNA_property_int_get_array(&itemptr, iprop, &((int *)in.array)[a]);
-                  a += itemlen;
-                  break;
-                }
-                case PROP_FLOAT: {
-                  RNA_property_float_get_array(&itemptr, iprop, &((float *)in.array)[a]);
-                  a += itemlen;
-                  break;
-                }
-                default:
-                  BLI_assert_unreachable();
-                  break;
-              }
-            }
+          break;
+        }
+        case PROP_FLOAT: {
+          float *array = static_cast<float *>(tmparray);
+          RNA_property_float_get_array(itemptr, iprop, array);
+          for (j = 0; j < itemlen; j++, a++) {
+            RAW_SET(float, in, a, array[j]);
           }
+          break;
         }
+        default:
+          BLI_assert_unreachable();
+          break;
       }
     }
-    RNA_PROP_END;
+  }
+  else {
+    if (set) {
+      switch (itemtype) {
+        case PROP_BOOLEAN: {
+          RNA_property_boolean_set_array(itemptr, iprop, &((bool *)in.array)[a]);
+          a += itemlen;
+          break;
+        }
+        case PROP_INT: {
+          RNA_property_int_set_array(itemptr, iprop, &((int *)in.array)[a]);
+          a += itemlen;
+          break;
+        }
+        case PROP_FLOAT: {
+          RNA_property_float_set_array(itemptr, iprop, &((float *)in.array)[a]);
+          a += itemlen;
+          break;
+        }
+        default:
+          BLI_assert_unreachable();
+          break;
+      }
+    }
+    else {
+      switch (itemtype) {
+        case PROP_BOOLEAN: {
+          RNA_property_boolean_get_array(itemptr, iprop, &((bool *)in.array)[a]);
+          a += itemlen;
+          break;
+        }
+        case PROP_INT: {
+          RNA_property_int_get_array(itemptr, iprop, &((int *)in.array)[a]);
+          a += itemlen;
+          break;
+        }
+        case PROP_FLOAT: {
+          RNA_property_float_get_array(itemptr, iprop, &((float *)in.array)[a]);
+          a += itemlen;
+          break;
+        }
+        default:
+          BLI_assert_unreachable();
+          break;
+      }
+    }
+  }
+  return true;
+}
+
+/**
+ * Access properties of all items in a collection. Properties stored in raw arrays
+ * are accessed at once, the other properties are accessed in a single pass over the items.
+ */
+static int rna_raw_access(ReportList *reports,
+                          PointerRNA *ptr,
+                          PropertyRNA *prop,
+                          const char **propnames,
+                          const RawArray *arrays,
+                          const int arrays_num,
+                          bool set)
+{
+  blender::Vector<RawAccess, 4> raw_accesses;
+  blender::Vector<RawAccess, 4> accesses;
+  bool err = false;
+
+  /* Check all properties before accessing any of them,
+   * so the items aren't partially modified when one of them is invalid. */
+  for (int i = 0; i < arrays_num; i++) {
+    RawAccess access;
+    access.propname = propnames[i];
+    /* initialize in array, stride assumed 0 in following code */
+    access.in = arrays[i];
+    access.in.stride = 0;
+
+    if (!rna_raw_access_begin(reports, ptr, prop, &access, set)) {
+      return 0;
+    }
+    if (access.use_raw_array) {
+      raw_accesses.append(access);
+    }
+    else {
+      accesses.append(access);
+    }
+  }
+
+  for (RawAccess &access : raw_accesses) {
+    rna_raw_access_array(&access, set);
+  }
+
+  if (accesses.is_empty()) {
+    return 1;
+  }
 
-    if (tmparray) {
-      MEM_freeN(tmparray);
+  /* no item property pointer, can still be id property, or
+   * property of a type derived from the collection pointer type */
+  RNA_PROP_BEGIN (ptr, itemptr, prop) {
+    if (itemptr.data) {
+      for (RawAccess &access : accesses) {
+        if (!rna_raw_access_item(reports, &itemptr, &access, set)) {
+          err = true;
+          break;
+        }
+      }
+      if (err) {
+        break;
+      }
     }
+  }
+  RNA_PROP_END;
 
-    return !err;
+  for (RawAccess &access : accesses) {
+    if (access.tmparray) {
+      MEM_freeN(access.tmparray);
+    }
   }
+
+  return !err;
 }
 
 RawPropertyType RNA_property_raw_type(PropertyRNA *prop)
@@ -5278,7 +5437,8 @@ int RNA_property_collection_raw_get(ReportList *reports,
                                     RawPropertyType type,
                                     int len)
 {
-  return rna_raw_access(reports, ptr, prop, propname, array, type, len, 0);
+  const RawArray in = {array, type, len, 0};
+  return rna_raw_access(reports, ptr, prop, &propname, &in, 1, false);
 }
 
 int RNA_property_collection_raw_set(ReportList *reports,
@@ -5289,7 +5449,28 @@ int RNA_property_collection_raw_set(ReportList *reports,
                                     RawPropertyType type,
                                     int len)
 {
-  return rna_raw_access(reports, ptr, prop, propname, array, type, len, 1);
+  const RawArray in = {array, type, len, 0};
+  return rna_raw_access(reports, ptr, prop, &propname, &in, 1, true);
+}
+
+int RNA_property_collection_raw_get_multi(ReportList *reports,
+                                          PointerRNA *ptr,
+                                          PropertyRNA *prop,
+                                          const char **propnames,
+                                          const RawArray *arrays,
+                                          int arrays_num)
+{
+  return rna_raw_access(reports, ptr, prop, propnames, arrays, arrays_num, false);
+}
+
+int RNA_property_collection_raw_set_multi(ReportList *reports,
+                                          PointerRNA *ptr,
+                                          PropertyRNA *prop,
+                                          const char **propnames,
+                                          const RawArray *arrays,
+                                          int arrays_num)
+{
+  return rna_raw_access(reports, ptr, prop, propnames, arrays, arrays_num, true);
 }
 
 /* Standard iterator functions */
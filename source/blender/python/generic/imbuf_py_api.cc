@@ -39,6 +39,8 @@ struct Py_ImBuf {
   PyObject_VAR_HEAD
   /* can be nullptr */
   ImBuf *ibuf;
+  /** Number of buffers exported through the buffer protocol, see #py_imbuf_getbuffer. */
+  int exports;
 };
 
 static int py_imbuf_valid_check(Py_ImBuf *self)
@@ -63,6 +65,23 @@ static int py_imbuf_valid_check(Py_ImBuf *self)
   } \
   ((void)0)
 
+/**
+ * Operations that reallocate or free the pixels must not run
+ * while a buffer (such as a `memoryview` or NumPy array) references them.
+ */
+static int py_imbuf_exports_check(Py_ImBuf *self, const char *error_prefix)
+{
+  if (LIKELY(self->exports == 0)) {
+    return 0;
+  }
+
+  PyErr_Format(PyExc_BufferError,
+               "%s: ImBuf pixels are referenced by %d exported buffer(s)",
+               error_prefix,
+               self->exports);
+  return -1;
+}
+
 /** \} */
 
 /* -------------------------------------------------------------------- */
@@ -113,6 +132,9 @@ static PyObject *py_imbuf_resize(Py_ImBuf *self, PyObject *args, PyObject *kw)
     PyErr_Format(PyExc_ValueError, "resize: Image size cannot be below 1 (%d, %d)", UNPACK2(size));
     return nullptr;
   }
+  if (py_imbuf_exports_check(self, "resize") == -1) {
+    return nullptr;
+  }
 
   if (method.value_found == FAST) {
     IMB_scale(self->ibuf, UNPACK2(size), IMBScaleFilter::Nearest, false);
@@ -170,6 +192,9 @@ static PyObject *py_imbuf_crop(Py_ImBuf *self, PyObject *args, PyObject *kw)
     PyErr_SetString(PyExc_ValueError, "ImBuf crop min/max not in range");
     return nullptr;
   }
+  if (py_imbuf_exports_check(self, "crop") == -1) {
+    return nullptr;
+  }
   IMB_rect_crop(self->ibuf, &crop);
   Py_RETURN_NONE;
 }
@@ -211,6 +236,9 @@ PyDoc_STRVAR(
     "   Clear image data immediately (causing an error on re-use).\n");
 static PyObject *py_imbuf_free(Py_ImBuf *self)
 {
+  if (py_imbuf_exports_check(self, "free") == -1) {
+    return nullptr;
+  }
   if (self->ibuf) {
     IMB_freeImBuf(self->ibuf);
     self->ibuf = nullptr;
@@ -349,6 +377,30 @@ static PyObject *py_imbuf_channels_get(Py_ImBuf *self, void * /*closure*/)
   return PyLong_FromLong(imbuf->channels);
 }
 
+PyDoc_STRVAR(
+    /* Wrap. */
+    py_imbuf_pixels_doc,
+    "The pixels of the image, as a writable memoryview sharing memory with the image.\n"
+    "\n"
+    "The view has the shape ``(height, width, channels)``, starting at the bottom row.\n"
+    "Images with float pixels expose them as floats (format ``'f'``),\n"
+    "other images expose their byte pixels (format ``'B'``) with 4 channels.\n"
+    "The same data is available through the buffer protocol,\n"
+    "so ``numpy.asarray(ibuf)`` wraps the pixels without copying them.\n"
+    "\n"
+    ".. note::\n"
+    "\n"
+    "   The image can't be resized, cropped or freed while views of its pixels exist.\n"
+    "   Byte pixels created from float pixels (when writing byte formats)\n"
+    "   are freed when views of the float pixels are created or released.\n"
+    "\n"
+":type: memoryview");
+static PyObject *py_imbuf_pixels_get(Py_ImBuf *self, void * /*closure*/)
+{
+  PY_IMBUF_CHECK_OBJ(self);
+  return PyMemoryView_FromObject((PyObject *)self);
+}
+
 static PyGetSetDef Py_ImBuf_getseters[] = {
     {"size", (getter)py_imbuf_size_get, (setter) nullptr, py_imbuf_size_doc, nullptr},
     {"ppm", (getter)py_imbuf_ppm_get, (setter)py_imbuf_ppm_set, py_imbuf_ppm_doc, nullptr},
@@ -359,11 +411,102 @@ static PyGetSetDef Py_ImBuf_getseters[] = {
      nullptr},
     {"planes", (getter)py_imbuf_planes_get, nullptr, py_imbuf_planes_doc, nullptr},
     {"channels", (getter)py_imbuf_channels_get, nullptr, py_imbuf_channels_doc, nullptr},
+    {"pixels", (getter)py_imbuf_pixels_get, nullptr, py_imbuf_pixels_doc, nullptr},
     {nullptr, nullptr, nullptr, nullptr, nullptr} /* Sentinel */
 };
 
 /** \} */
 
+/* -------------------------------------------------------------------- */
+/** \name Buffer Protocol
+ *
+ * Expose the pixels as a 3D array of `(height, width, channels)`,
+ * float pixels take precedence over byte pixels when both exist.
+ * \{ */
+
+/**
+ * Byte pixels are only created from float pixels when there are none (when writing byte formats),
+ * free them so edits made through an exported view of the float pixels aren't ignored.
+ */
+static void py_imbuf_byte_pixels_invalidate(ImBuf *ibuf)
+{
+  if (ibuf->float_buffer.data && ibuf->byte_buffer.data) {
+    imb_freerectImBuf(ibuf);
+  }
+}
+
+static int py_imbuf_getbuffer(Py_ImBuf *self, Py_buffer *view, int flags)
+{
+  PY_IMBUF_CHECK_INT(self);
+  ImBuf *ibuf = self->ibuf;
+
+  void *buf;
+  const char *format;
+  Py_ssize_t itemsize;
+  int channels;
+  if (ibuf->float_buffer.data) {
+    buf = ibuf->float_buffer.data;
+    format = "f";
+    itemsize = sizeof(float);
+    channels = ibuf->channels;
+  }
+  else if (ibuf->byte_buffer.data) {
+    buf = ibuf->byte_buffer.data;
+    format = "B";
+    itemsize = sizeof(uchar);
+    channels = 4;
+  }
+  else {
+    PyErr_SetString(PyExc_BufferError, "ImBuf has no pixels");
+    return -1;
+  }
+
+  /* Shape followed by strides, owned by the view. */
+  Py_ssize_t *shape = PyMem_New(Py_ssize_t, 6);
+  if (shape == nullptr) {
+    PyErr_NoMemory();
+    return -1;
+  }
+  Py_ssize_t *strides = shape + 3;
+  shape[0] = ibuf->y;
+  shape[1] = ibuf->x;
+  shape[2] = channels;
+  strides[2] = itemsize;
+  strides[1] = strides[2] * shape[2];
+  strides[0] = strides[1] * shape[1];
+
+  view->obj = Py_NewRef((PyObject *)self);
+  view->buf = buf;
+  view->len = strides[0] * shape[0];
+  view->readonly = 0;
+  view->itemsize = itemsize;
+  view->format = (flags & PyBUF_FORMAT) ? (char *)format : nullptr;
+  view->ndim = (flags & PyBUF_ND) ? 3 : 1;
+  view->shape = (flags & PyBUF_ND) ? shape : nullptr;
+  view->strides = ((flags & PyBUF_STRIDES) == PyBUF_STRIDES) ? strides : nullptr;
+  view->suboffsets = nullptr;
+  view->internal = shape;
+
+  py_imbuf_byte_pixels_invalidate(ibuf);
+  self->exports++;
+  return 0;
+}
+
+static void py_imbuf_releasebuffer(Py_ImBuf *self, Py_buffer *view)
+{
+  PyMem_Free(view->internal);
+  /* The byte pixels may have been created while the float pixels were exported. */
+  py_imbuf_byte_pixels_invalidate(self->ibuf);
+  self->exports--;
+}
+
+static PyBufferProcs Py_ImBuf_as_buffer = {
+    /*bf_getbuffer*/ (getbufferproc)py_imbuf_getbuffer,
+    /*bf_releasebuffer*/ (releasebufferproc)py_imbuf_releasebuffer,
+};
+
+/** \} */
+
 /* -------------------------------------------------------------------- */
 /** \name Type & Implementation
  * \{ */
@@ -416,7 +559,7 @@ PyTypeObject Py_ImBuf_Type = {
     /*tp_str*/ nullptr,
     /*tp_getattro*/ nullptr,
     /*tp_setattro*/ nullptr,
-    /*tp_as_buffer*/ nullptr,
+    /*tp_as_buffer*/ &Py_ImBuf_as_buffer,
     /*tp_flags*/ Py_TPFLAGS_DEFAULT,
     /*tp_doc*/ nullptr,
     /*tp_traverse*/ nullptr,
@@ -453,6 +596,7 @@ static PyObject *Py_ImBuf_CreatePyObject(ImBuf *ibuf)
 {
   Py_ImBuf *self = PyObject_New(Py_ImBuf, &Py_ImBuf_Type);
   self->ibuf = ibuf;
+  self->exports = 0;
   return (PyObject *)self;
 }
 
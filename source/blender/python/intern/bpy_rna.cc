@@ -5483,12 +5483,11 @@ static bool foreach_attr_type(BPy_PropertyRNA *self,
 
 /* pyrna_prop_collection_foreach_get/set both use this. */
 static int foreach_parse_args(BPy_PropertyRNA *self,
-                              PyObject *args,
                               const char *function_name,
+                              const char *attr,
+                              PyObject *seq,
 
                               /* Values to assign. */
-                              const char **r_attr,
-                              PyObject **r_seq,
                               int *r_tot,
                               size_t *r_size,
                               RawPropertyType *r_raw_type,
@@ -5499,20 +5498,16 @@ static int foreach_parse_args(BPy_PropertyRNA *self,
   *r_attr_signed = false;
   *r_raw_type = PROP_RAW_UNSET;
 
-  if (!PyArg_ParseTuple(args, "sO:foreach_get/set", r_attr, r_seq)) {
-    return -1;
-  }
-
-  if (!PySequence_Check(*r_seq) && PyObject_CheckBuffer(*r_seq)) {
+  if (!PySequence_Check(seq) && PyObject_CheckBuffer(seq)) {
     PyErr_Format(PyExc_TypeError,
                  "%s(..) expected second argument to be a sequence or buffer, not a %.200s",
                  function_name,
-                 Py_TYPE(*r_seq)->tp_name);
+                 Py_TYPE(seq)->tp_name);
     return -1;
   }
 
   /* TODO: buffer may not be a sequence! array.array() is though. */
-  *r_tot = PySequence_Size(*r_seq);
+  *r_tot = PySequence_Size(seq);
 
   if (*r_tot > 0) {
 #if 0
@@ -5535,13 +5530,13 @@ static int foreach_parse_args(BPy_PropertyRNA *self,
 #endif
 
     bool is_empty = false; /* `array_tot == 0`. */
-    if (!foreach_attr_type(self, *r_attr, r_raw_type, r_attr_tot, r_attr_signed, &is_empty)) {
+    if (!foreach_attr_type(self, attr, r_raw_type, r_attr_tot, r_attr_signed, &is_empty)) {
       PyErr_Format(PyExc_AttributeError,
                    "%s(..) '%.200s.%200s[...]' elements have no attribute '%.200s'",
                    function_name,
                    RNA_struct_identifier(self->ptr->type),
                    RNA_property_identifier(self->prop),
-                   *r_attr);
+                   attr);
       return -1;
     }
 
@@ -5642,204 +5637,333 @@ static bool foreach_compat_buffer(RawPropertyType raw_type, int attr_signed, con
   return false;
 }
 
-static PyObject *foreach_getset(BPy_PropertyRNA *self, PyObject *args, int set)
+/**
+ * Return the raw type matching the memory layout of a buffer,
+ * so RNA can convert the values while accessing the buffer directly.
+ */
+static RawPropertyType foreach_raw_type_from_buffer(const Py_buffer *buf)
 {
-  PyObject *item = nullptr;
-  int i = 0, ok = 0;
-  bool buffer_is_compat;
-  void *array = nullptr;
+  const char *format = buf->format ? buf->format : "B"; /* B is assumed when not set */
+  RawPropertyType raw_type = PROP_RAW_UNSET;
 
-  /* Get/set both take the same args currently. */
-  const char *attr;
-  PyObject *seq;
-  int tot, attr_tot;
-  size_t size;
-  bool attr_signed;
-  RawPropertyType raw_type;
-
-  if (foreach_parse_args(self,
-                         args,
-                         set ? "foreach_set" : "foreach_get",
-                         &attr,
-                         &seq,
-                         &tot,
-                         &size,
-                         &raw_type,
-                         &attr_tot,
-                         &attr_signed) == -1)
-  {
-    return nullptr;
+  /* Native byte order. */
+  if (ELEM(format[0], '@', '=')) {
+    format++;
+  }
+  if (format[0] == '\0' || format[1] != '\0') {
+    return PROP_RAW_UNSET;
   }
 
-  if (tot == 0) {
-    Py_RETURN_NONE;
+  switch (format[0]) {
+    case 'b':
+      raw_type = PROP_RAW_INT8;
+      break;
+    case 'B':
+      raw_type = PROP_RAW_UINT8;
+      break;
+    case 'h':
+      raw_type = PROP_RAW_SHORT;
+      break;
+    case 'H':
+      raw_type = PROP_RAW_UINT16;
+      break;
+    case 'i':
+    case 'l':
+    case 'q':
+      raw_type = (buf->itemsize == sizeof(int)) ? PROP_RAW_INT : PROP_RAW_INT64;
+      break;
+    case 'I':
+    case 'L':
+    case 'Q':
+      /* There is no unsigned 32 bit raw type, such buffers are accessed as sequences. */
+      raw_type = PROP_RAW_UINT64;
+      break;
+    case '?':
+      raw_type = PROP_RAW_BOOLEAN;
+      break;
+    case 'f':
+      raw_type = PROP_RAW_FLOAT;
+      break;
+    case 'd':
+      raw_type = PROP_RAW_DOUBLE;
+      break;
   }
 
-  if (set) { /* Get the array from python. */
-    buffer_is_compat = false;
-    if (PyObject_CheckBuffer(seq)) {
-      Py_buffer buf;
-      if (PyObject_GetBuffer(seq, &buf, PyBUF_ND | PyBUF_FORMAT) == -1) {
-        /* Request failed. A `PyExc_BufferError` will have been raised,
-         * so clear it to silently fall back to accessing as a sequence. */
-        PyErr_Clear();
-      }
-      else {
-        /* Check if the buffer matches. */
+  if (raw_type == PROP_RAW_UNSET || RNA_raw_type_sizeof(raw_type) != size_t(buf->itemsize)) {
+    return PROP_RAW_UNSET;
+  }
+  return raw_type;
+}
 
-        buffer_is_compat = foreach_compat_buffer(raw_type, attr_signed, buf.format);
+static void foreach_array_from_sequence(void *array,
+                                        RawPropertyType raw_type,
+                                        PyObject *seq,
+                                        int tot)
+{
+  for (int i = 0; i < tot; i++) {
+    PyObject *item = PySequence_GetItem(seq, i);
+    switch (raw_type) {
+      case PROP_RAW_CHAR:
+        ((char *)array)[i] = char(PyC_Long_AsU8(item));
+        break;
+      case PROP_RAW_INT8:
+        ((int8_t *)array)[i] = PyC_Long_AsI8(item);
+        break;
+      case PROP_RAW_UINT8:
+        ((uint8_t *)array)[i] = PyC_Long_AsU8(item);
+        break;
+      case PROP_RAW_SHORT:
+        ((short *)array)[i] = short(PyC_Long_AsI16(item));
+        break;
+      case PROP_RAW_UINT16:
+        ((uint16_t *)array)[i] = PyC_Long_AsU16(item);
+        break;
+      case PROP_RAW_INT:
+        ((int *)array)[i] = int(PyC_Long_AsI32(item));
+        break;
+      case PROP_RAW_BOOLEAN:
+        ((bool *)array)[i] = bool(PyC_Long_AsBool(item));
+        break;
+      case PROP_RAW_FLOAT:
+        ((float *)array)[i] = float(PyFloat_AsDouble(item));
+        break;
+      case PROP_RAW_DOUBLE:
+        ((double *)array)[i] = PyFloat_AsDouble(item);
+        break;
+      case PROP_RAW_INT64:
+        ((int64_t *)array)[i] = PyC_Long_AsI64(item);
+        break;
+      case PROP_RAW_UINT64:
+        ((uint64_t *)array)[i] = PyC_Long_AsU64(item);
+        break;
+      case PROP_RAW_UNSET:
+        /* Should never happen. */
+        BLI_assert_msg(0, "Invalid array type - set");
+        break;
+    }
 
-        if (buffer_is_compat) {
-          ok = RNA_property_collection_raw_set(
-              nullptr, &self->ptr.value(), self->prop, attr, buf.buf, raw_type, tot);
-        }
+    Py_DECREF(item);
+  }
+}
 
-        PyBuffer_Release(&buf);
-      }
+static void foreach_array_to_sequence(const void *array,
+                                      RawPropertyType raw_type,
+                                      PyObject *seq,
+                                      int tot)
+{
+  for (int i = 0; i < tot; i++) {
+    PyObject *item;
+    switch (raw_type) {
+      case PROP_RAW_CHAR:
+        item = PyLong_FromLong(long(((char *)array)[i]));
+        break;
+      case PROP_RAW_INT8:
+        item = PyLong_FromLong(long(((int8_t *)array)[i]));
+        break;
+      case PROP_RAW_UINT8:
+        item = PyLong_FromLong(long(((uint8_t *)array)[i]));
+        break;
+      case PROP_RAW_SHORT:
+        item = PyLong_FromLong(long(((short *)array)[i]));
+        break;
+      case PROP_RAW_UINT16:
+        item = PyLong_FromLong(long(((uint16_t *)array)[i]));
+        break;
+      case PROP_RAW_INT:
+        item = PyLong_FromLong(long(((int *)array)[i]));
+        break;
+      case PROP_RAW_FLOAT:
+        item = PyFloat_FromDouble(double(((float *)array)[i]));
+        break;
+      case PROP_RAW_DOUBLE:
+        item = PyFloat_FromDouble(((double *)array)[i]);
+        break;
+      case PROP_RAW_BOOLEAN:
+        item = PyBool_FromLong(long(((bool *)array)[i]));
+        break;
+      case PROP_RAW_INT64:
+        item = PyLong_FromLongLong(((int64_t *)array)[i]);
+        break;
+      case PROP_RAW_UINT64:
+        item = PyLong_FromUnsignedLongLong(((uint64_t *)array)[i]);
+        break;
+      default: /* PROP_RAW_UNSET */
+        /* Should never happen. */
+        BLI_assert_msg(0, "Invalid array type - get");
+        item = Py_None;
+        Py_INCREF(item);
+        break;
     }
 
-    /* Could not use the buffer, fallback to sequence. */
-    if (!buffer_is_compat) {
-      array = PyMem_Malloc(size * tot);
-
-      for (; i < tot; i++) {
-        item = PySequence_GetItem(seq, i);
-        switch (raw_type) {
-          case PROP_RAW_CHAR:
-            ((char *)array)[i] = char(PyC_Long_AsU8(item));
-            break;
-          case PROP_RAW_INT8:
-            ((int8_t *)array)[i] = PyC_Long_AsI8(item);
-            break;
-          case PROP_RAW_UINT8:
-            ((uint8_t *)array)[i] = PyC_Long_AsU8(item);
-            break;
-          case PROP_RAW_SHORT:
-            ((short *)array)[i] = short(PyC_Long_AsI16(item));
-            break;
-          case PROP_RAW_UINT16:
-            ((uint16_t *)array)[i] = PyC_Long_AsU16(item);
-            break;
-          case PROP_RAW_INT:
-            ((int *)array)[i] = int(PyC_Long_AsI32(item));
-            break;
-          case PROP_RAW_BOOLEAN:
-            ((bool *)array)[i] = bool(PyC_Long_AsBool(item));
-            break;
-          case PROP_RAW_FLOAT:
-            ((float *)array)[i] = float(PyFloat_AsDouble(item));
-            break;
-          case PROP_RAW_DOUBLE:
-            ((double *)array)[i] = PyFloat_AsDouble(item);
-            break;
-          case PROP_RAW_INT64:
-            ((int64_t *)array)[i] = PyC_Long_AsI64(item);
-            break;
-          case PROP_RAW_UINT64:
-            ((uint64_t *)array)[i] = PyC_Long_AsU64(item);
-            break;
-          case PROP_RAW_UNSET:
-            /* Should never happen. */
-            BLI_assert_msg(0, "Invalid array type - set");
-            break;
-        }
+    PySequence_SetItem(seq, i, item);
+    Py_DECREF(item);
+  }
+}
 
-        Py_DECREF(item);
-      }
+/** An attribute accessed by #foreach_getset. */
+struct ForeachAttr {
+  const char *attr;
+  PyObject *seq;
+  int tot;
+  /** The type of the values in `buf` or `array`. */
+  RawPropertyType raw_type;
+  /** The buffer of `seq`, when its values can be accessed directly. */
+  Py_buffer buf;
+  bool use_buf;
+  /** Values converted from or to `seq` when its buffer can't be used. */
+  void *array;
+};
+
+static PyObject *foreach_getset(BPy_PropertyRNA *self, PyObject *args, int set)
+{
+  const char *function_name = set ? "foreach_set" : "foreach_get";
+  PyObject *attr_arg, *seq_arg;
+  blender::Vector<ForeachAttr, 1> items;
+  bool is_error = false;
+  int ok = 0;
 
-      ok = RNA_property_collection_raw_set(
-          nullptr, &self->ptr.value(), self->prop, attr, array, raw_type, tot);
+  /* Get/set both take the same args currently. */
+  if (!PyArg_ParseTuple(args, "OO:foreach_get/set", &attr_arg, &seq_arg)) {
+    return nullptr;
+  }
+
+  /* A single attribute, or a tuple of attributes accessed in a single pass. */
+  if (PyUnicode_Check(attr_arg)) {
+    items.append({PyUnicode_AsUTF8(attr_arg), seq_arg});
+    if (items.last().attr == nullptr) {
+      return nullptr;
+    }
+  }
+  else if (PyTuple_Check(attr_arg)) {
+    const Py_ssize_t attr_num = PyTuple_GET_SIZE(attr_arg);
+    if (!PyTuple_Check(seq_arg) || PyTuple_GET_SIZE(seq_arg) != attr_num) {
+      PyErr_Format(PyExc_TypeError,
+                   "%s(..) expected second argument to be a tuple of %zd sequences or buffers",
+                   function_name,
+                   attr_num);
+      return nullptr;
+    }
+    for (Py_ssize_t i = 0; i < attr_num; i++) {
+      PyObject *attr_item = PyTuple_GET_ITEM(attr_arg, i);
+      if (!PyUnicode_Check(attr_item)) {
+        PyErr_Format(PyExc_TypeError,
+                     "%s(..) expected attribute names to be strings, not %.200s",
+                     function_name,
+                     Py_TYPE(attr_item)->tp_name);
+        return nullptr;
+      }
+      items.append({PyUnicode_AsUTF8(attr_item), PyTuple_GET_ITEM(seq_arg, i)});
+      if (items.last().attr == nullptr) {
+        return nullptr;
+      }
     }
   }
   else {
-    buffer_is_compat = false;
-    if (PyObject_CheckBuffer(seq)) {
-      Py_buffer buf;
-      if (PyObject_GetBuffer(seq, &buf, PyBUF_ND | PyBUF_FORMAT) == -1) {
+    PyErr_Format(PyExc_TypeError,
+                 "%s(..) expected first argument to be a string or a tuple of strings, not %.200s",
+                 function_name,
+                 Py_TYPE(attr_arg)->tp_name);
+    return nullptr;
+  }
+
+  for (ForeachAttr &item : items) {
+    int attr_tot;
+    size_t size;
+    bool attr_signed;
+
+    if (foreach_parse_args(self,
+                           function_name,
+                           item.attr,
+                           item.seq,
+                           &item.tot,
+                           &size,
+                           &item.raw_type,
+                           &attr_tot,
+                           &attr_signed) == -1)
+    {
+      is_error = true;
+      break;
+    }
+
+    if (item.tot == 0) {
+      continue;
+    }
+
+    if (PyObject_CheckBuffer(item.seq)) {
+      if (PyObject_GetBuffer(item.seq, &item.buf, PyBUF_ND | PyBUF_FORMAT) == -1) {
         /* Request failed. A `PyExc_BufferError` will have been raised,
          * so clear it to silently fall back to accessing as a sequence. */
         PyErr_Clear();
       }
       else {
-        /* Check if the buffer matches. */
-
-        buffer_is_compat = foreach_compat_buffer(raw_type, attr_signed, buf.format);
-
-        if (buffer_is_compat) {
-          ok = RNA_property_collection_raw_get(
-              nullptr, &self->ptr.value(), self->prop, attr, buf.buf, raw_type, tot);
+        /* Use buffers matching the attribute type directly, RNA converts other numeric types. */
+        const RawPropertyType buf_raw_type =
+            foreach_compat_buffer(item.raw_type, attr_signed, item.buf.format) ?
+                item.raw_type :
+                foreach_raw_type_from_buffer(&item.buf);
+
+        if (buf_raw_type != PROP_RAW_UNSET) {
+          item.raw_type = buf_raw_type;
+          item.use_buf = true;
+        }
+        else {
+          PyBuffer_Release(&item.buf);
         }
-
-        PyBuffer_Release(&buf);
       }
     }
 
     /* Could not use the buffer, fallback to sequence. */
-    if (!buffer_is_compat) {
-      array = PyMem_Malloc(size * tot);
-
-      ok = RNA_property_collection_raw_get(
-          nullptr, &self->ptr.value(), self->prop, attr, array, raw_type, tot);
+    if (!item.use_buf) {
+      item.array = PyMem_Malloc(size * item.tot);
+      if (set) {
+        foreach_array_from_sequence(item.array, item.raw_type, item.seq, item.tot);
+      }
+    }
+  }
 
-      if (!ok) {
-        /* Skip the loop. */
-        i = tot;
+  if (!is_error) {
+    blender::Vector<const char *, 1> attrs;
+    blender::Vector<RawArray, 1> arrays;
+    for (const ForeachAttr &item : items) {
+      if (item.tot != 0) {
+        attrs.append(item.attr);
+        arrays.append({item.use_buf ? item.buf.buf : item.array, item.raw_type, item.tot, 0});
       }
+    }
 
-      for (; i < tot; i++) {
+    if (attrs.is_empty()) {
+      ok = 1;
+    }
+    else if (set) {
+      ok = RNA_property_collection_raw_set_multi(
+          nullptr, &self->ptr.value(), self->prop, attrs.data(), arrays.data(), attrs.size());
+    }
+    else {
+      ok = RNA_property_collection_raw_get_multi(
+          nullptr, &self->ptr.value(), self->prop, attrs.data(), arrays.data(), attrs.size());
 
-        switch (raw_type) {
-          case PROP_RAW_CHAR:
-            item = PyLong_FromLong(long(((char *)array)[i]));
-            break;
-          case PROP_RAW_INT8:
-            item = PyLong_FromLong(long(((int8_t *)array)[i]));
-            break;
-          case PROP_RAW_UINT8:
-            item = PyLong_FromLong(long(((uint8_t *)array)[i]));
-            break;
-          case PROP_RAW_SHORT:
-            item = PyLong_FromLong(long(((short *)array)[i]));
-            break;
-          case PROP_RAW_UINT16:
-            item = PyLong_FromLong(long(((uint16_t *)array)[i]));
-            break;
-          case PROP_RAW_INT:
-            item = PyLong_FromLong(long(((int *)array)[i]));
-            break;
-          case PROP_RAW_FLOAT:
-            item = PyFloat_FromDouble(double(((float *)array)[i]));
-            break;
-          case PROP_RAW_DOUBLE:
-            item = PyFloat_FromDouble(((double *)array)[i]);
-            break;
-          case PROP_RAW_BOOLEAN:
-            item = PyBool_FromLong(long(((bool *)array)[i]));
-            break;
-          case PROP_RAW_INT64:
-            item = PyLong_FromLongLong(((int64_t *)array)[i]);
-            break;
-          case PROP_RAW_UINT64:
-            item = PyLong_FromUnsignedLongLong(((uint64_t *)array)[i]);
-            break;
-          default: /* PROP_RAW_UNSET */
-            /* Should never happen. */
-            BLI_assert_msg(0, "Invalid array type - get");
-            item = Py_None;
-            Py_INCREF(item);
-            break;
+      if (ok) {
+        for (const ForeachAttr &item : items) {
+          if (item.array) {
+            foreach_array_to_sequence(item.array, item.raw_type, item.seq, item.tot);
+          }
         }
-
-        PySequence_SetItem(seq, i, item);
-        Py_DECREF(item);
       }
     }
   }
 
-  if (array) {
-    PyMem_Free(array);
+  for (ForeachAttr &item : items) {
+    if (item.use_buf) {
+      PyBuffer_Release(&item.buf);
+    }
+    if (item.array) {
+      PyMem_Free(item.array);
+    }
   }
 
+  if (is_error) {
+    return nullptr;
+  }
   if (PyErr_Occurred()) {
     /* Maybe we could make our own error. */
     PyErr_Print();
@@ -5862,7 +5986,15 @@ PyDoc_STRVAR(
     pyrna_prop_collection_foreach_get_doc,
     ".. method:: foreach_get(attr, seq)\n"
     "\n"
-    "   This is a function to give fast access to attributes within a collection.\n");
+    "   This is a function to give fast access to attributes within a collection.\n"
+    "\n"
+    "   :arg attr: The attribute name,\n"
+    "      or a tuple of attribute names to get several attributes in a single pass.\n"
+    "   :type attr: str | tuple[str, ...]\n"
+    "   :arg seq: A flat sequence or buffer to fill with the values of the attribute,\n"
+    "      or a tuple of them (one for each attribute name).\n"
+    "      Buffers of any numeric type are filled directly, converting the values as needed.\n"
+    "   :type seq: Sequence | Buffer | tuple[Sequence | Buffer, ...]\n");
 static PyObject *pyrna_prop_collection_foreach_get(BPy_PropertyRNA *self, PyObject *args)
 {
   PYRNA_PROP_CHECK_OBJ(self);
@@ -5875,7 +6007,15 @@ PyDoc_STRVAR(
     pyrna_prop_collection_foreach_set_doc,
     ".. method:: foreach_set(attr, seq)\n"
     "\n"
-    "   This is a function to give fast access to attributes within a collection.\n");
+    "   This is a function to give fast access to attributes within a collection.\n"
+    "\n"
+    "   :arg attr: The attribute name,\n"
+    "      or a tuple of attribute names to set several attributes in a single pass.\n"
+    "   :type attr: str | tuple[str, ...]\n"
+    "   :arg seq: A flat sequence or buffer with the values of the attribute,\n"
+    "      or a tuple of them (one for each attribute name).\n"
+    "      Buffers of any numeric type are read directly, converting the values as needed.\n"
+    "   :type seq: Sequence | Buffer | tuple[Sequence | Buffer, ...]\n");
 static PyObject *pyrna_prop_collection_foreach_set(BPy_PropertyRNA *self, PyObject *args)
 {
   PYRNA_PROP_CHECK_OBJ(self);
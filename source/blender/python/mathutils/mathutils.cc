@@ -405,6 +405,301 @@ bool mathutils_array_parse_alloc_viseq(PyObject *value,
   return true;
 }
 
+/** Load a (possibly unaligned) item of type `T` from a buffer. */
+template<typename T> static T mathutils_buffer_item_load(const char *item)
+{
+  T value;
+  memcpy(&value, item, sizeof(T));
+  return value;
+}
+
+/** Store a (possibly unaligned) item of type `T` into a buffer. */
+template<typename T> static void mathutils_buffer_item_store(char *item, const T value)
+{
+  memcpy(item, &value, sizeof(T));
+}
+
+static char *mathutils_buffer_item_ptr(const Py_buffer *buffer,
+                                       const Py_ssize_t i,
+                                       const Py_ssize_t j)
+{
+  char *item = static_cast<char *>(buffer->buf) + i * buffer->strides[0];
+  if (buffer->ndim == 2) {
+    item += j * buffer->strides[1];
+  }
+  return item;
+}
+
+bool mathutils_buffer_get(PyObject *value,
+                          Py_buffer *r_buffer,
+                          const char type,
+                          const int ndim,
+                          const Py_ssize_t len,
+                          const Py_ssize_t dim_len,
+                          const bool writable,
+                          const char *error_prefix)
+{
+  BLI_assert(ELEM(type, 'f', 'i'));
+  BLI_assert(ELEM(ndim, 1, 2));
+
+  if (!PyObject_CheckBuffer(value)) {
+    PyErr_Format(PyExc_TypeError,
+                 "%.200s: expected an object supporting the buffer protocol, not %.200s",
+                 error_prefix,
+                 Py_TYPE(value)->tp_name);
+    return false;
+  }
+
+  if (PyObject_GetBuffer(
+          value, r_buffer, PyBUF_STRIDES | PyBUF_FORMAT | (writable ? PyBUF_WRITABLE : 0)) == -1)
+  {
+    /* PyObject_GetBuffer raise a PyExc_BufferError */
+    return false;
+  }
+
+  const char format = PyC_StructFmt_type_from_str(r_buffer->format);
+  if ((type == 'f') ? !ELEM(format, 'f', 'd') :
+                      (!PyC_StructFmt_type_is_int_any(format) || format == 'P'))
+  {
+    PyErr_Format(PyExc_TypeError,
+                 "%.200s: expected a buffer of %s, not '%.200s'",
+                 error_prefix,
+                 (type == 'f') ? "floats or doubles" : "integers",
+                 r_buffer->format);
+  }
+  else if (type == 'i' && writable &&
+           !(ELEM(format, 'i', 'l', 'q', 'n') && r_buffer->itemsize >= Py_ssize_t(sizeof(int))))
+  {
+    /* Narrower or unsigned items would silently truncate the values written. */
+    PyErr_Format(PyExc_TypeError,
+                 "%.200s: expected a buffer of signed integers of at least %d bits, not '%.200s'",
+                 error_prefix,
+                 int(sizeof(int) * 8),
+                 r_buffer->format);
+  }
+  else if (r_buffer->ndim != ndim || (ndim == 2 && r_buffer->shape[1] != dim_len)) {
+    if (ndim == 2) {
+      PyErr_Format(PyExc_ValueError,
+                   "%.200s: expected a buffer of shape (N, %d)",
+                   error_prefix,
+                   int(dim_len));
+    }
+    else {
+      PyErr_Format(PyExc_ValueError, "%.200s: expected a one dimensional buffer", error_prefix);
+    }
+  }
+  else if (len != -1 && r_buffer->shape[0] != len) {
+    PyErr_Format(PyExc_ValueError,
+                 "%.200s: expected a buffer of length %lld, not %lld",
+                 error_prefix,
+                 (long long)len,
+                 (long long)r_buffer->shape[0]);
+  }
+  else {
+    return true;
+  }
+
+  PyBuffer_Release(r_buffer);
+  return false;
+}
+
+float mathutils_buffer_item_float(const Py_buffer *buffer, const Py_ssize_t i, const Py_ssize_t j)
+{
+  const char *item = mathutils_buffer_item_ptr(buffer, i, j);
+  if (PyC_StructFmt_type_from_str(buffer->format) == 'f') {
+    return mathutils_buffer_item_load<float>(item);
+  }
+  return float(mathutils_buffer_item_load<double>(item));
+}
+
+void mathutils_buffer_item_float_set(Py_buffer *buffer,
+                                     const Py_ssize_t i,
+                                     const Py_ssize_t j,
+                                     const float value)
+{
+  char *item = mathutils_buffer_item_ptr(buffer, i, j);
+  if (PyC_StructFmt_type_from_str(buffer->format) == 'f') {
+    mathutils_buffer_item_store<float>(item, value);
+  }
+  else {
+    mathutils_buffer_item_store<double>(item, double(value));
+  }
+}
+
+int64_t mathutils_buffer_item_int(const Py_buffer *buffer, const Py_ssize_t i)
+{
+  const char *item = mathutils_buffer_item_ptr(buffer, i, 0);
+  switch (PyC_StructFmt_type_from_str(buffer->format)) {
+    case 'b':
+      return int64_t(mathutils_buffer_item_load<signed char>(item));
+    case 'B':
+      return int64_t(mathutils_buffer_item_load<unsigned char>(item));
+    case 'h':
+      return int64_t(mathutils_buffer_item_load<short>(item));
+    case 'H':
+      return int64_t(mathutils_buffer_item_load<unsigned short>(item));
+    case 'i':
+      return int64_t(mathutils_buffer_item_load<int>(item));
+    case 'I':
+      return int64_t(mathutils_buffer_item_load<unsigned int>(item));
+    case 'l':
+      return int64_t(mathutils_buffer_item_load<long>(item));
+    case 'L':
+      return int64_t(mathutils_buffer_item_load<unsigned long>(item));
+    case 'q':
+      return int64_t(mathutils_buffer_item_load<long long>(item));
+    case 'Q':
+      return int64_t(mathutils_buffer_item_load<unsigned long long>(item));
+    case 'n':
+      return int64_t(mathutils_buffer_item_load<Py_ssize_t>(item));
+    case 'N':
+      return int64_t(mathutils_buffer_item_load<size_t>(item));
+  }
+  BLI_assert_unreachable();
+  return 0;
+}
+
+void mathutils_buffer_item_int_set(Py_buffer *buffer, const Py_ssize_t i, const int value)
+{
+  char *item = mathutils_buffer_item_ptr(buffer, i, 0);
+  /* Writable buffers are signed integers that can hold an `int`, see #mathutils_buffer_get. */
+  switch (PyC_StructFmt_type_from_str(buffer->format)) {
+    case 'i':
+      mathutils_buffer_item_store<int>(item, value);
+      break;
+    case 'l':
+      mathutils_buffer_item_store<long>(item, long(value));
+      break;
+    case 'q':
+      mathutils_buffer_item_store<long long>(item, (long long)value);
+      break;
+    case 'n':
+      mathutils_buffer_item_store<Py_ssize_t>(item, Py_ssize_t(value));
+      break;
+    default:
+      BLI_assert_unreachable();
+      break;
+  }
+}
+
+bool mathutils_array_parse_buffer_v3(PyObject *value,
+                                     const char *error_prefix,
+                                     blender::Array<blender::float3> &r_data)
+{
+  if (!PyObject_CheckBuffer(value)) {
+    float *array;
+    const int num = mathutils_array_parse_alloc_v(&array, 3, value, error_prefix);
+    if (num == -1) {
+      return false;
+    }
+    r_data.reinitialize(num);
+    if (num != 0) {
+      memcpy(r_data.data(), array, sizeof(float[3]) * size_t(num));
+      PyMem_Free(array);
+    }
+    return true;
+  }
+
+  Py_buffer buffer;
+  if (!mathutils_buffer_get(value, &buffer, 'f', 2, -1, 3, false, error_prefix)) {
+    return false;
+  }
+  r_data.reinitialize(buffer.shape[0]);
+  for (const int64_t i : r_data.index_range()) {
+    for (int j = 0; j < 3; j++) {
+      r_data[i][j] = mathutils_buffer_item_float(&buffer, i, j);
+    }
+  }
+  PyBuffer_Release(&buffer);
+  return true;
+}
+
+bool mathutils_int_array_parse_buffer(PyObject *value,
+                                      const char *error_prefix,
+                                      blender::Array<int> &r_data)
+{
+  if (!PyObject_CheckBuffer(value)) {
+    PyObject *value_fast;
+    if (!(value_fast = PySequence_Fast(value, error_prefix))) {
+      /* PySequence_Fast sets the error */
+      return false;
+    }
+
+    PyObject **value_fast_items = PySequence_Fast_ITEMS(value_fast);
+    r_data.reinitialize(PySequence_Fast_GET_SIZE(value_fast));
+    for (const int64_t i : r_data.index_range()) {
+      if (((r_data[i] = PyC_Long_AsI32(value_fast_items[i])) == -1) && PyErr_Occurred()) {
+        PyErr_Format(PyExc_TypeError,
+                     "%.200s: sequence index %d expected an int",
+                     error_prefix,
+                     int(i));
+        Py_DECREF(value_fast);
+        return false;
+      }
+    }
+    Py_DECREF(value_fast);
+    return true;
+  }
+
+  Py_buffer buffer;
+  if (!mathutils_buffer_get(value, &buffer, 'i', 1, -1, 0, false, error_prefix)) {
+    return false;
+  }
+  bool ok = true;
+  r_data.reinitialize(buffer.shape[0]);
+  for (const int64_t i : r_data.index_range()) {
+    const int64_t item = mathutils_buffer_item_int(&buffer, i);
+    if (item < INT_MIN || item > INT_MAX) {
+      PyErr_Format(PyExc_ValueError, "%.200s: index %d out of range", error_prefix, int(i));
+      ok = false;
+      break;
+    }
+    r_data[i] = int(item);
+  }
+  PyBuffer_Release(&buffer);
+  return ok;
+}
+
+PyObject *mathutils_memoryview_new(const char *format,
+                                   const Py_ssize_t itemsize,
+                                   const blender::Span<Py_ssize_t> shape,
+                                   void **r_data)
+{
+  Py_ssize_t len = itemsize;
+  bool is_empty = false;
+  for (const Py_ssize_t dim : shape) {
+    len *= dim;
+    is_empty |= (dim == 0);
+  }
+
+  PyObject *py_bytes = PyByteArray_FromStringAndSize(nullptr, len);
+  if (py_bytes == nullptr) {
+    return nullptr;
+  }
+  *r_data = PyByteArray_AS_STRING(py_bytes);
+
+  PyObject *py_view = PyMemoryView_FromObject(py_bytes);
+  Py_DECREF(py_bytes);
+  if (py_view == nullptr) {
+    return nullptr;
+  }
+
+  PyObject *py_result;
+  if (is_empty) {
+    /* `memoryview.cast` doesn't support zero sized dimensions, use a flat empty view. */
+    py_result = PyObject_CallMethod(py_view, "cast", "s", format);
+  }
+  else {
+    PyObject *py_shape = PyTuple_New(shape.size());
+    for (const int64_t i : shape.index_range()) {
+      PyTuple_SET_ITEM(py_shape, i, PyLong_FromSsize_t(shape[i]));
+    }
+    py_result = PyObject_CallMethod(py_view, "cast", "sN", format, py_shape);
+  }
+  Py_DECREF(py_view);
+  return py_result;
+}
+
 int mathutils_any_to_rotmat(float rmat[3][3], PyObject *value, const char *error_prefix)
 {
   if (EulerObject_Check(value)) {
@@ -13,6 +13,8 @@
 /* Can cast different mathutils types to this, use for generic functions. */
 
 #include "BLI_array.hh"
+#include "BLI_math_vector_types.hh"
+#include "BLI_span.hh"
 #include "BLI_vector.hh"
 
 struct DynStr;
@@ -194,6 +196,56 @@ bool mathutils_array_parse_alloc_viseq(PyObject *value,
                                        const char *error_prefix,
                                        blender::Array<blender::Vector<int>> &r_data);
 int mathutils_any_to_rotmat(float rmat[3][3], PyObject *value, const char *error_prefix);
+/**
+ * Get a buffer of float or double (when `type` is 'f') or integer (when `type` is 'i') items,
+ * with a shape of (len) when `ndim` is 1 or (len, dim_len) when `ndim` is 2,
+ * used to read or write arrays such as NumPy arrays without copying.
+ * Writable integer buffers must have signed items large enough to store any `int`.
+ *
+ * \param len: The expected length, -1 for any length.
+ * \return false with an exception set when the buffer doesn't match,
+ * otherwise the caller must call #PyBuffer_Release.
+ */
+bool mathutils_buffer_get(PyObject *value,
+                          Py_buffer *r_buffer,
+                          char type,
+                          int ndim,
+                          Py_ssize_t len,
+                          Py_ssize_t dim_len,
+                          bool writable,
+                          const char *error_prefix);
+/** Item access for buffers from #mathutils_buffer_get, `j` is ignored for one dimensional buffers. */
+float mathutils_buffer_item_float(const Py_buffer *buffer, Py_ssize_t i, Py_ssize_t j);
+void mathutils_buffer_item_float_set(Py_buffer *buffer, Py_ssize_t i, Py_ssize_t j, float value);
+int64_t mathutils_buffer_item_int(const Py_buffer *buffer, Py_ssize_t i);
+void mathutils_buffer_item_int_set(Py_buffer *buffer, Py_ssize_t i, int value);
+
+/**
+ * Parse an array of 3D coordinates, either from an object supporting the buffer protocol
+ * with a shape of (N, 3) and float or double items (a NumPy array for example),
+ * or from a sequence of vectors.
+ */
+bool mathutils_array_parse_buffer_v3(PyObject *value,
+                                     const char *error_prefix,
+                                     blender::Array<blender::float3> &r_data);
+/**
+ * Parse an array of integers, either from a one dimensional buffer of any integer type
+ * or from a sequence of integers.
+ */
+bool mathutils_int_array_parse_buffer(PyObject *value,
+                                      const char *error_prefix,
+                                      blender::Array<int> &r_data);
+/**
+ * Create a `memoryview` of a new buffer with items of the `struct` module `format`,
+ * used to return arrays which can be wrapped by NumPy without copying.
+ *
+ * \param r_data: The buffer to fill, the product of `shape` and `itemsize` in bytes.
+ * \note Views with zero sized dimensions are one dimensional, `memoryview` doesn't support them.
+ */
+PyObject *mathutils_memoryview_new(const char *format,
+                                   Py_ssize_t itemsize,
+                                   blender::Span<Py_ssize_t> shape,
+                                   void **r_data);
 
 /**
  * helper function that returns a Python `__hash__`.
@@ -11,6 +11,8 @@
 
 #include <Python.h>
 
+#include <string>
+
 #include "MEM_guardedalloc.h"
 
 #include "BLI_ghash.h"
@@ -20,6 +22,7 @@
 #include "BLI_math_vector.h"
 #include "BLI_memarena.h"
 #include "BLI_polyfill_2d.h"
+#include "BLI_task.hh"
 #include "BLI_utildefines.h"
 
 #include "BKE_bvhutils.hh"
@@ -496,6 +499,332 @@ static PyObject *py_bvhtree_find_nearest_range(PyBVHTree *self, PyObject *args)
   return ret;
 }
 
+/* -------------------------------------------------------------------- */
+/** \name Batch Queries
+ *
+ * Read the queries from buffers and write the results into buffers passed in by the caller
+ * (NumPy arrays for example) without copying, running the queries in parallel.
+ * \{ */
+
+#define PYBVH_BATCH_GRAIN_SIZE 256
+
+#define PYBVH_BATCH_OUTPUT_DOC \
+  "   :arg location: Hit locations, a buffer of shape (N, 3) or None.\n" \
+  "   :type location: Buffer | None\n" \
+  "   :arg normal: Hit normals, a buffer of shape (N, 3) or None.\n" \
+  "   :type normal: Buffer | None\n" \
+  "   :arg index: Hit indices (typically face index), a buffer of shape (N) " \
+  "of signed integers of at least 32 bits, or None.\n" \
+  "   :type index: Buffer | None\n" \
+  "   :arg distance: Hit distances, a buffer of shape (N) or None.\n" \
+  "   :type distance: Buffer | None\n"
+
+#define PYBVH_BATCH_OUTPUT_NOTE_DOC \
+  "\n" \
+  ".. note::\n" \
+  "\n" \
+  "   Outputs set to None are not written to. " \
+  "When there is no hit the index is -1, the distance infinite " \
+  "and the location and normal are NaN.\n"
+
+struct PyBVH_BatchData {
+  Py_buffer origin;
+  Py_buffer direction;
+  /* Outputs, null when not written to. */
+  Py_buffer *location, *normal, *index, *distance;
+  Py_buffer location_buf, normal_buf, index_buf, distance_buf;
+};
+
+static void py_bvhtree_batch_data_release(PyBVH_BatchData *data, const bool use_direction)
+{
+  PyBuffer_Release(&data->origin);
+  if (use_direction) {
+    PyBuffer_Release(&data->direction);
+  }
+  for (Py_buffer *buffer : {data->location, data->normal, data->index, data->distance}) {
+    if (buffer) {
+      PyBuffer_Release(buffer);
+    }
+  }
+}
+
+/**
+ * \param py_direction: May be null for queries which don't use a direction.
+ */
+static bool py_bvhtree_batch_data_get(PyBVH_BatchData *data,
+                                      PyObject *py_origin,
+                                      PyObject *py_direction,
+                                      PyObject *py_location,
+                                      PyObject *py_normal,
+                                      PyObject *py_index,
+                                      PyObject *py_distance,
+                                      const char *error_prefix)
+{
+  const std::string prefix = error_prefix;
+  *data = {};
+
+  if (!mathutils_buffer_get(
+          py_origin, &data->origin, 'f', 2, -1, 3, false, (prefix + " 'origin'").c_str()))
+  {
+    return false;
+  }
+  const Py_ssize_t len = data->origin.shape[0];
+
+  if (py_direction &&
+      !mathutils_buffer_get(
+          py_direction, &data->direction, 'f', 2, len, 3, false, (prefix + " 'direction'").c_str()))
+  {
+    PyBuffer_Release(&data->origin);
+    return false;
+  }
+
+  bool ok = true;
+  if (ok && py_location != Py_None) {
+    if ((ok = mathutils_buffer_get(py_location,
+                                   &data->location_buf,
+                                   'f',
+                                   2,
+                                   len,
+                                   3,
+                                   true,
+                                   (prefix + " 'location'").c_str())))
+    {
+      data->location = &data->location_buf;
+    }
+  }
+  if (ok && py_normal != Py_None) {
+    if ((ok = mathutils_buffer_get(
+             py_normal, &data->normal_buf, 'f', 2, len, 3, true, (prefix + " 'normal'").c_str())))
+    {
+      data->normal = &data->normal_buf;
+    }
+  }
+  if (ok && py_index != Py_None) {
+    if ((ok = mathutils_buffer_get(
+             py_index, &data->index_buf, 'i', 1, len, 0, true, (prefix + " 'index'").c_str())))
+    {
+      data->index = &data->index_buf;
+    }
+  }
+  if (ok && py_distance != Py_None) {
+    if ((ok = mathutils_buffer_get(py_distance,
+                                   &data->distance_buf,
+                                   'f',
+                                   1,
+                                   len,
+                                   0,
+                                   true,
+                                   (prefix + " 'distance'").c_str())))
+    {
+      data->distance = &data->distance_buf;
+    }
+  }
+
+  if (!ok) {
+    py_bvhtree_batch_data_release(data, py_direction != nullptr);
+  }
+  return ok;
+}
+
+static void py_bvhtree_batch_result_set(PyBVH_BatchData *data,
+                                        const Py_ssize_t i,
+                                        const int index,
+                                        const float co[3],
+                                        const float no[3],
+                                        const float dist)
+{
+  if (data->location) {
+    for (int j = 0; j < 3; j++) {
+      mathutils_buffer_item_float_set(data->location, i, j, co[j]);
+    }
+  }
+  if (data->normal) {
+    for (int j = 0; j < 3; j++) {
+      mathutils_buffer_item_float_set(data->normal, i, j, no[j]);
+    }
+  }
+  if (data->index) {
+    mathutils_buffer_item_int_set(data->index, i, index);
+  }
+  if (data->distance) {
+    mathutils_buffer_item_float_set(data->distance, i, 0, dist);
+  }
+}
+
+static void py_bvhtree_batch_result_set_none(PyBVH_BatchData *data, const Py_ssize_t i)
+{
+  const float nan_v3[3] = {NAN, NAN, NAN};
+  py_bvhtree_batch_result_set(data, i, -1, nan_v3, nan_v3, INFINITY);
+}
+
+PyDoc_STRVAR(
+    /* Wrap. */
+    py_bvhtree_ray_cast_batch_doc,
+    ".. method:: ray_cast_batch(origin, direction, location, normal, index, distance, "
+    "max_distance=sys.float_info.max)\n"
+    "\n"
+    "   Cast many rays onto the mesh, the batch version of :class:`BVHTree.ray_cast`.\n"
+    "\n"
+    "   :arg origin: Start locations of the rays in object space, "
+    "a buffer of shape (N, 3) such as a NumPy array.\n"
+    "   :type origin: Buffer\n"
+    "   :arg direction: Directions of the rays in object space, a buffer of shape (N, 3).\n"
+    "   :type direction: Buffer\n" PYBVH_BATCH_OUTPUT_DOC
+    "   :arg max_distance: Maximum distance threshold.\n"
+    "   :type max_distance: float\n" PYBVH_BATCH_OUTPUT_NOTE_DOC);
+static PyObject *py_bvhtree_ray_cast_batch(PyBVHTree *self, PyObject *args, PyObject *kwargs)
+{
+  const char *error_prefix = "ray_cast_batch";
+  PyObject *py_origin, *py_direction, *py_location, *py_normal, *py_index, *py_distance;
+  float max_dist = FLT_MAX;
+  PyBVH_BatchData data;
+  const char *keywords[] = {
+      "origin", "direction", "location", "normal", "index", "distance", "max_distance", nullptr};
+
+  if (!PyArg_ParseTupleAndKeywords(args,
+                                   kwargs,
+                                   "OOOOOO|f:ray_cast_batch",
+                                   (char **)keywords,
+                                   &py_origin,
+                                   &py_direction,
+                                   &py_location,
+                                   &py_normal,
+                                   &py_index,
+                                   &py_distance,
+                                   &max_dist))
+  {
+    return nullptr;
+  }
+
+  if (!py_bvhtree_batch_data_get(&data,
+                                 py_origin,
+                                 py_direction,
+                                 py_location,
+                                 py_normal,
+                                 py_index,
+                                 py_distance,
+                                 error_prefix))
+  {
+    return nullptr;
+  }
+
+  const blender::IndexRange rays(data.origin.shape[0]);
+  blender::threading::parallel_for(
+      rays, PYBVH_BATCH_GRAIN_SIZE, [&](const blender::IndexRange range) {
+        for (const int64_t i : range) {
+          float co[3], direction[3];
+          for (int j = 0; j < 3; j++) {
+            co[j] = mathutils_buffer_item_float(&data.origin, i, j);
+            direction[j] = mathutils_buffer_item_float(&data.direction, i, j);
+          }
+          normalize_v3(direction);
+
+          BVHTreeRayHit hit;
+          hit.dist = max_dist;
+          hit.index = -1;
+
+          /* may fail if the mesh has no faces, in that case the ray-cast misses */
+          if (self->tree &&
+              (BLI_bvhtree_ray_cast(
+                   self->tree, co, direction, 0.0f, &hit, py_bvhtree_raycast_cb, self) != -1))
+          {
+            py_bvhtree_batch_result_set(&data, i, hit.index, hit.co, hit.no, hit.dist);
+          }
+          else {
+            py_bvhtree_batch_result_set_none(&data, i);
+          }
+        }
+      });
+
+  py_bvhtree_batch_data_release(&data, true);
+
+  Py_RETURN_NONE;
+}
+
+PyDoc_STRVAR(
+    /* Wrap. */
+    py_bvhtree_find_nearest_batch_doc,
+    ".. method:: find_nearest_batch(origin, location, normal, index, distance, "
+    "max_distance=" PYBVH_MAX_DIST_STR
+    ")\n"
+    "\n"
+    "   Find the nearest element (typically face index) to many points, "
+    "the batch version of :class:`BVHTree.find_nearest`.\n"
+    "\n"
+    "   :arg origin: Find nearest elements to these points, "
+    "a buffer of shape (N, 3) such as a NumPy array.\n"
+    "   :type origin: Buffer\n" PYBVH_BATCH_OUTPUT_DOC
+    "   :arg max_distance: Maximum distance threshold.\n"
+    "   :type max_distance: float\n" PYBVH_BATCH_OUTPUT_NOTE_DOC);
+static PyObject *py_bvhtree_find_nearest_batch(PyBVHTree *self, PyObject *args, PyObject *kwargs)
+{
+  const char *error_prefix = "find_nearest_batch";
+  PyObject *py_origin, *py_location, *py_normal, *py_index, *py_distance;
+  float max_dist = max_dist_default;
+  PyBVH_BatchData data;
+  const char *keywords[] = {
+      "origin", "location", "normal", "index", "distance", "max_distance", nullptr};
+
+  if (!PyArg_ParseTupleAndKeywords(args,
+                                   kwargs,
+                                   "OOOOO|f:find_nearest_batch",
+                                   (char **)keywords,
+                                   &py_origin,
+                                   &py_location,
+                                   &py_normal,
+                                   &py_index,
+                                   &py_distance,
+                                   &max_dist))
+  {
+    return nullptr;
+  }
+
+  if (!py_bvhtree_batch_data_get(&data,
+                                 py_origin,
+                                 nullptr,
+                                 py_location,
+                                 py_normal,
+                                 py_index,
+                                 py_distance,
+                                 error_prefix))
+  {
+    return nullptr;
+  }
+
+  const blender::IndexRange points(data.origin.shape[0]);
+  blender::threading::parallel_for(
+      points, PYBVH_BATCH_GRAIN_SIZE, [&](const blender::IndexRange range) {
+        for (const int64_t i : range) {
+          float co[3];
+          for (int j = 0; j < 3; j++) {
+            co[j] = mathutils_buffer_item_float(&data.origin, i, j);
+          }
+
+          BVHTreeNearest nearest;
+          nearest.index = -1;
+          nearest.dist_sq = max_dist * max_dist;
+
+          /* may fail if the mesh has no faces, in that case the search misses */
+          if (self->tree &&
+              (BLI_bvhtree_find_nearest(
+                   self->tree, co, &nearest, py_bvhtree_nearest_point_cb, self) != -1))
+          {
+            py_bvhtree_batch_result_set(
+                &data, i, nearest.index, nearest.co, nearest.no, sqrtf(nearest.dist_sq));
+          }
+          else {
+            py_bvhtree_batch_result_set_none(&data, i);
+          }
+        }
+      });
+
+  py_bvhtree_batch_data_release(&data, false);
+
+  Py_RETURN_NONE;
+}
+
+/** \} */
+
 BLI_INLINE uint overlap_hash(const void *overlap_v)
 {
   const BVHTreeOverlap *overlap = static_cast<const BVHTreeOverlap *>(overlap_v);
@@ -1271,6 +1600,14 @@ static PyMethodDef py_bvhtree_methods[] = {
      reinterpret_cast<PyCFunction>(py_bvhtree_find_nearest_range),
      METH_VARARGS,
      py_bvhtree_find_nearest_range_doc},
+    {"ray_cast_batch",
+     reinterpret_cast<PyCFunction>(py_bvhtree_ray_cast_batch),
+     METH_VARARGS | METH_KEYWORDS,
+     py_bvhtree_ray_cast_batch_doc},
+    {"find_nearest_batch",
+     reinterpret_cast<PyCFunction>(py_bvhtree_find_nearest_batch),
+     METH_VARARGS | METH_KEYWORDS,
+     py_bvhtree_find_nearest_batch_doc},
     {"overlap", reinterpret_cast<PyCFunction>(py_bvhtree_overlap), METH_O, py_bvhtree_overlap_doc},
 
     /* class methods */
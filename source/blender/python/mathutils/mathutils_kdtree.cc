@@ -11,9 +11,12 @@
 
 #include <Python.h>
 
+#include <array>
+
 #include "MEM_guardedalloc.h"
 
 #include "BLI_kdtree.h"
+#include "BLI_task.hh"
 #include "BLI_utildefines.h"
 
 #include "../generic/py_capi_utils.hh"
@@ -367,6 +370,329 @@ static PyObject *py_kdtree_find_range(PyKDTree *self, PyObject *args, PyObject *
   return py_list;
 }
 
+/* -------------------------------------------------------------------- */
+/* Batch Queries
+ *
+ * Take an array of points and return arrays of results, running the queries in parallel. */
+
+/** Grain size used when running queries in parallel. */
+#define KDTREE_BATCH_GRAIN_SIZE 1024
+
+PyDoc_STRVAR(
+    /* Wrap. */
+    py_kdtree_insert_batch_doc,
+    ".. method:: insert_batch(co, index=None)\n"
+    "\n"
+    "   Insert many points into the KDTree.\n"
+    "\n"
+    "   :arg co: Point 3d positions, a buffer of shape (N, 3) such as a NumPy array, "
+    "or a sequence of vectors.\n"
+    "   :type co: Buffer | Sequence[Sequence[float]]\n"
+    "   :arg index: The index of each point, the position of the point in ``co`` when None.\n"
+    "   :type index: Buffer | Sequence[int] | None\n");
+static PyObject *py_kdtree_insert_batch(PyKDTree *self, PyObject *args, PyObject *kwargs)
+{
+  PyObject *py_co, *py_index = Py_None;
+  blender::Array<blender::float3> co;
+  blender::Array<int> index;
+  const char *keywords[] = {"co", "index", nullptr};
+
+  if (!PyArg_ParseTupleAndKeywords(
+          args, kwargs, "O|O:insert_batch", (char **)keywords, &py_co, &py_index))
+  {
+    return nullptr;
+  }
+
+  if (!mathutils_array_parse_buffer_v3(py_co, "insert_batch: invalid 'co' arg", co)) {
+    return nullptr;
+  }
+
+  if (py_index != Py_None) {
+    if (!mathutils_int_array_parse_buffer(py_index, "insert_batch: invalid 'index' arg", index))
+    {
+      return nullptr;
+    }
+    if (index.size() != co.size()) {
+      PyErr_Format(PyExc_ValueError,
+                   "insert_batch: expected %lld indices, not %lld",
+                   (long long)co.size(),
+                   (long long)index.size());
+      return nullptr;
+    }
+    for (const int i : index) {
+      if (i < 0) {
+        PyErr_SetString(PyExc_ValueError, "negative index given");
+        return nullptr;
+      }
+    }
+  }
+
+  if (int64_t(self->count) + co.size() > int64_t(self->maxsize)) {
+    PyErr_SetString(PyExc_RuntimeError, "Trying to insert more items than KDTree has room for");
+    return nullptr;
+  }
+
+  for (const int64_t i : co.index_range()) {
+    BLI_kdtree_3d_insert(self->obj, index.is_empty() ? int(i) : index[i], co[i]);
+  }
+  self->count += uint(co.size());
+
+  Py_RETURN_NONE;
+}
+
+/**
+ * Create the index & distance arrays returned by batch queries.
+ *
+ * \param py_extra: Optional item added to the end of the tuple (the reference is stolen).
+ * \return a tuple or null on error.
+ */
+static PyObject *kdtree_batch_result_new(const blender::Span<Py_ssize_t> shape,
+                                         int **r_index,
+                                         float **r_dist,
+                                         PyObject *py_extra = nullptr)
+{
+  PyObject *py_index = mathutils_memoryview_new("i", sizeof(int), shape, (void **)r_index);
+  PyObject *py_dist = mathutils_memoryview_new("f", sizeof(float), shape, (void **)r_dist);
+  if (py_index == nullptr || py_dist == nullptr) {
+    Py_XDECREF(py_index);
+    Py_XDECREF(py_dist);
+    Py_XDECREF(py_extra);
+    return nullptr;
+  }
+
+  PyObject *py_retval = PyTuple_New(py_extra ? 3 : 2);
+  PyTuple_SET_ITEM(py_retval, 0, py_index);
+  PyTuple_SET_ITEM(py_retval, 1, py_dist);
+  if (py_extra) {
+    PyTuple_SET_ITEM(py_retval, 2, py_extra);
+  }
+  return py_retval;
+}
+
+PyDoc_STRVAR(
+    /* Wrap. */
+    py_kdtree_find_batch_doc,
+    ".. method:: find_batch(co)\n"
+    "\n"
+    "   Find the nearest point to each of the coordinates in ``co``, "
+    "the batch version of :class:`KDTree.find`.\n"
+    "\n"
+    "   :arg co: 3D coordinates, a buffer of shape (N, 3) such as a NumPy array, "
+    "or a sequence of vectors.\n"
+    "   :type co: Buffer | Sequence[Sequence[float]]\n"
+    "   :return: Returns (index, distance) arrays of length N, "
+    "the index is -1 and the distance infinite when the tree is empty.\n"
+    "   :rtype: tuple[memoryview, memoryview]\n");
+static PyObject *py_kdtree_find_batch(PyKDTree *self, PyObject *args, PyObject *kwargs)
+{
+  PyObject *py_co;
+  blender::Array<blender::float3> co;
+  int *r_index;
+  float *r_dist;
+  const char *keywords[] = {"co", nullptr};
+
+  if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O:find_batch", (char **)keywords, &py_co)) {
+    return nullptr;
+  }
+
+  if (!mathutils_array_parse_buffer_v3(py_co, "find_batch: invalid 'co' arg", co)) {
+    return nullptr;
+  }
+
+  if (self->count != self->count_balance) {
+    PyErr_SetString(PyExc_RuntimeError, "KDTree must be balanced before calling find_batch()");
+    return nullptr;
+  }
+
+  const std::array<Py_ssize_t, 1> shape = {Py_ssize_t(co.size())};
+  PyObject *py_retval = kdtree_batch_result_new(shape, &r_index, &r_dist);
+  if (py_retval == nullptr) {
+    return nullptr;
+  }
+
+  blender::threading::parallel_for(
+      co.index_range(), KDTREE_BATCH_GRAIN_SIZE, [&](const blender::IndexRange range) {
+        for (const int64_t i : range) {
+          KDTreeNearest_3d nearest;
+          if (BLI_kdtree_3d_find_nearest(self->obj, co[i], &nearest) != -1) {
+            r_index[i] = nearest.index;
+            r_dist[i] = nearest.dist;
+          }
+          else {
+            r_index[i] = -1;
+            r_dist[i] = INFINITY;
+          }
+        }
+      });
+
+  return py_retval;
+}
+
+PyDoc_STRVAR(
+    /* Wrap. */
+    py_kdtree_find_n_batch_doc,
+    ".. method:: find_n_batch(co, n)\n"
+    "\n"
+    "   Find the nearest ``n`` points to each of the coordinates in ``co``, "
+    "the batch version of :class:`KDTree.find_n`.\n"
+    "\n"
+    "   :arg co: 3D coordinates, a buffer of shape (N, 3) such as a NumPy array, "
+    "or a sequence of vectors.\n"
+    "   :type co: Buffer | Sequence[Sequence[float]]\n"
+    "   :arg n: Number of points to find.\n"
+    "   :type n: int\n"
+    "   :return: Returns (index, distance) arrays of shape (N, n) ordered by distance, "
+    "when less than ``n`` points are found the remaining indices are -1 "
+    "and distances infinite.\n"
+    "   :rtype: tuple[memoryview, memoryview]\n");
+static PyObject *py_kdtree_find_n_batch(PyKDTree *self, PyObject *args, PyObject *kwargs)
+{
+  PyObject *py_co;
+  blender::Array<blender::float3> co;
+  int *r_index;
+  float *r_dist;
+  uint n;
+  const char *keywords[] = {"co", "n", nullptr};
+
+  if (!PyArg_ParseTupleAndKeywords(args, kwargs, "OI:find_n_batch", (char **)keywords, &py_co, &n))
+  {
+    return nullptr;
+  }
+
+  if (!mathutils_array_parse_buffer_v3(py_co, "find_n_batch: invalid 'co' arg", co)) {
+    return nullptr;
+  }
+
+  if (UINT_IS_NEG(n)) {
+    PyErr_SetString(PyExc_RuntimeError, "negative 'n' given");
+    return nullptr;
+  }
+
+  if (self->count != self->count_balance) {
+    PyErr_SetString(PyExc_RuntimeError, "KDTree must be balanced before calling find_n_batch()");
+    return nullptr;
+  }
+
+  const std::array<Py_ssize_t, 2> shape = {Py_ssize_t(co.size()), Py_ssize_t(n)};
+  PyObject *py_retval = kdtree_batch_result_new(shape, &r_index, &r_dist);
+  if (py_retval == nullptr) {
+    return nullptr;
+  }
+
+  blender::threading::parallel_for(
+      co.index_range(), KDTREE_BATCH_GRAIN_SIZE, [&](const blender::IndexRange range) {
+        blender::Array<KDTreeNearest_3d> nearest(n);
+        for (const int64_t i : range) {
+          const int found = BLI_kdtree_3d_find_nearest_n(self->obj, co[i], nearest.data(), n);
+          int *index = &r_index[i * int64_t(n)];
+          float *dist = &r_dist[i * int64_t(n)];
+          for (int j = 0; j < found; j++) {
+            index[j] = nearest[j].index;
+            dist[j] = nearest[j].dist;
+          }
+          for (int j = found; j < int(n); j++) {
+            index[j] = -1;
+            dist[j] = INFINITY;
+          }
+        }
+      });
+
+  return py_retval;
+}
+
+PyDoc_STRVAR(
+    /* Wrap. */
+    py_kdtree_find_range_batch_doc,
+    ".. method:: find_range_batch(co, radius)\n"
+    "\n"
+    "   Find all points within ``radius`` of each of the coordinates in ``co``, "
+    "the batch version of :class:`KDTree.find_range`.\n"
+    "\n"
+    "   :arg co: 3D coordinates, a buffer of shape (N, 3) such as a NumPy array, "
+    "or a sequence of vectors.\n"
+    "   :type co: Buffer | Sequence[Sequence[float]]\n"
+    "   :arg radius: Distance to search for points.\n"
+    "   :type radius: float\n"
+    "   :return: Returns (index, distance, offset) arrays, the points found for ``co[i]`` "
+    "are ``index[offset[i]:offset[i + 1]]`` ordered by distance, "
+    "``offset`` has a length of N + 1.\n"
+    "   :rtype: tuple[memoryview, memoryview, memoryview]\n");
+static PyObject *py_kdtree_find_range_batch(PyKDTree *self, PyObject *args, PyObject *kwargs)
+{
+  PyObject *py_co;
+  blender::Array<blender::float3> co;
+  float radius;
+  const char *keywords[] = {"co", "radius", nullptr};
+
+  if (!PyArg_ParseTupleAndKeywords(
+          args, kwargs, "Of:find_range_batch", (char **)keywords, &py_co, &radius))
+  {
+    return nullptr;
+  }
+
+  if (!mathutils_array_parse_buffer_v3(py_co, "find_range_batch: invalid 'co' arg", co)) {
+    return nullptr;
+  }
+
+  if (radius < 0.0f) {
+    PyErr_SetString(PyExc_RuntimeError, "negative radius given");
+    return nullptr;
+  }
+
+  if (self->count != self->count_balance) {
+    PyErr_SetString(PyExc_RuntimeError,
+                    "KDTree must be balanced before calling find_range_batch()");
+    return nullptr;
+  }
+
+  /* The number of points found isn't known in advance,
+   * keep the results of each query until they can be copied into the returned arrays. */
+  blender::Array<KDTreeNearest_3d *> nearest(co.size(), nullptr);
+  blender::Array<int> found(co.size());
+  blender::threading::parallel_for(
+      co.index_range(), KDTREE_BATCH_GRAIN_SIZE, [&](const blender::IndexRange range) {
+        for (const int64_t i : range) {
+          found[i] = BLI_kdtree_3d_range_search(self->obj, co[i], &nearest[i], radius);
+        }
+      });
+
+  int64_t *r_offset;
+  const std::array<Py_ssize_t, 1> offset_shape = {Py_ssize_t(co.size() + 1)};
+  PyObject *py_offset = mathutils_memoryview_new(
+      "q", sizeof(int64_t), offset_shape, (void **)&r_offset);
+  PyObject *py_retval = nullptr;
+  if (py_offset != nullptr) {
+    r_offset[0] = 0;
+    for (const int64_t i : co.index_range()) {
+      r_offset[i + 1] = r_offset[i] + found[i];
+    }
+
+    int *r_index;
+    float *r_dist;
+    const std::array<Py_ssize_t, 1> shape = {Py_ssize_t(r_offset[co.size()])};
+    py_retval = kdtree_batch_result_new(shape, &r_index, &r_dist, py_offset);
+    if (py_retval != nullptr) {
+      blender::threading::parallel_for(
+          co.index_range(), KDTREE_BATCH_GRAIN_SIZE, [&](const blender::IndexRange range) {
+            for (const int64_t i : range) {
+              for (int j = 0; j < found[i]; j++) {
+                r_index[r_offset[i] + j] = nearest[i][j].index;
+                r_dist[r_offset[i] + j] = nearest[i][j].dist;
+              }
+            }
+          });
+    }
+  }
+
+  for (KDTreeNearest_3d *nearest_iter : nearest) {
+    if (nearest_iter) {
+      MEM_freeN(nearest_iter);
+    }
+  }
+
+  return py_retval;
+}
+
 #if (defined(__GNUC__) && !defined(__clang__))
 #  pragma GCC diagnostic push
 #  pragma GCC diagnostic ignored "-Wcast-function-type"
@@ -381,6 +707,22 @@ static PyMethodDef PyKDTree_methods[] = {
      (PyCFunction)py_kdtree_find_range,
      METH_VARARGS | METH_KEYWORDS,
      py_kdtree_find_range_doc},
+    {"insert_batch",
+     (PyCFunction)py_kdtree_insert_batch,
+     METH_VARARGS | METH_KEYWORDS,
+     py_kdtree_insert_batch_doc},
+    {"find_batch",
+     (PyCFunction)py_kdtree_find_batch,
+     METH_VARARGS | METH_KEYWORDS,
+     py_kdtree_find_batch_doc},
+    {"find_n_batch",
+     (PyCFunction)py_kdtree_find_n_batch,
+     METH_VARARGS | METH_KEYWORDS,
+     py_kdtree_find_n_batch_doc},
+    {"find_range_batch",
+     (PyCFunction)py_kdtree_find_range_batch,
+     METH_VARARGS | METH_KEYWORDS,
+     py_kdtree_find_range_batch_doc},
     {nullptr, nullptr, 0, nullptr},
 };
 
@@ -7,3 +7,4 @@ from .device import TestDevice, TestMachine
 from .config import TestEntry, TestQueue, TestConfig
 from .test import Test, TestCollection
 from .graph import TestGraph
+from . import statistics
@@ -33,6 +33,8 @@ class TestEntry:
     status: str = 'queued'
     error_msg: str = ''
     output: dict = field(default_factory=dict)
+    # Values of each output for all measured runs, `output` contains their median.
+    samples: dict = field(default_factory=dict)
     benchmark_type: str = 'comparison'
 
     def to_json(self) -> dict:
@@ -128,6 +130,9 @@ class TestConfig:
         self.builds = getattr(config, 'builds', {})
         self.queue = TestQueue(self.base_dir / 'results.json')
         self.benchmark_type = getattr(config, 'benchmark_type', 'comparison')
+        # Number of runs of each test to ignore, and to measure.
+        self.warmup_runs = max(0, getattr(config, 'warmup_runs', 0))
+        self.runs = max(1, getattr(config, 'runs', 1))
 
         self.devices = []
         self._update_devices(env, getattr(config, 'devices', ['CPU']))
@@ -157,6 +162,8 @@ class TestConfig:
         default_config += """}\n"""
         default_config += """revisions = {\n"""
         default_config += """}\n"""
+        default_config += """warmup_runs = 0\n"""
+        default_config += """runs = 1\n"""
 
         config_file = config_dir / 'config.py'
         with open(config_file, 'w') as f:
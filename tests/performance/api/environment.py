@@ -21,6 +21,19 @@ from .config import TestConfig
 from .device import TestMachine
 
 
+def get_peak_rss() -> int:
+    # Peak resident memory of the current process in bytes, zero when unknown.
+    # Runs in Blender, to measure memory separately from the test itself.
+    try:
+        import resource
+    except ImportError:
+        return 0
+
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Bytes on macOS, kilobytes on other platforms.
+    return peak_rss if platform.system() == "Darwin" else peak_rss * 1024
+
+
 class TestEnvironment:
     def __init__(self, blender_git_dir: pathlib.Path, base_dir: pathlib.Path):
         self.blender_git_dir = blender_git_dir
@@ -34,6 +47,8 @@ class TestEnvironment:
         self.cmake_options = ['-DWITH_INTERNATIONAL=OFF', '-DWITH_BUILDINFO=OFF']
         self.log_file = None
         self.machine = None
+        # Peak resident memory of Blender instances run since last reset, in bytes.
+        self.peak_rss = 0
         self._init_default_blender_executable()
         self.set_default_blender_executable()
 
@@ -254,6 +269,7 @@ class TestEnvironment:
         # Serialize arguments in base64, to avoid having to escape it.
         args = base64.b64encode(pickle.dumps(args))
         output_prefix = 'TEST_OUTPUT: '
+        peak_rss_prefix = 'TEST_PEAK_RSS: '
 
         expression = (f'import sys, pickle, base64;'
                       f'sys.path.append(r"{package_path}");'
@@ -261,12 +277,18 @@ class TestEnvironment:
                       f'args = pickle.loads(base64.b64decode({args}));'
                       f'result = {modulename}.{functionname}(args);'
                       f'result = base64.b64encode(pickle.dumps(result));'
+                      f'import api.environment;'
+                      f'print("\\n{peak_rss_prefix}" + str(api.environment.get_peak_rss()));'
                       f'print("\\n{output_prefix}" + result.decode() + "\\n")')
 
         expr_args = blender_args + ['--python-expr', expression]
         lines = self.call_blender(expr_args, foreground=foreground)
 
         # Parse output.
+        for line in lines:
+            if line.startswith(peak_rss_prefix):
+                self.peak_rss = max(self.peak_rss, int(line[len(peak_rss_prefix):]))
+
         for line in lines:
             if line.startswith(output_prefix):
                 output = line[len(output_prefix):].strip()
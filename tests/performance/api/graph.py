@@ -3,6 +3,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 from . import TestQueue
+from . import statistics
 
 import json
 import pathlib
@@ -98,15 +99,31 @@ class TestGraph:
             row += [{}] * len(tests)
             rows.append({'c': row})
 
+        # Samples to compare against for significant changes, the previous revision for
+        # time series and the first revision otherwise.
+        reference_samples = {}
+
+        is_memory = output.find("memory") != -1 or output == "peak_rss"
+
+        def formatter(value: float) -> str:
+            return '%.2f MB' % (value / (1024 * 1024)) if is_memory else "%.4f" % value
+
         for entry in entries:
             test_index = tests[entry.test]
             revision_index = revisions[entry.revision]
             output_value = entry.output[output] if output in entry.output else -1.0
-
-            if output.find("memory") != -1:
-                formatted_value = '%.2f MB' % (output_value / (1024 * 1024))
-            else:
-                formatted_value = "%.4f" % output_value
+            formatted_value = formatter(output_value)
+
+            # Show interquartile range and significant changes for repeated runs.
+            samples = entry.samples.get(output, [])
+            if len(samples) > 1:
+                formatted_value += ' (IQR ' + formatter(statistics.interquartile_range(samples))
+                if entry.test in reference_samples and \
+                   statistics.is_significant_change(reference_samples[entry.test], samples):
+                    formatted_value += ', significant change'
+                formatted_value += ')'
+            if chart_type == 'line' or entry.test not in reference_samples:
+                reference_samples[entry.test] = samples
 
             cell = {'f': formatted_value, 'v': output_value}
             rows[revision_index]['c'][test_index + 1] = cell
@@ -0,0 +1,102 @@
+# SPDX-FileCopyrightText: 2026 Blender Authors
+#
+# SPDX-License-Identifier: Apache-2.0
+
+# Statistics on samples of repeated test runs. Implemented without dependencies,
+# so results can be processed with any Python installation.
+
+import math
+
+# Probability threshold for a change between two sets of samples to be significant.
+SIGNIFICANCE_LEVEL = 0.05
+
+# Compute the exact distribution of the Mann-Whitney U statistic below this number of sample pairs,
+# use the normal approximation above.
+MANN_WHITNEY_EXACT_MAX = 400
+
+
+def quantile(samples: list, q: float) -> float:
+    # Linear interpolation between closest ranks, same as the default method of numpy.
+    values = sorted(samples)
+    position = (len(values) - 1) * q
+    index = math.floor(position)
+    if index + 1 >= len(values):
+        return values[-1]
+    return values[index] + (values[index + 1] - values[index]) * (position - index)
+
+
+def median(samples: list) -> float:
+    return quantile(samples, 0.5)
+
+
+def interquartile_range(samples: list) -> float:
+    return quantile(samples, 0.75) - quantile(samples, 0.25)
+
+
+def _ranks(values: list) -> tuple[list, list]:
+    # Ranks starting at 1 with ties getting the average rank, and the size of each group of ties.
+    order = sorted(range(len(values)), key=values.__getitem__)
+    ranks = [0.0] * len(values)
+    ties = []
+    i = 0
+    while i < len(order):
+        j = i
+        while j + 1 < len(order) and values[order[j + 1]] == values[order[i]]:
+            j += 1
+        rank = (i + j) / 2.0 + 1.0
+        for k in range(i, j + 1):
+            ranks[order[k]] = rank
+        ties.append(j - i + 1)
+        i = j + 1
+    return ranks, ties
+
+
+def _mann_whitney_u_exact_cdf(u: int, n1: int, n2: int) -> float:
+    # Probability of U <= u when there are no ties, counting the arrangements of both samples
+    # giving each value of U: f(n1, n2, u) = f(n1 - 1, n2, u - n2) + f(n1, n2 - 1, u).
+    counts_prev = [[1] for _ in range(n2 + 1)]
+    for i in range(1, n1 + 1):
+        counts = [[1]]
+        for j in range(1, n2 + 1):
+            size = i * j + 1
+            count = [0] * size
+            for value, num in enumerate(counts[j - 1]):
+                count[value] += num
+            for value, num in enumerate(counts_prev[j]):
+                count[value + j] += num
+            counts.append(count)
+        counts_prev = counts
+
+    distribution = counts_prev[n2]
+    return sum(distribution[:u + 1]) / sum(distribution)
+
+
+def mann_whitney_u_test(samples_a: list, samples_b: list) -> float:
+    """
+    Two-sided p-value of the Mann-Whitney U test, the probability that both sets of samples
+    come from the same distribution. Returns 1.0 when there are not enough samples.
+    """
+    n1 = len(samples_a)
+    n2 = len(samples_b)
+    if n1 < 2 or n2 < 2:
+        return 1.0
+
+    ranks, ties = _ranks(list(samples_a) + list(samples_b))
+    u1 = sum(ranks[:n1]) - n1 * (n1 + 1) / 2.0
+    u = min(u1, n1 * n2 - u1)
+
+    if len(ties) == n1 + n2 and n1 * n2 <= MANN_WHITNEY_EXACT_MAX:
+        return min(1.0, 2.0 * _mann_whitney_u_exact_cdf(int(u), n1, n2))
+
+    # Normal approximation, with tie and continuity correction.
+    n = n1 + n2
+    tie_correction = sum(t * t * t - t for t in ties) / (n * (n - 1))
+    sigma = math.sqrt(n1 * n2 / 12.0 * ((n + 1) - tie_correction))
+    if sigma == 0.0:
+        return 1.0
+    z = (n1 * n2 / 2.0 - u - 0.5) / sigma
+    return min(1.0, math.erfc(max(z, 0.0) / math.sqrt(2.0)))
+
+
+def is_significant_change(samples_a: list, samples_b: list, level: float = SIGNIFICANCE_LEVEL) -> bool:
+    return mann_whitney_u_test(samples_a, samples_b) < level
@@ -41,19 +41,45 @@ def use_revision_columns(config: api.TestConfig) -> bool:
     )
 
 
+def result_column_width(config: api.TestConfig) -> int:
+    # Leave room for the interquartile range and significant changes of repeated runs.
+    return 20 if config.runs == 1 else 36
+
+
 def print_header(config: api.TestConfig) -> None:
     # Print header with revision columns headers.
     if use_revision_columns(config):
+        width = result_column_width(config)
         header = ""
         if config.queue.has_multiple_categories:
             header += f"{'': <15} "
         header += f"{'': <40} "
 
         for revision_name in config.revision_names():
-            header += f"{revision_name: <20} "
+            header += f"{revision_name: <{width}} "
         print(header)
 
 
+def format_result(entry: api.TestEntry, reference_entry: api.TestEntry) -> str:
+    # Format median time of the entry. For repeated runs, add the interquartile range,
+    # and the change compared to the reference entry when it is statistically significant.
+    time = entry.output['time']
+    result = '%.4fs' % time
+
+    samples = entry.samples.get('time', [])
+    if len(samples) < 2:
+        return result
+    result += ' iqr %.4f' % api.statistics.interquartile_range(samples)
+
+    if reference_entry and reference_entry is not entry and reference_entry.status in {'done', 'outdated'}:
+        reference_time = reference_entry.output['time'] if reference_entry.output else 0.0
+        reference_samples = reference_entry.samples.get('time', [])
+        if reference_time > 0.0 and api.statistics.is_significant_change(reference_samples, samples):
+            result += ' %+.1f%%*' % ((time / reference_time - 1.0) * 100.0)
+
+    return result
+
+
 def print_row(config: api.TestConfig, entries: list, end='\n') -> None:
     # Print one or more test entries on a row.
     row = ""
@@ -72,13 +98,17 @@ def print_row(config: api.TestConfig, entries: list, end='\n') -> None:
         row += f"{category_name: <15} "
     row += f"{entries[0].test: <40} "
 
+    # Compare revisions to the first one.
+    width = result_column_width(config)
+    reference_entry = entries[0] if use_revision_columns(config) else None
+
     for entry in entries:
         # Show time or status.
         status = entry.status
         output = entry.output
         result = ''
         if status in {'done', 'outdated'} and output:
-            result = '%.4fs' % output['time']
+            result = format_result(entry, reference_entry)
 
             if status == 'outdated':
                 result += " (outdated)"
@@ -87,7 +117,7 @@ def print_row(config: api.TestConfig, entries: list, end='\n') -> None:
         else:
             result = status
 
-        row += f"{result: <20} "
+        row += f"{result: <{width}} "
 
     print(row, end=end, flush=True)
 
@@ -102,6 +132,31 @@ def match_entry(entry: api.TestEntry, args: argparse.Namespace):
     )
 
 
+def run_test(env: api.TestEnvironment,
+             config: api.TestConfig,
+             test: api.Test,
+             device_id: str) -> tuple[dict, dict]:
+    # Run test for warm-up and measured runs, returning the median and samples of all outputs.
+    for _ in range(config.warmup_runs):
+        test.run(env, device_id)
+
+    samples = {}
+    for _ in range(config.runs):
+        env.peak_rss = 0
+        output = test.run(env, device_id)
+        if not output:
+            raise Exception("Test produced no output")
+        # Peak memory is measured in the Blender instances, outside of timed code.
+        if env.peak_rss and 'peak_rss' not in output:
+            output['peak_rss'] = env.peak_rss
+
+        for key, value in output.items():
+            samples.setdefault(key, []).append(value)
+
+    output = {key: api.statistics.median(values) for key, values in samples.items()}
+    return output, samples
+
+
 def run_entry(env: api.TestEnvironment,
               config: api.TestConfig,
               row: list,
@@ -138,6 +193,7 @@ def run_entry(env: api.TestEnvironment,
 
     # Clear output
     entry.output = None
+    entry.samples = {}
     entry.error_msg = ''
 
     # Build revision, or just set path to existing executable.
@@ -167,9 +223,7 @@ def run_entry(env: api.TestEnvironment,
         print_row(config, row, end='\r')
 
         try:
-            entry.output = test.run(env, device_id)
-            if not entry.output:
-                raise Exception("Test produced no output")
+            entry.output, entry.samples = run_test(env, config, test, device_id)
             entry.status = 'done'
         except KeyboardInterrupt as e:
             raise e
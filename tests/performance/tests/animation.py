@@ -9,7 +9,7 @@ def _run(args):
     import bpy
     import time
 
-    start_time = time.time()
+    start_time = time.perf_counter_ns()
     elapsed_time = 0.0
     num_frames = 0
 
@@ -19,7 +19,7 @@ def _run(args):
             scene.frame_set(i)
 
         num_frames += scene.frame_end + 1 - scene.frame_start
-        elapsed_time = time.time() - start_time
+        elapsed_time = (time.perf_counter_ns() - start_time) / 1e9
 
     time_per_frame = elapsed_time / num_frames
 
@@ -0,0 +1,99 @@
+# SPDX-FileCopyrightText: 2026 Blender Authors
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import api
+
+
+def _generate_blend_files(args):
+    # Save a directory of blend files, each with a different number of objects.
+    import bpy
+    import os
+
+    dirpath = args['dirpath']
+    bpy.ops.wm.read_homefile(use_empty=True, use_factory_startup=True)
+    scene = bpy.context.scene
+    for i in range(args['num_files']):
+        mesh = bpy.data.meshes.new("Mesh%d" % i)
+        scene.collection.objects.link(bpy.data.objects.new("Object%d" % i, mesh))
+        bpy.ops.wm.save_as_mainfile(
+            filepath=os.path.join(dirpath, "file%04d.blend" % i),
+            compress=args['compress'],
+            copy=True,
+        )
+    return {}
+
+
+def _run(args):
+    import os
+    import sys
+    import time
+
+    sys.path.append(args['modules_dir'])
+    import blendfile
+
+    dirpath = args['dirpath']
+    filepaths = [os.path.join(dirpath, filename) for filename in sorted(os.listdir(dirpath))]
+    open_kwargs = args['open_kwargs']
+
+    def scan():
+        for filepath in filepaths:
+            with blendfile.open_blend(filepath, **open_kwargs) as blend:
+                for code in (b'LI', b'IM', b'OB'):
+                    for block in blend.find_blocks_from_code(code):
+                        block[b'id', b'name']
+
+    # Scan once to ensure files are cached by OS, and to create the block index when used.
+    scan()
+
+    start_time = time.perf_counter_ns()
+    scan()
+    elapsed_time = (time.perf_counter_ns() - start_time) / 1e9
+
+    result = {'time': elapsed_time / len(filepaths), 'files_per_second': len(filepaths) / elapsed_time}
+    return result
+
+
+class BlendFileScanTest(api.Test):
+    def __init__(self, mode, compress, num_files=200):
+        self.mode = mode
+        self.compress = compress
+        self.num_files = num_files
+
+    def name(self):
+        return "%s_%s" % (self.mode, "compressed" if self.compress else "uncompressed")
+
+    def category(self):
+        return "blendfile_scan"
+
+    def run(self, env, device_id):
+        import pathlib
+        import tempfile
+
+        modules_dir = pathlib.Path(__file__).resolve().parents[3] / "tools" / "modules"
+
+        with tempfile.TemporaryDirectory() as tempdir:
+            blends_dir = pathlib.Path(tempdir) / "blends"
+            blends_dir.mkdir()
+            args = {'dirpath': str(blends_dir), 'num_files': self.num_files, 'compress': self.compress}
+            env.run_in_blender(_generate_blend_files, args)
+
+            open_kwargs = {}
+            if self.mode == 'indexed':
+                open_kwargs = {
+                    'use_mmap': True,
+                    'use_sdna_cache': True,
+                    'index_dir': str(pathlib.Path(tempdir) / "index"),
+                }
+            args = {'dirpath': str(blends_dir), 'modules_dir': str(modules_dir), 'open_kwargs': open_kwargs}
+            result, _ = env.run_in_blender(_run, args)
+
+        return result
+
+
+def generate(env):
+    return [
+        BlendFileScanTest(mode, compress)
+        for mode in ('default', 'indexed')
+        for compress in (False, True)
+    ]
@@ -0,0 +1,115 @@
+# SPDX-FileCopyrightText: 2026 Blender Authors
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import api
+
+
+def _write_synthetic_fbx(args):
+    # Write an FBX file containing a single mesh, using the exporter's binary encoder.
+    import numpy as np
+    from io_scene_fbx import encode_bin
+
+    num_verts = args['num_verts']
+    version = 7400
+
+    encode_bin.init_version(version)
+    root = encode_bin.FBXElem(b'')
+
+    for elem_id in (b'FBXHeaderExtension', b'GlobalSettings', b'Definitions'):
+        elem = encode_bin.FBXElem(elem_id)
+        elem.add_int32(1000)
+        root.elems.append(elem)
+
+    elem = encode_bin.FBXElem(b'FileId')
+    elem.add_bytes(b'\0' * 16)
+    root.elems.append(elem)
+    elem = encode_bin.FBXElem(b'CreationTime')
+    elem.add_string(b'')
+    root.elems.append(elem)
+
+    objects = encode_bin.FBXElem(b'Objects')
+    root.elems.append(objects)
+
+    geom = encode_bin.FBXElem(b'Geometry')
+    geom.add_int64(1)
+    geom.add_string(b'Mesh\x00\x01Geometry')
+    geom.add_string(b'Mesh')
+    objects.elems.append(geom)
+
+    rng = np.random.default_rng(0)
+    elem = encode_bin.FBXElem(b'Vertices')
+    elem.add_float64_array(rng.random(num_verts * 3))
+    geom.elems.append(elem)
+
+    # Quads, with the last index of each polygon negated and decremented, as FBX does.
+    indices = np.arange(num_verts, dtype=np.int32)
+    indices[3::4] = -indices[3::4] - 1
+    elem = encode_bin.FBXElem(b'PolygonVertexIndex')
+    elem.add_int32_array(indices)
+    geom.elems.append(elem)
+
+    elem = encode_bin.FBXElem(b'Connections')
+    root.elems.append(elem)
+
+    encode_bin.write(args['filepath'], root, version)
+    return {}
+
+
+def _run(args):
+    import time
+    import tracemalloc
+    from io_scene_fbx import parse_fbx
+
+    filepath = args['filepath']
+
+    # Parse once to ensure it's cached by OS.
+    parse_fbx.parse(filepath)
+
+    tracemalloc.start()
+    start_time = time.perf_counter_ns()
+
+    elem_root, _version = parse_fbx.parse(filepath, use_mmap=args['use_mmap'])
+    # Access the elements an importer would, so that lazily parsed files are measured doing the same work.
+    for elem in elem_root.elems:
+        if elem.id == b'Objects':
+            for geom in elem.elems:
+                for sub_elem in geom.elems:
+                    sub_elem.props
+
+    elapsed_time = (time.perf_counter_ns() - start_time) / 1e9
+    _current, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    result = {'time': elapsed_time, 'peak_memory': peak_memory}
+    return result
+
+
+class FBXParseTest(api.Test):
+    def __init__(self, use_mmap, num_verts=1000000):
+        self.use_mmap = use_mmap
+        self.num_verts = num_verts
+
+    def name(self):
+        return "parse_%s_%dk_verts" % ("mmap" if self.use_mmap else "eager", self.num_verts // 1000)
+
+    def category(self):
+        return "fbx_parse"
+
+    def run(self, env, device_id):
+        import tempfile
+        import pathlib
+
+        with tempfile.TemporaryDirectory() as tempdir:
+            filepath = str(pathlib.Path(tempdir) / "synthetic.fbx")
+            args = {'filepath': filepath, 'num_verts': self.num_verts}
+            env.run_in_blender(_write_synthetic_fbx, args)
+
+            args['use_mmap'] = self.use_mmap
+            result, _ = env.run_in_blender(_run, args)
+
+        return result
+
+
+def generate(env):
+    return [FBXParseTest(use_mmap) for use_mmap in (False, True)]
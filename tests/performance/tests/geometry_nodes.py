@@ -27,9 +27,9 @@ def _run(args):
                     ob.update_tag()
                     break
 
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         bpy.context.view_layer.update()
-        elapsed_time = time.time() - start_time
+        elapsed_time = (time.perf_counter_ns() - start_time) / 1e9
         measured_times.append(elapsed_time)
 
         if len(measured_times) >= min_measurements and test_time_start + timeout < time.time():
@@ -0,0 +1,75 @@
+# SPDX-FileCopyrightText: 2026 Blender Authors
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import api
+
+
+def _run(args):
+    import bpy
+    import time
+
+    num_nodes = args['num_nodes']
+    num_meshes = args['num_meshes']
+
+    # Synthetic scene with many nodes, in a hierarchy of empties with mesh instances.
+    bpy.ops.wm.read_homefile(use_empty=True, use_factory_startup=True)
+    scene = bpy.context.scene
+
+    meshes = []
+    for i in range(num_meshes):
+        bpy.ops.mesh.primitive_cube_add(size=1.0 + i * 0.01)
+        obj = bpy.context.active_object
+        meshes.append(obj.data)
+        bpy.data.objects.remove(obj)
+
+    parent = None
+    for i in range(num_nodes):
+        if i % 10 == 0:
+            parent = bpy.data.objects.new("Empty%d" % i, None)
+            scene.collection.objects.link(parent)
+            continue
+        obj = bpy.data.objects.new("Object%d" % i, meshes[i % num_meshes])
+        obj.location = (i % 100, (i // 100) % 100, i // 10000)
+        obj.parent = parent
+        scene.collection.objects.link(obj)
+
+    # Export once to load the add-on and warm caches.
+    bpy.ops.export_scene.gltf(filepath=args['filepath'], export_format='GLB')
+
+    start_time = time.perf_counter_ns()
+    bpy.ops.export_scene.gltf(filepath=args['filepath'], export_format='GLB')
+    elapsed_time = (time.perf_counter_ns() - start_time) / 1e9
+
+    result = {'time': elapsed_time}
+    return result
+
+
+class GltfExportTest(api.Test):
+    def __init__(self, num_nodes, num_meshes=50):
+        self.num_nodes = num_nodes
+        self.num_meshes = num_meshes
+
+    def name(self):
+        return "export_%dk_nodes" % (self.num_nodes // 1000)
+
+    def category(self):
+        return "gltf_export"
+
+    def run(self, env, device_id):
+        import pathlib
+        import tempfile
+
+        with tempfile.TemporaryDirectory() as tempdir:
+            args = {
+                'filepath': str(pathlib.Path(tempdir) / "synthetic.glb"),
+                'num_nodes': self.num_nodes,
+                'num_meshes': self.num_meshes,
+            }
+            result, _ = env.run_in_blender(_run, args)
+
+        return result
+
+
+def generate(env):
+    return [GltfExportTest(num_nodes) for num_nodes in (1000, 5000, 20000)]
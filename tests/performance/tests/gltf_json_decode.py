@@ -0,0 +1,90 @@
+# SPDX-FileCopyrightText: 2026 Blender Authors
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import api
+
+
+def _run(args):
+    import time
+    import addon_utils
+
+    addon_utils.enable("io_scene_gltf2", default_set=True)
+    from io_scene_gltf2.io.com.gltf2_io import gltf_from_dict
+    from io_scene_gltf2.io.com.gltf2_io_decoder import decode_gltf
+
+    num_nodes = args['num_nodes']
+
+    # Synthetic glTF JSON data with one mesh, accessor and buffer view per node.
+    gltf = {
+        'asset': {'version': "2.0", 'generator': "Blender performance tests"},
+        'scene': 0,
+        'scenes': [{'name': "Scene", 'nodes': list(range(0, num_nodes, 10))}],
+        'nodes': [],
+        'meshes': [],
+        'accessors': [],
+        'bufferViews': [],
+        'buffers': [{'byteLength': num_nodes * 288}],
+    }
+    for i in range(num_nodes):
+        node = {
+            'name': "Node%d" % i,
+            'mesh': i,
+            'translation': [i % 100, (i // 100) % 100, 0.5],
+            'rotation': [0.0, 0.0, 0.0, 1.0],
+            'scale': [1, 1, 1],
+            'extras': {'index': i},
+        }
+        if i % 10 == 0:
+            node['children'] = list(range(i + 1, min(i + 10, num_nodes)))
+        gltf['nodes'].append(node)
+        gltf['meshes'].append({'name': "Mesh%d" % i, 'primitives': [{'attributes': {'POSITION': i}, 'mode': 4}]})
+        gltf['accessors'].append({
+            'bufferView': i, 'componentType': 5126, 'count': 24, 'type': "VEC3",
+            'min': [-1, -1, -1], 'max': [1, 1, 1],
+        })
+        gltf['bufferViews'].append({'buffer': 0, 'byteOffset': i * 288, 'byteLength': 288, 'target': 34962})
+
+    if args['mode'] == 'from_dict':
+        decode = gltf_from_dict
+    else:
+        strict = args['mode'] == 'strict'
+
+        def decode(gltf):
+            return decode_gltf(gltf, strict=strict)
+
+    # Decode once to warm caches.
+    decode(gltf)
+
+    start_time = time.perf_counter_ns()
+    decode(gltf)
+    elapsed_time = (time.perf_counter_ns() - start_time) / 1e9
+
+    result = {'time': elapsed_time}
+    return result
+
+
+class GltfJsonDecodeTest(api.Test):
+    def __init__(self, num_nodes, mode):
+        self.num_nodes = num_nodes
+        self.mode = mode
+
+    def name(self):
+        return "decode_%dk_nodes_%s" % (self.num_nodes // 1000, self.mode)
+
+    def category(self):
+        return "gltf_import"
+
+    def run(self, env, device_id):
+        args = {
+            'num_nodes': self.num_nodes,
+            'mode': self.mode,
+        }
+        result, _ = env.run_in_blender(_run, args)
+        return result
+
+
+def generate(env):
+    return [GltfJsonDecodeTest(num_nodes, mode)
+            for num_nodes in (10000, 100000)
+            for mode in ('from_dict', 'fast', 'strict')]
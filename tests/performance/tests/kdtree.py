@@ -0,0 +1,87 @@
+# SPDX-FileCopyrightText: 2026 Blender Authors
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import api
+
+
+def _run(args):
+    import time
+    import numpy as np
+    from mathutils import kdtree
+
+    rng = np.random.default_rng(0)
+    co = rng.uniform(-1.0, 1.0, (args['size'], 3))
+    co_find = rng.uniform(-1.0, 1.0, (args['size'], 3))
+    function = args['function']
+    use_batch = args['batch']
+
+    if use_batch:
+        co_find_arg = co_find
+    else:
+        co_list = co.tolist()
+        co_find_arg = co_find.tolist()
+
+    start_time = time.perf_counter_ns()
+
+    tree = kdtree.KDTree(len(co))
+    if use_batch:
+        tree.insert_batch(co)
+    else:
+        for index, co_item in enumerate(co_list):
+            tree.insert(co_item, index)
+    tree.balance()
+
+    if function == 'find':
+        if use_batch:
+            tree.find_batch(co_find_arg)
+        else:
+            for co_item in co_find_arg:
+                tree.find(co_item)
+    elif function == 'find_n':
+        if use_batch:
+            tree.find_n_batch(co_find_arg, 8)
+        else:
+            for co_item in co_find_arg:
+                tree.find_n(co_item, 8)
+    elif function == 'find_range':
+        if use_batch:
+            tree.find_range_batch(co_find_arg, 0.02)
+        else:
+            for co_item in co_find_arg:
+                tree.find_range(co_item, 0.02)
+
+    elapsed_time = (time.perf_counter_ns() - start_time) / 1e9
+
+    result = {'time': elapsed_time}
+    return result
+
+
+class KDTreeTest(api.Test):
+    def __init__(self, function, batch, size=1000000):
+        self.function = function
+        self.batch = batch
+        self.size = size
+
+    def name(self):
+        return "%s%s_%dk" % (self.function, "_batch" if self.batch else "", self.size // 1000)
+
+    def category(self):
+        return "kdtree"
+
+    def run(self, env, device_id):
+        args = {
+            'function': self.function,
+            'batch': self.batch,
+            'size': self.size,
+        }
+        result, _ = env.run_in_blender(_run, args)
+        return result
+
+
+def generate(env):
+    return [
+        KDTreeTest(function, batch)
+        for function in ('find', 'find_n', 'find_range')
+        for batch in (False, True)
+    ]
@@ -0,0 +1,89 @@
+# SPDX-FileCopyrightText: 2026 Blender Authors
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import api
+
+
+def _run(args):
+    import bpy
+    import time
+    import numpy as np
+    from bpy_extras import mesh_utils
+
+    size = args['size']
+    island_size = args['island_size']
+
+    mesh = bpy.data.meshes.new("Benchmark")
+    if args['function'] == 'edge_loops_from_edges':
+        # Loose edges forming closed loops of 10 edges each.
+        num_edges = size * size
+        loop_verts = np.arange(num_edges).reshape(-1, 10)
+        edges = np.stack((loop_verts, np.roll(loop_verts, -1, axis=1)), axis=2)
+        mesh.vertices.add(num_edges)
+        mesh.edges.add(num_edges)
+        mesh.edges.foreach_set("vertices", edges.ravel().astype(np.int32))
+        mesh.update()
+    else:
+        # Grid of size by size quads, with square UV islands of island_size by island_size quads,
+        # like many small islands of a scanned mesh.
+        grid = np.arange((size + 1) * (size + 1)).reshape(size + 1, size + 1)
+        corners = np.stack((grid[:-1, :-1], grid[:-1, 1:], grid[1:, 1:], grid[1:, :-1]), axis=2).reshape(-1)
+        xs, ys = np.meshgrid(np.arange(size + 1, dtype=np.float32), np.arange(size + 1, dtype=np.float32))
+        co = np.stack((xs, ys, np.zeros_like(xs)), axis=2)
+
+        num_faces = size * size
+        mesh.vertices.add((size + 1) * (size + 1))
+        mesh.vertices.foreach_set("co", co.ravel())
+        mesh.loops.add(num_faces * 4)
+        mesh.loops.foreach_set("vertex_index", corners.astype(np.int32))
+        mesh.polygons.add(num_faces)
+        mesh.polygons.foreach_set("loop_start", np.arange(0, num_faces * 4, 4, dtype=np.int32))
+        mesh.update(calc_edges=True)
+
+        # Offset the UV coordinates of each island, so that only faces of the same island share them.
+        face_y, face_x = np.divmod(np.arange(num_faces), size)
+        island = (face_y // island_size) * size + face_x // island_size
+        uv = co[:, :, :2].reshape(-1, 2)[corners]
+        uv[:, 0] += np.repeat(island, 4) * 2 * island_size
+        mesh.uv_layers.new().data.foreach_set("uv", uv.ravel())
+        mesh.calc_loop_triangles()
+
+    function = getattr(mesh_utils, args['function'])
+
+    start_time = time.perf_counter_ns()
+    function(mesh)
+    elapsed_time = (time.perf_counter_ns() - start_time) / 1e9
+
+    result = {'time': elapsed_time}
+    return result
+
+
+class MeshUtilsTest(api.Test):
+    def __init__(self, function, size=1000, island_size=4):
+        self.function = function
+        self.size = size
+        self.island_size = island_size
+
+    def name(self):
+        return "%s_%dk" % (self.function, self.size * self.size // 1000)
+
+    def category(self):
+        return "mesh_utils"
+
+    def run(self, env, device_id):
+        args = {
+            'function': self.function,
+            'size': self.size,
+            'island_size': self.island_size,
+        }
+        result, _ = env.run_in_blender(_run, args)
+        return result
+
+
+def generate(env):
+    return [MeshUtilsTest(function) for function in (
+        'mesh_linked_uv_islands',
+        'mesh_linked_triangles',
+        'edge_loops_from_edges',
+    )]
@@ -139,11 +139,11 @@ def _run(args: dict):
     set_view3d_context_override(context_override)
 
     with context.temp_override(**context_override):
-        start = time.time()
+        start = time.perf_counter_ns()
         bpy.ops.sculpt.brush_stroke(stroke=generate_stroke(context_override))
-        end = time.time()
+        end = time.perf_counter_ns()
 
-    result = {'time': end - start}
+    result = {'time': (end - start) / 1e9}
     # bpy.ops.wm.save_mainfile(filepath="/home/hans/Documents/test.blend")
     return result
 
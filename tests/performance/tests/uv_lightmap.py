@@ -0,0 +1,74 @@
+# SPDX-FileCopyrightText: 2026 Blender Authors
+#
+# SPDX-License-Identifier: Apache-2.0
+
+import api
+
+
+def _run(args):
+    import bpy
+    import time
+    import numpy as np
+    from bl_operators.uvcalc_lightmap import lightmap_uvpack
+
+    size = args['size']
+
+    # Grid of size by size faces, every other row split into triangles.
+    grid = np.arange((size + 1) * (size + 1)).reshape(size + 1, size + 1)
+    quads = np.stack((grid[:-1, :-1], grid[:-1, 1:], grid[1:, 1:], grid[1:, :-1]), axis=2)
+    tris = quads[1::2].reshape(-1, 4)[:, [0, 1, 2, 0, 2, 3]].reshape(-1)
+    corners = np.concatenate((quads[0::2].reshape(-1), tris))
+    loop_total = np.concatenate((np.full(quads[0::2].size // 4, 4), np.full(tris.size // 3, 3)))
+    xs, ys = np.meshgrid(np.arange(size + 1, dtype=np.float32), np.arange(size + 1, dtype=np.float32))
+    co = np.stack((xs, ys, np.sin(xs) * np.cos(ys)), axis=2)
+
+    mesh = bpy.data.meshes.new("Benchmark")
+    mesh.vertices.add((size + 1) * (size + 1))
+    mesh.vertices.foreach_set("co", co.ravel())
+    mesh.loops.add(len(corners))
+    mesh.loops.foreach_set("vertex_index", corners.astype(np.int32))
+    mesh.polygons.add(len(loop_total))
+    mesh.polygons.foreach_set("loop_start", (np.cumsum(loop_total) - loop_total).astype(np.int32))
+    mesh.update(calc_edges=True)
+
+    start_time = time.perf_counter_ns()
+    efficiencies = lightmap_uvpack(
+        [mesh],
+        PREF_SEL_ONLY=False,
+        PREF_MARGIN_DIV=1000,
+        PREF_PACK_PRESET=args['preset'],
+    )
+    elapsed_time = (time.perf_counter_ns() - start_time) / 1e9
+
+    result = {'time': elapsed_time, 'efficiency': efficiencies[0]}
+    return result
+
+
+class UVLightmapTest(api.Test):
+    def __init__(self, preset, size):
+        self.preset = preset
+        self.size = size
+
+    def name(self):
+        return "%s_%dk" % (self.preset.lower(), self.size * self.size // 1000)
+
+    def category(self):
+        return "uv_lightmap"
+
+    def run(self, env, device_id):
+        args = {
+            'preset': self.preset,
+            'size': self.size,
+        }
+        result, _ = env.run_in_blender(_run, args)
+        return result
+
+
+def generate(env):
+    return [
+        UVLightmapTest('CLASSIC', 100),
+        UVLightmapTest('SPEED', 100),
+        UVLightmapTest('QUALITY', 100),
+        UVLightmapTest('SPEED', 700),
+        UVLightmapTest('QUALITY', 700),
+    ]
@@ -0,0 +1,222 @@
+# SPDX-FileCopyrightText: 2026 Blender Authors
+#
+# SPDX-License-Identifier: Apache-2.0
+
+# ./blender.bin --background --factory-startup --python tests/python/bl_freestyle_parameter_editor.py -- --verbose
+
+"""
+Check the color, alpha and thickness modifiers of the Freestyle parameter editor
+shade strokes the same way with NumPy arrays as one vertex at a time.
+"""
+
+__all__ = (
+    "main",
+)
+
+import traceback
+import unittest
+
+import bpy
+import numpy as np
+from mathutils import Vector
+
+import parameter_editor
+from freestyle.types import Stroke, StrokeShader
+from freestyle.utils import (
+    BoundedProperty,
+    getCurrentScene,
+    iter_distance_from_camera,
+    iter_distance_from_object,
+    iter_t2d_along_stroke,
+)
+
+# Ramp blend types blended as arrays and some of the types blended one vertex at a time.
+COLOR_BLENDS = (
+    'MIX', 'ADD', 'MULTIPLY', 'SUBTRACT', 'SCREEN', 'DIVIDE', 'DIFFERENCE', 'DARKEN', 'LIGHTEN',
+    'OVERLAY', 'HUE',
+)
+SCALAR_BLENDS = ('MIX', 'ADD', 'SUBTRACT', 'MULTIPLY', 'DIVIDE', 'DIFFERENCE', 'MINIMUM', 'MAXIMUM')
+RAMP_INTERPOLATIONS = ('LINEAR', 'EASE', 'CONSTANT', 'B_SPLINE')
+THICKNESS_POSITIONS = ('CENTER', 'INSIDE', 'OUTSIDE', 'RELATIVE')
+
+INFLUENCE = 0.75
+# Ranges of the distances, the stroke vertices are both inside and outside of them.
+CAMERA_RANGE = (10.0, 12.0)
+OBJECT_RANGE = (1.0, 1.5)
+THICKNESS_RANGE = (1.0, 5.0)
+
+
+def modifier_shaders(linestyle, target):
+    """
+    Yields a description and a shader for each combination of modifier and settings,
+    the shaders are created while rendering, when the current scene is available.
+    """
+    ramps = [m.color_ramp for m in linestyle.color_modifiers]
+    curves = [m.curve for m in linestyle.alpha_modifiers]
+
+    for ramp in ramps:
+        for blend in COLOR_BLENDS:
+            args = (blend, INFLUENCE, ramp)
+            description = "%s, %s" % (ramp.interpolation, blend)
+            yield description, parameter_editor.ColorAlongStrokeShader(*args)
+            yield description, parameter_editor.ColorDistanceFromCameraShader(*args, *CAMERA_RANGE)
+            yield description, parameter_editor.ColorDistanceFromObjectShader(*args, target, *OBJECT_RANGE)
+            yield description, parameter_editor.ColorMaterialShader(*args, 'DIFF', True)
+            yield description, parameter_editor.TangentColorShader(*args)
+    yield "no ramp", parameter_editor.ColorMaterialShader('MULTIPLY', INFLUENCE, ramps[0], 'DIFF', False)
+
+    for curve in curves:
+        for mapping, invert in (('LINEAR', False), ('LINEAR', True), ('CURVE', False)):
+            for blend in SCALAR_BLENDS:
+                args = (blend, INFLUENCE, mapping, invert, curve)
+                description = "%d points, %s, invert=%r, %s" % (len(curve.curves[0].points), mapping, invert, blend)
+                yield description, parameter_editor.AlphaAlongStrokeShader(*args)
+                yield description, parameter_editor.AlphaDistanceFromCameraShader(*args, *CAMERA_RANGE)
+                yield description, parameter_editor.AlphaDistanceFromObjectShader(*args, target, *OBJECT_RANGE)
+                yield description, parameter_editor.AlphaMaterialShader(*args, 'DIFF')
+                yield description, parameter_editor.TangentAlphaShader(*args)
+                for position in THICKNESS_POSITIONS:
+                    thickness_args = (position, 0.25, *args)
+                    thickness_description = "%s, %s" % (description, position)
+                    yield thickness_description, parameter_editor.ThicknessAlongStrokeShader(
+                        *thickness_args, *THICKNESS_RANGE)
+                    yield thickness_description, parameter_editor.ThicknessDistanceFromCameraShader(
+                        *thickness_args, *CAMERA_RANGE, *THICKNESS_RANGE)
+                    yield thickness_description, parameter_editor.ThicknessDistanceFromObjectShader(
+                        *thickness_args, target, *OBJECT_RANGE, *THICKNESS_RANGE)
+                    yield thickness_description, parameter_editor.ThicknessMaterialShader(
+                        *thickness_args, 'DIFF', *THICKNESS_RANGE)
+                    yield thickness_description, parameter_editor.TangentThicknessShader(
+                        *thickness_args, *THICKNESS_RANGE)
+
+    for position in THICKNESS_POSITIONS:
+        for blend in SCALAR_BLENDS:
+            yield "%s, %s" % (position, blend), parameter_editor.CalligraphicThicknessShader(
+                position, 0.25, blend, INFLUENCE, 0.5, *THICKNESS_RANGE)
+
+
+def stroke_attributes(stroke):
+    """Returns the color, alpha and thickness of the stroke vertices, as an array of shape (count, 6)."""
+    return np.array([
+        (*svert.attribute.color, svert.attribute.alpha, *svert.attribute.thickness)
+        for svert in stroke
+    ])
+
+
+class CompareShader(StrokeShader):
+    """
+    Shades copies of the stroke with each modifier, one vertex at a time and with NumPy,
+    adding a name, the per-vertex result and the NumPy result to ``results``.
+    """
+
+    def __init__(self, linestyle, target, results, errors):
+        StrokeShader.__init__(self)
+        self.linestyle = linestyle
+        self.target = target
+        self.results = results
+        self.errors = errors
+
+    def shade(self, stroke):
+        # Any exception is reported by the test, instead of being printed by Freestyle.
+        try:
+            self.compare_inputs(stroke)
+            for description, shader in modifier_shaders(self.linestyle, self.target):
+                stroke_per_vertex = Stroke(stroke)
+                parameter_editor.np = None
+                try:
+                    shader.shade(stroke_per_vertex)
+                finally:
+                    parameter_editor.np = np
+                stroke_array = Stroke(stroke)
+                shader.shade(stroke_array)
+                name = "%s (%s)" % (type(shader).__name__, description)
+                self.results.append((name, stroke_attributes(stroke_per_vertex), stroke_attributes(stroke_array)))
+        except Exception:
+            self.errors.append(traceback.format_exc())
+
+    def compare_inputs(self, stroke):
+        sverts = tuple(stroke)
+        self.results.append((
+            "t2d_along_stroke",
+            np.array(list(iter_t2d_along_stroke(stroke))),
+            parameter_editor.t2d_along_stroke(stroke, sverts),
+        ))
+
+        camera_range = BoundedProperty(*CAMERA_RANGE)
+        self.results.append((
+            "distance_from_point (camera)",
+            np.array([value for _, value in iter_distance_from_camera(stroke, *camera_range)]),
+            parameter_editor.distance_from_point(sverts, Vector(), *camera_range),
+        ))
+
+        location = getCurrentScene().camera.matrix_world.inverted() @ self.target.location
+        object_range = BoundedProperty(*OBJECT_RANGE)
+        self.results.append((
+            "distance_from_point (object)",
+            np.array([value for _, value in iter_distance_from_object(stroke, location, *object_range)]),
+            parameter_editor.distance_from_point(sverts, location, *object_range),
+        ))
+
+
+class ParameterEditorModifiersTest(unittest.TestCase):
+    def setUp(self):
+        bpy.ops.wm.read_homefile(use_factory_startup=True)
+        scene = bpy.context.scene
+        scene.render.engine = 'CYCLES'
+        scene.cycles.samples = 1
+        scene.render.resolution_x = 64
+        scene.render.resolution_y = 64
+        scene.render.use_freestyle = True
+
+        lineset = bpy.context.view_layer.freestyle_settings.linesets.active
+        self.linestyle = lineset.linestyle
+        self.linestyle.color = (0.2, 0.5, 0.8)
+        self.linestyle.alpha = 0.6
+
+        # The modifiers of the line style are only used for their ramps and curves.
+        for interpolation in RAMP_INTERPOLATIONS:
+            modifier = self.linestyle.color_modifiers.new(interpolation, 'ALONG_STROKE')
+            modifier.use = False
+            ramp = modifier.color_ramp
+            ramp.interpolation = interpolation
+            ramp.elements[0].color = (1.0, 0.0, 0.0, 1.0)
+            ramp.elements[1].color = (0.0, 0.0, 1.0, 1.0)
+            ramp.elements[1].position = 0.8
+            ramp.elements.new(0.3).color = (0.0, 1.0, 0.5, 1.0)
+
+        for i in range(2):
+            modifier = self.linestyle.alpha_modifiers.new("Curve", 'ALONG_STROKE')
+            modifier.use = False
+            if i:
+                modifier.curve.curves[0].points.new(0.3, 0.8)
+                modifier.curve.update()
+
+        self.target = bpy.data.objects["Cube"]
+        self.results = []
+        self.errors = []
+
+        def callback(scene, layer, lineset):
+            return [CompareShader(self.linestyle, self.target, self.results, self.errors)]
+
+        parameter_editor.callbacks_modifiers_post.append(callback)
+        self.addCleanup(parameter_editor.callbacks_modifiers_post.remove, callback)
+
+    def test_modifiers(self):
+        bpy.ops.render.render()
+        self.assertEqual(self.errors, [])
+        self.assertNotEqual(self.results, [])
+
+        for name, expected, result in self.results:
+            with self.subTest(name=name):
+                self.assertEqual(len(expected), len(result))
+                np.testing.assert_allclose(result, expected, rtol=1e-5, atol=1e-5)
+
+
+def main():
+    import sys
+    sys.argv = [__file__] + (sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else [])
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
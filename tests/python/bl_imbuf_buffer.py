@@ -0,0 +1,160 @@
+# SPDX-FileCopyrightText: 2026 Blender Authors
+#
+# SPDX-License-Identifier: Apache-2.0
+
+# ./blender.bin --background --factory-startup --python tests/python/bl_imbuf_buffer.py -- --verbose
+
+__all__ = (
+    "main",
+)
+
+import os
+import tempfile
+import unittest
+
+import bpy
+import imbuf
+import numpy as np
+
+WIDTH = 5
+HEIGHT = 3
+
+
+def imbuf_new_float(filepath, file_format='HDR', color_depth=None):
+    """Return an image with float pixels, loaded from a file written by an image with float pixels."""
+    image = bpy.data.images.new("float", WIDTH, HEIGHT, float_buffer=True)
+    try:
+        image.pixels.foreach_set(np.linspace(0.0, 1.0, WIDTH * HEIGHT * 4, dtype=np.float32))
+        scene = bpy.context.scene
+        scene.render.image_settings.file_format = file_format
+        if color_depth is not None:
+            scene.render.image_settings.color_depth = color_depth
+        image.save_render(filepath, scene=scene)
+    finally:
+        bpy.data.images.remove(image)
+    return imbuf.load(filepath)
+
+
+class ImBufBufferTest(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tempdir.cleanup)
+
+    def assertViewLayout(self, ibuf, format, itemsize, channels):
+        shape = (HEIGHT, WIDTH, channels)
+        strides = (WIDTH * channels * itemsize, channels * itemsize, itemsize)
+        for view in (memoryview(ibuf), ibuf.pixels):
+            with view:
+                self.assertEqual(view.format, format)
+                self.assertEqual(view.itemsize, itemsize)
+                self.assertEqual(view.shape, shape)
+                self.assertEqual(view.strides, strides)
+                self.assertFalse(view.readonly)
+                self.assertTrue(view.c_contiguous)
+
+        pixels = np.asarray(ibuf)
+        self.assertEqual(pixels.dtype, np.dtype(format))
+        self.assertEqual(pixels.shape, shape)
+        self.assertEqual(pixels.strides, strides)
+
+    def test_byte_layout(self):
+        ibuf = imbuf.new((WIDTH, HEIGHT))
+        self.assertViewLayout(ibuf, 'B', 1, 4)
+
+    def test_float_layout(self):
+        ibuf = imbuf_new_float(os.path.join(self.tempdir.name, "float.hdr"))
+        self.assertGreaterEqual(ibuf.channels, 3)
+        self.assertViewLayout(ibuf, 'f', 4, ibuf.channels)
+
+    def test_byte_write(self):
+        ibuf = imbuf.new((WIDTH, HEIGHT))
+        pixels = np.asarray(ibuf)
+        pixels[:] = 0
+        pixels[1, 2] = (10, 20, 30, 40)
+        del pixels
+
+        # The pixels of the image are written to, not a copy of them.
+        ibuf_copy = ibuf.copy()
+        with ibuf_copy.pixels as view:
+            values = view.tolist()
+        self.assertEqual(values[1][2], [10, 20, 30, 40])
+        self.assertEqual(sum(value for row in values for pixel in row for value in pixel), 100)
+
+    def test_float_write(self):
+        ibuf = imbuf_new_float(os.path.join(self.tempdir.name, "float.hdr"))
+        pixels = np.asarray(ibuf)
+        pixels[:] = 0.25
+        pixels[2, 4, 0] = 2.5
+        del pixels
+
+        expected = np.full((HEIGHT, WIDTH, ibuf.channels), 0.25, dtype=np.float32)
+        expected[2, 4, 0] = 2.5
+        np.testing.assert_array_equal(np.asarray(ibuf.copy()), expected)
+
+    def load_pixels(self, filepath):
+        """Return the pixels of an image file, as floats in the ``[0, 1]`` range."""
+        pixels = np.asarray(imbuf.load(filepath).copy())
+        if pixels.dtype == np.uint8:
+            return pixels / np.float32(255.0)
+        return pixels
+
+    def test_float_write_file(self):
+        # 16 bit PNG images are loaded with float pixels, the byte pixels are created when written.
+        ibuf = imbuf_new_float(os.path.join(self.tempdir.name, "float.png"), 'PNG', '16')
+        self.assertEqual(np.asarray(ibuf).dtype, np.float32)
+        imbuf.write(ibuf, filepath=os.path.join(self.tempdir.name, "write_1.png"))
+
+        expected = np.zeros((HEIGHT, WIDTH, 3), dtype=np.float32)
+        pixels = np.asarray(ibuf)
+        pixels[:] = 1.0
+        pixels[:, :, :3] = 0.0
+        imbuf.write(ibuf, filepath=os.path.join(self.tempdir.name, "write_2.png"))
+
+        # Edits made after writing, while the pixels are still exported.
+        pixels[1, 2, :3] = 1.0
+        del pixels
+        imbuf.write(ibuf, filepath=os.path.join(self.tempdir.name, "write_3.png"))
+
+        pixels = self.load_pixels(os.path.join(self.tempdir.name, "write_2.png"))
+        np.testing.assert_allclose(pixels[:, :, :3], expected, atol=1e-3)
+        expected[1, 2] = 1.0
+        pixels = self.load_pixels(os.path.join(self.tempdir.name, "write_3.png"))
+        np.testing.assert_allclose(pixels[:, :, :3], expected, atol=1e-3)
+
+    def test_exported_resize(self):
+        ibuf = imbuf.new((WIDTH, HEIGHT))
+        view = memoryview(ibuf)
+        pixels = np.asarray(ibuf)
+        with self.assertRaises(BufferError):
+            ibuf.resize((WIDTH * 2, HEIGHT * 2))
+        with self.assertRaises(BufferError):
+            ibuf.crop((0, 0), (1, 1))
+        with self.assertRaises(BufferError):
+            ibuf.free()
+        self.assertEqual(tuple(ibuf.size), (WIDTH, HEIGHT))
+
+        # Still exported by the array.
+        view.release()
+        with self.assertRaises(BufferError):
+            ibuf.resize((WIDTH * 2, HEIGHT * 2))
+
+        del pixels
+        ibuf.resize((WIDTH * 2, HEIGHT * 2))
+        self.assertEqual(np.asarray(ibuf).shape, (HEIGHT * 2, WIDTH * 2, 4))
+        ibuf.free()
+
+    def test_freed(self):
+        ibuf = imbuf.new((WIDTH, HEIGHT))
+        ibuf.free()
+        with self.assertRaises(ReferenceError):
+            memoryview(ibuf)
+
+
+def main():
+    import sys
+    sys.argv = [__file__] + (sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else [])
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+# SPDX-FileCopyrightText: 2026 Blender Authors
+#
+# SPDX-License-Identifier: Apache-2.0
+
+# ./blender.bin --background --factory-startup --python tests/python/bl_operators_uvcalc_lightmap.py -- --verbose
+
+__all__ = (
+    "main",
+)
+
+import unittest
+from math import cos, pi, sin
+
+import bpy
+import numpy as np
+from bl_operators import uvcalc_lightmap
+
+
+def mesh_faces():
+    """
+    Return the locations of the corners of separate faces:
+    quads of different proportions, triangles of different shapes and planar n-gons at an angle.
+    """
+    faces = []
+    for x in range(3):
+        for y in range(2):
+            faces.append(((x, y, 0.0), (x + 1, y, 0.0), (x + 1, y + 1, 0.0), (x, y + 1, 0.0)))
+    faces.append(((0.0, 3.0, 0.0), (2.0, 3.0, 0.0), (2.0, 3.5, 0.5), (0.0, 3.5, 0.5)))
+
+    faces.append(((0.0, 0.0, 1.0), (1.0, 0.0, 1.0), (0.0, 1.0, 1.0)))
+    faces.append(((0.0, 0.0, 2.0), (1.1, 0.0, 2.0), (0.0, 0.9, 2.0)))
+    faces.append(((0.0, 0.0, 3.0), (1.0, 0.0, 3.0), (0.5, 0.866, 3.0)))
+    faces.append(((0.0, 0.0, 4.0), (3.0, 0.0, 4.0), (1.5, 0.2, 4.0)))
+    faces.append(((0.0, 0.0, 5.0), (0.0, 2.0, 5.5), (0.3, 0.5, 5.0)))
+
+    for num_corners, radius in ((5, 1.0), (6, 0.7), (8, 1.5)):
+        faces.append(tuple(
+            (radius * cos(2.0 * pi * i / num_corners), 5.0 + radius * sin(2.0 * pi * i / num_corners) * 0.6,
+             radius * sin(2.0 * pi * i / num_corners) * 0.8)
+            for i in range(num_corners)
+        ))
+    return faces
+
+
+def polygons_overlap(a, b, eps=1e-6):
+    """Return true when the interiors of two convex polygons overlap (separating axis theorem)."""
+    for polygon in (a, b):
+        edges = np.roll(polygon, -1, axis=0) - polygon
+        for axis in np.stack((-edges[:, 1], edges[:, 0]), axis=1):
+            length = np.hypot(*axis)
+            if length == 0.0:
+                continue
+            a_proj = a @ (axis / length)
+            b_proj = b @ (axis / length)
+            if min(a_proj.max(), b_proj.max()) - max(a_proj.min(), b_proj.min()) <= eps:
+                return False
+    return True
+
+
+class LightmapPackTest(unittest.TestCase):
+    def make_mesh(self):
+        faces = mesh_faces()
+        mesh = bpy.data.meshes.new("lightmap")
+        self.addCleanup(bpy.data.meshes.remove, mesh)
+        vertices = [co for face in faces for co in face]
+        face_offsets = np.cumsum([0] + [len(face) for face in faces])
+        mesh.from_pydata(vertices, [], [range(start, end) for start, end in zip(face_offsets[:-1], face_offsets[1:])])
+        return mesh
+
+    def face_uvs(self, mesh):
+        uv = np.empty((len(mesh.loops), 2), dtype=np.float32)
+        mesh.uv_layers.active.data.foreach_get("uv", uv.ravel())
+        return [uv[face.loop_start:face.loop_start + face.loop_total].astype(np.float64) for face in mesh.polygons]
+
+    def assertPacked(self, face_uvs, efficiencies, num_groups):
+        self.assertEqual(len(efficiencies), num_groups)
+        for efficiency in efficiencies:
+            self.assertGreater(efficiency, 0.0)
+            self.assertLessEqual(efficiency, 1.0)
+
+        for uv in face_uvs:
+            self.assertTrue(((uv >= 0.0) & (uv <= 1.0)).all(), uv)
+
+        # Pairs of triangles share a box, compare the faces rather than their bounds.
+        for i, uv_a in enumerate(face_uvs):
+            for j, uv_b in enumerate(face_uvs[i + 1:], i + 1):
+                self.assertFalse(polygons_overlap(uv_a, uv_b), "faces %d and %d overlap" % (i, j))
+
+    def check_pack(self, preset):
+        mesh = self.make_mesh()
+        efficiencies = uvcalc_lightmap.lightmap_uvpack([mesh], PREF_SEL_ONLY=False, PREF_PACK_PRESET=preset)
+        self.assertPacked(self.face_uvs(mesh), efficiencies, 1)
+
+    def test_quality(self):
+        self.check_pack('QUALITY')
+
+    def test_speed(self):
+        self.check_pack('SPEED')
+
+    def test_pack_in_one(self):
+        meshes = [self.make_mesh(), self.make_mesh()]
+        for preset in ('QUALITY', 'SPEED'):
+            with self.subTest(preset=preset):
+                efficiencies = uvcalc_lightmap.lightmap_uvpack(
+                    meshes, PREF_SEL_ONLY=False, PREF_PACK_IN_ONE=True, PREF_PACK_PRESET=preset)
+                self.assertPacked(self.face_uvs(meshes[0]) + self.face_uvs(meshes[1]), efficiencies, 1)
+
+
+def main():
+    import sys
+    sys.argv = [__file__] + (sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else [])
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+# SPDX-FileCopyrightText: 2026 Blender Authors
+#
+# SPDX-License-Identifier: Apache-2.0
+
+# ./blender.bin --background --python tests/python/bl_pyapi_bpy_extras_mesh_utils.py -- --verbose
+
+__all__ = (
+    "main",
+)
+
+import random
+import unittest
+
+import bpy
+from bpy_extras import mesh_utils
+
+
+def mesh_linked_triangles_reference(mesh):
+    """
+    The previous implementation of :func:`mesh_linked_triangles`, merging groups of triangles iteratively.
+    """
+    vert_tris = [[] for i in range(len(mesh.vertices))]
+    for t in mesh.loop_triangles:
+        for v in t.vertices:
+            vert_tris[v].append(t)
+
+    tri_groups = [[t] for t in mesh.loop_triangles]
+    tri_mapping = list(range(len(mesh.loop_triangles)))
+
+    ok = True
+    while ok:
+        ok = False
+
+        for t in mesh.loop_triangles:
+            mapped_index = tri_mapping[t.index]
+            mapped_group = tri_groups[mapped_index]
+
+            for v in t.vertices:
+                for nxt_t in vert_tris[v]:
+                    if nxt_t != t:
+                        nxt_mapped_index = tri_mapping[nxt_t.index]
+
+                        if mapped_index != nxt_mapped_index:
+                            ok = True
+
+                            for grp_t in tri_groups[nxt_mapped_index]:
+                                tri_mapping[grp_t.index] = mapped_index
+
+                            mapped_group.extend(tri_groups[nxt_mapped_index])
+
+                            tri_groups[nxt_mapped_index] = None
+
+    return [tg for tg in tri_groups if tg]
+
+
+def grid_pieces_faces(num_pieces, size, rng):
+    """
+    Returns the vertex count and faces of separate grids of quads, with the faces of each grid in order,
+    and the vertices of all grids shuffled, so vertex indices don't follow the order of the faces.
+    """
+    vert_order = list(range(num_pieces * (size + 1) * (size + 1)))
+    rng.shuffle(vert_order)
+    faces = []
+    for piece in range(num_pieces):
+        offset = piece * (size + 1) * (size + 1)
+        for y in range(size):
+            for x in range(size):
+                i = offset + y * (size + 1) + x
+                faces.append([vert_order[j] for j in (i, i + 1, i + size + 2, i + size + 1)])
+    return len(vert_order), faces
+
+
+class MeshLinkedTrianglesTest(unittest.TestCase):
+    def make_mesh(self, num_verts, faces):
+        mesh = bpy.data.meshes.new("linked_triangles")
+        self.addCleanup(bpy.data.meshes.remove, mesh)
+        mesh.from_pydata([(float(i), float(i % 7), 0.0) for i in range(num_verts)], [], faces)
+        mesh.calc_loop_triangles()
+        return mesh
+
+    def assertLinkedTrianglesEqual(self, mesh):
+        # Triangles are now in ascending order within each group, the groups are in the same order.
+        result = [[t.index for t in tris] for tris in mesh_utils.mesh_linked_triangles(mesh)]
+        expected = [sorted(t.index for t in tris) for tris in mesh_linked_triangles_reference(mesh)]
+        self.assertEqual(result, expected)
+
+    def test_empty(self):
+        mesh = self.make_mesh(0, [])
+        self.assertEqual(mesh_utils.mesh_linked_triangles(mesh), [])
+
+    def test_groups_ordered_by_triangle(self):
+        # The first triangle uses the last vertices.
+        mesh = self.make_mesh(7, [(4, 5, 6), (0, 1, 2, 3)])
+        self.assertEqual(
+            [[t.index for t in tris] for tris in mesh_utils.mesh_linked_triangles(mesh)],
+            [[0], [1, 2]],
+        )
+        self.assertLinkedTrianglesEqual(mesh)
+
+    def test_grid_pieces(self):
+        rng = random.Random(0)
+        for num_pieces, size in ((1, 4), (3, 1), (5, 3), (12, 2)):
+            with self.subTest(num_pieces=num_pieces, size=size):
+                self.assertLinkedTrianglesEqual(self.make_mesh(*grid_pieces_faces(num_pieces, size, rng)))
+
+
+def main():
+    import sys
+    sys.argv = [__file__] + (sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else [])
+    unittest.main()
+
+
+if __name__ == '__main__':
+    main()
@@ -5,7 +5,7 @@
 # ./blender.bin --background --python tests/python/bl_pyapi_mathutils.py -- --verbose
 import unittest
 from mathutils import Matrix, Vector, Quaternion, Euler
-from mathutils import kdtree, geometry
+from mathutils import bvhtree, kdtree, geometry
 import math
 
 # keep globals immutable
@@ -506,6 +506,180 @@ class KDTreeTesting(unittest.TestCase):
         with self.assertRaises(ValueError):
             k.find((0,) * 3, filter=lambda i: None)
 
+    @staticmethod
+    def kdtree_batch_buffer(co_list):
+        import array
+        # A buffer of shape (N, 3), like a NumPy array.
+        data = array.array('d', [axis for co in co_list for axis in co])
+        return memoryview(data).cast('B').cast('d', (len(co_list), 3))
+
+    def test_kdtree_batch_insert(self):
+        size = 10
+        k = self.kdtree_create_grid_3d(size)
+        co_list, index_list = zip(*self.kdtree_create_grid_3d_data(size))
+
+        k_batch = kdtree.KDTree(len(co_list))
+        k_batch.insert_batch(self.kdtree_batch_buffer(co_list), index_list)
+        k_batch.balance()
+        self.assertEqual(k.find_n((0.5,) * 3, 20), k_batch.find_n((0.5,) * 3, 20))
+
+        # Indices default to the position of the point.
+        k_batch = kdtree.KDTree(len(co_list))
+        k_batch.insert_batch(co_list)
+        k_batch.balance()
+        self.assertEqual(k.find_range((0.1,) * 3, 0.3), k_batch.find_range((0.1,) * 3, 0.3))
+
+    def test_kdtree_batch_find(self):
+        size = 10
+        k = self.kdtree_create_grid_3d(size)
+
+        samples = 5
+        mul = 1.5 / (samples - 1)
+        co_list = [
+            (x * mul - 0.25, y * mul - 0.25, z * mul - 0.25)
+            for x in range(samples) for y in range(samples) for z in range(samples)
+        ]
+        co_buffer = self.kdtree_batch_buffer(co_list)
+
+        index, dist = k.find_batch(co_buffer)
+        self.assertEqual(index.shape, (len(co_list),))
+        for i, co in enumerate(co_list):
+            _co_found, index_found, dist_found = k.find(co)
+            self.assertEqual(index[i], index_found)
+            self.assertAlmostEqual(dist[i], dist_found, places=6)
+
+        n = 10
+        index, dist = k.find_n_batch(co_buffer, n)
+        self.assertEqual(index.shape, (len(co_list), n))
+        for i, co in enumerate(co_list):
+            ret = k.find_n(co, n)
+            self.assertEqual([index[i, j] for j in range(n)], [index_found for _, index_found, _ in ret])
+
+        index, dist, offset = k.find_range_batch(co_buffer, 2.0 / size)
+        self.assertEqual(len(offset), len(co_list) + 1)
+        for i, co in enumerate(co_list):
+            ret = k.find_range(co, 2.0 / size)
+            self.assertEqual(index[offset[i]:offset[i + 1]].tolist(), [index_found for _, index_found, _ in ret])
+
+    def test_kdtree_batch_empty(self):
+        k = kdtree.KDTree(0)
+        k.balance()
+
+        index, dist = k.find_batch([(0,) * 3])
+        self.assertEqual(index.tolist(), [-1])
+        self.assertEqual(dist.tolist(), [math.inf])
+
+        index, dist, offset = k.find_range_batch([(0,) * 3], 1.0)
+        self.assertEqual(len(index), 0)
+        self.assertEqual(offset.tolist(), [0, 0])
+
+    def test_kdtree_batch_invalid(self):
+        k = kdtree.KDTree(2)
+        # wrong shape
+        with self.assertRaises(ValueError):
+            k.insert_batch(memoryview(bytes(16)).cast('d', (1, 2)))
+        # not enough indices
+        with self.assertRaises(ValueError):
+            k.insert_batch([(0,) * 3, (1,) * 3], [0])
+        # negative index
+        with self.assertRaises(ValueError):
+            k.insert_batch([(0,) * 3], [-1])
+        # too many items
+        with self.assertRaises(RuntimeError):
+            k.insert_batch([(0,) * 3] * 3)
+
+        k.insert_batch([(0,) * 3])
+        with self.assertRaises(RuntimeError):
+            k.find_batch([(0,) * 3])
+        k.balance()
+        # integer coordinates
+        with self.assertRaises(TypeError):
+            k.find_batch(memoryview(bytes(12)).cast('i', (1, 3)))
+
+
+class BVHTreeTesting(unittest.TestCase):
+    @staticmethod
+    def buffer_new(typecode, shape, values=None):
+        import array
+        # A buffer of the given shape, like a NumPy array.
+        data = array.array(typecode, [0] * math.prod(shape) if values is None else values)
+        return memoryview(data).cast('B').cast(typecode, shape)
+
+    @staticmethod
+    def bvhtree_create_grid(tot):
+        verts = [(x, y, 0.0) for y in range(tot + 1) for x in range(tot + 1)]
+        polys = [
+            (y * (tot + 1) + x, y * (tot + 1) + x + 1, (y + 1) * (tot + 1) + x + 1, (y + 1) * (tot + 1) + x)
+            for y in range(tot) for x in range(tot)
+        ]
+        return bvhtree.BVHTree.FromPolygons(verts, polys)
+
+    def assertBatchResultEqual(self, ret, location, normal, index, distance, i):
+        if ret[2] is None:
+            self.assertEqual(index[i], -1)
+            self.assertEqual(distance[i], math.inf)
+            self.assertTrue(math.isnan(location[i, 0]))
+        else:
+            self.assertEqual(index[i], ret[2])
+            self.assertAlmostEqual(distance[i], ret[3], places=5)
+            for axis in range(3):
+                self.assertAlmostEqual(location[i, axis], ret[0][axis], places=5)
+                self.assertAlmostEqual(normal[i, axis], ret[1][axis], places=5)
+
+    def test_bvhtree_ray_cast_batch(self):
+        tree = self.bvhtree_create_grid(4)
+        origin_list = [(x * 0.5 - 0.25, y * 0.5 - 0.25, 1.0) for y in range(10) for x in range(10)]
+        direction_list = [(0.1, -0.1, -1.0)] * len(origin_list)
+        num = len(origin_list)
+
+        location = self.buffer_new('d', (num, 3))
+        normal = self.buffer_new('f', (num, 3))
+        index = self.buffer_new('i', (num,))
+        distance = self.buffer_new('f', (num,))
+        tree.ray_cast_batch(
+            self.buffer_new('d', (num, 3), [axis for co in origin_list for axis in co]),
+            self.buffer_new('d', (num, 3), [axis for co in direction_list for axis in co]),
+            location, normal, index, distance,
+        )
+        for i in range(num):
+            ret = tree.ray_cast(origin_list[i], direction_list[i])
+            self.assertBatchResultEqual(ret, location, normal, index, distance, i)
+
+    def test_bvhtree_find_nearest_batch(self):
+        tree = self.bvhtree_create_grid(4)
+        origin_list = [(x * 0.5 - 0.25, y * 0.5 - 0.25, 0.5) for y in range(10) for x in range(10)]
+        num = len(origin_list)
+
+        location = self.buffer_new('f', (num, 3))
+        normal = self.buffer_new('f', (num, 3))
+        index = self.buffer_new('q', (num,))
+        distance = self.buffer_new('d', (num,))
+        tree.find_nearest_batch(
+            self.buffer_new('f', (num, 3), [axis for co in origin_list for axis in co]),
+            location, normal, index, distance,
+            max_distance=0.6,
+        )
+        for i in range(num):
+            ret = tree.find_nearest(origin_list[i], 0.6)
+            self.assertBatchResultEqual(ret, location, normal, index, distance, i)
+
+    def test_bvhtree_batch_invalid(self):
+        tree = self.bvhtree_create_grid(1)
+        origin = self.buffer_new('d', (2, 3))
+        # length mismatch
+        with self.assertRaises(ValueError):
+            tree.ray_cast_batch(origin, self.buffer_new('d', (1, 3)), None, None, None, None)
+        # wrong type
+        with self.assertRaises(TypeError):
+            tree.find_nearest_batch(origin, None, None, self.buffer_new('d', (2,)), None)
+        # integers too small or unsigned, which can't hold all indices
+        for typecode in ('b', 'h', 'I', 'Q'):
+            with self.assertRaises(TypeError):
+                tree.find_nearest_batch(origin, None, None, self.buffer_new(typecode, (2,)), None)
+        # read-only output
+        with self.assertRaises(BufferError):
+            tree.find_nearest_batch(origin, None, None, None, bytes(16))
+
 
 class TesselatePolygon(unittest.TestCase):
     def test_empty(self):
@@ -317,6 +317,100 @@ class TestPropArrayDynamicArg(unittest.TestCase):
         self.assertEqual(tuple([1.0] * self.dims), tuple([vg.weight(i) for i in range(self.dims)]))
 
 
+class TestPropCollectionForeach(unittest.TestCase):
+    """
+    Collection ``foreach_get`` & ``foreach_set``, with several attributes and buffers of other types.
+    """
+
+    num = 8
+
+    def setUp(self):
+        self.me = bpy.data.meshes.new("")
+        self.me.vertices.add(self.num)
+        self.co = np.arange(self.num * 3, dtype=np.float32) * 0.5
+        self.me.vertices.foreach_set("co", self.co)
+
+    def tearDown(self):
+        bpy.data.meshes.remove(self.me)
+        self.me = None
+
+    def test_foreach_get_cast(self):
+        vertices = self.me.vertices
+        for dtype in (np.float64, np.int16, np.int32, np.int64, np.uint64):
+            co = np.zeros(self.num * 3, dtype=dtype)
+            vertices.foreach_get("co", co)
+            np.testing.assert_array_equal(co, self.co.astype(dtype))
+
+        index = np.zeros(self.num, dtype=np.float64)
+        vertices.foreach_get("index", index)
+        np.testing.assert_array_equal(index, np.arange(self.num))
+
+    def test_foreach_unsigned(self):
+        # Values of unsigned 32 bit buffers don't fit signed integers, they must not wrap around.
+        vertices = self.me.vertices
+        co = np.arange(self.num * 3, dtype=np.uint32) + np.uint32(2 ** 31 - 8)
+        vertices.foreach_set("co", co)
+        co_result = np.zeros(self.num * 3, dtype=np.float64)
+        vertices.foreach_get("co", co_result)
+        np.testing.assert_array_equal(co_result, co.astype(np.float32))
+
+        value = self.me.attributes.new("value", 'INT', 'POINT').data
+        value_set = np.arange(self.num, dtype=np.uint32) + np.uint32(2 ** 31 - self.num)
+        value.foreach_set("value", value_set)
+        value_result = np.zeros(self.num, dtype=np.uint32)
+        value.foreach_get("value", value_result)
+        np.testing.assert_array_equal(value_result, value_set)
+
+        with self.assertRaises(TypeError):
+            value.foreach_set("value", value_set + np.uint32(1))
+
+    def test_foreach_get_multi(self):
+        co = np.zeros(self.num * 3, dtype=np.float64)
+        index = np.zeros(self.num, dtype=np.int64)
+        index_list = [0] * self.num
+        self.me.vertices.foreach_get(("co", "index", "index"), (co, index, index_list))
+        np.testing.assert_array_equal(co, self.co)
+        np.testing.assert_array_equal(index, np.arange(self.num))
+        self.assertEqual(index_list, list(range(self.num)))
+
+    def test_foreach_set_multi(self):
+        vertices = self.me.vertices
+        co = np.arange(self.num * 3, dtype=np.float64) + 1.0
+        hide = [bool(i % 2) for i in range(self.num)]
+        vertices.foreach_set(("co", "hide"), (co, hide))
+
+        co_result = np.zeros(self.num * 3, dtype=np.float32)
+        hide_result = np.zeros(self.num, dtype=bool)
+        vertices.foreach_get(("co", "hide"), (co_result, hide_result))
+        np.testing.assert_array_equal(co_result, co)
+        self.assertEqual(hide_result.tolist(), hide)
+
+    def test_foreach_multi_invalid(self):
+        vertices = self.me.vertices
+        co = np.zeros(self.num * 3, dtype=np.float32)
+        index = np.zeros(self.num, dtype=np.int32)
+        with self.assertRaises(TypeError):
+            vertices.foreach_get(("co", "index"), (co,))
+        with self.assertRaises(TypeError):
+            vertices.foreach_get(("co", "index"), [co, index])
+        with self.assertRaises(TypeError):
+            vertices.foreach_get(("co", 1), (co, index))
+        with self.assertRaises(AttributeError):
+            vertices.foreach_get(("co", "missing"), (co, index))
+        with self.assertRaises(RuntimeError):
+            vertices.foreach_get(("co", "index"), (co, index[:-1]))
+
+        # None of the attributes are set when one of them is invalid.
+        hide = np.ones(self.num, dtype=bool)
+        with self.assertRaises(RuntimeError):
+            vertices.foreach_set(("co", "hide"), (co, hide[:-1]))
+        with self.assertRaises(RuntimeError):
+            vertices.foreach_set(("hide", "co"), (hide, co[:-1]))
+        vertices.foreach_get(("co", "hide"), (co, hide))
+        np.testing.assert_array_equal(co, self.co)
+        self.assertFalse(hide.any())
+
+
 if __name__ == '__main__':
     import sys
     sys.argv = [__file__] + (sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else [])
@@ -0,0 +1,219 @@
+# SPDX-FileCopyrightText: 2026 Blender Authors
+#
+# SPDX-License-Identifier: Apache-2.0
+
+# python tests/python/image_diff_test.py -- --verbose
+
+import base64
+import os
+import pathlib
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+
+sys.path.append(str(pathlib.Path(__file__).parent.absolute()))
+
+from modules import image_diff
+
+# Images of 7x5 pixels, encoded with an independent PNG encoder and checked with an independent decoder.
+# Filtered images use the filter types listed, in turn for each row.
+WIDTH = 7
+HEIGHT = 5
+
+# 8-bit RGB, filters 0, 1, 2, 3, 4.
+PNG_RGB_8_FILTERS = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAcAAAAFCAIAAAAG+GGPAAAAX0lEQVR42mNgMM1Sjer3qt+Sv+TmlJP/dr5TvifswRg94agOBmCK"
+    "jo5OSkrKzMwsKCgoLy+vq6trbW1l3nYx+5yfX1BQUGhoaGTkzZg7MQ8SEliAah2hoMCx3LEOzAIA/5MozDyXOAsAAAAASUVORK5C"
+    "YII="
+)
+# 8-bit RGB, filter 4.
+PNG_RGB_8_PAETH = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAcAAAAFCAIAAAAG+GGPAAAAPElEQVR42mNhMM1SxQAs0dHROiigTqdVByRqDAKZxgXG5cZQABK1"
+    "SrLKtIKDOqtWK5CoIxQUOJY71oFZAPKRGdB+8SpUAAAAAElFTkSuQmCC"
+)
+# 8-bit RGB, filters 0, 1, 2.
+PNG_RGB_8_SUB_UP = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAcAAAAFCAIAAAAG+GGPAAAAWklEQVR42mNgMM1Sjer3qt+Sv+TmlJP/dr5TvifswRg94agOBmCK"
+    "jo5OSkrKzMwsKCgoLy+vq6trbW1lEHSr9m7Y2rrr/f4vmj/1ko0z5uYuus6Ys/CaIwYAACFqKersKNBiAAAAAElFTkSuQmCC"
+)
+# 8-bit grayscale, filters 3, 1, 4, 2.
+PNG_Y_8 = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAcAAAAFCAAAAACs8akEAAAALElEQVR42mNmULXwis1vYozWAQOWaGNj43JjY6bopMyC8rpW5pSg"
+    "0Mg7CckAwN4LSrVqsx0AAAAASUVORK5CYII="
+)
+# 8-bit grayscale and alpha, filters 4, 3, 2.
+PNG_YA_8 = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAcAAAAFCAQAAAAjkz5TAAAARUlEQVR42mNhMFVFAszRZe7u3t5+fkGXrl69GckUHZ2UlJlZUFBe"
+    "XlfX2soSHW2VlGkFBa3MKXVBQaGhkTfvxCQkJCcDAEJUGONeIciLAAAAAElFTkSuQmCC"
+)
+# 16-bit RGBA, filters 1, 4, 3, 0, 2.
+PNG_RGBA_16_FILTERS = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAcAAAAFEAYAAADZCiqbAAAAm0lEQVR42mNkYLBaWuq1/j3/XwGSIIuyJgiqaApqCf4jHmr9Yza1"
+    "C5qQn9xrKi0KgTJgOEdURgwCZWFQXFZ8LhDLAeE8IGbIrF6icO+oZFZN9XaFj0d1svqrTymwHLXPWlR9V0H8aFDW1uoPClpHU7NO"
+    "VDMr2B6tyLpdLaYQcLQ7iwniVKBjtSBQVRsC1XQgUF0XAjX0IFBTHwIBDGZiVzFYNxUAAAAASUVORK5CYII="
+)
+# 16-bit RGB, filter 2.
+PNG_RGB_16_UP = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAcAAAAFEAIAAABWaL3MAAAAfklEQVR42mNiYLBaWurF/9drUau7/K+o+VNd9L9nzVnqaP+lauZW"
+    "O/+PXdOOWse/mzX5qgWTsiYIqmqpAKGatioQquuoAaGGrjoQauppAKGWviYQQpWqgJWqgpWqgZWqg5VqgJVqwpSqgJWqgpWqgZWq"
+    "g5VqgJVqgpVqkWYqAFg2L3+GN3OEAAAAAElFTkSuQmCC"
+)
+# 8-bit palette.
+PNG_PALETTE = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAcAAAAFCAMAAAC+RAbqAAAADFBMVEUAAAD/AAAA/wAAAP+bwBPcAAAAGklEQVR4nGNgYGRiBmIo"
+    "xcwApRggFCMDVAIABDAANPyWv1QAAAAASUVORK5CYII="
+)
+# 8-bit RGB, Adam7 interlaced.
+PNG_INTERLACED = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAcAAAAFCAIAAAFx/1EZAAAAf0lEQVR4nAF0AIv/AAA1agCUyf4AbKHWcKXaAEp/tN4TSADuI1jy"
+    "J1wAtusgHFGGgrfs6B1SACVaj2+k2bnuIwDpHlNPhLm16h8AreIXL2SZseYbAFuQxYe88bPoHd8USQtAdTdsoWOYzQARRntLgLWF"
+    "uu+/9Cn5LmMzaJ1totfmPDYlY/RkfgAAAABJRU5ErkJggg=="
+)
+
+
+def expected_samples(num_channels, bit_depth):
+    """The samples of the test images, of shape (height, width, channels)."""
+    y, x, c = np.meshgrid(np.arange(HEIGHT), np.arange(WIDTH), np.arange(num_channels), indexing='ij')
+    if bit_depth == 8:
+        return (x * 37 + y * 91 + c * 53 + x * y * 7) % 256
+    return (x * 4093 + y * 9001 + c * 15013 + x * y * 257) % 65536
+
+
+def expected_pixels(num_channels, bit_depth, alpha_index=None):
+    """The pixels of the test images, with associated alpha computed on integer samples like OpenImageIO."""
+    samples = expected_samples(num_channels, bit_depth)
+    max_value = (1 << bit_depth) - 1
+    if alpha_index is not None:
+        alpha = samples[:, :, alpha_index:alpha_index + 1]
+        colors = [i for i in range(num_channels) if i != alpha_index]
+        samples[:, :, colors] = samples[:, :, colors] * alpha // max_value
+    return samples.astype(np.float32) / np.float32(max_value)
+
+
+class ImageDiffLoadTest(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tempdir.cleanup)
+
+    def load(self, data):
+        filepath = os.path.join(self.tempdir.name, "image.png")
+        with open(filepath, "wb") as fh:
+            fh.write(data)
+        return image_diff.load_image(filepath)
+
+    def assertImageEqual(self, image, channel_names, bit_depth, pixels):
+        self.assertIsNotNone(image)
+        self.assertEqual(image.channel_names, channel_names)
+        self.assertEqual(image.bit_depth, bit_depth)
+        self.assertEqual(image.pixels.dtype, np.float32)
+        # Well within the difference between 16-bit samples.
+        np.testing.assert_allclose(image.pixels, pixels, rtol=0.0, atol=1e-6)
+
+    def test_8bit(self):
+        for name, data in (
+                ("filters", PNG_RGB_8_FILTERS),
+                ("paeth", PNG_RGB_8_PAETH),
+                ("sub_up", PNG_RGB_8_SUB_UP),
+        ):
+            with self.subTest(name=name):
+                self.assertImageEqual(self.load(data), ("R", "G", "B"), 8, expected_pixels(3, 8))
+        self.assertImageEqual(self.load(PNG_Y_8), ("Y",), 8, expected_pixels(1, 8))
+
+    def test_16bit(self):
+        self.assertImageEqual(self.load(PNG_RGB_16_UP), ("R", "G", "B"), 16, expected_pixels(3, 16))
+
+    def test_alpha(self):
+        self.assertImageEqual(self.load(PNG_YA_8), ("Y", "A"), 8, expected_pixels(2, 8, alpha_index=1))
+        self.assertImageEqual(
+            self.load(PNG_RGBA_16_FILTERS), ("R", "G", "B", "A"), 16, expected_pixels(4, 16, alpha_index=3))
+
+    def test_unsupported(self):
+        # Left to oiiotool.
+        self.assertIsNone(self.load(PNG_PALETTE))
+        self.assertIsNone(self.load(PNG_INTERLACED))
+        self.assertIsNone(self.load(b"P6\n7 5\n255\n" + bytes(WIDTH * HEIGHT * 3)))
+        # Truncated image data.
+        self.assertIsNone(self.load(PNG_RGB_8_FILTERS[:-40]))
+        self.assertIsNone(image_diff.load_image(os.path.join(self.tempdir.name, "missing.png")))
+
+
+class ImageDiffCompareTest(unittest.TestCase):
+    def make_image(self, pixels, channel_names=("R", "G", "B", "A")):
+        return image_diff.Image(pixels.astype(np.float32), channel_names, 8)
+
+    def test_can_compare(self):
+        image = self.make_image(np.zeros((4, 5, 4)))
+        self.assertTrue(image_diff.can_compare(image, self.make_image(np.ones((4, 5, 4)))))
+        self.assertFalse(image_diff.can_compare(image, None))
+        self.assertFalse(image_diff.can_compare(image, self.make_image(np.zeros((5, 4, 4)))))
+        self.assertFalse(image_diff.can_compare(image, self.make_image(np.zeros((4, 5, 4)), ("R", "G", "B", "Y"))))
+
+    def test_fail_percent(self):
+        # 200 pixels, with a fail percent of 2.5, the comparison fails with more than 5 pixels over the threshold.
+        image_a = self.make_image(np.full((10, 20, 4), 0.5))
+        for num_failed in range(0, 8):
+            pixels = np.full((10, 20, 4), 0.5)
+            # Only one channel of the pixel needs to differ.
+            pixels.reshape(-1, 4)[:num_failed, num_failed % 4] += 0.25
+            # Differences up to the threshold are not failures.
+            pixels.reshape(-1, 4)[num_failed:, 1] += 0.125
+            image_b = self.make_image(pixels)
+            with self.subTest(num_failed=num_failed):
+                self.assertEqual(image_diff.compare(image_a, image_b, 0.125, 2.5), num_failed > 5)
+                self.assertEqual(image_diff.compare(image_b, image_a, 0.125, 2.5), num_failed > 5)
+
+    def test_fail_percent_zero(self):
+        image_a = self.make_image(np.zeros((10, 20, 4)))
+        pixels = np.zeros((10, 20, 4))
+        self.assertFalse(image_diff.compare(image_a, self.make_image(pixels), 0.0, 0.0))
+        pixels[3, 4, 2] = 0.01
+        self.assertTrue(image_diff.compare(image_a, self.make_image(pixels), 0.0, 0.0))
+        self.assertFalse(image_diff.compare(image_a, self.make_image(pixels), 0.01, 0.0))
+
+
+class ImageDiffWriteTest(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tempdir.cleanup)
+
+    def test_write_diff_images(self):
+        for bit_depth in (8, 16):
+            max_value = (1 << bit_depth) - 1
+            pixels_a = np.zeros((HEIGHT, WIDTH, 4), dtype=np.float32)
+            pixels_b = np.zeros((HEIGHT, WIDTH, 4), dtype=np.float32)
+            pixels_b[:, :, 0] = expected_samples(1, 8)[:, :, 0] / np.float32(255.0 * 16.0)
+            pixels_b[:, :, 3] = 0.5
+            image_a = image_diff.Image(pixels_a, ("R", "G", "B", "A"), bit_depth)
+            image_b = image_diff.Image(pixels_b, ("R", "G", "B", "A"), 8)
+
+            color_filepath = os.path.join(self.tempdir.name, "color.png")
+            alpha_filepath = os.path.join(self.tempdir.name, "alpha.png")
+            with self.subTest(bit_depth=bit_depth):
+                image_diff.write_diff_images(image_a, image_b, color_filepath, alpha_filepath)
+
+                # Differences are scaled and clamped, in the bit depth of the first image.
+                image = image_diff.load_image(color_filepath)
+                self.assertEqual(image.channel_names, ("R", "G", "B"))
+                self.assertEqual(image.bit_depth, bit_depth)
+                expected = np.zeros((HEIGHT, WIDTH, 3), dtype=np.float32)
+                expected[:, :, 0] = pixels_b[:, :, 0] * np.float32(16.0)
+                np.testing.assert_allclose(image.pixels, expected, atol=0.5 / max_value)
+
+                image = image_diff.load_image(alpha_filepath)
+                self.assertEqual(image.channel_names, ("Y",))
+                np.testing.assert_array_equal(image.pixels, np.ones((HEIGHT, WIDTH, 1), dtype=np.float32))
+
+    def test_write_diff_images_without_alpha(self):
+        image = image_diff.Image(np.zeros((HEIGHT, WIDTH, 3), dtype=np.float32), ("R", "G", "B"), 8)
+        color_filepath = os.path.join(self.tempdir.name, "color.png")
+        alpha_filepath = os.path.join(self.tempdir.name, "alpha.png")
+        image_diff.write_diff_images(image, image, color_filepath, alpha_filepath)
+        self.assertTrue(os.path.exists(color_filepath))
+        self.assertFalse(os.path.exists(alpha_filepath))
+
+
+if __name__ == '__main__':
+    sys.argv = [__file__] + (sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else [])
+    unittest.main()
@@ -0,0 +1,163 @@
+# SPDX-FileCopyrightText: 2026 Blender Authors
+#
+# SPDX-License-Identifier: Apache-2.0
+
+# ./blender.bin --background --factory-startup --python tests/python/io_bvh_import_test.py -- --verbose
+import os
+import tempfile
+import unittest
+from math import radians
+
+import bpy
+from mathutils import Euler, Matrix, Vector
+
+from io_anim_bvh import import_bvh
+
+# Joints with different rotation orders, the channels of the root are not in the usual order.
+BVH_HIERARCHY = """\
+HIERARCHY
+ROOT Hips
+{
+    OFFSET 1.0 2.0 3.0
+    CHANNELS 6 Zrotation Xposition Yposition Zposition Xrotation Yrotation
+    JOINT Spine
+    {
+        OFFSET 0.0 2.0 0.5
+        CHANNELS 3 Xrotation Yrotation Zrotation
+        JOINT Arm
+        {
+            OFFSET 1.5 1.0 0.0
+            CHANNELS 3 Yrotation Zrotation Xrotation
+            End Site
+            {
+                OFFSET 2.0 0.0 -0.5
+            }
+        }
+    }
+    JOINT Leg
+    {
+        OFFSET -0.5 -1.0 0.0
+        CHANNELS 4 Yposition Zrotation Yrotation Xrotation
+        End Site
+        {
+            OFFSET 0.0 -2.0 0.0
+        }
+    }
+}
+MOTION
+"""
+
+NUM_CHANNELS = 6 + 3 + 3 + 4
+NUM_FRAMES = 24
+
+
+def motion_lines():
+    lines = []
+    for frame in range(NUM_FRAMES):
+        values = [((channel * 37 + frame * 11) % 340 - 170) * 0.5 for channel in range(NUM_CHANNELS)]
+        lines.append(" ".join("%.4f" % value for value in values))
+    # Values beyond the channels are ignored.
+    lines[5] += " 12.5"
+    return lines
+
+
+def write_bvh(filepath):
+    lines = motion_lines()
+    with open(filepath, 'w') as fh:
+        fh.write(BVH_HIERARCHY)
+        fh.write("Frames: %d\n" % len(lines))
+        fh.write("Frame Time: 0.0333333\n")
+        fh.write("\n".join(lines))
+        fh.write("\n")
+
+
+def expected_keyframe_values(filepath, arm_ob, rotate_mode):
+    """
+    Return the keyframe values of each F-Curve as a dictionary ``{(data_path, index): values}``,
+    converting the motion one frame at a time, as the importer did before processing whole arrays.
+    """
+    bvh_nodes, _frame_time, _frame_count = import_bvh.read_bvh(bpy.context, filepath)
+    frame_lines = [line.split() for line in motion_lines()]
+
+    expected = {}
+    for bvh_node in bvh_nodes.values():
+        pose_bone = arm_ob.pose.bones[bvh_node.name]
+        bone_rest_matrix = arm_ob.data.bones[bvh_node.name].matrix_local.to_3x3()
+        bone_rest_matrix_inv = bone_rest_matrix.inverted()
+        bone_rest_matrix_inv.resize_4x4()
+        bone_rest_matrix.resize_4x4()
+        channels = bvh_node.channels
+
+        location = []
+        rotate = []
+        prev_euler = Euler((0.0, 0.0, 0.0))
+        for line in frame_lines:
+            bvh_loc = [float(line[channel]) if channel != -1 else 0.0 for channel in channels[:3]]
+            bvh_rot = [radians(float(line[channel])) for channel in channels[3:]]
+
+            bone_translate_matrix = Matrix.Translation(Vector(bvh_loc) - bvh_node.rest_head_local)
+            location.append((bone_rest_matrix_inv @ bone_translate_matrix).to_translation())
+
+            euler = Euler(bvh_rot, bvh_node.rot_order_str[::-1])
+            bone_rotation_matrix = bone_rest_matrix_inv @ euler.to_matrix().to_4x4() @ bone_rest_matrix
+            if rotate_mode == 'QUATERNION':
+                rotate.append(bone_rotation_matrix.to_quaternion())
+            else:
+                prev_euler = bone_rotation_matrix.to_euler(pose_bone.rotation_mode, prev_euler)
+                rotate.append(prev_euler)
+
+        if bvh_node.has_loc:
+            data_path = 'pose.bones["%s"].location' % bvh_node.name
+            for axis_i in range(3):
+                expected[data_path, axis_i] = [value[axis_i] for value in location]
+
+        data_path = 'pose.bones["%s"].%s' % (
+            bvh_node.name,
+            "rotation_quaternion" if rotate_mode == 'QUATERNION' else "rotation_euler",
+        )
+        for axis_i in range(len(rotate[0])):
+            expected[data_path, axis_i] = [value[axis_i] for value in rotate]
+
+    return expected
+
+
+class BVHImportTest(unittest.TestCase):
+    def setUp(self):
+        bpy.ops.wm.read_homefile(use_factory_startup=True)
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tempdir.cleanup)
+        self.filepath = os.path.join(self.tempdir.name, "motion.bvh")
+        write_bvh(self.filepath)
+
+    def check_import(self, rotate_mode):
+        import_bvh.load(bpy.context, self.filepath, rotate_mode=rotate_mode, global_matrix=Matrix())
+        arm_ob = bpy.context.view_layer.objects.active
+        action = arm_ob.animation_data.action
+
+        expected = expected_keyframe_values(self.filepath, arm_ob, rotate_mode)
+        fcurves = {(fcurve.data_path, fcurve.array_index): fcurve for fcurve in action.fcurves}
+        self.assertEqual(set(fcurves.keys()), set(expected.keys()))
+
+        for key, values in expected.items():
+            keyframe_points = fcurves[key].keyframe_points
+            self.assertEqual(len(keyframe_points), NUM_FRAMES)
+            for frame_i, (keyframe, value) in enumerate(zip(keyframe_points, values)):
+                self.assertEqual(keyframe.co[0], 1.0 + frame_i)
+                self.assertAlmostEqual(keyframe.co[1], value, places=4, msg="%r, frame %d" % (key, frame_i))
+                self.assertEqual(keyframe.interpolation, 'LINEAR')
+
+    def test_import_native(self):
+        self.check_import('NATIVE')
+
+    def test_import_quaternion(self):
+        self.check_import('QUATERNION')
+
+    def test_import_xyz(self):
+        self.check_import('XYZ')
+
+
+if __name__ == '__main__':
+    import sys
+
+    sys.argv = [__file__] + (sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else [])
+    unittest.main()
@@ -0,0 +1,187 @@
+# SPDX-FileCopyrightText: 2026 Blender Authors
+#
+# SPDX-License-Identifier: Apache-2.0
+
+# ./blender.bin --background --factory-startup --python tests/python/io_fbx_binary_test.py -- --verbose
+import os
+import tempfile
+import unittest
+import unittest.mock
+
+import numpy as np
+
+from io_scene_fbx import encode_bin, fbx_utils_threading, parse_fbx
+from io_scene_fbx.fbx_utils_threading import (
+    BACKEND_AUTO,
+    BACKEND_INLINE,
+    BACKEND_PROCESS,
+    BACKEND_THREAD,
+)
+
+FBX_VERSION = 7400
+
+ALL_BACKENDS = (BACKEND_INLINE, BACKEND_THREAD, BACKEND_PROCESS, BACKEND_AUTO)
+
+
+def build_elem_root():
+    """Build an element tree with many small arrays, like animation curves, followed by a few large arrays, enough for
+    BACKEND_AUTO to pick a backend."""
+    rng = np.random.default_rng(0)
+
+    root = encode_bin.FBXElem(b'')
+
+    elem = encode_bin.FBXElem(b'FileId')
+    elem.add_bytes(b'')
+    root.elems.append(elem)
+    elem = encode_bin.FBXElem(b'CreationTime')
+    elem.add_string(b'')
+    root.elems.append(elem)
+
+    objects = encode_bin.FBXElem(b'Objects')
+    root.elems.append(objects)
+    for i in range(300):
+        curve = encode_bin.FBXElem(b'AnimationCurve')
+        curve.add_int64(i)
+        num_keys = int(rng.integers(20, 2000))
+        sub_elem = encode_bin.FBXElem(b'KeyTime')
+        sub_elem.add_int64_array(np.cumsum(rng.integers(1, 1000, num_keys)))
+        curve.elems.append(sub_elem)
+        sub_elem = encode_bin.FBXElem(b'KeyValueFloat')
+        sub_elem.add_float32_array(rng.random(num_keys, dtype=np.float32))
+        curve.elems.append(sub_elem)
+        objects.elems.append(curve)
+
+    geom = encode_bin.FBXElem(b'Geometry')
+    geom.add_int64(1000)
+    sub_elem = encode_bin.FBXElem(b'Vertices')
+    sub_elem.add_float64_array(rng.random(300_000))
+    geom.elems.append(sub_elem)
+    sub_elem = encode_bin.FBXElem(b'PolygonVertexIndex')
+    sub_elem.add_int32_array(rng.integers(0, 100_000, 400_000, dtype=np.int32))
+    geom.elems.append(sub_elem)
+    objects.elems.append(geom)
+
+    elem = encode_bin.FBXElem(b'Connections')
+    elem.add_int32(0)
+    root.elems.append(elem)
+    return root
+
+
+def build_header_elems():
+    elem_file_id = encode_bin.FBXElem(b'FileId')
+    elem_file_id.add_bytes(b'')
+    elem_creation_time = encode_bin.FBXElem(b'CreationTime')
+    elem_creation_time.add_string(b'')
+    return [elem_file_id, elem_creation_time]
+
+
+def build_geometry_elem(i):
+    geom = encode_bin.FBXElem(b'Geometry')
+    geom.add_int64(i)
+    sub_elem = encode_bin.FBXElem(b'Vertices')
+    sub_elem.add_float64_array(np.random.default_rng(i).random(100_000))
+    geom.elems.append(sub_elem)
+    return geom
+
+
+def build_connections_elem():
+    elem = encode_bin.FBXElem(b'Connections')
+    elem.add_int32(0)
+    return elem
+
+
+def elems_as_tuples(elems):
+    return [(elem.id, elem.props, bytes(elem.props_type), elems_as_tuples(elem.elems)) for elem in elems]
+
+
+class FBXArrayBackendTest(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tempdir.cleanup)
+        # Backends other than BACKEND_INLINE fall back to it on single CPU systems.
+        patcher = unittest.mock.patch.object(fbx_utils_threading, "get_cpu_count", return_value=4)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def write(self, name, backend):
+        """Write the test file, compressing arrays with `backend`, or serially when `backend` is None."""
+        filepath = os.path.join(self.tempdir.name, name)
+        if backend is None:
+            elem_root = build_elem_root()
+        else:
+            with encode_bin.FBXElem.enable_multithreading_cm(backend=backend):
+                elem_root = build_elem_root()
+        encode_bin.write(filepath, elem_root, FBX_VERSION)
+        with open(filepath, 'rb') as fh:
+            return filepath, fh.read()
+
+    def test_write(self):
+        _filepath, expected = self.write("serial.fbx", None)
+        for backend in ALL_BACKENDS:
+            with self.subTest(backend=backend):
+                _filepath, data = self.write(backend.lower() + ".fbx", backend)
+                self.assertEqual(data, expected)
+
+    def test_parse(self):
+        filepath, _data = self.write("serial.fbx", None)
+        # The inline backend is the serial path.
+        elem_root, version = parse_fbx.parse(filepath, array_backend=BACKEND_INLINE)
+        self.assertEqual(version, FBX_VERSION)
+        expected = elems_as_tuples(elem_root.elems)
+        for backend in ALL_BACKENDS:
+            with self.subTest(backend=backend):
+                elem_root, _version = parse_fbx.parse(filepath, array_backend=backend)
+                self.assertEqual(elems_as_tuples(elem_root.elems), expected)
+
+
+class FBXStreamWriterTest(unittest.TestCase):
+    NUM_GEOMETRY = 20
+    MAX_PENDING_OPS = 4
+
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tempdir.cleanup)
+        patcher = unittest.mock.patch.object(fbx_utils_threading, "get_cpu_count", return_value=4)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def write_serial(self):
+        filepath = os.path.join(self.tempdir.name, "serial.fbx")
+        elem_root = encode_bin.FBXElem(b'')
+        elem_root.elems.extend(build_header_elems())
+        objects = encode_bin.FBXElem(b'Objects')
+        objects.elems.extend(build_geometry_elem(i) for i in range(self.NUM_GEOMETRY))
+        elem_root.elems.append(objects)
+        elem_root.elems.append(build_connections_elem())
+        encode_bin.write(filepath, elem_root, FBX_VERSION)
+        with open(filepath, 'rb') as fh:
+            return fh.read()
+
+    def test_stream(self):
+        expected = self.write_serial()
+        for backend in ALL_BACKENDS:
+            with self.subTest(backend=backend):
+                filepath = os.path.join(self.tempdir.name, backend.lower() + ".fbx")
+                with encode_bin.FBXStreamWriter(filepath, FBX_VERSION, max_pending_ops=self.MAX_PENDING_OPS) as stream:
+                    with encode_bin.FBXElem.enable_multithreading_cm(backend=backend):
+                        for elem in build_header_elems():
+                            stream.write_elem(elem)
+                        stream.begin_elem(encode_bin.FBXElem(b'Objects'))
+                        objects_offset = stream._file.tell()
+                        for i in range(self.NUM_GEOMETRY):
+                            stream.write_elem(build_geometry_elem(i))
+                            # Elements waiting for their arrays to be compressed are bounded.
+                            self.assertLessEqual(len(stream._ops), self.MAX_PENDING_OPS)
+                        # Most elements have been written before the end.
+                        self.assertGreater(stream._file.tell(), objects_offset)
+                        stream.end_elem()
+                        stream.write_elem(build_connections_elem())
+                with open(filepath, 'rb') as fh:
+                    self.assertEqual(fh.read(), expected)
+
+
+if __name__ == '__main__':
+    import sys
+
+    sys.argv = [__file__] + (sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else [])
+    unittest.main()
@@ -0,0 +1,269 @@
+# SPDX-FileCopyrightText: 2026 Blender Authors
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Compare images in process, with the same verdict as ``oiiotool --fail --failpercent --diff``,
+and write amplified difference images like ``oiiotool --sub --abs --mulc 16``.
+
+Each image is decoded once with a built-in PNG decoder. Images that can't be decoded
+(other formats, interlaced or palette PNG files) are reported as ``None``, so that
+the caller can fall back to ``oiiotool``.
+"""
+
+__all__ = (
+    "Image",
+    "load_image",
+    "can_compare",
+    "compare",
+    "write_diff_images",
+)
+
+import struct
+import zlib
+
+import numpy as np
+
+# Scale of differences in the diff images.
+DIFF_SCALE = 16.0
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# Channel names of PNG color types, as named by OpenImageIO.
+_PNG_CHANNEL_NAMES = {
+    0: ("Y",),
+    2: ("R", "G", "B"),
+    4: ("Y", "A"),
+    6: ("R", "G", "B", "A"),
+}
+
+
+class Image:
+    __slots__ = (
+        # Float pixels of shape (height, width, channels), with associated alpha like OpenImageIO.
+        "pixels",
+        # Channel names, like OpenImageIO.
+        "channel_names",
+        # Bits per sample in the file, 8 or 16.
+        "bit_depth",
+    )
+
+    def __init__(self, pixels, channel_names, bit_depth):
+        self.pixels = pixels
+        self.channel_names = channel_names
+        self.bit_depth = bit_depth
+
+    def channels(self, names):
+        indices = [self.channel_names.index(name) for name in names]
+        return self.pixels[:, :, indices]
+
+
+def _png_unfilter(rows, bpp):
+    # Reconstruct the bytes of all rows from the filtered rows, starting with the filter type byte.
+    height, row_size = rows.shape
+    row_size -= 1
+    filters = rows[:, 0]
+    filtered = rows[:, 1:]
+    if filters.max(initial=0) > 4:
+        raise ValueError("Unknown PNG filter type")
+
+    result = np.empty((height, row_size), dtype=np.uint8)
+    if (filters <= 2).all():
+        # Only filters depending on the previous row or the same row, each row is reconstructed at once.
+        prev = np.zeros(row_size, dtype=np.uint8)
+        for y in range(height):
+            if filters[y] == 0:
+                result[y] = filtered[y]
+            elif filters[y] == 1:
+                result[y] = np.cumsum(filtered[y].reshape(-1, bpp), axis=0, dtype=np.uint8).reshape(-1)
+            else:
+                np.add(filtered[y], prev, out=result[y])
+            prev = result[y]
+        return result
+
+    # Average and Paeth filters depend on the left, up and upper left pixels. All pixels on a diagonal
+    # only depend on the two previous diagonals, so the image is reconstructed one diagonal at a time.
+    # In a skewed layout, pixel (y, x) is stored at [x + y, y], so that each diagonal is contiguous.
+    width = row_size // bpp
+    num_diagonals = width + height - 1
+    ys = np.arange(height)[:, np.newaxis]
+    xs = np.arange(width)[np.newaxis, :]
+    filtered_skewed = np.zeros((num_diagonals, height, bpp), dtype=np.int16)
+    filtered_skewed[xs + ys, ys] = filtered.reshape(height, width, bpp)
+    # Padded with two diagonals and a row of zeros, for pixels outside the image.
+    recon = np.zeros((num_diagonals + 2, height + 1, bpp), dtype=np.int16)
+    zeros = np.zeros((height, bpp), dtype=np.int16)
+    # Files commonly use the Paeth filter for all rows, avoid selecting the filter of each row then.
+    only_paeth = (filters == 4).all()
+    filters = filters.astype(np.intp)[:, np.newaxis]
+
+    for diagonal in range(num_diagonals):
+        y_begin = max(0, diagonal - width + 1)
+        y_end = min(height, diagonal + 1)
+        a = recon[diagonal + 1, y_begin + 1:y_end + 1]
+        b = recon[diagonal + 1, y_begin:y_end]
+        c = recon[diagonal, y_begin:y_end]
+        a_c = a - c
+        b_c = b - c
+        pa = np.abs(b_c)
+        pb = np.abs(a_c)
+        pc = np.abs(a_c + b_c)
+        predictor = np.where((pa <= pb) & (pa <= pc), a, np.where(pb <= pc, b, c))
+        if not only_paeth:
+            predictor = np.choose(filters[y_begin:y_end], (zeros[y_begin:y_end], a, b, (a + b) >> 1, predictor))
+        predictor += filtered_skewed[diagonal, y_begin:y_end]
+        np.bitwise_and(predictor, 0xff, out=recon[diagonal + 2, y_begin + 1:y_end + 1])
+
+    result[:] = recon[xs + ys + 2, ys + 1].reshape(height, row_size)
+    return result
+
+
+def _png_associate_alpha(samples, alpha_index, max_value, gamma):
+    # Same as the OpenImageIO PNG reader, which associates alpha on integer samples.
+    alpha = samples[:, :, alpha_index:alpha_index + 1]
+    colors = [i for i in range(samples.shape[2]) if i != alpha_index]
+    if gamma == 1.0:
+        samples[:, :, colors] = (samples[:, :, colors].astype(np.uint64) * alpha) // max_value
+    else:
+        alpha_associate = np.power(alpha.astype(np.float32) * np.float32(1.0 / max_value), np.float32(gamma))
+        samples[:, :, colors] = (samples[:, :, colors] * alpha_associate).astype(samples.dtype)
+
+
+def _load_png(filepath):
+    with open(filepath, "rb") as f:
+        data = f.read()
+    if not data.startswith(_PNG_SIGNATURE):
+        return None
+
+    header = None
+    idat = []
+    gamma = 1.0
+    srgb = False
+    offset = len(_PNG_SIGNATURE)
+    while offset + 8 <= len(data):
+        length, chunk_type = struct.unpack_from(">I4s", data, offset)
+        chunk = data[offset + 8:offset + 8 + length]
+        offset += 12 + length
+        if chunk_type == b"IHDR":
+            header = struct.unpack(">IIBBBBB", chunk)
+        elif chunk_type == b"IDAT":
+            idat.append(chunk)
+        elif chunk_type == b"gAMA":
+            # Rounded to the nearest hundredth like OpenImageIO.
+            gamma = round(100.0 * 100000.0 / struct.unpack(">I", chunk)[0]) / 100.0
+        elif chunk_type == b"sRGB":
+            srgb = True
+        elif chunk_type == b"tRNS":
+            # Transparency from a color key is not supported.
+            return None
+        elif chunk_type == b"IEND":
+            break
+
+    if header is None:
+        return None
+    width, height, bit_depth, color_type, _compression, _filter, interlace = header
+    if color_type not in _PNG_CHANNEL_NAMES or bit_depth not in {8, 16} or interlace != 0:
+        return None
+
+    channel_names = _PNG_CHANNEL_NAMES[color_type]
+    num_channels = len(channel_names)
+    bpp = num_channels * bit_depth // 8
+    row_size = width * bpp + 1
+
+    raw = np.frombuffer(zlib.decompress(b"".join(idat)), dtype=np.uint8)
+    if len(raw) < height * row_size:
+        return None
+    rows = _png_unfilter(raw[:height * row_size].reshape(height, row_size), bpp)
+
+    if bit_depth == 16:
+        samples = rows.view(">u2").astype(np.uint16)
+    else:
+        samples = rows
+    samples = samples.reshape(height, width, num_channels)
+
+    max_value = (1 << bit_depth) - 1
+    if "A" in channel_names:
+        # The gamma of the file is only used when there is no sRGB chunk.
+        _png_associate_alpha(samples, channel_names.index("A"), max_value, 1.0 if srgb else gamma)
+
+    pixels = samples.astype(np.float32) * np.float32(1.0 / max_value)
+    return Image(pixels, channel_names, bit_depth)
+
+
+def load_image(filepath):
+    """
+    Load an image, returning None when it can't be decoded.
+    """
+    try:
+        return _load_png(filepath)
+    except (OSError, ValueError, struct.error, zlib.error):
+        return None
+
+
+def can_compare(image_a, image_b):
+    return (
+        image_a is not None and
+        image_b is not None and
+        image_a.pixels.shape == image_b.pixels.shape and
+        image_a.channel_names == image_b.channel_names
+    )
+
+
+def compare(image_a, image_b, fail_threshold, fail_percent, verbose=False):
+    """
+    Return True when more than fail_percent of the pixels have a channel differing
+    by more than fail_threshold.
+    """
+    diff = np.abs(image_a.pixels - image_b.pixels)
+    pixel_diff = diff.max(axis=2)
+    num_pixels = pixel_diff.size
+    num_failed = int(np.count_nonzero(pixel_diff > np.float32(fail_threshold)))
+    failed = num_failed > fail_percent / 100.0 * num_pixels
+
+    if verbose and failed:
+        max_index = np.unravel_index(np.argmax(pixel_diff), pixel_diff.shape)
+        print("  Mean error = {:.6g}".format(float(diff.mean())))
+        print("  Max error  = {:.6g} @ ({}, {})".format(float(pixel_diff[max_index]), max_index[1], max_index[0]))
+        print("  {} pixels ({:.3g}%) over {}".format(num_failed, 100.0 * num_failed / num_pixels, fail_threshold))
+        print("FAILURE")
+
+    return failed
+
+
+def _write_png(filepath, pixels, bit_depth):
+    # Write float pixels of shape (height, width, channels) as RGB or grayscale, without filtering.
+    height, width, num_channels = pixels.shape
+    max_value = (1 << bit_depth) - 1
+    samples = np.rint(np.clip(pixels, 0.0, 1.0) * max_value)
+    if bit_depth == 16:
+        samples = samples.astype(">u2")
+    else:
+        samples = samples.astype(np.uint8)
+
+    rows = samples.reshape(height, -1).view(np.uint8)
+    rows = np.concatenate((np.zeros((height, 1), dtype=np.uint8), rows), axis=1)
+
+    def chunk(chunk_type, data):
+        return (
+            struct.pack(">I", len(data)) + chunk_type + data +
+            struct.pack(">I", zlib.crc32(chunk_type + data) & 0xffffffff)
+        )
+
+    color_type = 2 if num_channels == 3 else 0
+    with open(filepath, "wb") as f:
+        f.write(_PNG_SIGNATURE)
+        f.write(chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, bit_depth, color_type, 0, 0, 0)))
+        f.write(chunk(b"IDAT", zlib.compress(rows.tobytes(), 6)))
+        f.write(chunk(b"IEND", b""))
+
+
+def write_diff_images(image_a, image_b, diff_color_filepath, diff_alpha_filepath):
+    """
+    Write the amplified absolute difference of the color and alpha channels, in the bit depth of the
+    first image. Images without these channels are skipped, like ``oiiotool --ch``.
+    """
+    for filepath, names in ((diff_color_filepath, ("R", "G", "B")), (diff_alpha_filepath, ("A",))):
+        if not all(name in image_a.channel_names for name in names):
+            continue
+        diff = np.abs(image_a.channels(names) - image_b.channels(names)) * np.float32(DIFF_SCALE)
+        _write_png(filepath, diff, image_a.bit_depth)
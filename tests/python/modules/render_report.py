@@ -8,16 +8,24 @@ a HTML report showing the differences, for regression testing.
 """
 
 import glob
+import json
 import os
 import pathlib
 import shutil
 import subprocess
 import time
 import multiprocessing
+import concurrent.futures
 
 from . import global_report
 from .colored_print import (print_message, use_message_colors)
 
+try:
+    # Compare images in process when NumPy is available, otherwise use `oiiotool` for all images.
+    from . import image_diff
+except ImportError:
+    image_diff = None
+
 
 def blend_list(dirpath, blocklist):
     import re
@@ -84,47 +92,27 @@ class TestResult:
             report.output_dir, filepath, name, report.reference_dir, report.reference_override_dir)
 
 
-def diff_output(test, oiiotool, fail_threshold, fail_percent, verbose, update):
-    # Create reference render directory.
-    old_dirpath = os.path.dirname(test.old_img)
-    os.makedirs(old_dirpath, exist_ok=True)
-
-    # Copy temporary to new image.
-    if os.path.exists(test.new_img):
-        os.remove(test.new_img)
-    if os.path.exists(test.tmp_out_img):
-        shutil.copy(test.tmp_out_img, test.new_img)
-
-    if os.path.exists(test.ref_img):
-        # Diff images test with threshold.
-        command = (
-            oiiotool,
-            test.ref_img,
-            test.tmp_out_img,
-            "--fail", str(fail_threshold),
-            "--failpercent", str(fail_percent),
-            "--diff",
-        )
-        try:
-            subprocess.check_output(command)
-            failed = False
-        except subprocess.CalledProcessError as e:
-            if verbose:
-                print_message(e.output.decode("utf-8", 'ignore'))
-            failed = e.returncode != 0
-    else:
-        if not update:
-            test.error = "VERIFY"
-            return test
-
-        failed = True
-
-    if failed and update:
-        # Update reference image if requested.
-        shutil.copy(test.new_img, test.ref_img)
-        shutil.copy(test.new_img, test.old_img)
+def _oiiotool_compare(test, oiiotool, fail_threshold, fail_percent, verbose):
+    # Diff images test with threshold.
+    command = (
+        oiiotool,
+        test.ref_img,
+        test.tmp_out_img,
+        "--fail", str(fail_threshold),
+        "--failpercent", str(fail_percent),
+        "--diff",
+    )
+    try:
+        subprocess.check_output(command)
         failed = False
+    except subprocess.CalledProcessError as e:
+        if verbose:
+            print_message(e.output.decode("utf-8", 'ignore'))
+        failed = e.returncode != 0
+    return failed
+
 
+def _oiiotool_diff_images(test, oiiotool, verbose):
     # Generate color diff image.
     command = (
         oiiotool,
@@ -158,13 +146,60 @@ def diff_output(test, oiiotool, fail_threshold, fail_percent, verbose, update):
     try:
         subprocess.check_output(command, stderr=subprocess.STDOUT)
     except subprocess.CalledProcessError as e:
-        if self.verbose:
+        if verbose:
             msg = e.output.decode("utf-8", 'ignore')
             for line in msg.splitlines():
                 # Ignore warnings for images without alpha channel.
                 if "--ch: Unknown channel name" not in line:
                     print_message(line)
 
+
+def diff_output(test, oiiotool, fail_threshold, fail_percent, verbose, update):
+    # Create reference render directory.
+    old_dirpath = os.path.dirname(test.old_img)
+    os.makedirs(old_dirpath, exist_ok=True)
+
+    # Copy temporary to new image.
+    if os.path.exists(test.new_img):
+        os.remove(test.new_img)
+    if os.path.exists(test.tmp_out_img):
+        shutil.copy(test.tmp_out_img, test.new_img)
+
+    # Images decoded in process, None when oiiotool is used instead.
+    ref_image = None
+    out_image = None
+
+    if os.path.exists(test.ref_img):
+        if image_diff is not None:
+            ref_image = image_diff.load_image(test.ref_img)
+            out_image = image_diff.load_image(test.tmp_out_img) if ref_image is not None else None
+            if not image_diff.can_compare(ref_image, out_image):
+                ref_image = out_image = None
+
+        if ref_image is not None:
+            failed = image_diff.compare(ref_image, out_image, fail_threshold, fail_percent, verbose)
+        else:
+            failed = _oiiotool_compare(test, oiiotool, fail_threshold, fail_percent, verbose)
+    else:
+        if not update:
+            test.error = "VERIFY"
+            return test
+
+        failed = True
+
+    if failed and update:
+        # Update reference image if requested.
+        shutil.copy(test.new_img, test.ref_img)
+        shutil.copy(test.new_img, test.old_img)
+        failed = False
+        if ref_image is not None:
+            ref_image = out_image
+
+    if ref_image is not None:
+        image_diff.write_diff_images(ref_image, out_image, test.diff_color_img, test.diff_alpha_img)
+    else:
+        _oiiotool_diff_images(test, oiiotool, verbose)
+
     if failed:
         test.error = "VERIFY"
     else:
@@ -173,7 +208,36 @@ def diff_output(test, oiiotool, fail_threshold, fail_percent, verbose, update):
     return test
 
 
+def _duration_key(filepath, dirpath):
+    # Files in sub-directories of the tests may have the same name.
+    return pathlib.PurePath(os.path.relpath(filepath, dirpath)).as_posix()
+
+
+def _split_shards(filepaths, dirpath, durations, num_shards):
+    # Balance the files over shards by their duration in previous runs, assigning the longest
+    # files first to the shard with the least work. Files without a duration use the average.
+    keys = [_duration_key(filepath, dirpath) for filepath in filepaths]
+    known_durations = [durations[key] for key in keys if key in durations]
+    default_duration = sum(known_durations) / len(known_durations) if known_durations else 1.0
+
+    def file_duration(index):
+        return durations.get(keys[index], default_duration)
+
+    shards = [[] for _ in range(num_shards)]
+    shard_durations = [0.0] * num_shards
+    for index in sorted(range(len(filepaths)), key=file_duration, reverse=True):
+        shard_index = shard_durations.index(min(shard_durations))
+        shards[shard_index].append(index)
+        shard_durations[shard_index] += file_duration(index)
+
+    # Run files of each shard in their original order.
+    return [[filepaths[index] for index in sorted(shard)] for shard in shards if shard]
+
+
 class Report:
+    # Threads of each Blender process when the number of processes is chosen automatically.
+    DEFAULT_THREADS_PER_JOB = 4
+
     __slots__ = (
         'title',
         'engine_name',
@@ -192,6 +256,8 @@ class Report:
         'compare_tests',
         'compare_engine',
         'blocklist',
+        'jobs',
+        'threads',
     )
 
     def __init__(self, title, output_dir, oiiotool, variation=None, blocklist=[]):
@@ -219,6 +285,16 @@ class Report:
         self.verbose = os.environ.get("BLENDER_VERBOSE") is not None
         self.update = os.getenv('BLENDER_TEST_UPDATE') is not None
 
+        # Number of concurrent Blender processes, and of threads in each process (0 for all).
+        # With "auto", the number of processes is sized from the CPU count and threads per process.
+        threads = int(os.getenv('BLENDER_TEST_THREADS', "0"))
+        jobs = os.getenv('BLENDER_TEST_JOBS', "1")
+        if jobs == "auto":
+            threads = threads or self.DEFAULT_THREADS_PER_JOB
+            self.set_jobs(multiprocessing.cpu_count() // threads, threads)
+        else:
+            self.set_jobs(int(jobs), threads)
+
         if os.environ.get("BLENDER_TEST_COLOR") is not None:
             use_message_colors()
 
@@ -249,6 +325,10 @@ class Report:
     def set_engine_name(self, engine_name):
         self.engine_name = engine_name
 
+    def set_jobs(self, jobs, threads=0):
+        self.jobs = max(1, jobs)
+        self.threads = threads
+
     def run(self, dirpath, blender, arguments_cb, batch=False, fail_silently=False):
         # Run tests and output report.
         dirname = os.path.basename(dirpath)
@@ -274,6 +354,24 @@ class Report:
             filepath = os.path.join(outdir, "compare.data")
             pathlib.Path(filepath).write_text(self.compare_tests)
 
+    def _durations_filepath(self, dirname):
+        return os.path.join(self.output_dir, dirname, "durations.json")
+
+    def _read_durations(self, dirname):
+        # Duration in seconds of each file in previous runs, to balance the work of Blender processes.
+        try:
+            with open(self._durations_filepath(dirname), 'r', encoding='utf-8') as file:
+                durations = json.load(file)
+        except (OSError, ValueError):
+            return {}
+        return durations if isinstance(durations, dict) else {}
+
+    def _write_durations(self, dirname, durations):
+        filepath = self._durations_filepath(dirname)
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        durations = {key: round(duration, 3) for key, duration in sorted(durations.items())}
+        pathlib.Path(filepath).write_text(json.dumps(durations, indent=1))
+
     def _navigation_item(self, title, href, active):
         if active:
             return """<li class="breadcrumb-item active" aria-current="page">%s</li>""" % title
@@ -495,7 +593,7 @@ class Report:
             testname = test_get_name(filepath)
             return [TestResult(self, filepath, testname)]
 
-    def _run_tests(self, filepaths, blender, arguments_cb, batch):
+    def _run_shard(self, filepaths, dirpath, blender, arguments_cb, batch, threads, pool, durations):
         # Run multiple tests in a single Blender process since startup can be
         # a significant factor. In case of crashes, re-run the remaining tests.
         verbose = os.environ.get("BLENDER_VERBOSE") is not None
@@ -505,6 +603,8 @@ class Report:
 
         while len(remaining_filepaths) > 0:
             command = [blender]
+            if threads:
+                command.extend(["--threads", str(threads)])
             running_tests = []
 
             # Construct output filepaths and command to run
@@ -530,6 +630,7 @@ class Report:
             # Run process
             crash = False
             output = None
+            time_start = time.time()
             try:
                 completed_process = subprocess.run(command, stdout=subprocess.PIPE)
                 if completed_process.returncode != 0:
@@ -549,6 +650,7 @@ class Report:
             for filepath in running_tests:
                 remaining_filepaths.pop(0)
                 file_crashed = False
+                file_time_end = None
                 for test in self._get_filepath_tests(filepath):
                     if not os.path.exists(test.tmp_out_img) or os.path.getsize(test.tmp_out_img) == 0:
                         if crash:
@@ -562,14 +664,45 @@ class Report:
                             test_results.append(test)
                     else:
                         tests_to_check.append(test)
+                        file_time_end = max(file_time_end or 0.0, os.path.getmtime(test.tmp_out_img))
                 if file_crashed:
                     break
 
-            pool = multiprocessing.Pool(multiprocessing.cpu_count())
+                # Files of a batch are rendered in order, so the duration of a file is the time
+                # between its last output and the last output of the previous file.
+                if file_time_end is not None:
+                    durations[_duration_key(filepath, dirpath)] = max(0.0, file_time_end - time_start)
+                    time_start = max(time_start, file_time_end)
+
             test_results.extend(pool.starmap(diff_output,
                                              [(test, self.oiiotool, self.fail_threshold, self.fail_percent, self.verbose, self.update)
                                               for test in tests_to_check]))
-            pool.close()
+
+        return test_results
+
+    def _run_tests(self, filepaths, dirpath, blender, arguments_cb, batch, durations):
+        # Shard the files over concurrent Blender processes. A crash only restarts the
+        # remaining files of its own shard, other shards keep running.
+        jobs = min(self.jobs, len(filepaths))
+        threads = self.threads
+        if jobs > 1 and not threads:
+            threads = max(1, multiprocessing.cpu_count() // jobs)
+
+        with multiprocessing.Pool(multiprocessing.cpu_count()) as pool:
+            if jobs > 1:
+                shards = _split_shards(filepaths, dirpath, durations, jobs)
+                with concurrent.futures.ThreadPoolExecutor(max_workers=len(shards)) as executor:
+                    futures = [executor.submit(self._run_shard, shard, dirpath, blender, arguments_cb, batch, threads,
+                                               pool, durations)
+                               for shard in shards]
+                    test_results = [test for future in futures for test in future.result()]
+            else:
+                test_results = self._run_shard(filepaths, dirpath, blender, arguments_cb, batch, threads, pool,
+                                               durations)
+
+        # Report results in the order of the files, independent of the sharding.
+        file_indices = {filepath: index for index, filepath in enumerate(filepaths)}
+        test_results.sort(key=lambda test: file_indices[test.filepath])
 
         for test in test_results:
             if test.error == "CRASH":
@@ -603,7 +736,9 @@ class Report:
                       format(len(all_files)),
                       'SUCCESS', "==========")
         time_start = time.time()
-        test_results = self._run_tests(all_files, blender, arguments_cb, batch)
+        durations = self._read_durations(dirname)
+        test_results = self._run_tests(all_files, dirpath, blender, arguments_cb, batch, durations)
+        self._write_durations(dirname, durations)
         for test in test_results:
             if test.error:
                 if test.error == "NO_ENGINE":
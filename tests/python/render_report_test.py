@@ -0,0 +1,97 @@
+# SPDX-FileCopyrightText: 2026 Blender Authors
+#
+# SPDX-License-Identifier: Apache-2.0
+
+# python tests/python/render_report_test.py -- --verbose
+
+import os
+import pathlib
+import random
+import sys
+import unittest
+
+sys.path.append(str(pathlib.Path(__file__).parent.absolute()))
+
+from modules import render_report
+
+TESTS_DIR = os.path.join("render", "shader")
+
+
+def make_filepaths(num_files):
+    # Files of different directories with the same name are distinct tests.
+    return [
+        os.path.join(TESTS_DIR, "dir_%d" % (index % 3), "file_%02d.blend" % (index // 3))
+        for index in range(num_files)
+    ]
+
+
+class SplitShardsTest(unittest.TestCase):
+    def assertShards(self, shards, filepaths, num_shards):
+        self.assertLessEqual(len(shards), num_shards)
+        self.assertTrue(all(shards))
+        # Each file is in exactly one shard, in the original order within the shard.
+        self.assertEqual(sorted(filepath for shard in shards for filepath in shard), sorted(filepaths))
+        for shard in shards:
+            self.assertEqual(shard, sorted(shard, key=filepaths.index))
+
+    def test_duration_key(self):
+        filepath = os.path.join(TESTS_DIR, "dir_1", "file_00.blend")
+        self.assertEqual(render_report._duration_key(filepath, TESTS_DIR), "dir_1/file_00.blend")
+        self.assertNotEqual(
+            render_report._duration_key(filepath, TESTS_DIR),
+            render_report._duration_key(os.path.join(TESTS_DIR, "dir_2", "file_00.blend"), TESTS_DIR),
+        )
+
+    def test_without_durations(self):
+        filepaths = make_filepaths(20)
+        for num_shards in (1, 2, 3, 7, 20, 25):
+            with self.subTest(num_shards=num_shards):
+                shards = render_report._split_shards(filepaths, TESTS_DIR, {}, num_shards)
+                self.assertShards(shards, filepaths, num_shards)
+                # Files of the same duration are spread evenly.
+                sizes = [len(shard) for shard in shards]
+                self.assertLessEqual(max(sizes) - min(sizes), 1)
+                self.assertEqual(len(shards), min(num_shards, len(filepaths)))
+
+    def test_durations(self):
+        rng = random.Random(0)
+        filepaths = make_filepaths(40)
+        durations = {
+            render_report._duration_key(filepath, TESTS_DIR): rng.uniform(0.5, 10.0)
+            for filepath in filepaths
+        }
+        for num_shards in (2, 3, 4, 8):
+            with self.subTest(num_shards=num_shards):
+                shards = render_report._split_shards(filepaths, TESTS_DIR, durations, num_shards)
+                self.assertShards(shards, filepaths, num_shards)
+                # Assigning the longest files first to the shard with the least work,
+                # shards differ by at most the duration of one file.
+                shard_durations = [
+                    sum(durations[render_report._duration_key(filepath, TESTS_DIR)] for filepath in shard)
+                    for shard in shards
+                ]
+                self.assertLessEqual(max(shard_durations) - min(shard_durations), max(durations.values()))
+
+    def test_long_file(self):
+        # A file taking longer than all others together gets a shard of its own.
+        filepaths = make_filepaths(10)
+        durations = {render_report._duration_key(filepath, TESTS_DIR): 1.0 for filepath in filepaths}
+        durations[render_report._duration_key(filepaths[4], TESTS_DIR)] = 100.0
+        shards = render_report._split_shards(filepaths, TESTS_DIR, durations, 3)
+        self.assertShards(shards, filepaths, 3)
+        self.assertIn([filepaths[4]], shards)
+        sizes = sorted(len(shard) for shard in shards)
+        self.assertEqual(sizes, [1, 4, 5])
+
+    def test_unknown_durations(self):
+        # Files without a duration count as the average of the known durations.
+        filepaths = make_filepaths(6)
+        durations = {render_report._duration_key(filepath, TESTS_DIR): 4.0 for filepath in filepaths[:3]}
+        shards = render_report._split_shards(filepaths, TESTS_DIR, durations, 2)
+        self.assertShards(shards, filepaths, 2)
+        self.assertEqual([len(shard) for shard in shards], [3, 3])
+
+
+if __name__ == '__main__':
+    sys.argv = [__file__] + (sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else [])
+    unittest.main()
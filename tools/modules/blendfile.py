@@ -16,11 +16,16 @@ __all__ = (
     # Expose for `wrapper_type` argument to `open_blend`.
     "BlendFile",
     "BlendFileRaw",
+
+    # Expose for `index_dir` argument to `open_blend`.
+    "BlendFileBlockIndex",
 )
 
 
 import gzip
+import hashlib
 import logging
+import mmap
 import os
 import struct
 import tempfile
@@ -71,9 +76,19 @@ class BlendFile:
         "is_modified",
         # bool (is file gzipped)
         "is_compressed",
+        # bytes (digest of the DNA1 block)
+        "sdna_digest",
     )
 
-    def __init__(self, handle):
+    def __init__(self, handle, block_index=None, use_sdna_cache=False):
+        """
+        :arg block_index: Block headers from a previous read of the same file,
+           skips reading the block headers from the file.
+        :type block_index: :class:`BlendFileBlockIndex` | None
+        :arg use_sdna_cache: Share the decoded DNA with other files with an identical DNA1 block,
+           in this case the DNA structs must be treated as read-only.
+        :type use_sdna_cache: bool
+        """
         log.debug("initializing reading blend-file")
         self.handle = handle
         self.header = BlendFileHeader(handle)
@@ -82,20 +97,37 @@ class BlendFile:
         self.code_index = {}
         self.structs = []
         self.sdna_index_from_id = {}
+        self.sdna_digest = b''
+
+        if block_index is not None:
+            for block_values in block_index.blocks:
+                block = BlendFileBlock.from_index(self, *block_values)
+                if block.code == b'ENDB':
+                    break
+                if block.code == b'DNA1':
+                    handle.seek(block.file_offset, os.SEEK_SET)
+                    (self.structs,
+                     self.sdna_index_from_id,
+                     self.sdna_digest,
+                     ) = BlendFile.decode_structs_cached(self.header, block, handle, use_sdna_cache)
+
+                self.blocks.append(block)
+                self.code_index.setdefault(block.code, []).append(block)
+        else:
+            block = BlendFileBlock(handle, self)
+            while block.code != b'ENDB':
+                if block.code == b'DNA1':
+                    (self.structs,
+                     self.sdna_index_from_id,
+                     self.sdna_digest,
+                     ) = BlendFile.decode_structs_cached(self.header, block, handle, use_sdna_cache)
+                else:
+                    handle.seek(block.size, os.SEEK_CUR)
 
-        block = BlendFileBlock(handle, self)
-        while block.code != b'ENDB':
-            if block.code == b'DNA1':
-                (self.structs,
-                 self.sdna_index_from_id,
-                 ) = BlendFile.decode_structs(self.header, block, handle)
-            else:
-                handle.seek(block.size, os.SEEK_CUR)
-
-            self.blocks.append(block)
-            self.code_index.setdefault(block.code, []).append(block)
+                self.blocks.append(block)
+                self.code_index.setdefault(block.code, []).append(block)
 
-            block = BlendFileBlock(handle, self)
+                block = BlendFileBlock(handle, self)
         self.is_modified = False
         self.blocks.append(block)
 
@@ -157,17 +189,45 @@ class BlendFile:
                                (self.structs[sdna_index_curr].dna_type_id.decode('ascii'),
                                 self.structs[sdna_index_next].dna_type_id.decode('ascii')))
 
+    # Decoded DNA shared between files, see `decode_structs_cached`.
+    # dict {(sdna_digest, pointer_size, endian_index): (structs, sdna_index_from_id)}
+    _sdna_cache = {}
+
+    @staticmethod
+    def decode_structs_cached(header, block, handle, use_sdna_cache):
+        """
+        Decode the DNA1 file-block, reusing the result of a previous call
+        for a file with an identical DNA1 block when ``use_sdna_cache`` is enabled.
+
+        Return (structs, sdna_index_from_id, sdna_digest).
+        """
+        data = handle.read(block.size)
+        sdna_digest = hashlib.sha1(data).digest()
+        if not use_sdna_cache:
+            return (*BlendFile.decode_structs_from_data(header, data), sdna_digest)
+
+        key = (sdna_digest, header.pointer_size, header.endian_index)
+        result = BlendFile._sdna_cache.get(key)
+        if result is None:
+            result = BlendFile._sdna_cache[key] = BlendFile.decode_structs_from_data(header, data)
+        else:
+            log.debug("reusing cached DNA catalog")
+        return (*result, sdna_digest)
+
     @staticmethod
     def decode_structs(header, block, handle):
         """
         DNACatalog is a catalog of all information in the DNA1 file-block
         """
+        return BlendFile.decode_structs_from_data(header, handle.read(block.size))
+
+    @staticmethod
+    def decode_structs_from_data(header, data):
         log.debug("building DNA catalog")
         shortstruct = DNA_IO.USHORT[header.endian_index]
         shortstruct2 = struct.Struct(header.endian_str + b'HH')
         intstruct = DNA_IO.UINT[header.endian_index]
 
-        data = handle.read(block.size)
         types = []
         names = []
 
@@ -315,6 +375,22 @@ class BlendFileBlock:
             self.count = 0
             self.file_offset = 0
 
+    @classmethod
+    def from_index(cls, bfile, code, size, addr_old, sdna_index, count, file_offset):
+        """
+        Create a block from values stored in a :class:`BlendFileBlockIndex`, without reading the file.
+        """
+        self = cls.__new__(cls)
+        self.file = bfile
+        self.user_data = None
+        self.code = code
+        self.size = size
+        self.addr_old = addr_old
+        self.sdna_index = sdna_index
+        self.count = count
+        self.file_offset = file_offset
+        return self
+
     @property
     def dna_type(self):
         return self.file.structs[self.sdna_index]
@@ -579,7 +655,12 @@ class BlendFileRaw:
         "is_compressed",
     )
 
-    def __init__(self, handle):
+    def __init__(self, handle, block_index=None):
+        """
+        :arg block_index: Block headers from a previous read of the same file,
+           skips reading the block headers from the file.
+        :type block_index: :class:`BlendFileBlockIndex` | None
+        """
         log.debug("initializing reading blend-file")
         self.handle = handle
         self.header = BlendFileHeader(handle)
@@ -587,13 +668,21 @@ class BlendFileRaw:
         self.blocks = []
         self.code_index = {}
 
-        block = BlendFileBlockRaw(handle, self)
-        while block.code != b'ENDB':
-            handle.seek(block.size, os.SEEK_CUR)
-            self.blocks.append(block)
-            self.code_index.setdefault(block.code, []).append(block)
-
+        if block_index is not None:
+            for block_values in block_index.blocks:
+                block = BlendFileBlockRaw.from_index(self, *block_values)
+                if block.code == b'ENDB':
+                    break
+                self.blocks.append(block)
+                self.code_index.setdefault(block.code, []).append(block)
+        else:
             block = BlendFileBlockRaw(handle, self)
+            while block.code != b'ENDB':
+                handle.seek(block.size, os.SEEK_CUR)
+                self.blocks.append(block)
+                self.code_index.setdefault(block.code, []).append(block)
+
+                block = BlendFileBlockRaw(handle, self)
         self.is_modified = False
         self.blocks.append(block)
 
@@ -726,6 +815,22 @@ class BlendFileBlockRaw:
             self.count = 0
             self.file_offset = 0
 
+    @classmethod
+    def from_index(cls, bfile, code, size, addr_old, sdna_index, count, file_offset):
+        """
+        Create a block from values stored in a :class:`BlendFileBlockIndex`, without reading the file.
+        """
+        self = cls.__new__(cls)
+        self.file = bfile
+        self.user_data = None
+        self.code = code
+        self.size = size
+        self.addr_old = addr_old
+        self.sdna_index = sdna_index
+        self.count = count
+        self.file_offset = file_offset
+        return self
+
     def get_data_hash(self, seed=1):
         """
         Generates a 'hash' that can be used instead of addr_old as block id, and that should be 'stable' across .blend
@@ -1181,6 +1286,105 @@ class DNA_IO:
             return st.unpack(handle.read(st.size))[0]
 
 
+# -----------------------------------------------------------------------------
+# Block Index
+#
+# A sidecar file storing the block headers of a blend-file,
+# so they don't have to be read again when re-opening an unchanged file.
+
+
+class BlendFileBlockIndex:
+    """
+    Block headers of a blend-file, valid as long as the size and modification time of the blend-file are unchanged.
+    """
+    __slots__ = (
+        # int
+        "file_size",
+        # int
+        "file_mtime_ns",
+        # [(code, size, addr_old, sdna_index, count, file_offset), ...]
+        "blocks",
+    )
+
+    MAGIC = b'BLENDIDX1'
+    # file_size, file_mtime_ns, number of blocks.
+    HEADER = struct.Struct(b'<QqI')
+    # code, size, addr_old, sdna_index, count, file_offset.
+    BLOCK = struct.Struct(b'<4sQQIQQ')
+
+    def __init__(self, file_size, file_mtime_ns, blocks):
+        self.file_size = file_size
+        self.file_mtime_ns = file_mtime_ns
+        self.blocks = blocks
+
+    @classmethod
+    def from_blend(cls, bfile, stat):
+        """
+        Create the index of an opened blend-file (:class:`BlendFile` or :class:`BlendFileRaw`),
+        where ``stat`` is the ``os.stat_result`` of the blend-file on disk.
+        """
+        return cls(
+            stat.st_size,
+            stat.st_mtime_ns,
+            [
+                (block.code, block.size, block.addr_old, block.sdna_index, block.count, block.file_offset)
+                for block in bfile.blocks
+            ],
+        )
+
+    @staticmethod
+    def filepath_from_blend(index_dir, filename):
+        """
+        Return the path of the index file in ``index_dir`` for the blend-file ``filename``.
+        """
+        filename_abs = os.path.abspath(filename)
+        name = hashlib.sha1(os.fsencode(filename_abs)).hexdigest()
+        return os.path.join(index_dir, os.path.basename(filename_abs) + "." + name + ".blkidx")
+
+    @classmethod
+    def read(cls, filepath_index, stat):
+        """
+        Return the index stored in ``filepath_index`` or None when it doesn't exist,
+        or doesn't match the blend-file size and modification time from ``stat``.
+        """
+        try:
+            with open(filepath_index, "rb") as fh:
+                data = fh.read()
+        except FileNotFoundError:
+            return None
+
+        if not data.startswith(cls.MAGIC):
+            log.debug("invalid block index %r", filepath_index)
+            return None
+        offset = len(cls.MAGIC)
+        try:
+            file_size, file_mtime_ns, blocks_len = cls.HEADER.unpack_from(data, offset)
+        except struct.error:
+            return None
+        if (file_size, file_mtime_ns) != (stat.st_size, stat.st_mtime_ns):
+            log.debug("outdated block index %r", filepath_index)
+            return None
+        offset += cls.HEADER.size
+        if len(data) != offset + cls.BLOCK.size * blocks_len:
+            log.debug("truncated block index %r", filepath_index)
+            return None
+
+        blocks = [
+            (code.partition(b'\0')[0], *values)
+            for code, *values in cls.BLOCK.iter_unpack(data[offset:])
+        ]
+        return cls(file_size, file_mtime_ns, blocks)
+
+    def write(self, filepath_index):
+        data = [self.MAGIC, self.HEADER.pack(self.file_size, self.file_mtime_ns, len(self.blocks))]
+        data.extend(self.BLOCK.pack(*block_values) for block_values in self.blocks)
+        # Write to a temporary file first, so concurrent readers never see a partially written index.
+        filepath_index_tmp = "%s.%d.tmp" % (filepath_index, os.getpid())
+        with open(filepath_index_tmp, "wb") as fh:
+            fh.write(b''.join(data))
+        os.replace(filepath_index_tmp, filepath_index)
+
+
 # -----------------------------------------------------------------------------
 # module global routines
 #
@@ -1188,11 +1392,60 @@ class DNA_IO:
 # open a filename
 # determine if the file is compressed
 # and returns a handle
-def open_blend(filename, access="rb", wrapper_type=BlendFile):
+def open_blend(
+        filename, access="rb", wrapper_type=BlendFile,
+        use_mmap=False,
+        use_sdna_cache=False,
+        index_dir=None,
+):
     """Opens a blend file for reading or writing pending on the access
     supports 2 kind of blend files. Uncompressed and compressed.
     Known issue: does not support packaged blend files
+
+    Options mainly useful when scanning many files (only used with "rb" access):
+
+    - ``use_mmap``: read the file through a memory map instead of file reads.
+    - ``use_sdna_cache``: decode the DNA once for all files sharing an identical DNA1 block
+      (only for :class:`BlendFile`), the DNA structs are then shared and must be treated as read-only.
+    - ``index_dir``: directory where the block headers of each file are stored after opening it,
+      so re-opening the file while its size and modification time are unchanged skips reading all block headers.
+
+    Z-standard files written with a seek table (as Blender does) are read in-place when using "rb" access,
+    only decompressing the frames that contain the data being read.
     """
+    if access != "rb":
+        use_mmap = False
+        index_dir = None
+
+    wrapper_kwargs = {}
+    if wrapper_type is BlendFile:
+        wrapper_kwargs["use_sdna_cache"] = use_sdna_cache
+
+    stat = block_index = filepath_index = None
+    if index_dir is not None:
+        stat = os.stat(filename)
+        filepath_index = BlendFileBlockIndex.filepath_from_blend(index_dir, filename)
+        block_index = BlendFileBlockIndex.read(filepath_index, stat)
+        if block_index is not None:
+            log.debug("using block index %r", filepath_index)
+            wrapper_kwargs["block_index"] = block_index
+
+    def handle_as_mmap(handle, can_mmap):
+        if not (use_mmap and can_mmap):
+            return handle
+        handle_mmap = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        # The memory map doesn't depend on the file remaining open.
+        handle.close()
+        return handle_mmap
+
+    def wrap(handle, is_compressed, can_mmap=True):
+        bfile = wrapper_type(handle_as_mmap(handle, can_mmap), **wrapper_kwargs)
+        bfile.is_compressed = is_compressed
+        bfile.filepath_orig = filename
+        if index_dir is not None and block_index is None:
+            os.makedirs(index_dir, exist_ok=True)
+            BlendFileBlockIndex.from_blend(bfile, stat).write(filepath_index)
+        return bfile
 
     def decompress(filename, file_open):
         log.debug("decompressing started")
@@ -1208,10 +1461,7 @@ def open_blend(filename, access="rb", wrapper_type=BlendFile):
             fs.close()
             log.debug("resetting decompressed file")
             handle.seek(os.SEEK_SET, 0)
-            bfile = wrapper_type(handle)
-            bfile.is_compressed = True
-            bfile.filepath_orig = filename
-            return bfile
+            return wrap(handle, True)
 
     handle = open(filename, access)
     magic_test = b"BLENDER"
@@ -1219,13 +1469,28 @@ def open_blend(filename, access="rb", wrapper_type=BlendFile):
     if magic == magic_test:
         log.debug("normal blendfile detected")
         handle.seek(0, os.SEEK_SET)
-        bfile = wrapper_type(handle)
-        bfile.is_compressed = False
-        bfile.filepath_orig = filename
-        return bfile
+        return wrap(handle, False)
     elif magic[:4] == b'\x28\xb5\x2f\xfd':
         log.debug("zstd blendfile detected")
         handle.close()
+        try:
+            # Shared with Blender, only available when Blender's `scripts/modules` are in the module search path.
+            from blend_render_info import ZstdSeekableReader
+        except ImportError:
+            log.debug("zstd seek table reader not found, decompressing the whole file")
+            ZstdSeekableReader = None
+        if access == "rb" and ZstdSeekableReader is not None:
+            handle = open(filename, "rb")
+            try:
+                handle_seekable = ZstdSeekableReader.from_handle(handle)
+            except BaseException:
+                handle.close()
+                raise
+            if handle_seekable is not None:
+                log.debug("zstd seek table found, decompressing frames on demand")
+                # Frames are decompressed on demand, there is no file to map.
+                return wrap(handle_seekable, True, can_mmap=False)
+            handle.close()
         return decompress(filename, zstd.open)
     elif magic[:2] == b'\x1f\x8b':
         log.debug("gzip blendfile detected")
@@ -69,6 +69,8 @@ import re
 # Avoid maintaining multiple blendfile modules
 import sys
 sys.path.append(os.path.join(os.path.dirname(__file__), "..", "modules"))
+# For `blendfile` to read seekable Z-standard files on demand (using `blend_render_info`).
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", "scripts", "modules"))
 del sys
 
 import blendfile